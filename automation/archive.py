@@ -0,0 +1,222 @@
+import argparse
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from rounds import RAW_JSON_DIR, Change, Round, iter_rounds
+
+ARCHIVE_DIR = Path("round_archive")
+
+# every finished round as one fixed-width record in rounds.bin, sorted by round,
+# with its odds changes as a contiguous run of records in changes.bin. Odds drop
+# the site's leading placeholder, missing foods are all zero, times are
+# microseconds since the epoch
+ROUND_DTYPE = np.dtype([
+    ("round", "<u4"),
+    ("flags", "u1"),
+    ("pirates", "u1", (5, 4)),
+    ("foods", "u1", (5, 10)),
+    ("opening_odds", "u1", (5, 4)),
+    ("current_odds", "u1", (5, 4)),
+    ("winners", "u1", (5,)),
+    ("start", "<i8"),
+    ("timestamp", "<i8"),
+    ("changes_offset", "<u8"),
+    ("changes_count", "<u4"),
+])
+CHANGE_DTYPE = np.dtype([
+    ("arena", "u1"),
+    ("pirate", "u1"),
+    ("old", "u1"),
+    ("new", "u1"),
+    ("t", "<i8"),
+])
+
+# which of a round's optional fields were present
+HAS_FOODS = 1
+HAS_TIMES = 2
+HAS_CHANGES = 4
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# the last two bytes are the format version, bumped whenever a dtype changes
+ROUNDS_MAGIC = b"NFCRND\x00\x02"
+CHANGES_MAGIC = b"NFCCHG\x00\x01"
+
+
+def _micros(timestamp: str | None) -> int:
+    if timestamp is None:
+        return 0
+    return (datetime.fromisoformat(timestamp) - EPOCH) // timedelta(microseconds=1)
+
+
+def _iso(micros: int) -> str:
+    return (EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+def is_finished(round: Round) -> bool:
+    return round.winners is not None and all(round.winners)
+
+
+def to_records(rounds: list[Round]) -> tuple[np.ndarray, np.ndarray]:
+    # changes_offset is relative to the first change of this batch
+    records = np.zeros(len(rounds), dtype=ROUND_DTYPE)
+    changes = []
+    for record, round in zip(records, rounds):
+        round_changes = round.changes or []
+        record["round"] = round.round
+        record["flags"] = (
+            (HAS_FOODS if round.foods is not None else 0)
+            | (HAS_TIMES if round.start is not None else 0)
+            | (HAS_CHANGES if round.changes is not None else 0)
+        )
+        record["pirates"] = round.pirates
+        if round.foods is not None:
+            record["foods"] = round.foods
+        record["opening_odds"] = [odds[1:] for odds in round.opening_odds]
+        record["current_odds"] = [odds[1:] for odds in round.current_odds]
+        record["winners"] = round.winners
+        record["start"] = _micros(round.start)
+        record["timestamp"] = _micros(round.timestamp)
+        record["changes_offset"] = len(changes)
+        record["changes_count"] = len(round_changes)
+        changes.extend(
+            (change.arena, change.pirate, change.old, change.new, _micros(change.t))
+            for change in round_changes
+        )
+    return records, np.array(changes, dtype=CHANGE_DTYPE)
+
+
+def _map(path: Path, magic: bytes, dtype: np.dtype) -> np.ndarray:
+    if not path.exists():
+        return np.empty(0, dtype=dtype)
+    with open(path, "rb") as f:
+        if f.read(len(magic)) != magic:
+            raise ValueError(f"{path} is not a round archive file of this version, rebuild it")
+    # whole records only, so a half-written append is simply not there yet
+    count = (path.stat().st_size - len(magic)) // dtype.itemsize
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=len(magic), shape=(count,))
+
+
+class Archive:
+    # memory-mapped, so opening it reads nothing and a lookup touches one record
+    def __init__(self, path: Path = ARCHIVE_DIR):
+        self.path = path
+        self.records = _map(path / "rounds.bin", ROUNDS_MAGIC, ROUND_DTYPE)
+        self.changes = _map(path / "changes.bin", CHANGES_MAGIC, CHANGE_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _index(self, round: int) -> int | None:
+        index = int(np.searchsorted(self.records["round"], round))
+        if index < len(self.records) and self.records["round"][index] == round:
+            return index
+        return None
+
+    def __contains__(self, round: int) -> bool:
+        return self._index(round) is not None
+
+    def __getitem__(self, round: int) -> Round:
+        index = self._index(round)
+        if index is None:
+            raise KeyError(round)
+        return self._round(index)
+
+    def __iter__(self) -> Iterator[Round]:
+        for index in range(len(self.records)):
+            yield self._round(index)
+
+    def _round(self, index: int) -> Round:
+        record = self.records[index]
+        flags = int(record["flags"])
+        changes = None
+        if flags & HAS_CHANGES:
+            offset = int(record["changes_offset"])
+            changes = [
+                Change(
+                    int(c["arena"]), int(c["pirate"]), int(c["old"]), int(c["new"]), _iso(int(c["t"]))
+                )
+                for c in self.changes[offset : offset + int(record["changes_count"])]
+            ]
+        return Round(
+            round=int(record["round"]),
+            pirates=record["pirates"].tolist(),
+            foods=record["foods"].tolist() if flags & HAS_FOODS else None,
+            opening_odds=[[1, *odds] for odds in record["opening_odds"].tolist()],
+            current_odds=[[1, *odds] for odds in record["current_odds"].tolist()],
+            winners=record["winners"].tolist(),
+            start=_iso(int(record["start"])) if flags & HAS_TIMES else None,
+            timestamp=_iso(int(record["timestamp"])) if flags & HAS_TIMES else None,
+            changes=changes,
+        )
+
+
+def _write_atomic(path: Path, magic: bytes, array: np.ndarray) -> None:
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        f.write(magic)
+        f.write(array.tobytes())
+    os.replace(f.name, path)
+
+
+def write_archive(path: Path, rounds: Iterable[Round]) -> int:
+    rounds = sorted((round for round in rounds if is_finished(round)), key=lambda r: r.round)
+    records, changes = to_records(rounds)
+    path.mkdir(parents=True, exist_ok=True)
+    # changes first, so rounds.bin never points past the end of changes.bin
+    _write_atomic(path / "changes.bin", CHANGES_MAGIC, changes)
+    _write_atomic(path / "rounds.bin", ROUNDS_MAGIC, records)
+    return len(records)
+
+
+def append_rounds(path: Path, rounds: Iterable[Round]) -> int:
+    # adds finished rounds the archive doesn't have yet; newer rounds are a
+    # plain append, backfilling an older gap rewrites the (small) archive
+    archive = Archive(path)
+    new = {
+        round.round: round
+        for round in rounds
+        if is_finished(round) and round.round not in archive
+    }
+    if not new:
+        return 0
+    if len(archive) and min(new) < archive.records["round"][-1]:
+        write_archive(path, [*archive, *new.values()])
+        return len(new)
+    if not len(archive):
+        return write_archive(path, new.values())
+
+    records, changes = to_records([new[round] for round in sorted(new)])
+    records["changes_offset"] += len(archive.changes)
+    with open(path / "changes.bin", "ab") as f:
+        f.write(changes.tobytes())
+    with open(path / "rounds.bin", "ab") as f:
+        f.write(records.tobytes())
+    return len(records)
+
+
+def pack(raw_json_dir: Path = RAW_JSON_DIR, path: Path = ARCHIVE_DIR) -> int:
+    paths = sorted(raw_json_dir.glob("**/*.json"), key=lambda path: int(path.stem))
+    return write_archive(path, iter_rounds(paths, changes=True))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Pack every finished round in raw_json/ into a single binary archive"
+    )
+    parser.add_argument("--input", type=Path, default=RAW_JSON_DIR)
+    parser.add_argument("--output", type=Path, default=ARCHIVE_DIR)
+    args = parser.parse_args(argv)
+    count = pack(args.input, args.output)
+    print(f"Packed {count} rounds into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import argparse
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from bets import bet_odds, bet_probabilities, bet_wins, payouts
+from scoring import Coefficients, score_history
+
+OUTPUT_PATH = Path("./output/backtest.csv")
+
+# the site lets you place 10 bets per round
+BETS_PER_ROUND = 10
+
+
+def top_bets(score: np.ndarray, count: int = BETS_PER_ROUND) -> np.ndarray:
+    # indices of the `count` highest-scoring bets in each round, best first
+    top = np.argpartition(-score, count - 1, axis=1)[:, :count]
+    order = np.argsort(-np.take_along_axis(score, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+# a strategy gets (rounds, 3124) win probabilities and payouts and picks the bets to place
+STRATEGIES: dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "max_er": lambda probabilities, returns: top_bets(probabilities * returns),
+    "max_probability": lambda probabilities, returns: top_bets(probabilities),
+}
+
+
+def _backtest_chunk(
+    strategy: str,
+    probabilities: np.ndarray,
+    odds: np.ndarray,
+    winners: np.ndarray,
+    bet_amount: int | None,
+) -> np.ndarray:
+    # every one of the 3124 bets is scored for every round in the chunk at once
+    all_probabilities = bet_probabilities(probabilities)
+    all_returns = payouts(bet_odds(odds), bet_amount)
+    chosen = STRATEGIES[strategy](all_probabilities, all_returns)
+
+    chosen_probabilities = np.take_along_axis(all_probabilities, chosen, axis=1)
+    chosen_returns = np.take_along_axis(all_returns, chosen, axis=1)
+    chosen_wins = np.take_along_axis(bet_wins(winners), chosen, axis=1)
+    stake = 1 if bet_amount is None else bet_amount
+    return np.column_stack([
+        np.full(len(chosen), chosen.shape[1] * stake, dtype=np.float64),
+        (chosen_returns * chosen_wins).sum(axis=1),
+        (chosen_returns * chosen_probabilities).sum(axis=1),
+    ])
+
+
+def round_arrays(df: pl.DataFrame, odds: str = "closing") -> tuple[np.ndarray, np.ndarray]:
+    # closing (or opening) odds as (rounds, 5, 4) and winning positions as (rounds, 5)
+    odds = df.select([f"{odds}_odds{i}" for i in range(1, 5)]).to_numpy()
+    winners = df["winner"].to_numpy()
+    return odds.reshape(-1, 5, 4), winners.reshape(-1, 5).astype(np.intp)
+
+
+def backtest(
+    df: pl.DataFrame,
+    coefficients: Coefficients,
+    strategy: str = "max_er",
+    bet_amount: int | None = None,
+    workers: int | None = None,
+) -> pl.DataFrame:
+    rounds, probabilities = score_history(df, coefficients)
+    odds, winners = round_arrays(df)
+
+    # a few hundred rounds per chunk keeps the (rounds, 3124, 5) intermediates small
+    chunks = max(workers or os.cpu_count(), len(rounds) // 256, 1)
+    splits = [np.array_split(a, chunks) for a in (probabilities, odds, winners)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _backtest_chunk,
+            [strategy] * chunks,
+            *splits,
+            [bet_amount] * chunks,
+        )
+        spent, returned, expected = np.concatenate(list(results)).T
+
+    return pl.DataFrame({
+        "round": rounds,
+        "spent": spent,
+        "returned": returned,
+        "expected": expected,
+    }).with_columns(
+        profit=pl.col("returned") - pl.col("spent"),
+    ).with_columns(
+        cumulative_profit=pl.col("profit").cum_sum(),
+    )
+
+
+def summarize(results: pl.DataFrame, block: int) -> pl.DataFrame:
+    # ROI, profit variance and hit rate per block of rounds, so drift over time shows up
+    return (
+        results.group_by(
+            (pl.col("round").cast(pl.Int64) - 1) // block * block + 1, maintain_order=True
+        )
+        .agg(
+            last_round=pl.col("round").max(),
+            rounds=pl.len(),
+            roi=pl.col("returned").sum() / pl.col("spent").sum() - 1,
+            expected_roi=pl.col("expected").sum() / pl.col("spent").sum() - 1,
+            profit_mean=pl.col("profit").mean(),
+            profit_variance=pl.col("profit").var(),
+            hit_rate=(pl.col("returned") > 0).mean(),
+        )
+        .rename({"round": "first_round"})
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Backtest a bet strategy over every round in the preprocessed history"
+    )
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="max_er")
+    parser.add_argument(
+        "--coefficients",
+        type=Path,
+        default=Path("./output/python.py"),
+        help="generated python.py to take the logit coefficients from",
+    )
+    parser.add_argument(
+        "--bet-amount",
+        type=int,
+        default=None,
+        help="NP per bet, with payouts capped at 1,000,000 (default: unit stakes, uncapped)",
+    )
+    parser.add_argument(
+        "--block",
+        type=int,
+        default=500,
+        help="rounds per block in the printed summary",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all cores)",
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    results = backtest(
+        pl.read_ipc("./output/history.arrow"),
+        Coefficients.from_published(args.coefficients),
+        strategy=args.strategy,
+        bet_amount=args.bet_amount,
+        workers=args.workers,
+    )
+    with pl.Config(tbl_rows=-1, tbl_cols=-1, tbl_width_chars=200, float_precision=4):
+        print(summarize(results, args.block))
+    spent, returned = results["spent"].sum(), results["returned"].sum()
+    print(
+        f"Overall: {len(results)} rounds, ROI {returned / spent - 1:+.2%}, "
+        f"profit per round {results['profit'].mean():.2f} "
+        f"(variance {results['profit'].var():.2f})"
+    )
+    print(f"Writing {args.output}...")
+    results.write_csv(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+import archive
+import logit
+import preprocessing
+from backtest import backtest
+from design import build_design, load_matches
+from grab_rounds import grab_rounds
+from mock_cdn import start_mock_cdn
+from rounds import RAW_JSON_DIR
+from scoring import Coefficients
+from synthetic import write_rounds
+
+OUTPUT_PATH = Path("./output/benchmark.json")
+
+# the fetch stage always downloads this many rounds from the stub CDN, so it
+# measures per-request overhead rather than growing with the scale
+FETCH_ROUNDS = 500
+
+# differences below this are timer noise, not regressions
+NOISE_FLOOR = 0.05
+
+
+def timed(stage: Callable[[], object], repeat: int) -> float:
+    # best of `repeat`, with the stages' progress output kept off the terminal
+    best = float("inf")
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            stage()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_scale(rounds: int, coefficients: Coefficients, repeat: int) -> dict[str, float]:
+    # every stage reads and writes relative paths (raw_json/, output/, round_archive/),
+    # so running inside a scratch directory benchmarks the real code paths
+    # against the synthetic archive without touching the real one
+    cwd = Path.cwd()
+    with tempfile.TemporaryDirectory(prefix="neofoodclub-benchmark-") as workspace:
+        workspace = Path(workspace)
+        stages = {}
+        stages["generate"] = timed(
+            lambda: write_rounds(workspace / RAW_JSON_DIR, rounds, coefficients), 1
+        )
+        (workspace / "output").mkdir()
+        os.chdir(workspace)
+        try:
+            server = start_mock_cdn(workspace / RAW_JSON_DIR)
+            stages["fetch"] = timed(
+                lambda: grab_rounds(
+                    base_url=server.base_url,
+                    raw_json_dir=Path(tempfile.mkdtemp(dir=workspace)),
+                    limit=FETCH_ROUNDS,
+                ),
+                repeat,
+            )
+            server.shutdown()
+
+            stages["ingest_full"] = timed(lambda: preprocessing.ingest(full=True), repeat)
+            stages["ingest_unchanged"] = timed(preprocessing.ingest, repeat)
+            stages["pack_archive"] = timed(archive.pack, repeat)
+            stages["ingest_archive"] = timed(
+                lambda: preprocessing.ingest_archive(archive.ARCHIVE_DIR), repeat
+            )
+            stages["load_matches"] = timed(load_matches, repeat)
+            matches = load_matches()
+            stages["build_design"] = timed(lambda: build_design(matches), repeat)
+            design = build_design(matches)
+            stages["fit"] = timed(lambda: logit.fit(design), repeat)
+            history = preprocessing.read_history()
+            stages["backtest"] = timed(lambda: backtest(history, coefficients), repeat)
+        finally:
+            os.chdir(cwd)
+    return stages
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    found = []
+    for scale, result in results["scales"].items():
+        previous = baseline["scales"].get(scale)
+        if previous is None:
+            continue
+        for stage, seconds in result["stages"].items():
+            before = previous["stages"].get(stage)
+            if before is None:
+                continue
+            if seconds > before * (1 + tolerance) and seconds - before > NOISE_FLOOR:
+                found.append(
+                    f"{scale}x {stage}: {before:.3f}s -> {seconds:.3f}s "
+                    f"({seconds / before - 1:+.0%})"
+                )
+    return found
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Time each pipeline stage on synthetic archives of increasing size"
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        nargs="+",
+        default=[1],
+        help="archive sizes to run, as multiples of the real raw_json/ (e.g. 1 10 100)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, best is kept")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="earlier results to compare against, exiting non-zero on a slowdown",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown per stage before it counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    coefficients = Coefficients.from_published()
+    real_rounds = len(list(RAW_JSON_DIR.glob("*.json")))
+    results = {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "scales": {},
+    }
+    for scale in args.scale:
+        rounds = real_rounds * scale
+        print(f"{scale}x ({rounds} rounds)...")
+        stages = run_scale(rounds, coefficients, args.repeat)
+        for stage, seconds in stages.items():
+            print(f"    {stage:20} {seconds:9.3f}s")
+        results["scales"][str(scale)] = {"rounds": rounds, "stages": stages}
+
+    print(f"Writing {args.output}...")
+    args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare is not None:
+        slower = regressions(results, json.loads(args.compare.read_text()), args.tolerance)
+        if slower:
+            print(f"PERFORMANCE REGRESSION against {args.compare}:")
+            for line in slower:
+                print(f"    {line}")
+            sys.exit(1)
+        print(f"No stage slower than {args.compare} by more than {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
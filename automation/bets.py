@@ -0,0 +1,41 @@
+import itertools
+
+import numpy as np
+
+# every bet as the position (1-4) backed in each arena, 0 for arenas left out;
+# 5 ** 5 combinations minus the empty bet
+ALL_BETS = np.array(list(itertools.product(range(5), repeat=5))[1:], dtype=np.intp)
+ARENAS = np.arange(5)
+
+# the most a single bet can pay out, however long the odds
+MAX_WINNINGS = 1_000_000
+
+
+def _gather(per_pirate: np.ndarray, fill: float) -> np.ndarray:
+    # (rounds, 5, 4) per-pirate values -> (rounds, 3124, 5) per-arena values for
+    # every bet, with `fill` for the arenas a bet leaves out
+    padded = np.concatenate(
+        [np.full(per_pirate.shape[:-1] + (1,), fill), per_pirate], axis=-1
+    )
+    return padded[:, ARENAS, ALL_BETS]
+
+
+def bet_probabilities(probabilities: np.ndarray) -> np.ndarray:
+    # arenas are independent, so a bet wins with the product of its pirates' probabilities
+    return _gather(probabilities, 1.0).prod(axis=-1)
+
+
+def bet_odds(odds: np.ndarray) -> np.ndarray:
+    return _gather(odds.astype(np.float64), 1.0).prod(axis=-1)
+
+
+def bet_wins(winners: np.ndarray) -> np.ndarray:
+    # winners is (rounds, 5) with the winning position (1-4) in each arena
+    return ((ALL_BETS == 0) | (ALL_BETS == winners[:, None, :])).all(axis=-1)
+
+
+def payouts(odds: np.ndarray, bet_amount: int | None = None) -> np.ndarray:
+    # return on a winning bet; per unit staked, or capped at MAX_WINNINGS for a real bet amount
+    if bet_amount is None:
+        return odds
+    return np.minimum(bet_amount * odds, MAX_WINNINGS)
@@ -0,0 +1,186 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import logit
+import numpy as np
+from design import Design, build_design, load_matches
+from scipy.stats import norm
+
+OUTPUT_PATH = Path("./output/confidence_intervals.json")
+
+# set once per worker process by the pool initializer, so the design arrays
+# are shared (copy-on-write under fork) rather than pickled with every replicate
+_design: Design | None = None
+_groups: np.ndarray | None = None
+_init: np.ndarray | None = None
+
+
+def _init_worker(design: Design, groups: np.ndarray, init: np.ndarray) -> None:
+    global _design, _groups, _init
+    _design, _groups, _init = design, groups, init
+
+
+def replicate_weights(
+    method: str, replicate: int, seed: np.random.SeedSequence, groups: np.ndarray
+) -> np.ndarray:
+    # every resample is just a weight per match: how many times it was drawn
+    n_groups = groups.max() + 1
+    if method == "match":
+        rng = np.random.default_rng(seed)
+        return np.bincount(rng.integers(0, len(groups), len(groups)), minlength=len(groups))
+    if method == "round":
+        # resample whole rounds so arenas from the same round stay together
+        rng = np.random.default_rng(seed)
+        counts = np.bincount(rng.integers(0, n_groups, n_groups), minlength=n_groups)
+        return counts[groups]
+    if method == "jackknife":
+        return (groups != replicate).astype(np.int64)
+    raise ValueError(f"Unknown resampling method: {method}")
+
+
+def _fit_replicate(job: tuple[str, int, np.random.SeedSequence]) -> np.ndarray | None:
+    method, replicate, seed = job
+    weights = replicate_weights(method, replicate, seed, _groups).astype(np.float64)
+    # the full-sample estimate is a good start, so each replicate is a few newton steps
+    try:
+        result = logit.fit(_design, init=_init, weights=weights)
+    except np.linalg.LinAlgError:
+        # a resample that leaves out every match of some pirate or position
+        # can't pin its coefficient down; it's dropped like a non-converged one
+        return None
+    return result.coeff if result.converged else None
+
+
+def resample(
+    design: Design,
+    rounds: np.ndarray,
+    init: np.ndarray,
+    method: str = "match",
+    replicates: int = 200,
+    blocks: int = 50,
+    seed: int = 0,
+    workers: int | None = None,
+) -> np.ndarray:
+    if method == "jackknife":
+        # delete-a-group jackknife over contiguous blocks of rounds
+        _, round_index = np.unique(rounds, return_inverse=True)
+        groups = round_index * blocks // (round_index.max() + 1)
+        replicates = blocks
+    elif method == "round":
+        _, groups = np.unique(rounds, return_inverse=True)
+    else:
+        groups = np.arange(len(rounds))
+
+    seeds = np.random.SeedSequence(seed).spawn(replicates)
+    jobs = [(method, replicate, seeds[replicate]) for replicate in range(replicates)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(design, groups, init)
+    ) as executor:
+        results = list(executor.map(_fit_replicate, jobs, chunksize=4))
+
+    samples = [coeff for coeff in results if coeff is not None]
+    if len(samples) < replicates:
+        print(
+            f"{replicates - len(samples)} of {replicates} replicates failed to converge "
+            "and were dropped"
+        )
+    if len(samples) < 2:
+        # a spread needs at least two fits to go on
+        raise ValueError(f"only {len(samples)} of {replicates} replicates could be fitted")
+    return np.array(samples)
+
+
+def confidence_intervals(
+    result: logit.LogitResult, samples: np.ndarray, method: str, confidence: float
+) -> list[dict]:
+    alpha = 1 - confidence
+    if method == "jackknife":
+        groups = len(samples)
+        spread = np.sqrt((groups - 1) / groups * ((samples - samples.mean(axis=0)) ** 2).sum(axis=0))
+        z = norm.ppf(1 - alpha / 2)
+        lower, upper = result.coeff - z * spread, result.coeff + z * spread
+    else:
+        spread = samples.std(axis=0, ddof=1)
+        lower, upper = np.quantile(samples, [alpha / 2, 1 - alpha / 2], axis=0)
+
+    return [
+        {
+            "coefficient": name,
+            "estimate": float(estimate),
+            "stderr": float(stderr),
+            "resampled_stderr": float(resampled),
+            "lower": float(low),
+            "upper": float(high),
+        }
+        for name, estimate, stderr, resampled, low, high in zip(
+            result.varnames, result.coeff, result.stderr, spread, lower, upper
+        )
+    ]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Resample arena-matches to get confidence intervals for every coefficient"
+    )
+    parser.add_argument(
+        "--method",
+        choices=["match", "round", "jackknife"],
+        default="match",
+        help="bootstrap single matches, bootstrap whole rounds, or jackknife blocks of rounds",
+    )
+    parser.add_argument("--replicates", type=int, default=200)
+    parser.add_argument(
+        "--blocks",
+        type=int,
+        default=50,
+        help="number of round blocks for --method jackknife",
+    )
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all cores)",
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    matches = load_matches()
+    design = build_design(matches)
+    result = logit.fit(design)
+
+    replicates = args.blocks if args.method == "jackknife" else args.replicates
+    print(f"Fitting {replicates} {args.method} replicates on {args.workers or os.cpu_count()} workers...")
+    samples = resample(
+        design,
+        matches.round,
+        result.coeff,
+        method=args.method,
+        replicates=args.replicates,
+        blocks=args.blocks,
+        seed=args.seed,
+        workers=args.workers,
+    )
+
+    print(f"Intervals from {len(samples)} replicates")
+    print(f"Writing {args.output}...")
+    args.output.write_text(
+        json.dumps(
+            {
+                "method": args.method,
+                "replicates": len(samples),
+                "confidence": args.confidence,
+                "seed": args.seed,
+                "coefficients": confidence_intervals(result, samples, args.method, args.confidence),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
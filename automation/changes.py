@@ -0,0 +1,117 @@
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from archive import HAS_TIMES
+from rounds import Round
+
+CHANGES_PATH = Path("./output/changes.arrow")
+
+# one row per odds change; arena is 0-4 like the history (and the raw JSON),
+# position is 1-4 within the arena (the raw JSON calls it "pirate"), and times
+# are seconds after the round started. round_seconds is how long that round ran
+# (start to its last update), so times before close are round_seconds - seconds
+changes_schema = {
+    "round": pl.UInt32,
+    "arena": pl.UInt8,
+    "position": pl.UInt8,
+    "pirate": pl.UInt8,
+    "old": pl.UInt8,
+    "new": pl.UInt8,
+    "seconds": pl.Int32,
+    "round_seconds": pl.Int32,
+}
+
+
+def parse_changes(round: Round) -> np.ndarray:
+    # a round's changes as a (changes, 8) array in changes_schema column order,
+    # small enough to hand back from a worker process
+    if not round.changes or not round.start or not round.timestamp:
+        return np.empty((0, len(changes_schema)), dtype=np.int32)
+
+    start = datetime.fromisoformat(round.start)
+    round_seconds = (datetime.fromisoformat(round.timestamp) - start).total_seconds()
+    pirates = round.pirates
+    return np.array(
+        [
+            (
+                round.round,
+                change.arena,
+                change.pirate,
+                pirates[change.arena][change.pirate - 1],
+                change.old,
+                change.new,
+                (datetime.fromisoformat(change.t) - start).total_seconds(),
+                round_seconds,
+            )
+            for change in round.changes
+        ],
+        dtype=np.int32,
+    )
+
+
+def build_changes(arrays: list[np.ndarray]) -> pl.DataFrame:
+    if not arrays:
+        return pl.DataFrame(schema=changes_schema)
+    events = np.concatenate(arrays)
+    return pl.DataFrame(
+        {name: events[:, i] for i, name in enumerate(changes_schema)}
+    ).cast(changes_schema)
+
+
+def changes_from_archive(records: np.ndarray, changes: np.ndarray) -> pl.DataFrame:
+    # the same table as parse_changes/build_changes, straight from the packed
+    # archive's arrays (see archive.py) without a per-round loop
+    timed = records[(records["flags"] & HAS_TIMES) != 0]
+    counts = timed["changes_count"].astype(np.intp)
+    owner = np.repeat(np.arange(len(timed)), counts)
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    events = changes[timed["changes_offset"][owner].astype(np.intp) + within]
+
+    start = timed["start"][owner]
+    arena, position = events["arena"].astype(np.intp), events["pirate"].astype(np.intp)
+    return pl.DataFrame({
+        "round": timed["round"][owner],
+        "arena": arena,
+        "position": position,
+        "pirate": timed["pirates"][owner, arena, position - 1],
+        "old": events["old"],
+        "new": events["new"],
+        "seconds": (events["t"] - start) // 1_000_000,
+        "round_seconds": (timed["timestamp"][owner] - start) // 1_000_000,
+    }).cast(changes_schema)
+
+
+def read_changes() -> pl.DataFrame:
+    return pl.read_ipc(CHANGES_PATH)
+
+
+def odds_as_of(
+    changes: pl.DataFrame, history: pl.DataFrame, seconds: int, before_close: bool = False
+) -> pl.DataFrame:
+    # every arena in the history with the odds in force `seconds` after the
+    # round started (or before it closed): the opening odds, overwritten by the
+    # last change at or before that time
+    if before_close:
+        in_force = pl.col("seconds") <= pl.col("round_seconds") - seconds
+    else:
+        in_force = pl.col("seconds") <= seconds
+    latest = (
+        changes.filter(in_force)
+        .group_by(["round", "arena", "position"])
+        .agg(pl.col("new").last())
+    )
+
+    odds = history.select([f"opening_odds{i}" for i in range(1, 5)]).to_numpy().copy()
+    # the history is sorted by round then arena, so each key has a row to find
+    keys = history["round"].to_numpy().astype(np.int64) * 5 + history["arena"].to_numpy()
+    change_keys = latest["round"].to_numpy().astype(np.int64) * 5 + latest["arena"].to_numpy()
+    rows = np.searchsorted(keys, change_keys).clip(max=len(keys) - 1)
+    # changes for unfinished rounds have no history row to land in
+    found = keys[rows] == change_keys
+    odds[rows[found], latest["position"].to_numpy()[found] - 1] = latest["new"].to_numpy()[found]
+
+    return history.select("round", "arena").with_columns(
+        pl.Series(f"odds{i + 1}", odds[:, i]) for i in range(4)
+    )
@@ -0,0 +1,45 @@
+import argparse
+import importlib
+
+# command -> (module whose main() runs it, arguments it always gets, description).
+# modules are only imported once their command is picked, so e.g. `missing`
+# never loads numpy and `export` never loads polars or scipy
+COMMANDS = {
+    "fetch": ("grab_rounds", [], "fetch finished rounds from the CDN into raw_json/"),
+    "missing": ("grab_rounds", ["--dry-run"], "list the rounds missing from raw_json/"),
+    "ingest": ("preprocessing", [], "build output/history.arrow and output/changes.arrow"),
+    "pack": ("archive", [], "pack raw_json/ into a binary round archive"),
+    "fit": ("final", [], "fit the model and write output/"),
+    "export": ("final", ["--export-only"], "rewrite output/ from output/python.py, no refit"),
+    "validate": ("validate", [], "cross-validate the model by round"),
+    "bootstrap": ("bootstrap", [], "bootstrap or jackknife confidence intervals"),
+    "windows": ("windows", [], "fit over sliding round windows"),
+    "spec-search": ("spec_search", [], "rank candidate model specifications"),
+    "backtest": ("backtest", [], "replay a bet strategy over the history"),
+    "optimize": ("optimizer", [], "pick the best bet set for every round"),
+    "outcomes": ("outcomes", [], "profit distribution of each round's bets"),
+    "benchmark": ("benchmark", [], "time every pipeline stage on synthetic rounds"),
+    "synthetic": ("synthetic", [], "write synthetic round files"),
+    "serve-cdn": ("mock_cdn", [], "serve raw_json/ like the CDN does"),
+    "watch": ("watcher", [], "follow the running round's odds live"),
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="NeoFoodClub automation pipeline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n"
+        + "\n".join(f"  {name:12} {help}" for name, (_, _, help) in COMMANDS.items())
+        + "\n\nrun `%(prog)s COMMAND --help` for a command's options",
+    )
+    parser.add_argument("command", choices=COMMANDS, metavar="COMMAND")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    module, fixed, _ = COMMANDS[args.command]
+    importlib.import_module(module).main([*fixed, *args.args])
+
+
+if __name__ == "__main__":
+    main()
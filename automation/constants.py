@@ -1,3 +1,5 @@
+import numpy as np
+
 # fmt: off
 POSITIVE_FAS = {
     1: {1: 2, 2: 0, 3: 0, 4: 1, 5: 0, 6: 1, 7: 1, 8: 1, 9: 0, 10: 1, 11: 0, 12: 2, 13: 0, 14: 0, 15: 0, 16: 0, 17: 0, 18: 0, 19: 0, 20: 0, 21: 0, 22: 0, 23: 0, 24: 0, 25: 1, 26: 0, 27: 0, 28: 0, 29: 0, 30: 0, 31: 0, 32: 0, 33: 2, 34: 0, 35: 0, 36: 0, 37: 0, 38: 0, 39: 0, 40: 0},
@@ -66,3 +68,33 @@ PIRATE_NAMES = {
     20: "Tailhook",
 }
 # fmt: on
+
+
+# dense [pirate, food] versions of the tables above. row and column 0 are
+# padding so ids index directly, and food 0 contributes nothing, which
+# lets rounds without food data go through the same path
+POSITIVE_FA_MATRIX = np.zeros((21, 41), dtype=np.int8)
+NEGATIVE_FA_MATRIX = np.zeros((21, 41), dtype=np.int8)
+for pirate, foods in POSITIVE_FAS.items():
+    for food, value in foods.items():
+        POSITIVE_FA_MATRIX[pirate, food] = value
+for pirate, foods in NEGATIVE_FAS.items():
+    for food, value in foods.items():
+        NEGATIVE_FA_MATRIX[pirate, food] = value
+
+# the most any pirate can be adjusted by the 10 foods in an arena, which bounds
+# the pfa and nfa values the model will ever see
+MAX_PFA = int(np.sort(POSITIVE_FA_MATRIX, axis=1)[:, -10:].sum(axis=1).max())
+MAX_NFA = int(np.sort(NEGATIVE_FA_MATRIX, axis=1)[:, -10:].sum(axis=1).max())
+
+
+def compute_fas(
+    pirates: np.ndarray, foods: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # pirates is (..., 4) and foods is (..., 10) over the same leading dims,
+    # e.g. (rounds, 5) for a whole archive. returns pfa, nfa and fa as (..., 4)
+    pirates = np.asarray(pirates)[..., :, None]
+    foods = np.asarray(foods)[..., None, :]
+    pfa = POSITIVE_FA_MATRIX[pirates, foods].sum(axis=-1, dtype=np.int8)
+    nfa = -NEGATIVE_FA_MATRIX[pirates, foods].sum(axis=-1, dtype=np.int8)
+    return pfa, nfa, pfa + nfa
@@ -0,0 +1,196 @@
+import runpy
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from constants import PIRATE_NAMES
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Gooblah is the reference pirate, so has no intercept of its own
+REFERENCE_PIRATE = 15
+
+pirates_including_the_first = list(range(1, 21))
+pirates_except_goob = [i for i in range(1, 21) if i != REFERENCE_PIRATE]
+
+# Build variable names list in the same order as pylogit specification
+varnames = []
+varnames_with_descriptions = []
+
+# Intercepts (ASC) for all pirates except Goob
+for p in pirates_except_goob:
+    varnames.append(f"asc_{p}")
+    varnames_with_descriptions.append(f"ASC_{p}_{PIRATE_NAMES[p]}")
+
+# PFA for all pirates
+for p in pirates_including_the_first:
+    varnames.append(f"pfa_{p}")
+    varnames_with_descriptions.append(f"PFA_{p}_{PIRATE_NAMES[p]}")
+
+# NFA for all pirates
+for p in pirates_including_the_first:
+    varnames.append(f"nfa_{p}")
+    varnames_with_descriptions.append(f"NFA_{p}_{PIRATE_NAMES[p]}")
+
+# is_pos2, is_pos3 and is_pos4 for all pirates
+for position in range(2, 5):
+    for p in pirates_including_the_first:
+        varnames.append(f"is_pos{position}_{p}")
+        varnames_with_descriptions.append(f"is_pos{position}_{p}_{PIRATE_NAMES[p]}")
+
+# Rather than expanding every alternative into 119 mostly-zero dummy
+# interaction columns, each alternative just looks up which coefficient
+# applies to it. Coefficients that don't exist (Goob's intercept, the
+# position 1 effect) point at an extra slot past the end that stays 0.
+FIXED = len(varnames)
+_slot = {name: i for i, name in enumerate(varnames)}
+
+# indexed by pirate id, and by [pirate id, position - 1] for the positional effects
+ASC_SLOT = np.array([_slot.get(f"asc_{p}", FIXED) for p in range(21)])
+PFA_SLOT = np.array([_slot.get(f"pfa_{p}", FIXED) for p in range(21)])
+NFA_SLOT = np.array([_slot.get(f"nfa_{p}", FIXED) for p in range(21)])
+POSITION_SLOT = np.array([
+    [_slot.get(f"is_pos{position}_{p}", FIXED) for position in range(1, 5)]
+    for p in range(21)
+])
+
+
+HISTORY_PATH = Path("./output/history.arrow")
+
+# published arrays in output/python.py, indexed by pirate id - 1
+PUBLISHED_ARRAYS = {
+    "asc": "LOGIT_INTERCEPTS",
+    "pfa": "LOGIT_PFA",
+    "nfa": "LOGIT_NFA",
+    "is_pos2": "LOGIT_IS_POS2",
+    "is_pos3": "LOGIT_IS_POS3",
+    "is_pos4": "LOGIT_IS_POS4",
+}
+
+
+def load_published_params(path: Path = Path("./output/python.py")) -> np.ndarray:
+    # turns the generated python.py back into a parameter vector ordered like varnames
+    published = runpy.run_path(str(path))
+    params = []
+    for name in varnames:
+        prefix, pirate = name.rsplit("_", 1)
+        params.append(published[PUBLISHED_ARRAYS[prefix]][int(pirate) - 1])
+    return np.array(params)
+
+
+def load_matches(path: Path = HISTORY_PATH) -> "Matches":
+    # written uncompressed by preprocessing.py, so this memory-maps rather than parses
+    import polars as pl
+
+    return Matches.from_history(pl.read_ipc(path))
+
+
+def _stack(df: "pl.DataFrame", name: str) -> np.ndarray:
+    return df.select([f"{name}{i}" for i in range(1, 5)]).to_numpy()
+
+
+@dataclass(frozen=True)
+class Matches:
+    # one row per arena-match, one column per position
+    round: np.ndarray
+    arena: np.ndarray
+    pirates: np.ndarray
+    pfa: np.ndarray
+    nfa: np.ndarray
+    opening_odds: np.ndarray
+    closing_odds: np.ndarray
+    # position (0-3) of the winning pirate
+    winner: np.ndarray
+
+    @classmethod
+    def from_history(cls, df: "pl.DataFrame") -> "Matches":
+        return cls(
+            round=df["round"].to_numpy().astype(np.int64),
+            arena=df["arena"].to_numpy().astype(np.int64),
+            pirates=_stack(df, "pirate").astype(np.intp),
+            pfa=_stack(df, "pfa").astype(np.float64),
+            nfa=_stack(df, "nfa").astype(np.float64),
+            opening_odds=_stack(df, "opening_odds").astype(np.float64),
+            closing_odds=_stack(df, "closing_odds").astype(np.float64),
+            winner=df["winner"].to_numpy().astype(np.intp) - 1,
+        )
+
+    def __len__(self) -> int:
+        return len(self.winner)
+
+    def take(self, index: np.ndarray) -> "Matches":
+        return Matches(**{f.name: getattr(self, f.name)[index] for f in fields(self)})
+
+
+@dataclass(frozen=True)
+class Term:
+    # (matches, 4) index into the parameter vector for each alternative
+    slot: np.ndarray
+    # (matches, 4) value multiplying that parameter, None for a plain dummy
+    value: np.ndarray | None = None
+
+
+@dataclass(frozen=True)
+class Design:
+    terms: list[Term]
+    choice: np.ndarray
+    varnames: list[str]
+
+    @property
+    def n_params(self) -> int:
+        return len(self.varnames)
+
+    def utilities(self, params: np.ndarray) -> np.ndarray:
+        coeff = np.append(params, 0.0)
+        utilities = np.zeros((len(self.choice), 4))
+        for term in self.terms:
+            if term.value is None:
+                utilities += coeff[term.slot]
+            else:
+                utilities += coeff[term.slot] * term.value
+        return utilities
+
+    def probabilities(self, params: np.ndarray) -> np.ndarray:
+        utilities = self.utilities(params)
+        exp_utilities = np.exp(utilities - utilities.max(axis=1, keepdims=True))
+        return exp_utilities / exp_utilities.sum(axis=1, keepdims=True)
+
+    def scatter(self, per_alternative: np.ndarray) -> np.ndarray:
+        # sums a (matches, 4) array into the parameters each alternative uses,
+        # i.e. X.T @ per_alternative without ever building X
+        total = np.zeros(self.n_params + 1)
+        for term in self.terms:
+            values = per_alternative if term.value is None else per_alternative * term.value
+            total += np.bincount(
+                term.slot.ravel(), weights=values.ravel(), minlength=self.n_params + 1
+            )
+        return total[: self.n_params]
+
+    def loglik_gradient(
+        self, params: np.ndarray, weights: np.ndarray | None = None
+    ) -> tuple[float, np.ndarray]:
+        probabilities = self.probabilities(params)
+        rows = np.arange(len(self.choice))
+        loglik = np.log(probabilities[rows, self.choice])
+        residuals = -probabilities
+        residuals[rows, self.choice] += 1.0
+        if weights is not None:
+            loglik = loglik * weights
+            residuals *= weights[:, None]
+        return loglik.sum(), self.scatter(residuals)
+
+
+def build_design(matches: Matches) -> Design:
+    positions = np.arange(4)
+    return Design(
+        terms=[
+            Term(ASC_SLOT[matches.pirates]),
+            Term(PFA_SLOT[matches.pirates], matches.pfa),
+            Term(NFA_SLOT[matches.pirates], matches.nfa),
+            Term(POSITION_SLOT[matches.pirates, positions]),
+        ],
+        choice=matches.winner,
+        varnames=varnames,
+    )
@@ -1,258 +1,96 @@
+import argparse
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import fitcache
+import logit
 import numpy as np
-import polars as pl
-from constants import PIRATE_NAMES
-from xlogit import MultinomialLogit
-
-df = pl.read_csv("./output/history.csv")
-
-
-# combine columns pirate1 through pirate4 into a single column containing a list of pirate choices
-def convert_df(df_orig: pl.DataFrame) -> pl.DataFrame:
-    # Create list columns from scalar columns using pl.concat_list
-    df = df_orig.with_columns([
-        pl.concat_list([
-            pl.col("pirate1"),
-            pl.col("pirate2"),
-            pl.col("pirate3"),
-            pl.col("pirate4"),
-        ]).alias("pirates"),
-        pl.concat_list([
-            pl.col("fa1"),
-            pl.col("fa2"),
-            pl.col("fa3"),
-            pl.col("fa4"),
-        ]).alias("fas"),
-        pl.concat_list([
-            pl.col("pfa1"),
-            pl.col("pfa2"),
-            pl.col("pfa3"),
-            pl.col("pfa4"),
-        ]).alias("pfas"),
-        pl.concat_list([
-            pl.col("nfa1"),
-            pl.col("nfa2"),
-            pl.col("nfa3"),
-            pl.col("nfa4"),
-        ]).alias("nfas"),
-        pl.concat_list([
-            pl.col("opening_odds1"),
-            pl.col("opening_odds2"),
-            pl.col("opening_odds3"),
-            pl.col("opening_odds4"),
-        ]).alias("opening_odds"),
-        pl.concat_list([
-            pl.col("closing_odds1"),
-            pl.col("closing_odds2"),
-            pl.col("closing_odds3"),
-            pl.col("closing_odds4"),
-        ]).alias("closing_odds"),
-        (pl.col("round") * 5 + pl.col("arena")).alias("match_id"),
-    ]).drop([
-        "pirate1",
-        "pirate2",
-        "pirate3",
-        "pirate4",
-        "fa1",
-        "fa2",
-        "fa3",
-        "fa4",
-        "pfa1",
-        "pfa2",
-        "pfa3",
-        "pfa4",
-        "nfa1",
-        "nfa2",
-        "nfa3",
-        "nfa4",
-        "opening_odds1",
-        "opening_odds2",
-        "opening_odds3",
-        "opening_odds4",
-        "closing_odds1",
-        "closing_odds2",
-        "closing_odds3",
-        "closing_odds4",
-    ])
-    return df
-
-
-df = convert_df(df)
-
-
-# explode each row of df into four rows, so that the resulting df
-# contains columns of round, arena, win (0 or 1), pirate, fa, opening_odds, closing_odds, match_id
-def convert_to_long_format_with_win(df: pl.DataFrame):
-    # positional effect is significant but sorta non-linear; this is taken from a model data
-    # and we'll calculate each pirates "suscetibility to positional effects" by fitting a multiplier
-    position_factor = [-0.1856, 0.0, 0.2848, 0.5554]
-
-    # Use polars explode to efficiently expand list columns
-    # Add row index to track position within each original row
-    df = df.with_row_index("_row_idx")
-
-    # Explode all list columns at once - polars will maintain alignment
-    long_format = df.explode([
-        "pirates",
-        "fas",
-        "pfas",
-        "nfas",
-        "opening_odds",
-        "closing_odds",
-    ])
-
-    # Rename exploded columns to singular
-    long_format = long_format.rename({
-        "pirates": "pirate",
-        "fas": "fa",
-        "pfas": "pfa",
-        "nfas": "nfa",
-    })
-
-    # Add position column (1-4) within each original row
-    long_format = long_format.with_columns([
-        (pl.int_range(pl.len()).over("_row_idx") % 4 + 1).alias("position")
-    ])
-
-    # Add position-based columns
-    long_format = long_format.with_columns([
-        pl.when(pl.col("position") == 1)
-        .then(position_factor[0])
-        .when(pl.col("position") == 2)
-        .then(position_factor[1])
-        .when(pl.col("position") == 3)
-        .then(position_factor[2])
-        .otherwise(position_factor[3])
-        .alias("position_factor"),
-        (pl.col("position") == 1).cast(pl.Int32).alias("is_pos1"),
-        (pl.col("position") == 2).cast(pl.Int32).alias("is_pos2"),
-        (pl.col("position") == 3).cast(pl.Int32).alias("is_pos3"),
-        (pl.col("position") == 4).cast(pl.Int32).alias("is_pos4"),
-    ])
-
-    # Add win column if winner exists
-    if "winner" in df.columns:
-        winner_df = df.select(["_row_idx", "winner"])
-        long_format = long_format.join(winner_df, on="_row_idx", how="left")
-        long_format = long_format.with_columns([
-            ((pl.col("winner") == pl.col("position")).cast(pl.Int32)).alias("win")
-        ]).drop("winner")
-    else:
-        long_format = long_format.with_columns([pl.lit(0).cast(pl.Int32).alias("win")])
-
-    # Drop temporary column and add log column
-    long_format = long_format.drop("_row_idx")
-    long_format = long_format.with_columns([
-        (np.log(1.0 / pl.col("opening_odds"))).alias("log_opening_implied_winrate")
-    ])
-
-    return long_format
-
-
-long_format = convert_to_long_format_with_win(df)
-
-pirates_including_the_first = list(range(1, 21))
-pirates_except_the_first = list(range(2, 21))
-pirates_except_goob = [i for i in range(1, 21) if i != 15]
-
-# For xlogit, we need to create interaction variables for each pirate
-# First, create pirate dummy columns
-pirate_dummy_exprs = []
-for p in pirates_including_the_first:
-    col_name = f"is_pirate_{p}"
-    pirate_dummy_exprs.append((pl.col("pirate") == p).cast(pl.Int32).alias(col_name))
-
-# Add pirate dummy columns first
-long_format = long_format.with_columns(pirate_dummy_exprs)
-
-# Now create interaction variables that reference the pirate dummy columns
-interaction_exprs = []
-
-# Create interaction variables for intercepts (ASC) - all pirates except Goob (15)
-for p in pirates_except_goob:
-    interaction_exprs.append(pl.col(f"is_pirate_{p}").alias(f"asc_{p}"))
-
-# Create interaction variables for pfa
-for p in pirates_including_the_first:
-    interaction_exprs.append(
-        (pl.col("pfa") * pl.col(f"is_pirate_{p}")).alias(f"pfa_{p}")
-    )
-
-# Create interaction variables for nfa
-for p in pirates_including_the_first:
-    interaction_exprs.append(
-        (pl.col("nfa") * pl.col(f"is_pirate_{p}")).alias(f"nfa_{p}")
-    )
-
-# Create interaction variables for positional effects
-for p in pirates_including_the_first:
-    interaction_exprs.append(
-        (pl.col("is_pos2") * pl.col(f"is_pirate_{p}")).alias(f"is_pos2_{p}")
-    )
-    interaction_exprs.append(
-        (pl.col("is_pos3") * pl.col(f"is_pirate_{p}")).alias(f"is_pos3_{p}")
-    )
-    interaction_exprs.append(
-        (pl.col("is_pos4") * pl.col(f"is_pirate_{p}")).alias(f"is_pos4_{p}")
-    )
-
-# Add interaction columns
-long_format = long_format.with_columns(interaction_exprs)
-
-# Build variable names list in the same order as pylogit specification
-varnames = []
-varnames_with_descriptions = []
-
-# Intercepts (ASC) for all pirates except Goob
-for p in pirates_except_goob:
-    varnames.append(f"asc_{p}")
-    varnames_with_descriptions.append(f"ASC_{p}_{PIRATE_NAMES[p]}")
-
-# PFA for all pirates
-for p in pirates_including_the_first:
-    varnames.append(f"pfa_{p}")
-    varnames_with_descriptions.append(f"PFA_{p}_{PIRATE_NAMES[p]}")
-
-# NFA for all pirates
-for p in pirates_including_the_first:
-    varnames.append(f"nfa_{p}")
-    varnames_with_descriptions.append(f"NFA_{p}_{PIRATE_NAMES[p]}")
-
-# is_pos2 for all pirates
-for p in pirates_including_the_first:
-    varnames.append(f"is_pos2_{p}")
-    varnames_with_descriptions.append(f"is_pos2_{p}_{PIRATE_NAMES[p]}")
-
-# is_pos3 for all pirates
-for p in pirates_including_the_first:
-    varnames.append(f"is_pos3_{p}")
-    varnames_with_descriptions.append(f"is_pos3_{p}_{PIRATE_NAMES[p]}")
-
-# is_pos4 for all pirates
-for p in pirates_including_the_first:
-    varnames.append(f"is_pos4_{p}")
-    varnames_with_descriptions.append(f"is_pos4_{p}_{PIRATE_NAMES[p]}")
-
-# Fit the model using xlogit
-# Use position (1-4) as the alternative since each match has exactly 4 positions
-model = MultinomialLogit()
-# Convert polars DataFrame columns to numpy arrays for xlogit
-X = long_format.select(varnames).to_numpy()
-y = long_format["win"].to_numpy()
-ids = long_format["match_id"].to_numpy()
-alts = long_format["position"].to_numpy()
-
-model.fit(
-    X=X,
-    y=y,
-    varnames=varnames,
-    ids=ids,
-    alts=alts,
-    fit_intercept=False,  # We're handling intercepts manually via ASC variables
+import scoring
+from design import (
+    HISTORY_PATH,
+    build_design,
+    load_matches,
+    load_published_params,
+    varnames,
 )
-model.summary()
+from instrument import PROFILE_MODES, enable_profiling, stage, write_report
+
+
+def fit(
+    warm_start: bool = False, compare_cold_start: bool = False, cache: bool = True
+) -> logit.LogitResult:
+    # comparing against a cold start needs the real fits, so skips the cache
+    cache = cache and not (warm_start and compare_cold_start)
+    if cache:
+        key = fitcache.fit_key(HISTORY_PATH, warm_start=warm_start)
+        result = fitcache.load(key)
+        if result is not None:
+            print(f"History and model unchanged, using cached fit {key}")
+            result.summary()
+            return result
+
+    with stage("load_matches") as counts:
+        matches = load_matches()
+        counts["matches"] = len(matches)
+
+    # each arena-match keeps just its 4 pirates, positions, pfas and nfas; utilities
+    # are gathered straight from the parameter vector instead of a dense design matrix
+    with stage("build_design", matches=len(matches)):
+        design = build_design(matches)
+
+    with stage("fit", parameters=design.n_params) as counts:
+        if warm_start:
+            # most monthly updates barely move the coefficients, so starting from the
+            # last published ones converges in a handful of newton steps
+            result = logit.fit(design, init=load_published_params())
+        else:
+            result = logit.fit(design)
+        counts["iterations"] = result.iterations
+    result.summary()
+
+    if warm_start:
+        print(f"Warm start: {result.iterations} iterations in {result.fit_time:.3f} seconds")
+    if warm_start and compare_cold_start:
+        cold = logit.fit(design)
+        print(f"Cold start: {cold.iterations} iterations in {cold.fit_time:.3f} seconds")
+        difference = np.abs(cold.coeff - result.coeff).max()
+        print(f"Largest coefficient difference from cold start: {difference:.3g}")
+    if cache:
+        fitcache.store(key, result)
+    return result
+
+
+def fit_mixed(
+    random: list[str], draws: int, chunk: int, workers: int | None, cache: bool = True
+) -> logit.LogitResult:
+    # scipy and the halton machinery only load when a mixed fit is asked for
+    import mixed
+
+    if cache:
+        key = fitcache.fit_key(
+            HISTORY_PATH, code=(Path(mixed.__file__),), random=random, draws=draws
+        )
+        result = fitcache.load(key)
+        if result is not None:
+            print(f"History and model unchanged, using cached mixed fit {key}")
+            result.summary()
+            return result
+
+    # the fixed-coefficient fit is where the means start from, cached like any other
+    init = fit(cache=cache)
+    with stage("load_matches") as counts:
+        matches = load_matches()
+        counts["matches"] = len(matches)
+
+    with stage("fit_mixed", draws=draws, parameters=len(init.coeff) + len(random)) as counts:
+        result = mixed.fit(
+            matches, tuple(random), draws=draws, chunk=chunk, init=init, workers=workers
+        )
+        counts["iterations"] = result.iterations
+    result.summary()
+    if cache:
+        fitcache.store(key, result)
+    return result
 
 
 # Extract parameters as a Series-like object for compatibility with existing code
@@ -275,11 +113,16 @@ class ParamsSeries:
         self.iloc = IlocIndexer(self.coeff)
 
 
-params = ParamsSeries(varnames, model.coeff_)
+def exp_utility_table(params) -> tuple[str, str]:
+    # scoring's exp-utility table as its shape and its values flattened
+    # row-major, one per line like the coefficients
+    table = scoring.Coefficients.from_params(params.coeff).exp_utility_table()
+    return ", ".join(map(str, table.shape)), ",\n    ".join(map(str, table.ravel().tolist()))
 
 
 def generate_javascript(params) -> str:
     sep = ",\n    "
+    shape, table = exp_utility_table(params)
     return f"""
 export const LOGIT_INTERCEPTS = {{
     {sep.join([f"{i + 1}: {params.iloc[i]}" for i in range(14)])}{sep}15: 0.0{sep}{sep.join([f"{i + 2}: {params.iloc[i]}" for i in range(14, 19)])},
@@ -299,11 +142,18 @@ export const LOGIT_IS_POS3 = {{
 export const LOGIT_IS_POS4 = {{
     {sep.join([f"{i - 98}: {params.iloc[i]}" for i in range(99, 119)])},
 }};
+// exp(utility) for [pirate, position - 1, pfa, -nfa] (pirate 0 is padding), flattened
+// row-major: [p, q, f, n] is at ((p * 4 + q) * shape[2] + f) * shape[3] + n
+export const LOGIT_EXP_UTILITY_SHAPE = [{shape}];
+export const LOGIT_EXP_UTILITY = [
+    {table},
+];
 """.lstrip()
 
 
 def generate_python(params) -> str:
     sep = ",\n    "
+    shape, table = exp_utility_table(params)
     return f"""
 LOGIT_INTERCEPTS = [
     {sep.join([f"{params.iloc[i]}" for i in range(14)])}{sep}0.0{sep}{sep.join([f"{params.iloc[i]}" for i in range(14, 19)])},
@@ -323,11 +173,19 @@ LOGIT_IS_POS3 = [
 LOGIT_IS_POS4 = [
     {sep.join([f"{params.iloc[i]}" for i in range(99, 119)])},
 ]
+# exp(utility) for [pirate, position - 1, pfa, -nfa] (pirate 0 is padding), flattened
+# row-major: [p, q, f, n] is at ((p * 4 + q) * shape[2] + f) * shape[3] + n
+LOGIT_EXP_UTILITY_SHAPE = [{shape}]
+LOGIT_EXP_UTILITY = [
+    {table},
+]
 """.lstrip()
 
 
 def generate_rust(params) -> str:
     sep = ",\n    "
+    shape, table = exp_utility_table(params)
+    size = np.prod(scoring.EXP_UTILITY_TABLE_SHAPE)
     return f"""
 static LOGIT_INTERCEPTS: [f64; 20] = [
     {sep.join([f"{params.iloc[i]}" for i in range(14)])}{sep}0.0{sep}{sep.join([f"{params.iloc[i]}" for i in range(14, 19)])},
@@ -347,19 +205,110 @@ static LOGIT_IS_POS3: [f64; 20] = [
 static LOGIT_IS_POS4: [f64; 20] = [
     {sep.join([f"{params.iloc[i]}" for i in range(99, 119)])},
 ];
+// exp(utility) for [pirate, position - 1, pfa, -nfa] (pirate 0 is padding), flattened
+// row-major: [p, q, f, n] is at ((p * 4 + q) * shape[2] + f) * shape[3] + n
+static LOGIT_EXP_UTILITY_SHAPE: [usize; 4] = [{shape}];
+static LOGIT_EXP_UTILITY: [f64; {size}] = [
+    {table},
+];
 """.lstrip()
 
 
-print("Writing output files...")
-print("Creating javascript.js...")
-Path("./output/javascript.js").write_text(
-    generate_javascript(params),
-)
-print("Creating rust.rs...")
-Path("./output/rust.rs").write_text(
-    generate_rust(params),
-)
-print("Creating python.py...")
-Path("./output/python.py").write_text(
-    generate_python(params),
-)
+def write_outputs(coeff: np.ndarray) -> None:
+    params = ParamsSeries(varnames, coeff)
+    print("Writing output files...")
+    with stage("write", files=3):
+        print("Creating javascript.js...")
+        Path("./output/javascript.js").write_text(
+            generate_javascript(params),
+        )
+        print("Creating rust.rs...")
+        Path("./output/rust.rs").write_text(
+            generate_rust(params),
+        )
+        print("Creating python.py...")
+        Path("./output/python.py").write_text(
+            generate_python(params),
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Fit the logit model and write output/")
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="start from the coefficients currently in output/python.py",
+    )
+    parser.add_argument(
+        "--compare-cold-start",
+        action="store_true",
+        help="with --warm-start, also fit from zero and report both",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always refit, even if output/fit_cache/ has this exact fit",
+    )
+    parser.add_argument(
+        "--mixed",
+        action="store_true",
+        help="fit a mixed logit with random coefficients and publish their means",
+    )
+    parser.add_argument(
+        "--random",
+        nargs="+",
+        choices=["pfa", "nfa"],
+        default=["pfa", "nfa"],
+        help="with --mixed, coefficients that vary from round to round",
+    )
+    parser.add_argument(
+        "--draws",
+        type=int,
+        default=1000,
+        help="with --mixed, halton draws per round",
+    )
+    parser.add_argument(
+        "--chunk",
+        type=int,
+        default=50,
+        help="with --mixed, draws each worker makes and holds at once",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="with --mixed, number of worker processes (default: all cores)",
+    )
+    parser.add_argument(
+        "--export-only",
+        action="store_true",
+        help="skip the fit and rewrite every output from the coefficients in output/python.py",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        action="append",
+        default=[],
+        help="profile each stage into output/run_report.json (or set NEOFOODCLUB_PROFILE)",
+    )
+    args = parser.parse_args(argv)
+    if args.compare_cold_start and not args.warm_start:
+        parser.error("--compare-cold-start only applies with --warm-start")
+    enable_profiling(args.profile)
+
+    if args.export_only:
+        coeff = load_published_params()
+    elif args.mixed:
+        # the generators take one coefficient per pirate, so they get the means
+        result = fit_mixed(
+            args.random, args.draws, args.chunk, args.workers, cache=not args.no_cache
+        )
+        coeff = result.coeff[: len(varnames)]
+    else:
+        coeff = fit(args.warm_start, args.compare_cold_start, cache=not args.no_cache).coeff
+    write_outputs(coeff)
+    write_report("final")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+from importlib import metadata
+from pathlib import Path
+
+import design
+import logit
+import numpy as np
+
+CACHE_DIR = Path("./output/fit_cache")
+# an entry is ~115 KB (the 119x119 covariance), so this keeps a few dozen
+MAX_CACHE_BYTES = 4 * 2**20
+
+SUMMARY_FIELDS = ("loglikelihood", "sample_size", "iterations", "converged", "message", "fit_time")
+
+
+def fit_key(history_path: Path, code: tuple[Path, ...] = (), **options) -> str:
+    # everything a fit depends on: the preprocessed history, the model spec and
+    # fit options, and the code that builds the design and runs the fit (plus
+    # any other modules in `code`), and the numpy and scipy versions doing the
+    # arithmetic, scipy's read from its metadata so `export` never imports it.
+    # The output generators aren't in here, so changing them reuses the cached fit
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(history_path.read_bytes())
+    spec = {
+        "varnames": design.varnames,
+        "reference_pirate": design.REFERENCE_PIRATE,
+        "options": options,
+        "versions": [np.__version__, metadata.version("scipy")],
+    }
+    digest.update(json.dumps(spec, sort_keys=True).encode())
+    for path in (Path(design.__file__), Path(logit.__file__), *code):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load(key: str, cache_dir: Path = CACHE_DIR) -> logit.LogitResult | None:
+    path = cache_dir / f"{key}.npz"
+    if not path.exists():
+        return None
+    with np.load(path) as entry:
+        summary = json.loads(str(entry["summary"]))
+        result = logit.LogitResult(
+            varnames=summary.pop("varnames"),
+            coeff=entry["coeff"],
+            covariance=entry["covariance"],
+            **summary,
+        )
+    # eviction goes by least recently used
+    os.utime(path)
+    return result
+
+
+def store(key: str, result: logit.LogitResult, cache_dir: Path = CACHE_DIR) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    summary = {"varnames": list(result.varnames)}
+    summary |= {name: getattr(result, name) for name in SUMMARY_FIELDS}
+    # written under a temporary name and renamed, so a reader never sees half an entry
+    path = cache_dir / f"{key}.npz"
+    partial = cache_dir / f".{key}.tmp.npz"
+    np.savez(
+        partial,
+        coeff=result.coeff,
+        covariance=result.covariance,
+        summary=np.array(json.dumps(summary, default=float)),
+    )
+    os.replace(partial, path)
+    evict(cache_dir)
+
+
+def evict(cache_dir: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES) -> None:
+    # drop the least recently used entries until the cache fits, always keeping the newest
+    entries = sorted(cache_dir.glob("*.npz"), key=lambda path: path.stat().st_mtime)
+    total = sum(path.stat().st_size for path in entries)
+    for path in entries[:-1]:
+        if total <= max_bytes:
+            break
+        total -= path.stat().st_size
+        path.unlink()
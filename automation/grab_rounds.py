@@ -1,35 +1,212 @@
 # /// script
 # requires-python = ">=3.12"
 # dependencies = [
+#     "numpy",
 #     "requests",
 # ]
 # ///
+import argparse
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
+from instrument import PROFILE_MODES, enable_profiling, stage, write_report
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 # directory where this script lives
 SCRIPT_DIR = Path(__file__).resolve().parent
 RAW_JSON_DIR = SCRIPT_DIR / "raw_json"
 
-# grab the current round from the API
-current_round = int(requests.get("https://cdn.neofood.club/current_round.txt").text)
-
-# grab rounds that we don't have
-limit = 90
-previous_round = current_round - 1
-while not (RAW_JSON_DIR / f"{previous_round}.json").exists():
-    print(f"Grabbing round {previous_round}...")
-    r = requests.get(f"https://cdn.neofood.club/rounds/{previous_round}.json")
-    if r.status_code == 200:
-        print(f"Saving round {previous_round}...")
-        (RAW_JSON_DIR / f"{previous_round}.json").write_text(r.text)
+BASE_URL = os.environ.get("NEOFOODCLUB_BASE_URL", "https://cdn.neofood.club")
+
+
+def make_session(workers: int, retries: int, backoff: float) -> requests.Session:
+    # one pooled session shared by every worker thread, retrying transient
+    # failures with exponential backoff
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_current_round(session: requests.Session, base_url: str, timeout: float) -> int:
+    r = session.get(f"{base_url}/current_round.txt", timeout=timeout)
+    r.raise_for_status()
+    return int(r.text)
+
+
+def find_missing_rounds(first: int, last: int, have: set[int]) -> list[int]:
+    return [round for round in range(first, last + 1) if round not in have]
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    # write next to the target and rename over it, so an interrupted run never
+    # leaves a truncated round behind for preprocessing.py to choke on
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        f.write(content)
+    os.replace(f.name, path)
+
+
+def fetch_round(
+    session: requests.Session,
+    base_url: str,
+    round: int,
+    raw_json_dir: Path | None,
+    timeout: float,
+) -> bytes | None:
+    # saves into raw_json_dir when given, otherwise just hands the round back
+    print(f"Grabbing round {round}...")
+    try:
+        r = session.get(f"{base_url}/rounds/{round}.json", timeout=timeout)
+    except requests.RequestException as e:
+        print(f"Round {round} failed: {e}")
+        return None
+    if r.status_code != 200:
+        print(f"Round {round} not found")
+        return None
+    if raw_json_dir is not None:
+        print(f"Saving round {round}...")
+        write_atomic(raw_json_dir / f"{round}.json", r.content)
+    return r.content
+
+
+def grab_rounds(
+    base_url: str = BASE_URL,
+    raw_json_dir: Path = RAW_JSON_DIR,
+    limit: int = 90,
+    start: int | None = None,
+    workers: int = 16,
+    retries: int = 5,
+    backoff: float = 0.5,
+    timeout: float = 10.0,
+    archive: Path | None = None,
+    dry_run: bool = False,
+) -> list[int]:
+    session = make_session(workers, retries, backoff)
+    current_round = get_current_round(session, base_url, timeout)
+
+    if archive is not None:
+        # only needed for the archive, and pulls in numpy
+        from archive import Archive, append_rounds
+        from rounds import get_decoder
+
+        have = set(Archive(archive).records["round"].tolist())
     else:
-        print(f"Round {previous_round} not found")
+        have = {int(path.stem) for path in raw_json_dir.glob("*.json")}
+
+    # the current round is still running, so stop one short of it.
+    # don't go too far back unless asked to, it's a good idea to have a limit
+    first = start if start is not None else current_round - limit
+    missing = find_missing_rounds(first, current_round - 1, have)
+    print(f"Missing {len(missing)} rounds between {first} and {current_round - 1}")
+    if dry_run:
+        print(" ".join(map(str, missing)))
+        return missing
+
+    save_dir = raw_json_dir if archive is None else None
+    with stage("fetch", missing=len(missing)) as counts:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda round: fetch_round(session, base_url, round, save_dir, timeout),
+                missing,
+            )
+            fetched = {round: raw for round, raw in zip(missing, results) if raw is not None}
+        counts["fetched"] = len(fetched)
+        counts["bytes"] = sum(len(raw) for raw in fetched.values())
+
+    if archive is not None:
+        # one append for the whole batch, from this thread only
+        with stage("append_archive", rounds=len(fetched)) as counts:
+            decode = get_decoder(changes=True)
+            added = append_rounds(archive, [decode(raw) for raw in fetched.values()])
+            counts["added"] = added
+        print(f"Added {added} rounds to {archive}")
+    return list(fetched)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Fetch finished rounds into raw_json/")
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help="CDN to fetch from (default: $NEOFOODCLUB_BASE_URL or cdn.neofood.club)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=RAW_JSON_DIR,
+        help="directory to save round files into",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=90,
+        help="how many rounds back from the current round to check",
+    )
+    parser.add_argument(
+        "--start",
+        type=int,
+        default=None,
+        help="first round to check, for backfilling older gaps (overrides --limit)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="maximum concurrent downloads",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=5,
+        help="retries per request on connection errors and 429/5xx responses",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=None,
+        help="append rounds to a packed archive (see archive.py) instead of saving JSON files",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="list the missing rounds without fetching them",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        action="append",
+        default=[],
+        help="profile each stage into output/run_report.json (or set NEOFOODCLUB_PROFILE)",
+    )
+    args = parser.parse_args(argv)
+    enable_profiling(args.profile)
+    if args.archive is None:
+        args.output.mkdir(parents=True, exist_ok=True)
+    grab_rounds(
+        base_url=args.base_url.rstrip("/"),
+        raw_json_dir=args.output,
+        limit=args.limit,
+        start=args.start,
+        workers=args.workers,
+        retries=args.retries,
+        archive=args.archive,
+        dry_run=args.dry_run,
+    )
+    write_report("grab_rounds")
 
-    # don't go too far back
-    # shouldn't happen but it's a good idea to have a limit
-    if previous_round < current_round - limit:
-        break
 
-    previous_round -= 1
+if __name__ == "__main__":
+    main()
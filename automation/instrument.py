@@ -0,0 +1,128 @@
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # not on Windows; stages just go without memory figures there
+    resource = None
+
+REPORT_PATH = Path("./output/run_report.json")
+PROFILE_DIR = Path("./output/profiles")
+
+# "cprofile", "tracemalloc" or both comma-separated; --profile on the CLIs sets it too
+PROFILE = {
+    mode.strip()
+    for mode in os.environ.get("NEOFOODCLUB_PROFILE", "").split(",")
+    if mode.strip()
+}
+PROFILE_MODES = ("cprofile", "tracemalloc")
+
+# how many functions / allocation sites to keep in the report
+TOP = 15
+
+_started = datetime.now(UTC)
+_stages: list[dict] = []
+
+
+def enable_profiling(modes: list[str]) -> None:
+    PROFILE.update(modes)
+
+
+def _peak_rss_mb() -> dict[str, float] | None:
+    # on linux ru_maxrss is in KiB; worker pools show up under children
+    if resource is None:
+        return None
+    scale = 1 / 1024 if sys.platform != "darwin" else 1 / 1024 / 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale,
+    }
+
+
+def _reset_peak_rss() -> None:
+    # linux lets a process reset its high-water mark, so each stage gets its own
+    # peak rather than the peak of everything before it
+    with contextlib.suppress(OSError):
+        Path("/proc/self/clear_refs").write_text("5")
+
+
+def _top_functions(profiler: cProfile.Profile) -> list[dict]:
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:TOP]
+    return [
+        {
+            "function": f"{Path(file).name}:{line}({name})",
+            "calls": calls,
+            "tottime": tottime,
+            "cumtime": cumtime,
+        }
+        for (file, line, name), (_, calls, tottime, cumtime, _) in rows
+    ]
+
+
+def _top_allocations(snapshot: tracemalloc.Snapshot) -> list[dict]:
+    return [
+        {"line": str(stat.traceback), "size_mb": stat.size / 2**20, "count": stat.count}
+        for stat in snapshot.statistics("lineno")[:TOP]
+    ]
+
+
+@contextlib.contextmanager
+def stage(name: str, **counts: int) -> Iterator[dict]:
+    # times a block and records it for the run report; anything the block
+    # assigns into the yielded dict (rows, files, ...) is reported with it
+    _reset_peak_rss()
+    profiler = cProfile.Profile() if "cprofile" in PROFILE else None
+    tracing = "tracemalloc" in PROFILE
+    if tracing:
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield counts
+    finally:
+        record = {
+            "name": name,
+            "seconds": time.perf_counter() - wall,
+            "cpu_seconds": time.process_time() - cpu,
+            "peak_rss_mb": _peak_rss_mb(),
+            "counts": counts,
+        }
+        if profiler is not None:
+            profiler.disable()
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(PROFILE_DIR / f"{Path(sys.argv[0]).stem}-{name}.prof")
+            record["profile"] = _top_functions(profiler)
+        if tracing:
+            record["traced_peak_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+            record["allocations"] = _top_allocations(tracemalloc.take_snapshot())
+            tracemalloc.stop()
+        _stages.append(record)
+        print(f"[{name}] {record['seconds']:.2f}s")
+
+
+def write_report(script: str, path: Path = REPORT_PATH) -> None:
+    # each script in the job (grab_rounds, preprocessing, final) replaces its own
+    # entry, so one file ends up describing the whole run
+    report = json.loads(path.read_text()) if path.exists() else {}
+    peaks = [stage["peak_rss_mb"] for stage in _stages if stage["peak_rss_mb"]]
+    report[script] = {
+        "started": _started.isoformat(timespec="seconds"),
+        "seconds": (datetime.now(UTC) - _started).total_seconds(),
+        # stages reset the high-water mark, so the run's peak is the largest stage peak
+        "peak_rss_mb": max((peak["self"] for peak in peaks), default=None),
+        "stages": _stages,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
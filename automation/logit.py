@@ -0,0 +1,155 @@
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from design import Design
+
+
+@dataclass
+class LogitResult:
+    varnames: list[str]
+    coeff: np.ndarray
+    covariance: np.ndarray
+    loglikelihood: float
+    sample_size: float
+    iterations: int
+    converged: bool
+    message: str
+    fit_time: float
+
+    @property
+    def stderr(self) -> np.ndarray:
+        return np.sqrt(np.diag(self.covariance))
+
+    @property
+    def zvalues(self) -> np.ndarray:
+        return self.coeff / self.stderr
+
+    @property
+    def pvalues(self) -> np.ndarray:
+        # scipy takes over a second to import, so only pay for it when asked
+        from scipy.stats import t
+
+        return 2 * t.cdf(-np.abs(self.zvalues), df=self.sample_size)
+
+    @property
+    def aic(self) -> float:
+        return 2 * len(self.coeff) - 2 * self.loglikelihood
+
+    @property
+    def bic(self) -> float:
+        return np.log(self.sample_size) * len(self.coeff) - 2 * self.loglikelihood
+
+    def summary(self) -> None:
+        # same layout as xlogit's model.summary()
+        if self.converged:
+            print("Optimization terminated successfully.")
+        print(f"    Message: {self.message}")
+        print(f"    Iterations: {self.iterations}")
+        print(f"Estimation time= {self.fit_time:.1f} seconds")
+        print("-" * 75)
+        print(f"{'Coefficient':19} {'Estimate':>13} {'Std.Err.':>13} {'z-val':>13} {'P>|z|':>13}")
+        print("-" * 75)
+        for name, coeff, stderr, z, p in zip(
+            self.varnames, self.coeff, self.stderr, self.zvalues, self.pvalues
+        ):
+            signif = ""
+            if p < 0.001:
+                signif = "***"
+            elif p < 0.01:
+                signif = "**"
+            elif p < 0.05:
+                signif = "*"
+            elif p < 0.1:
+                signif = "."
+            print(f"{name[:19]:19} {coeff:13.7f} {stderr:13.7f} {z:13.7f} {p:13.3g} {signif:3}")
+        print("-" * 75)
+        print("Significance:  0 '***' 0.001 '**' 0.01 '*' 0.05 '.' 0.1 ' ' 1")
+        print()
+        print(f"Log-Likelihood= {self.loglikelihood:.3f}")
+        print(f"AIC= {self.aic:.3f}")
+        print(f"BIC= {self.bic:.3f}")
+
+
+def information(
+    design: Design, probabilities: np.ndarray, weights: np.ndarray | None = None
+) -> np.ndarray:
+    # negative hessian of the log-likelihood,
+    #   sum_n sum_j P_nj x_nj x_nj' - (sum_j P_nj x_nj)(sum_j P_nj x_nj)'
+    # accumulated term pair by term pair straight into the flattened
+    # (params + 1)^2 matrix, the extra row/column being the fixed slot
+    size = design.n_params + 1
+    weighted = probabilities if weights is None else probabilities * weights[:, None]
+    total = np.zeros((size, size))
+    for i, a in enumerate(design.terms):
+        # the matrix is symmetric, so each pair of terms only needs doing once
+        for b in design.terms[i:]:
+            value_a = 1.0 if a.value is None else a.value
+            value_b = 1.0 if b.value is None else b.value
+
+            index = a.slot * size + b.slot
+            values = weighted * value_a * value_b
+            block = np.bincount(index.ravel(), weights=values.ravel(), minlength=size * size)
+
+            index = a.slot[:, :, None] * size + b.slot[:, None, :]
+            values = (weighted * value_a)[:, :, None] * (probabilities * value_b)[:, None, :]
+            block -= np.bincount(index.ravel(), weights=values.ravel(), minlength=size * size)
+
+            block = block.reshape(size, size)
+            total += block if a is b else block + block.T
+    return total[: design.n_params, : design.n_params]
+
+
+def fit(
+    design: Design,
+    init: np.ndarray | None = None,
+    weights: np.ndarray | None = None,
+    tol: float = 1e-10,
+    maxiter: int = 100,
+) -> LogitResult:
+    # newton's method with step halving; the log-likelihood is concave, so
+    # from any reasonable start this converges quadratically in a few steps
+    fit_start = time.perf_counter()
+    params = np.zeros(design.n_params) if init is None else np.array(init, dtype=float)
+    loglik, gradient = design.loglik_gradient(params, weights)
+
+    converged = False
+    message = "Maximum number of iterations reached without convergence"
+    iterations = 0
+    while iterations < maxiter:
+        iterations += 1
+        hessian = information(design, design.probabilities(params), weights)
+        step = np.linalg.solve(hessian, gradient)
+        # newton decrement: the expected increase in log-likelihood from this step
+        decrement = gradient @ step / 2
+
+        step_size = 1.0
+        while True:
+            new_params = params + step_size * step
+            new_loglik, new_gradient = design.loglik_gradient(new_params, weights)
+            if new_loglik >= loglik or step_size < 1e-10:
+                break
+            step_size /= 2
+        if new_loglik < loglik:
+            # no step along the newton direction helps, so stay where we are
+            message = "The line search failed to increase the log-likelihood"
+            break
+
+        params, loglik, gradient = new_params, new_loglik, new_gradient
+        if decrement < tol:
+            converged = True
+            message = "The Newton decrement is within tolerance"
+            break
+
+    covariance = np.linalg.inv(information(design, design.probabilities(params), weights))
+    return LogitResult(
+        varnames=design.varnames,
+        coeff=params,
+        covariance=covariance,
+        loglikelihood=loglik,
+        sample_size=len(design.choice) if weights is None else weights.sum(),
+        iterations=iterations,
+        converged=converged,
+        message=message,
+        fit_time=time.perf_counter() - fit_start,
+    )
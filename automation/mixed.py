@@ -0,0 +1,268 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import logit
+import numpy as np
+from design import Design, Matches, build_design
+from scipy.optimize import minimize
+from scipy.stats import norm
+
+# coefficients that can be random: each round draws one deviation per term,
+# scaled by its standard deviation, on top of every pirate's mean coefficient,
+# so e.g. food counts for more in some rounds than in others
+RANDOM_TERMS = {
+    "pfa": lambda matches: matches.pfa,
+    "nfa": lambda matches: matches.nfa,
+}
+
+# where the standard deviations start; at 0 their gradient vanishes by symmetry
+INITIAL_SD = 0.1
+
+# the first prime bases of the halton sequence, one per random term
+HALTON_BASES = (2, 3, 5, 7, 11, 13)
+# digits of a point's index looked up at once, so a point costs a couple of gathers
+HALTON_TABLE_SIZE = 2**12
+
+# set once per worker process by the pool initializer
+_matches: Matches | None = None
+_halton: list[tuple[int, list[np.ndarray]]] | None = None
+_draws: int = 0
+_blocks: list[tuple[int, int]] | None = None
+_random: tuple[str, ...] = ()
+_chunk: int = 0
+# the design of the block this worker built last; blocks go to whichever
+# worker is free, so keeping every one it has seen would end up as the lot
+_built: tuple[int, tuple] | None = None
+
+
+def halton_tables(terms: int, seed: int = 0) -> list[tuple[int, list[np.ndarray]]]:
+    # scrambled halton, which covers the distribution far more evenly than
+    # random draws, so a few hundred do the job of thousands. point i's k-th
+    # base-b digit goes through its own random permutation of 0..b-1 and lands
+    # at b^-(k+1); the permuted digits are summed from tables `group` digits at
+    # a time, so any point can be made on its own and none need be stored
+    rng = np.random.default_rng(seed)
+    tables = []
+    for base in HALTON_BASES[:terms]:
+        group = int(np.log(HALTON_TABLE_SIZE) / np.log(base))
+        size = base**group
+        # enough digits to fill a double, in whole groups
+        groups = -(-int(53 / np.log2(base)) // group)
+        permutations = rng.permuted(np.tile(np.arange(base), (groups * group, 1)), axis=1)
+        weights = float(base) ** -np.arange(1, groups * group + 1)
+        digits = np.arange(size)[:, None] // base ** np.arange(group) % base
+        parts = [
+            (permutations[k, digits] * weights[k]).sum(axis=1)
+            for k in (np.arange(group) + g * group for g in range(groups))
+        ]
+        tables.append((size, parts))
+    return tables
+
+
+def halton_points(tables: list[tuple[int, list[np.ndarray]]], index: np.ndarray) -> np.ndarray:
+    # (terms, *index.shape) standard normal draws for the given point indices
+    uniform = np.empty((len(tables), *index.shape))
+    for term, (size, parts) in enumerate(tables):
+        remaining = index
+        uniform[term] = 0.0
+        for part in parts:
+            if remaining.any():
+                remaining, digits = np.divmod(remaining, size)
+                uniform[term] += part[digits]
+            else:
+                # past the index's last digit, every digit is a zero
+                uniform[term] += part[0]
+    return norm.ppf(np.clip(uniform, 1e-12, 1 - 1e-12))
+
+
+def _init_worker(
+    matches: Matches,
+    halton: list[tuple[int, list[np.ndarray]]],
+    draws: int,
+    blocks: list[tuple[int, int]],
+    random: tuple[str, ...],
+    chunk: int,
+) -> None:
+    global _matches, _halton, _draws, _blocks, _random, _chunk, _built
+    _matches, _halton, _draws, _blocks = matches, halton, draws, blocks
+    _random, _chunk, _built = random, chunk, None
+
+
+def _block(index: int) -> tuple:
+    global _built
+    if _built is None or _built[0] != index:
+        first, last = _blocks[index]
+        matches = _matches.take(slice(first, last))
+        # which of the block's rounds each match is in, and where each round starts
+        starts = np.flatnonzero(np.diff(matches.round, prepend=-1))
+        round_index = np.cumsum(np.diff(matches.round, prepend=matches.round[0]) != 0)
+        # round r's draws are halton points r * draws onwards, counting the
+        # rounds before the block
+        first_round = np.count_nonzero(np.diff(_matches.round[:first], prepend=-1))
+        offsets = (first_round + np.arange(len(starts))) * _draws
+        # (terms, 4, matches), alternatives first like the utilities
+        values = np.stack([RANDOM_TERMS[term](matches).T for term in _random])
+        _built = index, (build_design(matches), starts, round_index, offsets, values)
+    return _built[1]
+
+
+def _round_scatter(
+    design: Design, per_alternative: np.ndarray, round_index: np.ndarray, n_rounds: int
+) -> np.ndarray:
+    # design.scatter kept apart by round: (rounds, params)
+    size = design.n_params + 1
+    groups = round_index[:, None] * size
+    total = np.zeros(n_rounds * size)
+    for term in design.terms:
+        values = per_alternative if term.value is None else per_alternative * term.value
+        total += np.bincount(
+            (groups + term.slot).ravel(), weights=values.ravel(), minlength=n_rounds * size
+        )
+    return total.reshape(n_rounds, size)[:, :-1]
+
+
+def _simulated_loglik(
+    index: int, params: np.ndarray, per_round: bool = False
+) -> tuple[float, np.ndarray]:
+    # panel log-likelihood of one block of rounds, and its gradient (or with
+    # `per_round`, each round's share of it), averaging each round's
+    # probability over the draws `_chunk` draws at a time. the draws are made
+    # a chunk at a time too, so the (4, matches, chunk) arrays are all there
+    # is, whatever the number of draws.
+    # a round's weight on each draw is only known once every draw is in, so
+    # the gradient is accumulated per match against a running max and rescaled
+    # as it goes, in one pass over the draws. alternatives go first so the
+    # per-match max and sum are elementwise over 4 slabs, not reductions
+    # along a length-4 axis
+    design, starts, round_index, offsets, values = _block(index)
+    means, sds = params[: design.n_params], params[design.n_params :]
+    n_matches, n_rounds, n_draws = len(design.choice), len(starts), _draws
+    chosen_index = (design.choice, np.arange(n_matches))
+
+    base = design.utilities(means).T
+    running_max = np.full(n_rounds, -np.inf)
+    total = np.zeros(n_rounds)
+    residual_sum = np.zeros((4, n_matches))
+    sd_sum = np.zeros((len(sds), n_matches))
+    for start in range(0, n_draws, _chunk):
+        # (terms, matches, chunk): each match gets its round's deviations
+        points = offsets[:, None] + np.arange(start, min(start + _chunk, n_draws))
+        deviations = halton_points(_halton, points)[:, round_index]
+        utilities = np.repeat(base[:, :, None], deviations.shape[2], axis=2)
+        for sd, deviation, value in zip(sds, deviations, values):
+            utilities += (sd * value)[:, :, None] * deviation
+        utilities -= utilities.max(axis=0)
+        probabilities = np.exp(utilities, out=utilities)
+        probabilities /= probabilities.sum(axis=0)
+
+        # log of each round's likelihood under each draw
+        chosen = np.log(probabilities[chosen_index])
+        round_loglik = np.add.reduceat(chosen, starts, axis=0)
+
+        new_max = np.maximum(running_max, round_loglik.max(axis=1))
+        rescale = np.exp(running_max - new_max)
+        weights = np.exp(round_loglik - new_max[:, None])
+        total = total * rescale + weights.sum(axis=1)
+        running_max = new_max
+
+        # probabilities become residuals, 1 - p for the winner and -p otherwise
+        match_weights = weights[round_index]
+        residuals = probabilities
+        residuals *= -1
+        residuals[chosen_index] += 1
+        residual_sum *= rescale[round_index]
+        residual_sum += np.einsum("nc,jnc->jn", match_weights, residuals)
+        sd_sum *= rescale[round_index]
+        for k, (deviation, value) in enumerate(zip(deviations, values)):
+            sd_sum[k] += (
+                np.einsum("jnc,jn->nc", residuals, value) * deviation * match_weights
+            ).sum(axis=1)
+
+    loglik = (running_max + np.log(total / n_draws)).sum()
+    per_match = 1 / total[round_index]
+    residuals = (residual_sum * per_match).T
+    sd_scores = sd_sum * per_match
+    if not per_round:
+        return loglik, np.concatenate([design.scatter(residuals), sd_scores.sum(axis=1)])
+    return loglik, np.column_stack([
+        _round_scatter(design, residuals, round_index, n_rounds),
+        *(np.bincount(round_index, weights=scores, minlength=n_rounds) for scores in sd_scores),
+    ])
+
+
+def round_blocks(rounds: np.ndarray, blocks: int) -> list[tuple[int, int]]:
+    # contiguous [first, last) match ranges holding whole rounds, one per worker
+    starts = np.flatnonzero(np.diff(rounds, prepend=-1))
+    edges = [starts[chunk[0]] for chunk in np.array_split(np.arange(len(starts)), blocks)]
+    return list(zip(edges, [*edges[1:], len(rounds)]))
+
+
+def fit(
+    matches: Matches,
+    random: tuple[str, ...] = ("pfa", "nfa"),
+    draws: int = 1000,
+    chunk: int = 50,
+    seed: int = 0,
+    init: logit.LogitResult | None = None,
+    workers: int | None = None,
+    tol: float = 1e-3,
+    maxiter: int = 500,
+) -> logit.LogitResult:
+    # mixed logit by maximum simulated likelihood. the rounds are split into
+    # one block per worker and each evaluation sums the blocks' log-likelihoods
+    # and gradients. a worker holds the matches, the design of one block and
+    # `chunk` draws of it at a time
+    fit_start = time.perf_counter()
+    if init is None:
+        # the fixed-coefficient fit is the natural start for the means
+        init = logit.fit(build_design(matches))
+    n_rounds = len(np.unique(matches.round))
+    blocks = round_blocks(matches.round, min(workers or os.cpu_count(), n_rounds))
+
+    with ProcessPoolExecutor(
+        max_workers=len(blocks),
+        initializer=_init_worker,
+        initargs=(matches, halton_tables(len(random), seed), draws, blocks, random, chunk),
+    ) as executor:
+
+        def negative_loglik(params: np.ndarray) -> tuple[float, np.ndarray]:
+            futures = [
+                executor.submit(_simulated_loglik, index, params) for index in range(len(blocks))
+            ]
+            parts = [future.result() for future in futures]
+            return -sum(part[0] for part in parts), -sum(part[1] for part in parts)
+
+        start = np.concatenate([init.coeff, np.full(len(random), INITIAL_SD)])
+        result = minimize(
+            negative_loglik,
+            start,
+            jac=True,
+            method="BFGS",
+            options={"gtol": tol, "maxiter": maxiter},
+        )
+
+        # BFGS's inverse hessian is only built up from the steps it took, so
+        # the covariance is the inverse outer product of the rounds' scores
+        # (BHHH), which only needs one more pass
+        futures = [
+            executor.submit(_simulated_loglik, index, result.x, True)
+            for index in range(len(blocks))
+        ]
+        scores = np.concatenate([future.result()[1] for future in futures])
+
+    # a deviation and its negative are the same distribution
+    coeff = result.x.copy()
+    coeff[len(init.coeff) :] = np.abs(coeff[len(init.coeff) :])
+    scores[:, len(init.coeff) :] *= np.where(result.x[len(init.coeff) :] < 0, -1, 1)
+    return logit.LogitResult(
+        varnames=[*init.varnames, *(f"sd_{term}" for term in random)],
+        coeff=coeff,
+        covariance=np.linalg.inv(scores.T @ scores),
+        loglikelihood=-result.fun,
+        sample_size=len(matches),
+        iterations=result.nit,
+        converged=bool(result.success),
+        message=result.message,
+        fit_time=time.perf_counter() - fit_start,
+    )
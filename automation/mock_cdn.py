@@ -0,0 +1,200 @@
+# a local stand-in for cdn.neofood.club that serves round files from a
+# directory, so grab_rounds.py can be exercised without touching the real CDN:
+#
+#   uv run mock_cdn.py --port 8000
+#   uv run grab_rounds.py --base-url http://127.0.0.1:8000 --output /tmp/rounds --start 8000
+#
+# with --replay it plays recorded rounds back as if they were running, for watcher.py:
+#
+#   uv run mock_cdn.py --replay 9150 9151 9152 --replay-step 2
+#   uv run watcher.py --base-url http://127.0.0.1:8000 --interval 0.1
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+RAW_JSON_DIR = SCRIPT_DIR / "raw_json"
+
+ROUND_PATH = re.compile(r"^/rounds/(\d+)\.json$")
+
+
+class Replay:
+    # plays recorded rounds back as if they were live: every request for the
+    # running round reveals `step` more of its recorded changes, with the
+    # current odds rebuilt from the opening odds to match. once they're all
+    # out the recorded file is served as-is (winners and all) and the next
+    # round starts; the last one stays finished
+    def __init__(self, raw_json_dir: Path, rounds: list[int], step: int = 1) -> None:
+        self.raw_json_dir = raw_json_dir
+        self.rounds = rounds
+        self.step = step
+        self.index = 0
+        self.revealed = 0
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        self.raw = (self.raw_json_dir / f"{self.current_round}.json").read_bytes()
+        self.data = json.loads(self.raw)
+
+    @property
+    def current_round(self) -> int:
+        return self.rounds[self.index]
+
+    def live_payload(self) -> bytes:
+        with self.lock:
+            changes = self.data.get("changes") or []
+            if self.revealed >= len(changes):
+                body = self.raw
+                if self.index + 1 < len(self.rounds):
+                    self.index += 1
+                    self.revealed = 0
+                    self._load()
+                return body
+
+            shown = changes[: self.revealed]
+            odds = [row.copy() for row in self.data["openingOdds"]]
+            for change in shown:
+                odds[change["arena"]][change["pirate"]] = change["new"]
+            payload = self.data | {
+                "currentOdds": odds,
+                "changes": shown,
+                "lastChange": shown[-1]["t"] if shown else self.data["start"],
+                "winners": [0] * 5,
+            }
+            self.revealed += self.step
+            return json.dumps(payload, separators=(",", ":")).encode()
+
+
+class MockCDN(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        raw_json_dir: Path,
+        current_round: int | None = None,
+        latency: float = 0.0,
+        fail_rate: float = 0.0,
+        replay: list[int] | None = None,
+        replay_step: int = 1,
+    ) -> None:
+        super().__init__(address, MockCDNHandler)
+        self.raw_json_dir = raw_json_dir
+        self.replay = Replay(raw_json_dir, replay, replay_step) if replay else None
+        if current_round is None:
+            current_round = max(int(p.stem) for p in raw_json_dir.glob("*.json")) + 1
+        self.current_round = current_round
+        self.latency = latency
+        self.fail_rate = fail_rate
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class MockCDNHandler(BaseHTTPRequestHandler):
+    server: MockCDN
+
+    def do_GET(self) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        # fail some requests on purpose to exercise the client's retries
+        if random.random() < self.server.fail_rate:
+            self.send_error(503)
+            return
+
+        replay = self.server.replay
+        if self.path == "/current_round.txt":
+            current_round = replay.current_round if replay else self.server.current_round
+            self.send_body(str(current_round).encode(), "text/plain")
+            return
+
+        match = ROUND_PATH.match(self.path)
+        if match and replay and int(match.group(1)) == replay.current_round:
+            self.send_body(replay.live_payload(), "application/json")
+            return
+        path = match and self.server.raw_json_dir / f"{match.group(1)}.json"
+        if not path or not path.exists():
+            self.send_error(404)
+            return
+        self.send_body(path.read_bytes(), "application/json")
+
+    def send_body(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def start_mock_cdn(
+    raw_json_dir: Path = RAW_JSON_DIR, port: int = 0, **kwargs
+) -> MockCDN:
+    # serves from a background thread; port 0 picks a free port
+    server = MockCDN(("127.0.0.1", port), raw_json_dir, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve round files like the CDN does")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--directory", type=Path, default=RAW_JSON_DIR)
+    parser.add_argument(
+        "--current-round",
+        type=int,
+        default=None,
+        help="round to report as current (default: newest file + 1)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds to wait before answering each request",
+    )
+    parser.add_argument(
+        "--fail-rate",
+        type=float,
+        default=0.0,
+        help="fraction of requests answered with a 503",
+    )
+    parser.add_argument(
+        "--replay",
+        type=int,
+        nargs="+",
+        default=None,
+        metavar="ROUND",
+        help="play these recorded rounds back one after another as if they were running",
+    )
+    parser.add_argument(
+        "--replay-step",
+        type=int,
+        default=1,
+        help="recorded changes revealed per request for the running round",
+    )
+    args = parser.parse_args(argv)
+    server = MockCDN(
+        ("127.0.0.1", args.port),
+        args.directory,
+        current_round=args.current_round,
+        latency=args.latency,
+        fail_rate=args.fail_rate,
+        replay=args.replay,
+        replay_step=args.replay_step,
+    )
+    print(f"Serving {args.directory} at {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
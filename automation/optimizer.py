@@ -0,0 +1,223 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from backtest import BETS_PER_ROUND, round_arrays, top_bets
+from bets import ALL_BETS, MAX_WINNINGS, bet_odds, bet_probabilities
+from constants import compute_fas
+from scoring import Coefficients, score_history
+
+OUTPUT_PATH = Path("./output/optimal_bets.csv")
+
+OBJECTIVES = ("expected_return", "expected_ratio")
+
+# dinkelbach converges in a handful of steps; this just bounds a pathological round
+MAX_ITERATIONS = 50
+
+
+def bet_amounts(odds: np.ndarray, bet_amount: int | None) -> np.ndarray:
+    # NP staked on each of the (rounds, 3124) bets. past the payout cap a bigger
+    # stake wins nothing more, so long shots get just enough to reach it
+    if bet_amount is None:
+        return np.ones_like(odds)
+    return np.minimum(bet_amount, np.ceil(MAX_WINNINGS / odds))
+
+
+def chosen_values(values: np.ndarray, chosen: np.ndarray) -> np.ndarray:
+    # (rounds, 3124) values gathered for the (rounds, count) chosen bets, 0 in
+    # the -1 padding rather than whatever the last bet holds
+    placed = chosen >= 0
+    return np.where(placed, np.take_along_axis(values, np.where(placed, chosen, 0), axis=1), 0)
+
+
+def select_bets(
+    probabilities: np.ndarray,
+    odds: np.ndarray,
+    objective: str = "expected_return",
+    bet_amount: int | None = None,
+    count: int = BETS_PER_ROUND,
+) -> tuple[np.ndarray, np.ndarray]:
+    # probabilities and odds are (rounds, 3124); returns the chosen bet indices
+    # (rounds, count) best first, and the stake on each.
+    #
+    # the expected return of a set is the sum over its bets, so the best set
+    # is just the `count` best bets: one top-k, no set search. a bet that
+    # loses on average only makes the set worse, so where fewer than `count`
+    # bets pay the rest are -1 with a zero stake. the expected
+    # ratio (return over stake) isn't a sum, but for a guessed ratio r the
+    # best set is again a top-k, of return - r * stake; dinkelbach's method
+    # moves r to the chosen set's ratio until the set stops changing, which
+    # is the optimum. rounds that have settled drop out of later steps
+    amounts = bet_amounts(odds, bet_amount)
+    expected = probabilities * np.minimum(amounts * odds, MAX_WINNINGS)
+    if objective == "expected_return":
+        chosen = top_bets(expected - amounts, count)
+        profitable = np.take_along_axis(expected - amounts, chosen, axis=1) > 0
+        chosen = np.where(profitable, chosen, -1)
+        return chosen, chosen_values(amounts, chosen)
+
+    chosen = top_bets(expected, count)
+    active = np.arange(len(chosen))
+    for _ in range(MAX_ITERATIONS):
+        ratio = (
+            np.take_along_axis(expected[active], chosen[active], axis=1).sum(axis=1)
+            / np.take_along_axis(amounts[active], chosen[active], axis=1).sum(axis=1)
+        )
+        update = top_bets(expected[active] - ratio[:, None] * amounts[active], count)
+        changed = (np.sort(update, axis=1) != np.sort(chosen[active], axis=1)).any(axis=1)
+        chosen[active] = update
+        active = active[changed]
+        if not len(active):
+            break
+    # best first by expected return, like top_bets
+    order = np.argsort(-np.take_along_axis(expected, chosen, axis=1), axis=1)
+    chosen = np.take_along_axis(chosen, order, axis=1)
+    return chosen, chosen_values(amounts, chosen)
+
+
+def optimize_round(
+    pirates: np.ndarray,
+    foods: np.ndarray,
+    odds: np.ndarray,
+    coefficients: Coefficients,
+    objective: str = "expected_return",
+    bet_amount: int | None = None,
+    count: int = BETS_PER_ROUND,
+) -> pl.DataFrame:
+    # one round from its (5, 4) pirates, (5, 10) foods and (5, 4) odds
+    pirates = np.asarray(pirates, dtype=np.intp)[None]
+    pfa, nfa, _ = compute_fas(pirates, np.asarray(foods, dtype=np.intp)[None])
+    probabilities = coefficients.probabilities(pirates, pfa, nfa)
+    return _bet_table(
+        np.zeros(1, dtype=np.int64),
+        *_optimize_chunk(probabilities, np.asarray(odds)[None], objective, bet_amount, count),
+    ).drop("round")
+
+
+def _optimize_chunk(
+    probabilities: np.ndarray,
+    odds: np.ndarray,
+    objective: str,
+    bet_amount: int | None,
+    count: int,
+) -> tuple[np.ndarray, ...]:
+    # every one of the 3124 bets scored for every round in the chunk at once,
+    # then only the chosen ones kept
+    all_probabilities = bet_probabilities(probabilities)
+    all_odds = bet_odds(odds)
+    chosen, amounts = select_bets(all_probabilities, all_odds, objective, bet_amount, count)
+    return (
+        chosen,
+        amounts,
+        chosen_values(all_probabilities, chosen),
+        chosen_values(all_odds, chosen),
+    )
+
+
+def _bet_table(
+    rounds: np.ndarray,
+    chosen: np.ndarray,
+    amounts: np.ndarray,
+    probabilities: np.ndarray,
+    odds: np.ndarray,
+) -> pl.DataFrame:
+    # one row per chosen bet, padding left out; the bet is its position (0 for
+    # none) in each arena, the way the site's bet URLs spell it
+    count = chosen.shape[1]
+    placed = chosen.ravel() >= 0
+    bets = ALL_BETS[chosen.ravel()[placed]]
+    return pl.DataFrame({
+        "round": np.repeat(rounds, count)[placed],
+        "rank": np.tile(np.arange(1, count + 1), len(rounds))[placed],
+        "bet": ["".join(map(str, bet)) for bet in bets.tolist()],
+        "amount": amounts.ravel()[placed].astype(np.int64),
+        "probability": probabilities.ravel()[placed],
+        "odds": odds.ravel()[placed],
+    }).with_columns(
+        expected_return=pl.col("probability")
+        * pl.min_horizontal(pl.col("amount") * pl.col("odds"), MAX_WINNINGS),
+    )
+
+
+def optimize_history(
+    df: pl.DataFrame,
+    coefficients: Coefficients,
+    objective: str = "expected_return",
+    bet_amount: int | None = None,
+    count: int = BETS_PER_ROUND,
+    odds: str = "closing",
+    workers: int | None = None,
+) -> pl.DataFrame:
+    rounds, probabilities = score_history(df, coefficients)
+    round_odds, _ = round_arrays(df, odds)
+
+    # a few hundred rounds per chunk keeps the (rounds, 3124, 5) intermediates small
+    chunks = max(workers or os.cpu_count(), len(rounds) // 256, 1)
+    splits = [np.array_split(a, chunks) for a in (probabilities, round_odds)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                _optimize_chunk,
+                *splits,
+                [objective] * chunks,
+                [bet_amount] * chunks,
+                [count] * chunks,
+            )
+        )
+    return _bet_table(rounds, *(np.concatenate(parts) for parts in zip(*results)))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Pick the best set of bets for every round in the preprocessed history"
+    )
+    parser.add_argument("--objective", choices=OBJECTIVES, default="expected_return")
+    parser.add_argument(
+        "--coefficients",
+        type=Path,
+        default=Path("./output/python.py"),
+        help="generated python.py to take the logit coefficients from",
+    )
+    parser.add_argument(
+        "--bet-amount",
+        type=int,
+        default=None,
+        help="most NP per bet, less where the 1,000,000 payout cap is reached "
+        "(default: unit stakes, uncapped)",
+    )
+    parser.add_argument(
+        "--bets", type=int, default=BETS_PER_ROUND, help="bets per round (default: 10)"
+    )
+    parser.add_argument("--odds", choices=["opening", "closing"], default="closing")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all cores)",
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    bets = optimize_history(
+        pl.read_ipc("./output/history.arrow"),
+        Coefficients.from_published(args.coefficients),
+        objective=args.objective,
+        bet_amount=args.bet_amount,
+        count=args.bets,
+        odds=args.odds,
+        workers=args.workers,
+    )
+    totals = bets.group_by("round").agg(pl.col("amount", "expected_return").sum())
+    print(
+        f"{totals.height} rounds, expected ratio "
+        f"{totals['expected_return'].sum() / totals['amount'].sum():.4f}"
+    )
+    print(f"Writing {args.output}...")
+    bets.write_csv(args.output)
+
+
+if __name__ == "__main__":
+    main()
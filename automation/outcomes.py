@@ -0,0 +1,205 @@
+import argparse
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from backtest import BETS_PER_ROUND, round_arrays
+from bets import ALL_BETS, ARENAS, MAX_WINNINGS, bet_odds, bet_probabilities
+from optimizer import OBJECTIVES, chosen_values, select_bets
+from scoring import Coefficients, score_history
+from validate import calibration, implied_probabilities
+
+OUTPUT_PATH = Path("./output/payout_distribution.csv")
+
+# every way a round can end, as the winning position (1-4) in each arena, in
+# the order outcome_index numbers them
+ALL_OUTCOMES = np.array(list(itertools.product(range(1, 5), repeat=5)), dtype=np.intp)
+# (3124, 1024): whether each bet wins under each outcome
+BET_WINS = ((ALL_BETS[:, None, :] == 0) | (ALL_BETS[:, None, :] == ALL_OUTCOMES)).all(axis=-1)
+
+# profit quantiles reported for each bet set
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def outcome_probabilities(probabilities: np.ndarray) -> np.ndarray:
+    # (..., 5, 4) per-arena win probabilities -> (..., 1024); arenas are independent
+    return probabilities[..., ARENAS, ALL_OUTCOMES - 1].prod(axis=-1)
+
+
+def outcome_index(winners: np.ndarray) -> np.ndarray:
+    # (..., 5) winning positions -> index into ALL_OUTCOMES
+    return (winners - 1) @ 4 ** np.arange(4, -1, -1)
+
+
+def payout_matrix(chosen: np.ndarray, returns: np.ndarray) -> np.ndarray:
+    # what a bet set pays under every outcome: chosen bet indices and their
+    # returns when they win, both (..., bets), give (..., 1024). -1 padding
+    # wins nothing
+    placed = chosen >= 0
+    wins = BET_WINS[np.where(placed, chosen, 0)] & placed[..., None]
+    return np.einsum("...k,...ko->...o", returns, wins)
+
+
+def distribution(
+    payouts: np.ndarray, probabilities: np.ndarray, stake: np.ndarray
+) -> dict[str, np.ndarray]:
+    # profit statistics for (..., 1024) payouts, outcome probabilities that
+    # broadcast against them, and the (...) total staked
+    profit = payouts - stake[..., None]
+    expected = (profit * probabilities).sum(axis=-1)
+    variance = (profit**2 * probabilities).sum(axis=-1) - expected**2
+
+    # quantiles from the cumulative probability of the outcomes in profit order
+    order = np.argsort(profit, axis=-1)
+    cumulative = np.take_along_axis(
+        np.broadcast_to(probabilities, profit.shape), order, axis=-1
+    ).cumsum(axis=-1)
+    sorted_profit = np.take_along_axis(profit, order, axis=-1)
+    stats = {
+        "expected_profit": expected,
+        "variance": np.maximum(variance, 0.0),
+        "p_profit": (probabilities * (profit > 0)).sum(axis=-1),
+        # nothing staked, nothing to lose
+        "p_total_loss": (probabilities * ((payouts == 0) & (stake[..., None] > 0))).sum(axis=-1),
+    }
+    for level in QUANTILES:
+        index = np.minimum((cumulative < level).sum(axis=-1), profit.shape[-1] - 1)
+        stats[f"profit_q{round(level * 100):02d}"] = np.take_along_axis(
+            sorted_profit, index[..., None], axis=-1
+        )[..., 0]
+    return stats
+
+
+def _round_distributions(
+    probabilities: np.ndarray,
+    odds: np.ndarray,
+    model: np.ndarray,
+    winners: np.ndarray,
+    objective: str,
+    bet_amount: int | None,
+    count: int,
+) -> dict[str, np.ndarray]:
+    # picks each round's bets with the model's probabilities, then describes
+    # their payouts under `model` (the logit or what the odds imply) next to
+    # what actually happened
+    all_odds = bet_odds(odds)
+    # bets left out are -1 with a zero stake
+    chosen, stake = select_bets(
+        bet_probabilities(probabilities), all_odds, objective, bet_amount, count
+    )
+    returns = np.minimum(stake * chosen_values(all_odds, chosen), MAX_WINNINGS)
+    payouts = payout_matrix(chosen, returns)
+    outcome_probs = outcome_probabilities(model)
+    realized = outcome_index(winners)
+    rows = np.arange(len(realized))
+    stats = distribution(payouts, outcome_probs, stake.sum(axis=1))
+    stats["stake"] = stake.sum(axis=1)
+    stats["realized_profit"] = payouts[rows, realized] - stats["stake"]
+    stats["realized_outcome_log_probability"] = np.log(outcome_probs[rows, realized])
+    return stats
+
+
+def evaluate_history(
+    df: pl.DataFrame,
+    coefficients: Coefficients,
+    objective: str = "expected_return",
+    bet_amount: int | None = None,
+    count: int = BETS_PER_ROUND,
+    model: str = "logit",
+    workers: int | None = None,
+) -> pl.DataFrame:
+    rounds, probabilities = score_history(df, coefficients)
+    odds, winners = round_arrays(df)
+    if model == "logit":
+        outcome_model = probabilities
+    else:
+        outcome_model = implied_probabilities(round_arrays(df, model)[0])
+
+    # a few hundred rounds per chunk keeps the (rounds, 10, 1024) payouts small
+    chunks = max(workers or os.cpu_count(), len(rounds) // 256, 1)
+    splits = [
+        np.array_split(a, chunks) for a in (probabilities, odds, outcome_model, winners)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                _round_distributions,
+                *splits,
+                [objective] * chunks,
+                [bet_amount] * chunks,
+                [count] * chunks,
+            )
+        )
+    return pl.DataFrame(
+        {"round": rounds}
+        | {name: np.concatenate([part[name] for part in results]) for name in results[0]}
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Work out the full profit distribution of every round's chosen bets "
+        "and check it against what happened"
+    )
+    parser.add_argument("--objective", choices=OBJECTIVES, default="expected_return")
+    parser.add_argument(
+        "--model",
+        choices=["logit", "opening", "closing"],
+        default="logit",
+        help="outcome probabilities from the logit, or implied by the opening or closing odds",
+    )
+    parser.add_argument(
+        "--coefficients",
+        type=Path,
+        default=Path("./output/python.py"),
+        help="generated python.py to take the logit coefficients from",
+    )
+    parser.add_argument(
+        "--bet-amount",
+        type=int,
+        default=None,
+        help="most NP per bet, less where the 1,000,000 payout cap is reached "
+        "(default: unit stakes, uncapped)",
+    )
+    parser.add_argument(
+        "--bets", type=int, default=BETS_PER_ROUND, help="bets per round (default: 10)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all cores)",
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    results = evaluate_history(
+        pl.read_ipc("./output/history.arrow"),
+        Coefficients.from_published(args.coefficients),
+        objective=args.objective,
+        bet_amount=args.bet_amount,
+        count=args.bets,
+        model=args.model,
+        workers=args.workers,
+    )
+    profit = results["realized_profit"].to_numpy() > 0
+    print(
+        f"{len(results)} rounds: predicted P(profit) {results['p_profit'].mean():.4f}, "
+        f"realized {profit.mean():.4f}; expected profit {results['expected_profit'].mean():.2f}, "
+        f"realized {results['realized_profit'].mean():.2f}; "
+        f"log-likelihood of the outcomes {results['realized_outcome_log_probability'].sum():.1f}"
+    )
+    for bucket in calibration(results["p_profit"].to_numpy(), profit.astype(np.float64)):
+        print(
+            f"    P(profit) {bucket['low']:.1f}-{bucket['high']:.1f}: {bucket['count']:5d} rounds, "
+            f"predicted {bucket['predicted']:.3f}, realized {bucket['observed']:.3f}"
+        )
+    print(f"Writing {args.output}...")
+    results.write_csv(args.output)
+
+
+if __name__ == "__main__":
+    main()
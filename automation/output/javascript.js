@@ -1,132 +1,9965 @@
 export const LOGIT_INTERCEPTS = {
-    1: -0.5794546137649016,
-    2: -2.3340176069570022,
-    3: -3.474037823978662,
-    4: -1.4578830613659912,
-    5: -1.8102069310612203,
-    6: -2.422310039511212,
-    7: -2.3184881291648933,
-    8: -2.928866300910098,
-    9: -3.9102802356052813,
-    10: -3.5320077355301014,
-    11: -3.1314070773414184,
-    12: -2.3663937896941962,
-    13: -1.715608068650775,
-    14: -2.5531507387746055,
+    1: -0.5794523453896011,
+    2: -2.3340175411354074,
+    3: -3.47403203045831,
+    4: -1.4578821176676036,
+    5: -1.8102060623702128,
+    6: -2.422308829591133,
+    7: -2.3184878231063304,
+    8: -2.9288664091929384,
+    9: -3.9102745494366227,
+    10: -3.5320068937225826,
+    11: -3.131406836313672,
+    12: -2.366392997121365,
+    13: -1.7156066350034416,
+    14: -2.5531508764586817,
     15: 0.0,
-    16: -1.262467332140883,
-    17: -1.103465227110361,
-    18: -2.2579227035112517,
-    19: -0.5650341699607364,
-    20: -1.558154401612824,
+    16: -1.2624664243822439,
+    17: -1.1034644500793653,
+    18: -2.257922416128488,
+    19: -0.5650322292259612,
+    20: -1.5581537420428364,
 };
 export const LOGIT_PFA = {
-    1: 0.15129605892144243,
-    2: 0.2530527649979796,
-    3: 0.23974280606406095,
-    4: 0.17517164487162887,
-    5: 0.26530335015021544,
-    6: 0.28883341735028595,
-    7: 0.23618502676327702,
-    8: 0.27632288797217713,
-    9: 0.33911291319200493,
-    10: 0.20645506433963406,
-    11: 0.16258334490695758,
-    12: 0.2267205822583252,
-    13: 0.2373537543131154,
-    14: 0.24942106458862776,
-    15: 0.2667678760178308,
-    16: 0.1831021036769767,
-    17: 0.15741968373448073,
-    18: 0.18353049785395714,
-    19: 0.253471447136691,
-    20: 0.27045548959604065,
+    1: 0.15129592217833973,
+    2: 0.2530528998422965,
+    3: 0.23974228397776404,
+    4: 0.1751719235097634,
+    5: 0.26530339701299005,
+    6: 0.2888335525794972,
+    7: 0.23618511501160586,
+    8: 0.2763229554825431,
+    9: 0.33911216149142503,
+    10: 0.20645519347207325,
+    11: 0.1625831514170176,
+    12: 0.22672064099745595,
+    13: 0.23735388044555894,
+    14: 0.24942126091966282,
+    15: 0.26676843310755854,
+    16: 0.18310239582256121,
+    17: 0.1574199943865054,
+    18: 0.1835306288149246,
+    19: 0.25347066459601186,
+    20: 0.27045578191872277,
 };
 export const LOGIT_NFA = {
-    1: 0.4696065161547852,
-    2: 0.32395212072128166,
-    3: 0.2890471502222602,
-    4: 0.5181910373170984,
-    5: 0.3804292931289034,
-    6: 0.39126649935517344,
-    7: 0.31072511120701124,
-    8: 0.3044291939500264,
-    9: 0.23833833294864382,
-    10: 0.3437123089907127,
-    11: 0.40922317817650533,
-    12: 0.4675485779040732,
-    13: 0.46902371461304243,
-    14: 0.3603534368675031,
-    15: 0.4832855296602312,
-    16: 0.43249902125801176,
-    17: 0.4720557851980187,
-    18: 0.463493123784612,
-    19: 0.420171654938422,
-    20: 0.3705750455448484,
+    1: 0.4696067377759768,
+    2: 0.32395227130430576,
+    3: 0.2890468667063156,
+    4: 0.5181914999413576,
+    5: 0.3804295557847193,
+    6: 0.3912667455875839,
+    7: 0.31072522282474,
+    8: 0.30442802134745933,
+    9: 0.23834042585234264,
+    10: 0.34371278576263836,
+    11: 0.40922258830165675,
+    12: 0.4675488278325862,
+    13: 0.46902424573617163,
+    14: 0.3603536244377047,
+    15: 0.4832831193248202,
+    16: 0.43249976000645,
+    17: 0.472056339209932,
+    18: 0.46349340198946265,
+    19: 0.42017133250015865,
+    20: 0.3705752905556523,
 };
 export const LOGIT_IS_POS2 = {
-    1: 0.04376402324072572,
-    2: 0.02538118023096806,
-    3: 0.2384139905094721,
-    4: 0.2735844593834547,
-    5: 0.1793367367423826,
-    6: 0.14811293125663813,
-    7: 0.40193527419447694,
-    8: 0.06210568149558645,
-    9: 0.23653557508585984,
-    10: 0.537623959110779,
-    11: 0.5730376051750228,
-    12: 0.3351573750340522,
-    13: 0.37369492849128266,
-    14: 0.20858138294274442,
-    15: 0.16606944424047773,
-    16: 0.08813480508408332,
-    17: 0.07565821843203682,
-    18: 0.43401118190707755,
-    19: 0.21672179670665537,
-    20: 0.0875079874018897,
+    1: 0.04376381633577072,
+    2: 0.02538195442480716,
+    3: 0.23841136372567645,
+    4: 0.27358457485246007,
+    5: 0.17933712045489641,
+    6: 0.148112363516044,
+    7: 0.4019359387862551,
+    8: 0.06210519515342888,
+    9: 0.23653000212294095,
+    10: 0.537623650176727,
+    11: 0.5730382160155869,
+    12: 0.3351577145252598,
+    13: 0.37369509610086243,
+    14: 0.20858179279433461,
+    15: 0.16606753230179555,
+    16: 0.08813475213974098,
+    17: 0.07565856630824697,
+    18: 0.43401191992885346,
+    19: 0.2167214843302673,
+    20: 0.08750832894202283,
 };
 export const LOGIT_IS_POS3 = {
-    1: 0.3524928498440687,
-    2: 0.3843393293695538,
-    3: 0.6484090757422685,
-    4: 0.5600714124680725,
-    5: 0.4562077578067562,
-    6: 0.3215799883521333,
-    7: 0.5903302898393084,
-    8: 0.2600818572454927,
-    9: 0.6099452657297066,
-    10: 0.8491220677783762,
-    11: 0.595170109365996,
-    12: 0.5926666694068489,
-    13: 0.5537704402652582,
-    14: 0.4772478538294615,
-    15: 0.40225534376314526,
-    16: 0.37971456716173024,
-    17: 0.240666666912557,
-    18: 0.6649015928873812,
-    19: 0.5324813774827821,
-    20: 0.5108294958415198,
+    1: 0.3524926379205692,
+    2: 0.3843400271620508,
+    3: 0.6484058286997134,
+    4: 0.5600712212452436,
+    5: 0.45620815847633894,
+    6: 0.32157971068043023,
+    7: 0.5903307659709727,
+    8: 0.2600811030123402,
+    9: 0.609944417541201,
+    10: 0.8491220022753492,
+    11: 0.5951711184840032,
+    12: 0.592666901500265,
+    13: 0.5537704635378919,
+    14: 0.47724860862414875,
+    15: 0.40225676187249404,
+    16: 0.3797151779253642,
+    17: 0.24066667078420684,
+    18: 0.6649023704056742,
+    19: 0.5324812028871033,
+    20: 0.5108296524490828,
 };
 export const LOGIT_IS_POS4 = {
-    1: 0.556254968120439,
-    2: 0.6153941832210503,
-    3: 0.8483294355086128,
-    4: 0.8610947241531649,
-    5: 0.7620600438458967,
-    6: 0.6380752472938512,
-    7: 0.8766237076115079,
-    8: 0.6572134020019397,
-    9: 1.0251541436609148,
-    10: 1.0175029272045701,
-    11: 1.0785825159241023,
-    12: 0.9848969531866039,
-    13: 0.9509999512072826,
-    14: 0.7193771178192622,
-    15: 0.5562556504529854,
-    16: 0.737359077852164,
-    17: 0.5458781702452122,
-    18: 0.9633552191404998,
-    19: 0.7259614979158966,
-    20: 0.7715448357294399,
+    1: 0.5562529209094239,
+    2: 0.6153947945459319,
+    3: 0.8483263357690971,
+    4: 0.8610952491886272,
+    5: 0.7620606348775232,
+    6: 0.6380750262732275,
+    7: 0.8766244091128439,
+    8: 0.6572124229223895,
+    9: 1.0251509747840781,
+    10: 1.0175026887875922,
+    11: 1.0785831208540237,
+    12: 0.9848973314225572,
+    13: 0.9510004897759745,
+    14: 0.7193780027434747,
+    15: 0.5562501088051351,
+    16: 0.7373614030384777,
+    17: 0.5458798065126594,
+    18: 0.9633558545795319,
+    19: 0.7259589013590714,
+    20: 0.7715458341546902,
 };
+// exp(utility) for [pirate, position - 1, pfa, -nfa] (pirate 0 is padding), flattened
+// row-major: [p, q, f, n] is at ((p * 4 + q) * shape[2] + f) * shape[3] + n
+export const LOGIT_EXP_UTILITY_SHAPE = [21, 4, 13, 9];
+export const LOGIT_EXP_UTILITY = [
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.0,
+    0.5602050814664552,
+    0.3502671663831187,
+    0.2190038825154888,
+    0.13693176283727632,
+    0.08561632542015778,
+    0.0535314453459654,
+    0.033470434835473455,
+    0.02092732600129783,
+    0.01308477095434787,
+    0.6517094643380094,
+    0.40748010850095007,
+    0.2547761662362928,
+    0.1592983154953483,
+    0.09960097011633554,
+    0.062275317960941344,
+    0.03893752463059872,
+    0.02434561354322412,
+    0.015222048767071405,
+    0.7581602523060431,
+    0.47403826210285743,
+    0.2963915257414323,
+    0.1853182402231336,
+    0.11586987878107981,
+    0.07244742229678351,
+    0.04529761360469743,
+    0.028322247130821227,
+    0.017708431387567107,
+    0.8819988041153244,
+    0.5514680821210526,
+    0.344804374086779,
+    0.21558828197654042,
+    0.1347961650680766,
+    0.08428104695893146,
+    0.0526965650165656,
+    0.032948427490444805,
+    0.020600941897291242,
+    1.0260652521610196,
+    0.6415453559575416,
+    0.401125018982808,
+    0.25080265854906564,
+    0.15681388733813975,
+    0.09804758611555153,
+    0.061304067555937515,
+    0.03833025215402889,
+    0.023965917577179387,
+    1.1936636385218935,
+    0.746335929665541,
+    0.466645126762409,
+    0.29176898186945055,
+    0.18242800342042154,
+    0.11406276369313359,
+    0.07131752700999644,
+    0.044591148716202414,
+    0.02788053129705091,
+    1.3886376903695472,
+    0.8682430863806168,
+    0.54286734565524,
+    0.33942677989787556,
+    0.2122259513929356,
+    0.1326938742375835,
+    0.08296659359806144,
+    0.05187470554172921,
+    0.03243456141007561,
+    1.6154589725985884,
+    1.0100626635857715,
+    0.6315397677533533,
+    0.3948690439047111,
+    0.2468911219777937,
+    0.15436820650383373,
+    0.09651842880504047,
+    0.060347964843151254,
+    0.0377324507433344,
+    1.8793294393837066,
+    1.1750471732783143,
+    0.7346960200241132,
+    0.45936729530042747,
+    0.287218531529141,
+    0.17958284296187121,
+    0.112283832504018,
+    0.07020525365258426,
+    0.04389570190568015,
+    2.186300736596845,
+    1.3669803955802877,
+    0.854701903823864,
+    0.5344007469032,
+    0.3341330550605056,
+    0.20891605996256207,
+    0.13062437088834958,
+    0.08167264054776242,
+    0.051065663847257935,
+    2.54341299118445,
+    1.5902641565337794,
+    0.9943096525501282,
+    0.6216902274332032,
+    0.388710637470617,
+    0.24304059001642866,
+    0.15196066868635366,
+    0.0950131203435723,
+    0.059406773578068846,
+    2.95885627052172,
+    1.8500192802564288,
+    1.1567210517856719,
+    0.7232376472631638,
+    0.4522029694292071,
+    0.2827390503445208,
+    0.17678205583352846,
+    0.11053264565558946,
+    0.06911032739164995,
+    3.44215841467753,
+    2.152203030709392,
+    1.3456608695415393,
+    0.8413719105387698,
+    0.526066193843357,
+    0.32892189154214,
+    0.20565778984055794,
+    0.1285871436644236,
+    0.0803988680836941,
+    0.5852661786155182,
+    0.3659365699199018,
+    0.22880114740529556,
+    0.14305748415753697,
+    0.08944642107599099,
+    0.0559262054021098,
+    0.034967754025862496,
+    0.021863521989766457,
+    0.013670125723358092,
+    0.6808640627861076,
+    0.425708965973505,
+    0.26617372485286145,
+    0.16642461743795228,
+    0.10405667691159041,
+    0.06506124019735253,
+    0.040679417233495246,
+    0.02543472859473908,
+    0.01590301589068396,
+    0.7920769880983398,
+    0.4952446369322939,
+    0.3096507714471673,
+    0.19360855849294997,
+    0.12105338458074412,
+    0.07568839948254222,
+    0.047324028452981906,
+    0.02958925917749396,
+    0.01850062827053649,
+    0.9214555288873132,
+    0.576138324569524,
+    0.3602293964621393,
+    0.2252327480079275,
+    0.14082634919145012,
+    0.08805140816332013,
+    0.05505397622005741,
+    0.03442239438143656,
+    0.021522536904781606,
+    1.0719668725075764,
+    0.6702452571599636,
+    0.41906957786351823,
+    0.2620224600094309,
+    0.1638290469554283,
+    0.10243380138236198,
+    0.06404654034577789,
+    0.04004497807273285,
+    0.025038046710845755,
+    1.2470628692643093,
+    0.7797236975705065,
+    0.4875207654219448,
+    0.30482143541123674,
+    0.1905890252813104,
+    0.11916542715795152,
+    0.0745079576789754,
+    0.04658595945058519,
+    0.02912778293135213,
+    1.4507591976791616,
+    0.907084441192729,
+    0.5671528292015626,
+    0.3546112324982464,
+    0.2217200016280532,
+    0.13863001116916673,
+    0.0866781519738709,
+    0.05419535038800084,
+    0.033885540205836194,
+    1.6877274606791322,
+    1.0552483989105947,
+    0.6597920632015358,
+    0.41253373813516875,
+    0.25793593859554004,
+    0.16127395717962592,
+    0.10083623633835695,
+    0.06304766582716136,
+    0.039420433671435634,
+    1.963402324856648,
+    1.227613585719939,
+    0.7675630698635328,
+    0.47991735597551194,
+    0.3000674180526632,
+    0.18761658493006478,
+    0.11730691445694527,
+    0.07334592613194908,
+    0.045859401426228734,
+    2.2841061599491184,
+    1.4281330513270447,
+    0.892937486030916,
+    0.5583074722752991,
+    0.34908068982965923,
+    0.21826204029714913,
+    0.1364679273950111,
+    0.08532631318819979,
+    0.05335011574710054,
+    2.657194037038957,
+    1.6614055399986347,
+    1.0387906678482763,
+    0.6495018980191644,
+    0.4060998318403376,
+    0.25391315086793537,
+    0.15875871677048783,
+    0.09926358703540014,
+    0.06206436982845473,
+    3.0912224108850843,
+    1.9327809588702314,
+    1.20846763462152,
+    0.7555921001940002,
+    0.47243252985785295,
+    0.2953875446958562,
+    0.18469050297552464,
+    0.11547738725569497,
+    0.07220201771375817,
+    3.596145354972472,
+    2.2484830735392882,
+    1.405859784005139,
+    0.8790111678145311,
+    0.5496000681813668,
+    0.3436364019082598,
+    0.2148580095835922,
+    0.13433956363722885,
+    0.08399555777891388,
+    0.7969528928923435,
+    0.4982932871717364,
+    0.31155693423645753,
+    0.1948003831674458,
+    0.1217985707016346,
+    0.07615432569354531,
+    0.047615347934134175,
+    0.029771406131442132,
+    0.018614515308579292,
+    0.9271278681905288,
+    0.5796849439777235,
+    0.3624469135312411,
+    0.22661924635629524,
+    0.14169325465829521,
+    0.08859343916489369,
+    0.05539288007740192,
+    0.0346342933764932,
+    0.02165502635018905,
+    1.0785657366220631,
+    0.674371184451944,
+    0.4216493060899771,
+    0.2636354301980536,
+    0.1648375535115459,
+    0.10306436819686748,
+    0.06444080105250677,
+    0.040291488833043405,
+    0.0251921770969374,
+    1.2547395975546594,
+    0.7845235573974029,
+    0.49052186868970193,
+    0.30669786954651584,
+    0.19176226217117978,
+    0.11989899130170217,
+    0.07496661727077918,
+    0.046872735491843155,
+    0.029307089108109845,
+    1.4596898494127664,
+    0.9126683142780923,
+    0.5706441352745694,
+    0.35679416500926026,
+    0.22308487604696575,
+    0.13948339631506698,
+    0.08721172942037576,
+    0.05452896867604629,
+    0.03409413440869735,
+    1.6981168527964996,
+    1.061744346658636,
+    0.6638536422302785,
+    0.4150732327318882,
+    0.25952375278335443,
+    0.16226673499387348,
+    0.1014569687867922,
+    0.06343577761512711,
+    0.03966309983193313,
+    1.9754887292746208,
+    1.2351705871954732,
+    0.7722880707261802,
+    0.48287165381762526,
+    0.3019145871841892,
+    0.18877152393175373,
+    0.11802903788075993,
+    0.07379743243527703,
+    0.04614170488741265,
+    2.2981667681256646,
+    1.4369244199642766,
+    0.8984342726240184,
+    0.5617443276839268,
+    0.35122957716587777,
+    0.2196056280349888,
+    0.13730800308387897,
+    0.08585156892189794,
+    0.053678530899971565,
+    2.6735513171246996,
+    1.6716328983981166,
+    1.0451853043210366,
+    0.6535001323648805,
+    0.408599720293944,
+    0.2554762013897665,
+    0.15973601114947186,
+    0.09987463849525624,
+    0.06244642859664332,
+    3.110251503257473,
+    1.9446788628425968,
+    1.2159067765503826,
+    0.7602434095982697,
+    0.4753407522551576,
+    0.2972059052427639,
+    0.18582742946423297,
+    0.11618824838987699,
+    0.07264648229181955,
+    3.618282675762895,
+    2.2623243914442916,
+    1.4145140418153368,
+    0.8844222261226634,
+    0.5529833221421518,
+    0.34575177504071436,
+    0.21618064262899095,
+    0.13516653744432777,
+    0.08451262158584572,
+    4.209296099692976,
+    2.6318544156141455,
+    1.6455619896858533,
+    1.0288845180165407,
+    0.6433080965951471,
+    0.402227169228547,
+    0.25149177590318333,
+    0.15724475665888993,
+    0.09831698634245688,
+    4.896846167817642,
+    3.0617437937649714,
+    1.9143495093365603,
+    1.1969434057023667,
+    0.7483865978845681,
+    0.4679273031832124,
+    0.2925706602486299,
+    0.18292925130894602,
+    0.11437616798627101,
+    0.9770676131420869,
+    0.6109096749428341,
+    0.3819701174400571,
+    0.23882609263116308,
+    0.14932556217678442,
+    0.09336552498829916,
+    0.058376617702069235,
+    0.03649986967631386,
+    0.0228214743989985,
+    1.1366626827375108,
+    0.7106961899983086,
+    0.4443614470228474,
+    0.27783615330864336,
+    0.17371652874596705,
+    0.10861593064897068,
+    0.06791190496325118,
+    0.04246178998035745,
+    0.026549153779615423,
+    1.322326149132271,
+    0.8267819207894781,
+    0.5169438303802022,
+    0.3232181510609009,
+    0.2020915369052605,
+    0.1263573507696818,
+    0.0790046942985904,
+    0.049397535506983496,
+    0.03088571553661756,
+    1.5383160468221093,
+    0.961829195321795,
+    0.6013818830561494,
+    0.3760128836047247,
+    0.2351013434562335,
+    0.146996669808341,
+    0.0919093894449182,
+    0.057466171710907094,
+    0.035930615044359335,
+    1.7895859213426866,
+    1.1189352085614026,
+    0.6996121203384243,
+    0.43743115345678796,
+    0.2735030003796617,
+    0.17100723308237534,
+    0.10692194866562951,
+    0.06685274593588973,
+    0.04179955280412216,
+    2.081898434644817,
+    1.3017030539808767,
+    0.8138873695979411,
+    0.508881536664803,
+    0.31817721718209885,
+    0.19893970254304685,
+    0.12438667230301813,
+    0.07777253131898375,
+    0.048627127937207006,
+    2.4219575268700195,
+    1.5143243574591274,
+    0.9468284369782296,
+    0.5920026873072561,
+    0.37014855922316486,
+    0.23143468574134204,
+    0.14470409901528447,
+    0.09047596389776937,
+    0.05656992510188548,
+    2.8175621655448784,
+    1.7616754086740347,
+    1.101484213366647,
+    0.6887009186380904,
+    0.43060894525509485,
+    0.2692374276200797,
+    0.16834019179173093,
+    0.10525438614896089,
+    0.06581010563003738,
+    3.277785208301876,
+    2.0494289946799538,
+    1.2814015981269449,
+    0.8011939227680867,
+    0.5009449830707349,
+    0.3132149020760577,
+    0.1958370244196295,
+    0.12244672868157964,
+    0.07655958524315461,
+    3.813181481191863,
+    2.3841845004785704,
+    1.490706844234839,
+    0.9320616315568426,
+    0.5827697701799419,
+    0.3643756952727543,
+    0.2278252134878372,
+    0.1424472833236737,
+    0.08906489416009365,
+    4.436029844688176,
+    2.773619260329602,
+    1.7342001903984243,
+    1.0843053851668674,
+    0.6779598888359902,
+    0.423893136710535,
+    0.26503838104464195,
+    0.16571474587174898,
+    0.10361283105903386,
+    5.1606147989613795,
+    3.226664630915577,
+    2.017465950471044,
+    1.2614167652605128,
+    0.7886984438616097,
+    0.49313220854588646,
+    0.3083299795986582,
+    0.1927827358907199,
+    0.12053704056247659,
+    6.00355408680332,
+    3.7537108244497577,
+    2.3470005849641455,
+    1.4674576714708698,
+    0.9175251303107813,
+    0.5736808503021463,
+    0.35869286532993216,
+    0.22427203482708885,
+    0.1402256650943363,
+    0.09690564158047774,
+    0.07009037400335388,
+    0.050695299549203085,
+    0.0366671377193743,
+    0.026520782015039823,
+    0.019182077534173624,
+    0.013874104403044528,
+    0.01003492831491531,
+    0.007258110747919085,
+    0.12480975746428448,
+    0.09027299584694068,
+    0.0652930824059469,
+    0.04722549163315763,
+    0.03415747852318137,
+    0.02470558375812476,
+    0.017869172293133,
+    0.012924500046944395,
+    0.009348093953274995,
+    0.1607489027907298,
+    0.11626723205659914,
+    0.08409431738206959,
+    0.06082413841686412,
+    0.04399317253917875,
+    0.03181959137337065,
+    0.023014625605066313,
+    0.016646128026164726,
+    0.012039890764178605,
+    0.20703677559679512,
+    0.14974654516864802,
+    0.10830939443153237,
+    0.07833853468147539,
+    0.056661068490417736,
+    0.040982087494099956,
+    0.02964171944018491,
+    0.021439404020039972,
+    0.015506794255375298,
+    0.26665330652564573,
+    0.19286627361206868,
+    0.13949723699911382,
+    0.10089622600127447,
+    0.0729767029103589,
+    0.05278293726863003,
+    0.038177094272488145,
+    0.027612910582690588,
+    0.019971997486386287,
+    0.34343650144327625,
+    0.24840238855001814,
+    0.17966566272963705,
+    0.1299494362856332,
+    0.09399044722510716,
+    0.06798185834494713,
+    0.0491702423009424,
+    0.03556408704901323,
+    0.02572296227235693,
+    0.4423295254066299,
+    0.3199302059491496,
+    0.231400643184673,
+    0.1673685593625726,
+    0.12105512879126865,
+    0.08755733013704657,
+    0.06332888277659415,
+    0.045804815969767605,
+    0.03312992546269442,
+    0.5696989348080984,
+    0.4120545590408246,
+    0.29803278407659545,
+    0.21556257159539466,
+    0.1559131235068335,
+    0.11276958658335313,
+    0.08156452370491445,
+    0.05899437719665832,
+    0.042669734128685896,
+    0.7337445449139294,
+    0.5307062492664885,
+    0.38385174372034697,
+    0.27763411748174954,
+    0.20080852686194028,
+    0.1452417477585885,
+    0.10505114310445977,
+    0.07598189114259761,
+    0.05495654412693827,
+    0.945027319337189,
+    0.6835238606900103,
+    0.49438239358017577,
+    0.35757925236923027,
+    0.2586316248015853,
+    0.18706431344746532,
+    0.13530076761655582,
+    0.09786098363849789,
+    0.07078135835736755,
+    1.2171492660274486,
+    0.8803455184074432,
+    0.6367404996344896,
+    0.46054470136705317,
+    0.3331049651765853,
+    0.24092974578999674,
+    0.1742608140820133,
+    0.12604019161251623,
+    0.09116295011822467,
+    1.5676291102676256,
+    1.1338422494830058,
+    0.8200908226903274,
+    0.5931591963234372,
+    0.4290230087307325,
+    0.31030580518894246,
+    0.22443946076186358,
+    0.16233364218373036,
+    0.11741344991287342,
+    2.0190301189427395,
+    1.4603337210580083,
+    1.0562371293281385,
+    0.7639602217519639,
+    0.552560787927001,
+    0.39965879853576725,
+    0.2890671193775599,
+    0.2090778429284658,
+    0.15122281806989096,
+    0.09939677736597685,
+    0.07189217455955543,
+    0.051998514437458454,
+    0.037609733190956826,
+    0.027202546957302967,
+    0.019675187728856295,
+    0.014230763493335696,
+    0.010292894400506345,
+    0.0074446936869963865,
+    0.1280182193053893,
+    0.09259362740926069,
+    0.0669715598554968,
+    0.04843950879744674,
+    0.03503555864012532,
+    0.025340685727398643,
+    0.01832853187045652,
+    0.013256747829958036,
+    0.009588403712267424,
+    0.16488124573475893,
+    0.11925609274348276,
+    0.08625611477560541,
+    0.06238773353228954,
+    0.04512409706165839,
+    0.032637571848576866,
+    0.02360625841920987,
+    0.017074047025922245,
+    0.012349398056499013,
+    0.21235903250766033,
+    0.15359605249701835,
+    0.11109368442717783,
+    0.08035236921108344,
+    0.058117644320875184,
+    0.04203560659841571,
+    0.030403713755859978,
+    0.021990542898056076,
+    0.015905424608138163,
+    0.2735081148048525,
+    0.19782425199366666,
+    0.14308326721777911,
+    0.1034899470180725,
+    0.0748527018012672,
+    0.05413981868181835,
+    0.03915850592383753,
+    0.02832275067633675,
+    0.020485414010283056,
+    0.35226516141434155,
+    0.254788023784748,
+    0.18428429539695723,
+    0.133290022919774,
+    0.09640664263704385,
+    0.06972945567081786,
+    0.05043425281859441,
+    0.036478326596695566,
+    0.026384217806922437,
+    0.45370041044233955,
+    0.3281545938372392,
+    0.23734921762908368,
+    0.1716710726197526,
+    0.12416707107276824,
+    0.08980815057257319,
+    0.06495686690184692,
+    0.046982312081959667,
+    0.033981590459128054,
+    0.5843440821938941,
+    0.4226471709967775,
+    0.30569425890464824,
+    0.22110399960059024,
+    0.1599211539482218,
+    0.1156685339312269,
+    0.08366128815035451,
+    0.06051093497163347,
+    0.04376663725952607,
+    0.7526067831019079,
+    0.5443490187438241,
+    0.39371935100834854,
+    0.2847712074803734,
+    0.20597067531006447,
+    0.14897545107543178,
+    0.1077516738230741,
+    0.0779351438633696,
+    0.05636930205814996,
+    0.9693209655592211,
+    0.7010950848399821,
+    0.5070913922750092,
+    0.3667714774781187,
+    0.26528022116085864,
+    0.1918731418894276,
+    0.13877891995648112,
+    0.10037667822933911,
+    0.07260092192327039,
+    1.2484383018714236,
+    0.9029764012821753,
+    0.6531090723908938,
+    0.47238384063372507,
+    0.3416680342151375,
+    0.24712328315005047,
+    0.17874050528357657,
+    0.12928028400152694,
+    0.09350645957389017,
+    1.6079278680209053,
+    1.1629897269335547,
+    0.8411727490100315,
+    0.6084074324050492,
+    0.4400518255511036,
+    0.318282780348973,
+    0.2302090853498983,
+    0.1665067237364536,
+    0.12043177621469105,
+    2.0709329607099214,
+    1.4978742556643192,
+    1.0833896260035463,
+    0.7835992088745418,
+    0.5667653680734045,
+    0.40993275492039327,
+    0.29649811548622873,
+    0.21445256918773645,
+    0.1551102756784872,
+    0.1423199603854044,
+    0.10293785881672635,
+    0.07445338481740459,
+    0.05385099879178563,
+    0.03894960689812717,
+    0.028171657194036064,
+    0.02037613039674721,
+    0.014737744644753834,
+    0.010659586142452422,
+    0.1833011932878772,
+    0.13257896014380874,
+    0.09589234176565571,
+    0.06935746968694809,
+    0.05016520102441394,
+    0.03628372553350853,
+    0.026243465823056745,
+    0.018981498957980642,
+    0.013729028975101042,
+    0.23608302988401822,
+    0.17075525831665658,
+    0.12350467654160661,
+    0.08932905070109314,
+    0.06461034126485286,
+    0.046731675368734925,
+    0.03380030874340561,
+    0.024447248298610905,
+    0.017682322191525483,
+    0.30406347061628397,
+    0.21992447527994674,
+    0.15906802197951905,
+    0.11505147657744079,
+    0.08321497996846738,
+    0.06018812706407479,
+    0.04353315521861478,
+    0.031486867854693235,
+    0.022773971753717065,
+    0.39161897493708236,
+    0.28325203747146854,
+    0.20487188279022558,
+    0.1481807111881401,
+    0.10717685057205219,
+    0.07751938296449053,
+    0.056068588534941885,
+    0.040553555769924705,
+    0.02933176897362924,
+    0.5043862099578289,
+    0.3648148603269804,
+    0.26386502978842685,
+    0.19084955553302654,
+    0.13803857554128734,
+    0.09984119839446144,
+    0.07221361751781262,
+    0.052231009231337715,
+    0.03777789313284522,
+    0.6496249290180485,
+    0.4698638128200583,
+    0.3398453364951903,
+    0.245804953661668,
+    0.1777869776520234,
+    0.12859061199453037,
+    0.0930076303197658,
+    0.06727100185250047,
+    0.048656090631280104,
+    0.8366853416491867,
+    0.6051617590356015,
+    0.43770427945732543,
+    0.3165848360289162,
+    0.22898098809478842,
+    0.16561845970435735,
+    0.11978930837475989,
+    0.08664178151709859,
+    0.06266668041000525,
+    1.077610063377305,
+    0.7794189392902097,
+    0.5637418427778481,
+    0.4077458851435893,
+    0.2949163858980135,
+    0.213308528277403,
+    0.1542828083198008,
+    0.11159040444969406,
+    0.08071163923484365,
+    1.3879093978186796,
+    1.0038537198589523,
+    0.7260720998492062,
+    0.5251568866562628,
+    0.37983797430004007,
+    0.2747310192178688,
+    0.19870876012219987,
+    0.14372301846989194,
+    0.10395266935083225,
+    1.7875598623460096,
+    1.292914811375195,
+    0.9351455829174278,
+    0.6763765513056703,
+    0.48921285360607597,
+    0.3538402028742736,
+    0.2559272272738013,
+    0.1851082639225395,
+    0.13388598679951458,
+    2.3022902406255894,
+    1.665211451035147,
+    1.2044220696974792,
+    0.8711401312263384,
+    0.6300823833489327,
+    0.4557289873074652,
+    0.3296218325743474,
+    0.2384104490513092,
+    0.17243864513745916,
+    2.965237955792629,
+    2.1447114320774032,
+    1.5512370998414358,
+    1.1219861581068977,
+    0.8115154924493193,
+    0.5869567906224712,
+    0.4245369031933143,
+    0.3070610734085432,
+    0.2220925957050972,
+    0.17931293728115463,
+    0.1296943153432255,
+    0.0938059221347429,
+    0.0678483941586965,
+    0.0490737096886219,
+    0.03549426648138976,
+    0.02567246211965125,
+    0.018568500679694084,
+    0.013430313613273459,
+    0.23094634994685345,
+    0.1670399759857264,
+    0.12081746944142258,
+    0.08738543475051971,
+    0.06320455346269024,
+    0.04571489047142737,
+    0.03306488371994025,
+    0.02391532658481363,
+    0.01729759132083005,
+    0.2974476764615467,
+    0.215139372172718,
+    0.15560702981270344,
+    0.11254819367834017,
+    0.08140439359008354,
+    0.05887855752450456,
+    0.04258596352456208,
+    0.030801778534750083,
+    0.022278457087312003,
+    0.3830981535440301,
+    0.2770890571896773,
+    0.2004142930577712,
+    0.14495660445497566,
+    0.10484490329768673,
+    0.07583272103283575,
+    0.05484865165945332,
+    0.039671194016068854,
+    0.02869357016161631,
+    0.49341180605194124,
+    0.3568772411989059,
+    0.25812387081863786,
+    0.18669706272824968,
+    0.13503514076714845,
+    0.09766885978567931,
+    0.0706423981020161,
+    0.05109457016857117,
+    0.036955924074674566,
+    0.6354904300614379,
+    0.459640545092182,
+    0.3324510027196052,
+    0.24045674470929262,
+    0.17391869960746018,
+    0.12579274542587213,
+    0.09098397606176392,
+    0.06580732356211902,
+    0.04759743442592154,
+    0.8184807938242938,
+    0.591994686976654,
+    0.4281807368638397,
+    0.30969660278132005,
+    0.22399883394285083,
+    0.16201494351937173,
+    0.11718294002495616,
+    0.08475663500293475,
+    0.061303182660298584,
+    1.054163490384081,
+    0.7624603902997754,
+    0.5514759826905734,
+    0.3988741754374426,
+    0.2884996134458483,
+    0.2086673745351498,
+    0.15092593253531475,
+    0.1091624273435105,
+    0.0789555203890419,
+    1.357711351131969,
+    0.9820119328182618,
+    0.7102742680861067,
+    0.5137305556536643,
+    0.37157348318893035,
+    0.26875343872330065,
+    0.19438526723090635,
+    0.1405959019387048,
+    0.10169087361171679,
+    1.748666245613351,
+    1.26478365101472,
+    0.9147987432633448,
+    0.6616599922087824,
+    0.4785685906475906,
+    0.34614136966309567,
+    0.2503587785193212,
+    0.18108068978490904,
+    0.13097290379393625,
+    2.252197152213595,
+    1.628979883455421,
+    1.1782163289276624,
+    0.8521859182245493,
+    0.6163730898901888,
+    0.4458132642373372,
+    0.322449941163652,
+    0.23322312927210295,
+    0.16868673578037996,
+    2.900720492068437,
+    2.0980469336186527,
+    1.5174853791334468,
+    1.0975740527939677,
+    0.7938585886438628,
+    0.5741858211383272,
+    0.4152998555567667,
+    0.30038005759797515,
+    0.2172603187679888,
+    3.7359870404044306,
+    2.7021825010689833,
+    1.9544474298532328,
+    1.413622046086365,
+    1.022451286567203,
+    0.7395234364780555,
+    0.5348860334818176,
+    0.38687491795589907,
+    0.2798207333422015,
+    0.030991818445031714,
+    0.02321216237986211,
+    0.017385378121801087,
+    0.013021250131363047,
+    0.009752618194188397,
+    0.007304487716776407,
+    0.005470894045286425,
+    0.004097574370069505,
+    0.003068989378932751,
+    0.03938817059436784,
+    0.029500837884159224,
+    0.02209545207951062,
+    0.016548987676722863,
+    0.012394812839257873,
+    0.009283431006255657,
+    0.00695307725623302,
+    0.0052076956567638985,
+    0.0039004448036538105,
+    0.050059275660855336,
+    0.03749325123722549,
+    0.028081586674594157,
+    0.021032465420864867,
+    0.01575283500914464,
+    0.011798512721155292,
+    0.008836815871584625,
+    0.006618572746738835,
+    0.0049571594384730435,
+    0.06362141327903734,
+    0.04765098177406476,
+    0.03568949425995223,
+    0.02673061400015955,
+    0.020020617821623402,
+    0.014994984326103104,
+    0.011230899912450628,
+    0.008411686874784675,
+    0.006300160862531055,
+    0.08085782653038316,
+    0.06056066062838139,
+    0.04535854812233727,
+    0.03397251394583035,
+    0.025444635059455836,
+    0.019057449040751726,
+    0.014273592963396805,
+    0.010690594299849419,
+    0.00800701034259943,
+    0.10276395594267212,
+    0.07696784996237287,
+    0.05764715724971828,
+    0.04317640080369077,
+    0.032338135569903746,
+    0.024220523079081693,
+    0.018140617196567545,
+    0.013586906905269019,
+    0.010176282165712435,
+    0.13060492835556584,
+    0.09782010081069152,
+    0.07326501567049074,
+    0.054873819150783036,
+    0.04109923407012458,
+    0.03078238524840831,
+    0.02305530171108985,
+    0.017267893072609366,
+    0.012933256519633514,
+    0.16598862075997015,
+    0.12432167622314667,
+    0.09311408883433686,
+    0.06974032045615645,
+    0.052233903141989904,
+    0.039121997427041214,
+    0.029301480276534272,
+    0.021946137796192308,
+    0.016437154697442728,
+    0.2109585187075602,
+    0.15800310008721252,
+    0.1183407040877891,
+    0.08863447765432209,
+    0.06638519425426631,
+    0.04972099044080928,
+    0.037239883353300134,
+    0.02789181993102767,
+    0.02089033447511944,
+    0.2681117320665182,
+    0.20080954822680896,
+    0.15040175358328092,
+    0.11264746960825041,
+    0.08437037539003997,
+    0.0631914792956424,
+    0.04732897106491951,
+    0.03544831561204581,
+    0.026549976715268098,
+    0.3407489837912496,
+    0.25521318655644937,
+    0.19114883298433966,
+    0.14316609907299335,
+    0.10722813005851507,
+    0.08031141415666865,
+    0.06015141027195191,
+    0.04505202897618563,
+    0.03374293812388793,
+    0.4330652338852616,
+    0.32435594406462287,
+    0.24293517516099378,
+    0.18195288358502965,
+    0.1362785435372517,
+    0.10206950867011501,
+    0.07644772485634078,
+    0.05725759545486996,
+    0.0428846279393444,
+    0.5503919475075846,
+    0.4122309660781675,
+    0.3087515545299607,
+    0.2312478447011941,
+    0.1731993406814035,
+    0.1297223403367702,
+    0.09715906259368134,
+    0.07276991318207918,
+    0.05450299872357688,
+    0.03933578295005257,
+    0.02946160073811368,
+    0.022066064355555446,
+    0.01652697694438614,
+    0.012378327304728627,
+    0.009271083718370942,
+    0.006943829420329507,
+    0.005200769239424585,
+    0.0038952570756643702,
+    0.04999269507362755,
+    0.03744338390192153,
+    0.028044237182289287,
+    0.021004491506338877,
+    0.015731883187697655,
+    0.011782820286636039,
+    0.008825062597447378,
+    0.006609769813530752,
+    0.004950566243065434,
+    0.06353679457450241,
+    0.04758760430192571,
+    0.03564202598450637,
+    0.026695061348755905,
+    0.019993989699789258,
+    0.01497504047256701,
+    0.011215962422816675,
+    0.00840049903708016,
+    0.006291781428263997,
+    0.08075028279345756,
+    0.060480112831907885,
+    0.04529821966712257,
+    0.03392732931424594,
+    0.025410792805014657,
+    0.01903210196707863,
+    0.01425460858560054,
+    0.010676375435574974,
+    0.00799636073883447,
+    0.10262727628755955,
+    0.07686548003031729,
+    0.057570484514625174,
+    0.04311897468072074,
+    0.0322951247187144,
+    0.024188308936382266,
+    0.01811648954130932,
+    0.013568835843943831,
+    0.010162747354562175,
+    0.13043121923353082,
+    0.09768999665579362,
+    0.07316757063753337,
+    0.05480083505234659,
+    0.04104457065154979,
+    0.030741443599551953,
+    0.023024637353558235,
+    0.017244926170955622,
+    0.012916054836179703,
+    0.1657678500896512,
+    0.12415632404617635,
+    0.09299024383993919,
+    0.06964756339109454,
+    0.05216443022416434,
+    0.03906996380234668,
+    0.02926250828307851,
+    0.021916948665455543,
+    0.016415292706879293,
+    0.21067793650035027,
+    0.15779295043864613,
+    0.1181833068129165,
+    0.0885165906994482,
+    0.06629689962438347,
+    0.04965485978475419,
+    0.0371903530061422,
+    0.027854722835127986,
+    0.020862549599721694,
+    0.26775513408686336,
+    0.2005424645052532,
+    0.1502017139913878,
+    0.11249764453433092,
+    0.08425815984029536,
+    0.06310743241834033,
+    0.04726602187828449,
+    0.03540116811263579,
+    0.026514664317770328,
+    0.3402957757266385,
+    0.25487374409339175,
+    0.1908945983518966,
+    0.1429756831546335,
+    0.10708551289571394,
+    0.08020459716730849,
+    0.06007140679276418,
+    0.04499210820215448,
+    0.033698058836175104,
+    0.43248924197967825,
+    0.32392453931612125,
+    0.2426120628824605,
+    0.1817108798868748,
+    0.13609728830861575,
+    0.10193375265416003,
+    0.07634604670886525,
+    0.05718144085058716,
+    0.04282758988448738,
+    0.5496599069699076,
+    0.4116826844773529,
+    0.3083409041652339,
+    0.23094027698088448,
+    0.17296897950142648,
+    0.12954980508766478,
+    0.09702983764272896,
+    0.07267312665274542,
+    0.0544305078292764,
+    0.6985746326248821,
+    0.5232164042165383,
+    0.39187710640544265,
+    0.29350697968779116,
+    0.21983000720721105,
+    0.16464764183845612,
+    0.12331731371601064,
+    0.09236184431389233,
+    0.06917690653486978,
+    0.059271529270116856,
+    0.04439301825289505,
+    0.033249354181847775,
+    0.024903004954790676,
+    0.01865178049433815,
+    0.013969756510932567,
+    0.010463027754051835,
+    0.007836568210504267,
+    0.005869410151770272,
+    0.07532946511096666,
+    0.05642004451094823,
+    0.042257321460177966,
+    0.031649766186240914,
+    0.023704950172662945,
+    0.0177544648949956,
+    0.013297687673317729,
+    0.009959663583381127,
+    0.007459559972457933,
+    0.09573784216101358,
+    0.0717054516204198,
+    0.053705741387413054,
+    0.0402243705714325,
+    0.03012713252008348,
+    0.022564532421230323,
+    0.016900318111899206,
+    0.012657951290612859,
+    0.009480515681105282,
+    0.12167528878832796,
+    0.09113200524133988,
+    0.06825578522978022,
+    0.051122020249594,
+    0.038289222599986114,
+    0.02867775099953978,
+    0.021478978849570656,
+    0.016087263343199657,
+    0.012048991885786455,
+    0.15463974921038975,
+    0.11582163129340849,
+    0.08674774981182506,
+    0.0649720783016053,
+    0.04866259894910256,
+    0.03644717236054136,
+    0.027298097548559063,
+    0.020445650005414526,
+    0.01531332369958406,
+    0.1965349930457383,
+    0.14720020962932817,
+    0.11024958649412384,
+    0.08257441584311126,
+    0.061846346717994126,
+    0.04632149756444737,
+    0.034693741028826525,
+    0.02598481763031577,
+    0.0194620334174901,
+    0.24978056216928496,
+    0.18707992171192364,
+    0.14011857769788955,
+    0.10494560632921285,
+    0.07860185614753076,
+    0.058870990467728895,
+    0.04409302386124762,
+    0.03302466525162837,
+    0.024734718090873326,
+    0.3174515045424218,
+    0.23776390805333683,
+    0.17807972293053392,
+    0.13337763489276847,
+    0.09989679451898116,
+    0.07482041170688515,
+    0.056038775167346455,
+    0.04197175945193877,
+    0.03143588678072866,
+    0.40345596495194147,
+    0.30217927961209173,
+    0.22632536127643965,
+    0.16951251330887485,
+    0.1269609910539121,
+    0.09509087520884293,
+    0.07122088818717613,
+    0.053342814471209504,
+    0.03995254662131866,
+    0.5127608889109864,
+    0.38404616484684856,
+    0.2876417837694653,
+    0.21543710976276598,
+    0.16135746223897907,
+    0.120853044532922,
+    0.09051616312138668,
+    0.06779453358318624,
+    0.05077655332780921,
+    0.6516788746154828,
+    0.4880925552635769,
+    0.3655701477883504,
+    0.27380367004743184,
+    0.20507267944330754,
+    0.15359474124934955,
+    0.1150389442586694,
+    0.08616153514438953,
+    0.06453301693855218,
+    0.8282327392833312,
+    0.6203273572559485,
+    0.46461098663296174,
+    0.3479829905534675,
+    0.2606312919806098,
+    0.19520686988591374,
+    0.1462054757933326,
+    0.10950455362789094,
+    0.08201640328570019,
+    1.052618854379038,
+    0.7883874195793628,
+    0.5904841251562746,
+    0.4422590891260056,
+    0.3312419311235496,
+    0.2480926217961737,
+    0.18581569302209452,
+    0.13917169935689636,
+    0.1042364161329651,
+    0.07238865471586264,
+    0.054217444862250164,
+    0.040607624757350164,
+    0.03041418112976933,
+    0.02277952525718667,
+    0.01706134282322994,
+    0.012778555112334685,
+    0.009570845182047722,
+    0.007168343892832375,
+    0.0920003027928899,
+    0.0689061202140395,
+    0.05160910626175252,
+    0.038654038870036087,
+    0.028950990032423088,
+    0.02168362862870683,
+    0.016240541341802334,
+    0.012163793597055375,
+    0.009110402883611349,
+    0.11692516938194575,
+    0.08757427457186527,
+    0.06559112642151661,
+    0.049126251816255746,
+    0.03679443774154302,
+    0.027558191367416857,
+    0.020640454320238238,
+    0.015459227670853318,
+    0.011578607547651991,
+    0.14860271999075725,
+    0.11130003464083947,
+    0.08336117745235454,
+    0.06243561314843568,
+    0.046762844628114225,
+    0.035024299873764285,
+    0.026232398636199757,
+    0.019647465921908698,
+    0.014715502097466072,
+    0.18886240238417973,
+    0.14145361490704067,
+    0.1059455186298395,
+    0.0793507675651984,
+    0.05943190797135544,
+    0.044513138227849865,
+    0.03333932129264061,
+    0.024970388260751708,
+    0.018702249047593055,
+    0.24002930119006133,
+    0.179776450518079,
+    0.13464844500500314,
+    0.10084860219465794,
+    0.07553329386194146,
+    0.056572707578257525,
+    0.042371662601988554,
+    0.03173540508332964,
+    0.023769091745664918,
+    0.30505841661693944,
+    0.2284817689680028,
+    0.1711276132934894,
+    0.12817066396062063,
+    0.09599689251747041,
+    0.0718994744057979,
+    0.05385106001102261,
+    0.04033321089308145,
+    0.030208651428826214,
+    0.3877053221729227,
+    0.2903824088211041,
+    0.21748977517295448,
+    0.16289486163028388,
+    0.12200452147439168,
+    0.09137859298459294,
+    0.06844047380323147,
+    0.051260347762200564,
+    0.03839282673957285,
+    0.4927430572419191,
+    0.369053267285214,
+    0.27641244679581994,
+    0.207026593493359,
+    0.155058178133072,
+    0.1161350249755171,
+    0.0869824745037895,
+    0.06514788172127574,
+    0.04879427168497519,
+    0.6262377805374113,
+    0.46903775833680245,
+    0.3512985411975957,
+    0.2631145634952084,
+    0.19706678338961425,
+    0.14759850842021663,
+    0.11054790316844883,
+    0.08279784820147172,
+    0.06201369243836149,
+    0.7958991040230523,
+    0.5961102048057298,
+    0.44647289396023365,
+    0.3343979744587489,
+    0.25045642598870477,
+    0.18758612823707066,
+    0.14049771479435574,
+    0.10522957133317071,
+    0.07881453943340373,
+    1.0115253398494932,
+    0.7576093181358856,
+    0.5674320319169898,
+    0.4249935991253121,
+    0.31831047444975674,
+    0.2384072568456588,
+    0.17856157644489776,
+    0.1337385321417814,
+    0.10016709829484358,
+    1.2855693742909367,
+    0.9628620250065618,
+    0.7211616095872586,
+    0.5401335327758318,
+    0.4045476483362366,
+    0.30299692547009777,
+    0.22693775930203205,
+    0.1699711854076538,
+    0.12730452595344866,
+    0.23272864504010032,
+    0.13861241559802082,
+    0.08255709886768721,
+    0.04917073657539229,
+    0.02928592899372015,
+    0.01744260299436802,
+    0.010388756978970208,
+    0.006187509490581776,
+    0.003685260303377949,
+    0.27728478557716585,
+    0.16514990636759666,
+    0.09836274109469914,
+    0.05858452510489073,
+    0.03489275048223045,
+    0.020782007433453684,
+    0.012377695280401294,
+    0.007372114601780202,
+    0.004390807211729878,
+    0.33037124544478347,
+    0.19676802727630546,
+    0.11719438992362288,
+    0.06980059321468869,
+    0.041573003761508305,
+    0.024760744316864643,
+    0.014747417883063751,
+    0.008783513590485157,
+    0.005231431807654836,
+    0.3936211631285598,
+    0.23443947023517964,
+    0.13963137745772242,
+    0.08316398920020797,
+    0.0495321984615271,
+    0.02950121450434189,
+    0.01757082633647267,
+    0.010465126379832379,
+    0.006232994854574914,
+    0.46898034317146947,
+    0.27932315003073727,
+    0.16636394953245928,
+    0.09908582121099892,
+    0.05901518924412438,
+    0.035149252627208485,
+    0.020934779267429468,
+    0.012468685682287909,
+    0.007426308185898587,
+    0.5587671164149125,
+    0.3327998568876906,
+    0.1982145002645891,
+    0.11805590447834706,
+    0.07031370845017075,
+    0.04187861350825031,
+    0.024942764476948105,
+    0.014855828491789473,
+    0.008848082592506095,
+    0.6657436605450257,
+    0.39651473475177246,
+    0.23616287197771235,
+    0.1406578298677261,
+    0.08377534087985404,
+    0.04989631751133744,
+    0.02971808261290999,
+    0.017699992268709427,
+    0.010542057184277281,
+    0.7932009750315752,
+    0.47242789208387953,
+    0.2813764988248196,
+    0.1675869173212503,
+    0.09981421680395947,
+    0.05944901926377589,
+    0.03540764036015159,
+    0.021088674151396043,
+    0.012560344969055587,
+    0.9450601246070591,
+    0.5628747021432603,
+    0.33524632143864497,
+    0.19967160650531107,
+    0.11892375216325335,
+    0.07083059567716116,
+    0.04218646984072953,
+    0.0251261226961082,
+    0.014965036044100676,
+    1.1259928659149174,
+    0.670637647822477,
+    0.3994295774790897,
+    0.23789894271989426,
+    0.1416918278922556,
+    0.08439118670269598,
+    0.050263113258055096,
+    0.029936544953353118,
+    0.017830107720207895,
+    1.3415653682546864,
+    0.7990319212505577,
+    0.4759007844753428,
+    0.28344494211167737,
+    0.16881887534029638,
+    0.10054796694849327,
+    0.05988603843673458,
+    0.03566792754231611,
+    0.021243700341072046,
+    1.5984094498129162,
+    0.9520074115289759,
+    0.5670124833860184,
+    0.33771077033867636,
+    0.20113942416519728,
+    0.11979797953418664,
+    0.07135128262416794,
+    0.042496589273954145,
+    0.025310828810629453,
+    1.9044265972481478,
+    1.1342702181254922,
+    0.6755676115768989,
+    0.4023658476777725,
+    0.23964777559355188,
+    0.14273342700032043,
+    0.08501155970589346,
+    0.05063260537850371,
+    0.030156613245122667,
+    0.3059610285515388,
+    0.1822293823739504,
+    0.1085352208338443,
+    0.0646432205827159,
+    0.03850128958324849,
+    0.022931241454413318,
+    0.01365777199497732,
+    0.008134524083120964,
+    0.004844895791437236,
+    0.36453758488674437,
+    0.21711738668316372,
+    0.12931440146225798,
+    0.07701923222733205,
+    0.04587240141709214,
+    0.02732145142085804,
+    0.016272566612659876,
+    0.009691887157989689,
+    0.005772456117040987,
+    0.4343286837025244,
+    0.25868473561190675,
+    0.15407177777932507,
+    0.09176464414079291,
+    0.05465472025867896,
+    0.03255217163999827,
+    0.019387966372614248,
+    0.01154740900922705,
+    0.006877598829278261,
+    0.5174813607913028,
+    0.30821019661706917,
+    0.183568979476814,
+    0.10933308046270108,
+    0.0651184231536969,
+    0.038784318671699194,
+    0.023099812648680766,
+    0.0137581724438934,
+    0.008194322260302745,
+    0.6165537041754031,
+    0.3672173585118181,
+    0.2187134510411344,
+    0.13026501214479821,
+    0.07758541282352586,
+    0.04620961671815501,
+    0.027522295745152036,
+    0.016392188831681302,
+    0.009763133758230489,
+    0.7345935504829094,
+    0.4375215027682474,
+    0.2605863681470466,
+    0.15520438386324786,
+    0.09243922059951162,
+    0.055056495778974056,
+    0.032791467818544126,
+    0.019530490389569298,
+    0.011632295844998678,
+    0.8752322478263276,
+    0.5212854483795459,
+    0.3104758986739087,
+    0.184918424170525,
+    0.11013680528428027,
+    0.06559711901417416,
+    0.039069428351885295,
+    0.02326962303654328,
+    0.013859310952439283,
+    1.0427963696816422,
+    0.6210860882789628,
+    0.36991683157799016,
+    0.22032124832143668,
+    0.13122261091729237,
+    0.07815575550311414,
+    0.04654931094239952,
+    0.02772461650794046,
+    0.016512690412614356,
+    1.2424408165054153,
+    0.7399936642252137,
+    0.4407377927535043,
+    0.2625019798846708,
+    0.1563453159141961,
+    0.0931187559768086,
+    0.055461224814865664,
+    0.0330325231012659,
+    0.019674062123186238,
+    1.4803073997945644,
+    0.8816662189469398,
+    0.5251175004192176,
+    0.31275825626605075,
+    0.18627778884628632,
+    0.11094643841454421,
+    0.06607933384387304,
+    0.03935663391856675,
+    0.02344068172750956,
+    1.7637137872289086,
+    1.0504621312482134,
+    0.6256517906571889,
+    0.3726361488989778,
+    0.22194086477464423,
+    0.13218724915029856,
+    0.07873029086223221,
+    0.04689150231278332,
+    0.02792842456275693,
+    2.101378621557278,
+    1.2515741960767444,
+    0.7454334750604351,
+    0.4439777261967484,
+    0.2644316735881146,
+    0.15749463513767437,
+    0.09380328672648106,
+    0.055868929078115595,
+    0.03327535041961748,
+    2.503689738727915,
+    1.4911893743602413,
+    0.8881474872100915,
+    0.528977722481437,
+    0.31505739183097803,
+    0.18764714642745978,
+    0.11176202328640732,
+    0.06656509351129464,
+    0.03964595077893775,
+    0.4074606577249166,
+    0.2426822277020408,
+    0.1445407366965621,
+    0.08608798741717334,
+    0.05127372218323329,
+    0.030538460305542497,
+    0.018188606524418807,
+    0.010833074228044437,
+    0.006452143382879109,
+    0.4854694233660708,
+    0.2891439919660709,
+    0.1722132106907854,
+    0.1025696219201018,
+    0.06109012948909356,
+    0.03638508021313874,
+    0.021670834113273432,
+    0.012907077527767354,
+    0.007687412927302078,
+    0.5784130481193528,
+    0.344500909200168,
+    0.20518360853998782,
+    0.12220668244747389,
+    0.07278589815768433,
+    0.04335104156761523,
+    0.02581973778664838,
+    0.015378150910895214,
+    0.009159176107534181,
+    0.6891508262559364,
+    0.41045596566872067,
+    0.24446622326253176,
+    0.14560327858526334,
+    0.0867208338716422,
+    0.051650643450237003,
+    0.03076295337256761,
+    0.01832231385683592,
+    0.010912709875501202,
+    0.8210894669015844,
+    0.4890381861231959,
+    0.2912695353274226,
+    0.17347917732641172,
+    0.10332362748482476,
+    0.06153921272370178,
+    0.036652552710745946,
+    0.021830139853196352,
+    0.013001959502547651,
+    0.9782878971784742,
+    0.5826650542087394,
+    0.3470333900431937,
+    0.20669194580138087,
+    0.12310504315980549,
+    0.07332095884345932,
+    0.04366972195237845,
+    0.02600954277575115,
+    0.015491198138182411,
+    1.1655821300172546,
+    0.6942168833223762,
+    0.4134732925964637,
+    0.24626333325744174,
+    0.14667363138797443,
+    0.08735833248080713,
+    0.05203033552527786,
+    0.030989096723747136,
+    0.01845700409306801,
+    1.388734038041265,
+    0.8271254258491707,
+    0.49263318342157864,
+    0.29341070389526824,
+    0.17475445028363842,
+    0.10408317586408666,
+    0.061991597240420415,
+    0.036921991441121016,
+    0.02199061667488935,
+    1.6546086103652329,
+    0.9854794467285766,
+    0.5869483174695245,
+    0.349584487554707,
+    0.2082113710892995,
+    0.12401000786426991,
+    0.07385995284522967,
+    0.04399074500721282,
+    0.026200743051443817,
+    1.9713851453919775,
+    1.1741505091895914,
+    0.6993201817781066,
+    0.4165128003731903,
+    0.2480736540930589,
+    0.14775185252396345,
+    0.08800051744339528,
+    0.05241281877700538,
+    0.03121690249058173,
+    2.3488088766891435,
+    1.3989428422954033,
+    0.8332057560886633,
+    0.4962546081154943,
+    0.29556761253298025,
+    0.17603909797471223,
+    0.10484830780399662,
+    0.06244730730749811,
+    0.03719341085835302,
+    2.798490772901086,
+    1.6667719007849409,
+    0.9927238625004533,
+    0.5912630676781342,
+    0.35215433858879186,
+    0.20974196591358596,
+    0.12492162510786108,
+    0.07440290907742539,
+    0.0443141279534577,
+    3.3342647346649135,
+    1.9858771103813342,
+    1.182781875876707,
+    0.7044609953904886,
+    0.4195746520538405,
+    0.24989728288436933,
+    0.1488379998345967,
+    0.08864742320953437,
+    0.05279811372380221,
+    0.5505778761222324,
+    0.3279223723017882,
+    0.19530948648608518,
+    0.11632568782575335,
+    0.06928319710214734,
+    0.04126484433846855,
+    0.024577205577963473,
+    0.014638102813788462,
+    0.00871840589473545,
+    0.6559865817023914,
+    0.3907034506817568,
+    0.23270169029750978,
+    0.13859636144198142,
+    0.08254753706514838,
+    0.04916504159724662,
+    0.029282537083465975,
+    0.0174405827837758,
+    0.010387553748185464,
+    0.7815758933220455,
+    0.4655040316497477,
+    0.2772526703211422,
+    0.1651307786267282,
+    0.0983513486751444,
+    0.058577739817270824,
+    0.03488870918723917,
+    0.020779600451447718,
+    0.01237626168983453,
+    0.9312094089438087,
+    0.5546252614458606,
+    0.330332981689676,
+    0.19674523750960365,
+    0.11718081641352533,
+    0.06979250887671457,
+    0.04156818875639832,
+    0.024757876515656512,
+    0.014745709830095701,
+    1.1094904163685242,
+    0.6608088431451847,
+    0.3935755737378404,
+    0.23441231734399953,
+    0.13961520528503485,
+    0.08315435710734156,
+    0.04952646161869348,
+    0.029497797659617263,
+    0.01756879127499187,
+    1.3219035076221837,
+    0.7873213817209126,
+    0.4689260256446002,
+    0.279290798690371,
+    0.16634468118053283,
+    0.09907434504396044,
+    0.059008354076778555,
+    0.03514518162401652,
+    0.020932354591316888,
+    1.5749833055641402,
+    0.9380548770572911,
+    0.5587023997411724,
+    0.33276131184964836,
+    0.19819154296669636,
+    0.11804223118722316,
+    0.07030556468294547,
+    0.041873763107273795,
+    0.02493987559407829,
+    1.8765154933795094,
+    1.1176464564541577,
+    0.6656665537969576,
+    0.39646881022620845,
+    0.23613551948132105,
+    0.14064153881083116,
+    0.08376563797994468,
+    0.0498905384960619,
+    0.029714640650417668,
+    2.2357763313764476,
+    1.331621030043689,
+    0.7931091061165954,
+    0.4723731752602521,
+    0.2813439096646174,
+    0.16756750732461173,
+    0.09980265627379624,
+    0.05944213385003044,
+    0.03540353943036925,
+    2.663818029522756,
+    1.5865612577346786,
+    0.9449506672929973,
+    0.5628095097269834,
+    0.3352074930499125,
+    0.19964848044467917,
+    0.11890997835759692,
+    0.07082239204381088,
+    0.04218158378368586,
+    3.1738087548506764,
+    1.8903100565046338,
+    1.1258624528845218,
+    0.67055997425047,
+    0.3993833153550518,
+    0.2378713891509622,
+    0.14167541707721656,
+    0.08438141247522994,
+    0.05025729176032138,
+    3.781437733632079,
+    2.2522118779230347,
+    1.3414099875143244,
+    0.7989393769926074,
+    0.4758456654196632,
+    0.28341211338338784,
+    0.16879932265769276,
+    0.1005363214350386,
+    0.05987910240722026,
+    4.505397910785359,
+    2.683400178506731,
+    1.598224321268613,
+    0.9518971495768315,
+    0.5669468117299459,
+    0.3376716565162977,
+    0.2011161281012243,
+    0.11978410447509943,
+    0.07134301868460735,
+    0.1636204173176572,
+    0.11184563490304489,
+    0.07645406515850052,
+    0.052261530674194534,
+    0.03572429514045405,
+    0.024419974823133867,
+    0.016692706406604613,
+    0.011410595186737366,
+    0.007799914486250026,
+    0.21333263486819548,
+    0.1458273018950299,
+    0.0996828356389206,
+    0.06813996824935235,
+    0.04657828244213682,
+    0.03183941012887239,
+    0.021764392850120617,
+    0.014877436303533612,
+    0.010169735149054384,
+    0.2781487411283816,
+    0.19013349959002515,
+    0.1299691219873774,
+    0.08884269582473923,
+    0.06072999863901295,
+    0.04151306644240207,
+    0.02837699199855107,
+    0.019397595598077372,
+    0.013259570112496864,
+    0.3626576976331043,
+    0.2479010939417387,
+    0.16945718449821479,
+    0.11583546051156492,
+    0.07918138113564412,
+    0.054125835826604914,
+    0.036998673954801775,
+    0.02529109903815767,
+    0.017288178796334545,
+    0.47284271400617184,
+    0.3232200138851009,
+    0.22094276655074188,
+    0.15102934222522726,
+    0.10323878246426453,
+    0.07057069869780194,
+    0.048239851302196615,
+    0.032975204958974325,
+    0.022540785527604874,
+    0.6165048574673173,
+    0.42142281711930435,
+    0.28807103243008186,
+    0.19691605758935535,
+    0.13460545966538887,
+    0.09201194658037919,
+    0.06289639613843583,
+    0.04299394583231896,
+    0.029389273340301548,
+    0.8038153661300493,
+    0.5494622336471506,
+    0.3755946439019307,
+    0.256744372750485,
+    0.17550216439255553,
+    0.11996761360921943,
+    0.0820059875894126,
+    0.05605664560787837,
+    0.03831851318638302,
+    1.0480357697117382,
+    0.716403417043852,
+    0.4897102472879072,
+    0.33475011507950936,
+    0.22882437148566462,
+    0.15641695290641747,
+    0.10692157919053294,
+    0.07308813964325966,
+    0.049960692658621,
+    1.3664568019934675,
+    0.9340657547024278,
+    0.6384971942288937,
+    0.43645606852169294,
+    0.29834727775032777,
+    0.20394056712859557,
+    0.13940718760483978,
+    0.09529425277922557,
+    0.06514007468891558,
+    1.7816225797596468,
+    1.2178596770350276,
+    0.8324895574392378,
+    0.5690629850990995,
+    0.3889930847973838,
+    0.26590311438694925,
+    0.1817627844914186,
+    0.12424717138888625,
+    0.08493135512494354,
+    2.3229267197314556,
+    1.587877711479071,
+    1.085421940001403,
+    0.741959396066463,
+    0.5071794894901416,
+    0.34669152506620254,
+    0.23698713383216502,
+    0.16199675371718394,
+    0.11073575088465046,
+    3.0286933981103306,
+    2.070317027615565,
+    1.4152018812829363,
+    0.967386317202555,
+    0.6612740550219944,
+    0.4520255952242001,
+    0.3089901035524466,
+    0.21121565925043945,
+    0.14438020570786816,
+    3.948890691143952,
+    2.6993341891816356,
+    1.845177705532812,
+    1.2613039091790035,
+    0.8621866319649969,
+    0.5893629464947984,
+    0.4028694830368608,
+    0.2753885722332563,
+    0.18824673724351682,
+    0.19575939665537725,
+    0.133814803592943,
+    0.09147147961505557,
+    0.0625269503695537,
+    0.0427414046320197,
+    0.029216644328900043,
+    0.019971554823492246,
+    0.01365191010910228,
+    0.009332005007831408,
+    0.25523628758153205,
+    0.17447128605857634,
+    0.119262938461326,
+    0.0815242944082767,
+    0.05572737570039475,
+    0.03809343490788507,
+    0.026039442282063147,
+    0.01779972207810921,
+    0.01216731536052028,
+    0.33278383368277037,
+    0.22748028500292844,
+    0.1554981787797486,
+    0.10629353485954784,
+    0.07265882881458777,
+    0.04966722963615272,
+    0.033950914706115644,
+    0.02320774921061667,
+    0.015864068113777774,
+    0.43389237874424735,
+    0.296594822185469,
+    0.20274264508130926,
+    0.13858832676742378,
+    0.09473450594714027,
+    0.06475744982555272,
+    0.04426610204996342,
+    0.030258878259974035,
+    0.020683992290951796,
+    0.5657203784478446,
+    0.3867081868043973,
+    0.26434123188534103,
+    0.18069513203764706,
+    0.12351735863993052,
+    0.08443247869127203,
+    0.05771531658747354,
+    0.039452327118955466,
+    0.0269683371266283,
+    0.7376012169594157,
+    0.5042003789534502,
+    0.3446551012819035,
+    0.23559510027779265,
+    0.16104520452028354,
+    0.11008530257377622,
+    0.07525075880935969,
+    0.05143898930185937,
+    0.0351620324135216,
+    0.9617040078222476,
+    0.6573898117791591,
+    0.4493704519435827,
+    0.3071751333253345,
+    0.20997500419828066,
+    0.14353213396792774,
+    0.09811393294190891,
+    0.06706751701664528,
+    0.04584518940282619,
+    1.2538951636684494,
+    0.857122252720356,
+    0.5859011003432452,
+    0.4005030767710375,
+    0.2737709733077767,
+    0.18714099884115415,
+    0.12792354508632647,
+    0.08744440549525755,
+    0.05977417251264361,
+    1.634861733634085,
+    1.1175387006989639,
+    0.7639133768112624,
+    0.5221865219577597,
+    0.35694984796909995,
+    0.24399939218551905,
+    0.16679010714148432,
+    0.11401233253530556,
+    0.07793514970953574,
+    2.1315760404414243,
+    1.4570765647445987,
+    0.9960104989209099,
+    0.6808406215321755,
+    0.4654006683970986,
+    0.3181328717681838,
+    0.2174653604345846,
+    0.14865229966994367,
+    0.10161391291469539,
+    2.779205313029179,
+    1.8997750272093912,
+    1.2986248756392436,
+    0.887698039754875,
+    0.6068017212412888,
+    0.4147900664544289,
+    0.2835370982094745,
+    0.19381680653117006,
+    0.13248691169925272,
+    3.6236015161673834,
+    2.476977010910243,
+    1.6931815171186806,
+    1.157404221873984,
+    0.791164160054924,
+    0.540814277609888,
+    0.3696831803483117,
+    0.25270348711286256,
+    0.17273994542795623,
+    4.724547656271951,
+    3.229548248978853,
+    2.2076149192052963,
+    1.509054287403439,
+    1.031540792064619,
+    0.7051279828535588,
+    0.4820027244952443,
+    0.329481501330643,
+    0.22522291722059667,
+    0.2582059119893534,
+    0.176501225431433,
+    0.12065053948138123,
+    0.08247281366781924,
+    0.056375752843910665,
+    0.03853664459077186,
+    0.026342406112557525,
+    0.018006818371651332,
+    0.01230887970082091,
+    0.3366557086594702,
+    0.2301269737361167,
+    0.15730736975118753,
+    0.10753023939910782,
+    0.07350420011165529,
+    0.05024509816258343,
+    0.034345926974686324,
+    0.02347776684470574,
+    0.016048643451103066,
+    0.4389406319158305,
+    0.3000456450740993,
+    0.20510151620047715,
+    0.1402007749099168,
+    0.09583672344054293,
+    0.06551089011969112,
+    0.04478112951072245,
+    0.03061093440483317,
+    0.020924646505681262,
+    0.5723024246755151,
+    0.39120746110869,
+    0.26741679054370576,
+    0.18279748464415907,
+    0.12495445900869992,
+    0.08541483410754233,
+    0.05838682303535098,
+    0.03991134724758972,
+    0.027282108467406023,
+    0.7461830632081458,
+    0.5100666519899384,
+    0.348665096140961,
+    0.23833620330345295,
+    0.16291893405395433,
+    0.11136612359089375,
+    0.07612628670621473,
+    0.05203747190631922,
+    0.03557113580032134,
+    0.9728932463188164,
+    0.6650384139783619,
+    0.45459878947697163,
+    0.31074905606979264,
+    0.21241802240469623,
+    0.14520210234263106,
+    0.09925546940904846,
+    0.06784783449184355,
+    0.04637858923684602,
+    1.2684839892549735,
+    0.867094702900866,
+    0.592717945332784,
+    0.4051628519286231,
+    0.2769562451677902,
+    0.18931834785029622,
+    0.12941191057472523,
+    0.08846180409224653,
+    0.060469633347514797,
+    1.6538830309332082,
+    1.1305410454428335,
+    0.7728013599062025,
+    0.5282620602588946,
+    0.3611028898070813,
+    0.24683827750779602,
+    0.16873067749628648,
+    0.11533884377983745,
+    0.07884190997077295,
+    2.1563765117881957,
+    1.4740293662906871,
+    1.0075988867480015,
+    0.6887620693274557,
+    0.47081551437132907,
+    0.3218342856615014,
+    0.2199955274743944,
+    0.15038184017361372,
+    0.10279617096595041,
+    2.811540824606002,
+    1.9218785389930286,
+    1.3137341226975021,
+    0.8980262332520048,
+    0.613861740877135,
+    0.41961606794949996,
+    0.28683599702728735,
+    0.19607182726029374,
+    0.1340283710678516,
+    3.665761412820761,
+    2.5057961551585377,
+    1.7128813537200942,
+    1.1708703941787137,
+    0.8003692006961065,
+    0.5471065462136443,
+    0.3739843720241728,
+    0.25564364288139607,
+    0.174749740990371,
+    4.779516846463994,
+    3.267123412750739,
+    2.233300088070826,
+    1.5266118396114854,
+    1.043542567920256,
+    0.7133320093591977,
+    0.4876107321530121,
+    0.3333149543147315,
+    0.22784334192006406,
+    6.2316606873918445,
+    4.259762060920196,
+    2.9118358212872457,
+    1.9904369607677048,
+    1.3605984464600596,
+    0.9300611719928648,
+    0.6357597907739002,
+    0.4345848678950919,
+    0.297068185412439,
+    0.35058733620692684,
+    0.23965018455431747,
+    0.16381712921604294,
+    0.11198010080606981,
+    0.07654598170866697,
+    0.05232436186042424,
+    0.035767244510898,
+    0.024449333626177766,
+    0.016712775136536188,
+    0.4571050570005753,
+    0.3124622596357641,
+    0.21358911305276748,
+    0.14600262210177736,
+    0.09980267887215802,
+    0.06822188921453513,
+    0.046634280969172444,
+    0.0318776889140791,
+    0.021790558991883036,
+    0.5959856833282013,
+    0.4073965721255635,
+    0.27848314418026204,
+    0.1903620867203126,
+    0.13012537676985989,
+    0.08894950654946356,
+    0.06080301100212197,
+    0.04156297533666828,
+    0.02841110810739631,
+    0.7770619232762854,
+    0.5311744438292558,
+    0.3630937011914323,
+    0.24819913189812956,
+    0.1696609136232483,
+    0.11597472316417981,
+    0.07927657658897044,
+    0.054190908365177516,
+    0.03704315544134678,
+    1.0131539221443366,
+    0.6925593121838027,
+    0.4734111869964921,
+    0.323608603668515,
+    0.22120839398132353,
+    0.15121091656116967,
+    0.10336290081830919,
+    0.07065554199754918,
+    0.04829784744279489,
+    1.320976925015905,
+    0.9029771790878555,
+    0.6172460476125605,
+    0.42192947077376636,
+    0.2884173645112992,
+    0.1971527990189768,
+    0.13476728846363997,
+    0.09212256752232954,
+    0.0629720130430303,
+    1.7223247112652253,
+    1.177325568524108,
+    0.8047817494776488,
+    0.5501228221045321,
+    0.37604620084474194,
+    0.2570530424983781,
+    0.17571316106701967,
+    0.12011184412399717,
+    0.08210457891292937,
+    2.245612587819523,
+    1.535028266938908,
+    1.049295765922577,
+    0.71726470977545,
+    0.49029899919297004,
+    0.3351525668743504,
+    0.22909947453973198,
+    0.1566050044726606,
+    0.10705012517009817,
+    2.927889184652676,
+    2.001410521692256,
+    1.3680996184340366,
+    0.9351887309839751,
+    0.6392648245604243,
+    0.4369807958338975,
+    0.2987059644004818,
+    0.20418575374268325,
+    0.1395747892585449,
+    3.8174594870480263,
+    2.609492061229832,
+    1.783764527357733,
+    1.2193238432617393,
+    0.8334904142021945,
+    0.5697471384702683,
+    0.3894607499544825,
+    0.26622279519008635,
+    0.18198130796776307,
+    4.977304814554218,
+    3.4023248822854772,
+    2.325719447756114,
+    1.5897867301953783,
+    1.0867268835644832,
+    0.7428514133569581,
+    0.5077892437117447,
+    0.3471083333665849,
+    0.23727205052993028,
+    6.489541880152747,
+    4.436041318770402,
+    3.0323346308961754,
+    2.0728060567932127,
+    1.4169033012721406,
+    0.9685493529779734,
+    0.6620690687302412,
+    0.45256904092867395,
+    0.30936158549124526,
+    8.461236629733781,
+    5.783828194742957,
+    3.953638226916732,
+    2.702579451364903,
+    1.8473960619901832,
+    1.262820306035114,
+    0.8632231918999795,
+    0.5900715054017112,
+    0.40335383103027783,
+    0.08871654942237697,
+    0.059990109310183316,
+    0.04056529743863115,
+    0.027430244338716103,
+    0.018548324602326798,
+    0.012542372619980266,
+    0.008481149338884053,
+    0.005734951136268068,
+    0.0038779725743763463,
+    0.11842501813805562,
+    0.08007896868642722,
+    0.05414937930096971,
+    0.03661579721589579,
+    0.024759593241202523,
+    0.016742430974674163,
+    0.011321227784762869,
+    0.007655411495998781,
+    0.005176587406177507,
+    0.1580819476446117,
+    0.10689497484868303,
+    0.07228235619660306,
+    0.048877311816842364,
+    0.03305082645539312,
+    0.0223489608732554,
+    0.015112361949206211,
+    0.01021897550311245,
+    0.006910068769144162,
+    0.2110187742760692,
+    0.14269084424206996,
+    0.09648751444209144,
+    0.06524483398121181,
+    0.04411854099310158,
+    0.029832946772774226,
+    0.020173031408412687,
+    0.013640998970178552,
+    0.009224040211765754,
+    0.2816825308673531,
+    0.1904736593963987,
+    0.12879824251841865,
+    0.08709334050914462,
+    0.05889249583477115,
+    0.039823091471435375,
+    0.02692836484280872,
+    0.018208953808308642,
+    0.01231289017096272,
+    0.37600942602402154,
+    0.2542574831382118,
+    0.17192884874021225,
+    0.1162582460279705,
+    0.0786137979084768,
+    0.053158631174497116,
+    0.03594585357186404,
+    0.0243065775107802,
+    0.0164361018470851,
+    0.501923523704396,
+    0.33940056560387755,
+    0.22950258055662262,
+    0.15518958958843673,
+    0.10493916302908626,
+    0.07095983671617154,
+    0.047983024463327216,
+    0.03244610956275711,
+    0.021940051456386236,
+    0.6700024153962107,
+    0.4530554716047999,
+    0.30635600056705187,
+    0.20715785365309147,
+    0.1400800906485363,
+    0.09472212349217547,
+    0.06405107704690578,
+    0.04331132284220327,
+    0.029287106053936054,
+    0.8943658056184964,
+    0.6047699419293561,
+    0.40894528878852376,
+    0.27652870559143,
+    0.18698864398854928,
+    0.1264416759406407,
+    0.08549983075794185,
+    0.05781496492555629,
+    0.039094465330655886,
+    1.1938616576279077,
+    0.8072889647832737,
+    0.5458886031701092,
+    0.3691297417288655,
+    0.24960544227804424,
+    0.16878313983320536,
+    0.11413111842418029,
+    0.07717543473611588,
+    0.05218601034445491,
+    1.593649543173656,
+    1.0776254365118187,
+    0.7286900601148961,
+    0.49274004280097317,
+    0.3331906980331562,
+    0.22530346960387657,
+    0.15235015177552644,
+    0.10301913586521427,
+    0.06966151481130552,
+    2.1273142078319087,
+    1.4384893539688686,
+    0.9727061540150613,
+    0.6577436666098877,
+    0.44476610863379024,
+    0.3007507353264582,
+    0.2033675746500742,
+    0.13751710490137256,
+    0.0929890331484474,
+    2.839686904958611,
+    1.9201955998549587,
+    1.2984358012370683,
+    0.8780019754557786,
+    0.5937047239222735,
+    0.4014629910424116,
+    0.27146917766114975,
+    0.18356739242306766,
+    0.12412822645768425,
+    0.10287954243375454,
+    0.06956712176663936,
+    0.04704127095054586,
+    0.031809296064679936,
+    0.02150943832266336,
+    0.01454467700309087,
+    0.009835107079543957,
+    0.006650497033762926,
+    0.004497064489321278,
+    0.13733076588390392,
+    0.09286303074980277,
+    0.06279395898315274,
+    0.04246125991086335,
+    0.028712293704902626,
+    0.0194152460743558,
+    0.013128584710159326,
+    0.008877545812797438,
+    0.0060029943362692306,
+    0.18331865414743323,
+    0.1239600296957262,
+    0.0838217421660057,
+    0.056680241824648266,
+    0.038327165843655184,
+    0.025916820294303047,
+    0.01752494762871675,
+    0.011850365357388223,
+    0.00801321419491567,
+    0.24470648468410722,
+    0.16547046589040992,
+    0.11189108910348206,
+    0.0756607274500274,
+    0.05116176564313363,
+    0.03459557358144299,
+    0.02339351850710934,
+    0.01581869156914383,
+    0.010696595421661605,
+    0.3266512288394499,
+    0.22088148211320818,
+    0.14936000490145793,
+    0.10099719927055645,
+    0.06829428177393508,
+    0.046180576854643114,
+    0.031227294924734653,
+    0.02111588929228187,
+    0.01427855924371882,
+    0.4360367705010496,
+    0.2948479589876777,
+    0.19937611871425873,
+    0.13481808336079903,
+    0.09116395543404408,
+    0.06164504466466043,
+    0.0416843643259568,
+    0.028186957097870585,
+    0.019060013587455845,
+    0.582052196480282,
+    0.39358355479814466,
+    0.2661411047742553,
+    0.1799645508227292,
+    0.12169198583697922,
+    0.08228809145604918,
+    0.05564318758467885,
+    0.03762591001685155,
+    0.025442631273446675,
+    0.7769637387191528,
+    0.5253826926236855,
+    0.3552636499658948,
+    0.2402291943741123,
+    0.1624429232632586,
+    0.10984386550961404,
+    0.07427639534989335,
+    0.05022568061109233,
+    0.033962593108674305,
+    1.0371452164168482,
+    0.7013173450554323,
+    0.4742306194833936,
+    0.32067463045253436,
+    0.2168401077262587,
+    0.14662722851627402,
+    0.09914929653837336,
+    0.06704473039237187,
+    0.045335630511973944,
+    1.3844535418211723,
+    0.9361671508808028,
+    0.6330360015081562,
+    0.42805879145449505,
+    0.28945325148165685,
+    0.1957282188005474,
+    0.13235137431946487,
+    0.0894959673755643,
+    0.06051715154203812,
+    1.8480648409902378,
+    1.2496609994994607,
+    0.8450204662912262,
+    0.5714026353843569,
+    0.3863823241550502,
+    0.2612716343512079,
+    0.1766718160977735,
+    0.11946543941057249,
+    0.0807825012998269,
+    2.466925435440453,
+    1.6681343841222094,
+    1.1279920679864228,
+    0.7627479641634626,
+    0.5157699892997025,
+    0.34876354229797135,
+    0.2358338231376795,
+    0.15947077429388118,
+    0.10783409909376505,
+    3.2930235828534,
+    2.22674175204744,
+    1.5057222353733872,
+    1.018169012196044,
+    0.6884856403406943,
+    0.4655538238518564,
+    0.31480738334038805,
+    0.21287267664491935,
+    0.14394445257649954,
+    0.12236717549729559,
+    0.08274465454141719,
+    0.05595191543282613,
+    0.03783467171326601,
+    0.02558379588218341,
+    0.017299756601607465,
+    0.011698091239200395,
+    0.007910246472944115,
+    0.005348906756090735,
+    0.16334421336403687,
+    0.11045331765825946,
+    0.07468850674573335,
+    0.05050435023750792,
+    0.0341510294428075,
+    0.023092917867842153,
+    0.015615425489412806,
+    0.010559146947600013,
+    0.007140092617815902,
+    0.21804321241447366,
+    0.1474407676161097,
+    0.09969941148135762,
+    0.06741671798406315,
+    0.04558716843170692,
+    0.030826032292347504,
+    0.02084455559709506,
+    0.014095083464512211,
+    0.009531092037253743,
+    0.29105923926467475,
+    0.19681418735186446,
+    0.13308570599179764,
+    0.08999252227518559,
+    0.060852921845332544,
+    0.0411487310666837,
+    0.027824762017210042,
+    0.018815097361318717,
+    0.012722764295232555,
+    0.3885261083032355,
+    0.2627212606748693,
+    0.17765205306800694,
+    0.12012827541329195,
+    0.08123071084490906,
+    0.05492818707059478,
+    0.03714242684177305,
+    0.025115700067133564,
+    0.016983230324432438,
+    0.5186316614261084,
+    0.35069860429926347,
+    0.23714231159598068,
+    0.16035557387361782,
+    0.10843240035606162,
+    0.07332196295367836,
+    0.04958029365509702,
+    0.033526182604776134,
+    0.022670396586754453,
+    0.6923055992511936,
+    0.46813687914529717,
+    0.31655404470646525,
+    0.21405376863915357,
+    0.14474310669797757,
+    0.09787525381952074,
+    0.0661832230133379,
+    0.044753079430171594,
+    0.030262021510793092,
+    0.9241376460446585,
+    0.6249016532409359,
+    0.4225583471191954,
+    0.2857338523495038,
+    0.19321316200495722,
+    0.1306506935212245,
+    0.08834596743020537,
+    0.05973952185650635,
+    0.04039585026292698,
+    1.2336031800995002,
+    0.834162172688073,
+    0.5640602598702464,
+    0.3814174116042833,
+    0.25791436168252047,
+    0.17440162912938967,
+    0.11793033953039678,
+    0.07974446713130498,
+    0.053923189430118534,
+    1.646699290376123,
+    1.1134976627680722,
+    0.7529468508526282,
+    0.5091424788441378,
+    0.34428202132728053,
+    0.2328034197387865,
+    0.15742161624685186,
+    0.10644845891687013,
+    0.07198042223126515,
+    2.1981286986521167,
+    1.4863740955724203,
+    1.0050858047317561,
+    0.6796387786106045,
+    0.45957157808490945,
+    0.31076219019642404,
+    0.21013731801716384,
+    0.14209480373251263,
+    0.0960844719933663,
+    2.93421501064376,
+    1.984115482107574,
+    1.3416584101910323,
+    0.907229093199896,
+    0.6134680938877081,
+    0.4148269770437085,
+    0.280505901770207,
+    0.1896780230848546,
+    0.12826023343655682,
+    3.9167941958842296,
+    2.648535290049506,
+    1.7909389239824531,
+    1.2110324682045202,
+    0.8188998627514897,
+    0.5537398895742554,
+    0.3744387797006634,
+    0.253195412473388,
+    0.1712106768129591,
+    0.16792567581742057,
+    0.11355130146363125,
+    0.07678336264731503,
+    0.051920891292623304,
+    0.03510889416243442,
+    0.023740625760100352,
+    0.01605340540985184,
+    0.010855308864106822,
+    0.007340357234287512,
+    0.2241588670208952,
+    0.15157617178513186,
+    0.10249577078248762,
+    0.06930761546866512,
+    0.046865792854480164,
+    0.03169063781846698,
+    0.02142920164520898,
+    0.014490420981159062,
+    0.009798419170606825,
+    0.2992228402208328,
+    0.20233441234836444,
+    0.13681848080228093,
+    0.09251662370123483,
+    0.06255971862050663,
+    0.04230286663416931,
+    0.028605188209425866,
+    0.019342821364161294,
+    0.013079611138603448,
+    0.39942345042935984,
+    0.27009004079078947,
+    0.1826348204041457,
+    0.1234976214835391,
+    0.08350906184451391,
+    0.05646880746671204,
+    0.038184193981842425,
+    0.025820142755847472,
+    0.01745957430054347,
+    0.5331781913277478,
+    0.36053496430835874,
+    0.24379365586040389,
+    0.16485321126010713,
+    0.11147370167142823,
+    0.07537849016919725,
+    0.05097091686194626,
+    0.03446652168166006,
+    0.023306253643619133,
+    0.7117233187033536,
+    0.4812671363529308,
+    0.3254327214616512,
+    0.220057527718393,
+    0.14880284713852196,
+    0.1006204493257134,
+    0.06803952355215015,
+    0.04600830940655085,
+    0.03111080771790652,
+    0.950057767975615,
+    0.642428833435561,
+    0.434410222137112,
+    0.2937480873765045,
+    0.1986323857962063,
+    0.13431517134109083,
+    0.090823886447681,
+    0.06141509009814778,
+    0.04152886910357393,
+    1.2682031609350928,
+    0.8575586713793746,
+    0.579880966639222,
+    0.39211536970358474,
+    0.26514831836761876,
+    0.17929322889414245,
+    0.12123803811087343,
+    0.08198113211320392,
+    0.055435621751122786,
+    1.6928857503400168,
+    1.1447289358498625,
+    0.7740654301737511,
+    0.5234228570847097,
+    0.35393840964739015,
+    0.23933306719054864,
+    0.16183696227798786,
+    0.10943411483760553,
+    0.07399932204436285,
+    2.2597815965000247,
+    1.5280637702189939,
+    1.0332763526671462,
+    0.6987012203215247,
+    0.47246159656965286,
+    0.31947841758516643,
+    0.2160312288740167,
+    0.14608026483158798,
+    0.0987794398267828,
+    3.0165135850747964,
+    2.0397657582774094,
+    1.379289113507456,
+    0.9326749657013567,
+    0.6306745867325547,
+    0.42646200335309387,
+    0.2883735037528291,
+    0.19499809364688062,
+    0.13185766386675035,
+    4.026652054797678,
+    2.7228211477356954,
+    1.8411710030230652,
+    1.2449993879296917,
+    0.8418682856726961,
+    0.5692711316107963,
+    0.3849410018177468,
+    0.26029701253454574,
+    0.17601277706054383,
+    5.375055113502607,
+    3.6346109706330583,
+    2.4577230612315977,
+    1.6619117409029143,
+    1.123784318143194,
+    0.7599026847348924,
+    0.5138460120367313,
+    0.3474625493370476,
+    0.2349540920114606,
+    0.09842230506649818,
+    0.07213520700274004,
+    0.0528689923062914,
+    0.038748490004007693,
+    0.028399358718475372,
+    0.020814322713923195,
+    0.015255134256165254,
+    0.011180720332444705,
+    0.008194520287608819,
+    0.12464286535260174,
+    0.09135265514813735,
+    0.06695375286027401,
+    0.04907142561762809,
+    0.0359651955159508,
+    0.026359439780284297,
+    0.019319235042731166,
+    0.014159361721923001,
+    0.01037761194627068,
+    0.1578488115352526,
+    0.1156897990505179,
+    0.08479081644121295,
+    0.0621444812919768,
+    0.04554663720836332,
+    0.03338182438507368,
+    0.024466047716718863,
+    0.017931539150520974,
+    0.013142298258780145,
+    0.1999011113280027,
+    0.14651057030193076,
+    0.10737982929457615,
+    0.07870031299154917,
+    0.05768065851526411,
+    0.04227503348190965,
+    0.030984016165897955,
+    0.022708657538483865,
+    0.016643521112273307,
+    0.2531565104704391,
+    0.18554226376366845,
+    0.13598675214227451,
+    0.09966676261834773,
+    0.07304728890376987,
+    0.05353747102856665,
+    0.039238428244893965,
+    0.02875844192020503,
+    0.02107750026367144,
+    0.3205996123173721,
+    0.23497234070962483,
+    0.1722148086813774,
+    0.12621885724760365,
+    0.0925077236207137,
+    0.06780032014312053,
+    0.049691887678017944,
+    0.03641994161373147,
+    0.026692730124123886,
+    0.40601014458228335,
+    0.297571021171141,
+    0.21809433538153894,
+    0.15984466141331422,
+    0.11715258783607928,
+    0.08586291663005181,
+    0.06293023985551907,
+    0.046122531631858116,
+    0.0338039061827155,
+    0.5141747873997488,
+    0.37684653595149104,
+    0.2761965680519244,
+    0.20242867301686138,
+    0.14836305877509576,
+    0.10873754632215099,
+    0.07969540448802531,
+    0.058409976234824475,
+    0.04280956155088456,
+    0.6511554342307758,
+    0.47724173913078327,
+    0.34977774214175467,
+    0.256357436632877,
+    0.18788827131929264,
+    0.13770617682492753,
+    0.10092695516641896,
+    0.07397090322327818,
+    0.0542144020360594,
+    0.8246289198124873,
+    0.6043830998565753,
+    0.4429615826174324,
+    0.3246532931207105,
+    0.23794334513463072,
+    0.17439230309241624,
+    0.12781477607902575,
+    0.09367739684861084,
+    0.06865759147366814,
+    1.0443172545959383,
+    0.7653960277186531,
+    0.5609704107341978,
+    0.41114376129865227,
+    0.30133352708133887,
+    0.22085193329085206,
+    0.161865746937416,
+    0.1186338722111284,
+    0.08694857251823591,
+    1.3225324773896956,
+    0.9693042035532022,
+    0.7104178196669426,
+    0.5206760443731341,
+    0.38161140624421896,
+    0.2796888140898007,
+    0.20498819334791346,
+    0.15023897022406477,
+    0.11011243040557861,
+    1.6748666614986416,
+    1.227535295455271,
+    0.8996793214811276,
+    0.6593886827511071,
+    0.48327601241789875,
+    0.35420035297558017,
+    0.25959883549845963,
+    0.19026394193571713,
+    0.13944734201680473,
+    0.1471133524397136,
+    0.10782161750769657,
+    0.07902410630428734,
+    0.05791797156767322,
+    0.04244896383386003,
+    0.031111492370946424,
+    0.022802086791465514,
+    0.016711996835326016,
+    0.012248477114317508,
+    0.18630563231905695,
+    0.1365462365876462,
+    0.10007681729299114,
+    0.07334782422264763,
+    0.05375773794290316,
+    0.03939986522252604,
+    0.02887676154085929,
+    0.02116421851643554,
+    0.015511578221042564,
+    0.2359390773045401,
+    0.17292334466155207,
+    0.1267381540631401,
+    0.09288832416912877,
+    0.0680792680841053,
+    0.049896332874178835,
+    0.03656978261304375,
+    0.026802550875584485,
+    0.019643997915975132,
+    0.2987953048246283,
+    0.21899163152507783,
+    0.16050230342864,
+    0.11763458368932789,
+    0.086216178734867,
+    0.06318915103464506,
+    0.04631229157996092,
+    0.03394298413997303,
+    0.024877330251241114,
+    0.3783969794456961,
+    0.27733291171228636,
+    0.2032615165995339,
+    0.1489734625265258,
+    0.10918492053204075,
+    0.08002329186290726,
+    0.05865028988775829,
+    0.04298569108867837,
+    0.031504867953891506,
+    0.4792052342913004,
+    0.35121681766185225,
+    0.2574121570081485,
+    0.1886612919526624,
+    0.13827273542531635,
+    0.10134219459706038,
+    0.07427523852882482,
+    0.05443745401852435,
+    0.03989803949089843,
+    0.6068696872490112,
+    0.4447840404044409,
+    0.3259890002008362,
+    0.2389223052052651,
+    0.17510979784418937,
+    0.12834063891476777,
+    0.09406280973327824,
+    0.06894006644921587,
+    0.050527225111593056,
+    0.7685450636748163,
+    0.5632783871670137,
+    0.4128353123919349,
+    0.3025732906510623,
+    0.22176057490086146,
+    0.16253170421798407,
+    0.11912196244896936,
+    0.0873063012903764,
+    0.0639881184653194,
+    0.9732921701468453,
+    0.7133406611464029,
+    0.5228182394275439,
+    0.38318145363932615,
+    0.28083952574783033,
+    0.20583156745499567,
+    0.1508570919572839,
+    0.11056546124191731,
+    0.08103511118389727,
+    1.232585691123471,
+    0.9033808334171183,
+    0.662101577247384,
+    0.4852643341294591,
+    0.35565762425320924,
+    0.26066689182166697,
+    0.19104673668852332,
+    0.14002106421825272,
+    0.10262357140795816,
+    1.5609572670589817,
+    1.1440493646806362,
+    0.8384912107761833,
+    0.6145429841177985,
+    0.4504079165943906,
+    0.3301108247491,
+    0.2419432532192046,
+    0.17732389667252724,
+    0.1299633856813545,
+    1.9768098941367365,
+    1.448834091238498,
+    1.0618725807478622,
+    0.7782625937385614,
+    0.5704005130126745,
+    0.41805522694107267,
+    0.3063990455577805,
+    0.2245645289634229,
+    0.16458676487311083,
+    2.5034492871925864,
+    1.8348161265933296,
+    1.3447646955062789,
+    0.9855985349538563,
+    0.7223601834203954,
+    0.529428784728842,
+    0.3880264230127619,
+    0.28439047762239367,
+    0.2084341141882319,
+    0.17761143626106868,
+    0.130174127826917,
+    0.0954066016930963,
+    0.06992495205136262,
+    0.05124906277569647,
+    0.037561218968845844,
+    0.02752918968685299,
+    0.020176562572245517,
+    0.0147877101310451,
+    0.22492867160562072,
+    0.16485365056386678,
+    0.1208237523043922,
+    0.08855356900487621,
+    0.06490225997737288,
+    0.04756785522601068,
+    0.03486320586666113,
+    0.02555177477576445,
+    0.01872728505486464,
+    0.28485163103970024,
+    0.20877210055417764,
+    0.15301225346934752,
+    0.11214501195140343,
+    0.08219278796583326,
+    0.0602403466372976,
+    0.04415106790744548,
+    0.03235899038072518,
+    0.023716397090437855,
+    0.36073858937932707,
+    0.26439080857913955,
+    0.19377605201983733,
+    0.1420214210100091,
+    0.10408966337923631,
+    0.07628890026131441,
+    0.05591329738358773,
+    0.040979707579961555,
+    0.030034652076021098,
+    0.4568424951347741,
+    0.33482682540232944,
+    0.2453996819536862,
+    0.179857165956188,
+    0.13182005733771424,
+    0.09661292850989918,
+    0.07080908735569469,
+    0.05189705901144137,
+    0.03803614528327094,
+    0.5785493193840338,
+    0.4240276112905969,
+    0.3107762970462696,
+    0.2277726832736869,
+    0.166938070048409,
+    0.12235145510404123,
+    0.08967324566370763,
+    0.06572288806067546,
+    0.048169306051830084,
+    0.7326799028645146,
+    0.5369922643466866,
+    0.3935698124662561,
+    0.2884533122151665,
+    0.2114118275649868,
+    0.15494694961598607,
+    0.11356298023543096,
+    0.08323203852618684,
+    0.0610020292076069,
+    0.927872217761992,
+    0.6800516859987233,
+    0.49842024233161625,
+    0.3652997898256418,
+    0.26773378188334745,
+    0.19622616808997753,
+    0.1438171484092088,
+    0.10540577935085721,
+    0.07725350171002408,
+    1.1750654673733583,
+    0.8612233850190655,
+    0.6312037409810396,
+    0.462618839152445,
+    0.3390603959446187,
+    0.2485025303092739,
+    0.18213129079280105,
+    0.1334867980803571,
+    0.09783450819561379,
+    1.4881131541407477,
+    1.0906608044275765,
+    0.7993619215075494,
+    0.5858645318161995,
+    0.4293890419409639,
+    0.31470577125980026,
+    0.23065265479653896,
+    0.169048845058429,
+    0.12389847426988097,
+    1.8845594743557461,
+    1.381222352999942,
+    1.012318907621043,
+    0.7419439516753209,
+    0.5437820268725643,
+    0.398546132874244,
+    0.2921005332642939,
+    0.2140849314430742,
+    0.15690610817720227,
+    2.386622551182754,
+    1.749192031731602,
+    1.282009491763592,
+    0.9396042899560451,
+    0.6886503004664226,
+    0.5047222978884859,
+    0.3699186623650567,
+    0.271119023943314,
+    0.1987072635752446,
+    3.022439609533308,
+    2.2151920414753516,
+    1.6235479991520603,
+    1.189923065900464,
+    0.8721127453585967,
+    0.6391847190905117,
+    0.46846821961170315,
+    0.3433474960077729,
+    0.2516446112663105,
+    0.23648667526928158,
+    0.17332468755343228,
+    0.1270323043836929,
+    0.09310391142090736,
+    0.06823727526574662,
+    0.05001213874509311,
+    0.03665465850032245,
+    0.026864757706589446,
+    0.019689590250238136,
+    0.2994887876620859,
+    0.21949989566295855,
+    0.16087481795950087,
+    0.11790760526484392,
+    0.08641628040747833,
+    0.06333580859936737,
+    0.04641977914370588,
+    0.03402176341318479,
+    0.024935068780904842,
+    0.3792752121580387,
+    0.27797658184842694,
+    0.20373327224964394,
+    0.14931921943043502,
+    0.10943833103506916,
+    0.08020902028168668,
+    0.05878641307574795,
+    0.04308545784720809,
+    0.03157798853132233,
+    0.4803174358561674,
+    0.3520319671348935,
+    0.2580095924770321,
+    0.1890991615106815,
+    0.1385936566960239,
+    0.10157740268610513,
+    0.07444762612105302,
+    0.054563799511466046,
+    0.03999064002774883,
+    0.6082781890088614,
+    0.4458163528049874,
+    0.32674559768810907,
+    0.23947682703164686,
+    0.17551621533976172,
+    0.12863850848968617,
+    0.09428112288325013,
+    0.0691000714831764,
+    0.050644495238912526,
+    0.7703288025852522,
+    0.564585716592556,
+    0.4137934740471465,
+    0.3032755419272754,
+    0.22227526556110705,
+    0.16290892884500444,
+    0.11939843612572645,
+    0.08750893306058548,
+    0.06413663037712118,
+    0.9755511126567513,
+    0.7149962745304753,
+    0.5240316637026194,
+    0.3840707907789672,
+    0.28149133448793134,
+    0.20630928801195292,
+    0.1512072206323062,
+    0.11082207588260536,
+    0.0812231879639875,
+    1.2354464356153956,
+    0.9054775166432173,
+    0.6636382683300776,
+    0.4863905984378845,
+    0.35648308052527256,
+    0.26127188130059414,
+    0.19149014269560077,
+    0.1403460432368317,
+    0.10286175348224406,
+    1.564580138828488,
+    1.1467046226006896,
+    0.8404372897628448,
+    0.6159692950587144,
+    0.4514532816150913,
+    0.33087698870056115,
+    0.2425047864529502,
+    0.17773545293538645,
+    0.13026502153711472,
+    1.9813979305361196,
+    1.452196733021598,
+    1.0643371121458627,
+    0.7800688863511903,
+    0.5717243723901952,
+    0.4190255036499494,
+    0.3071101761414167,
+    0.2250857274033692,
+    0.16496875915103015,
+    2.509259616495225,
+    1.8390746054687914,
+    1.3478857995587665,
+    0.9878860396688818,
+    0.7240367304797903,
+    0.530657551613519,
+    0.3889270049847488,
+    0.2850505278714538,
+    0.20891787507267767,
+    3.177748258407695,
+    2.329020116608325,
+    1.706974329767796,
+    1.2510674947408487,
+    0.9169264288878072,
+    0.6720293505564255,
+    0.4925405504529859,
+    0.3609904740613874,
+    0.2645754187004831,
+    4.024328103569252,
+    2.949491384110304,
+    2.161727175581227,
+    1.584362784316453,
+    1.1612036248987156,
+    0.8510638294623027,
+    0.6237576479165888,
+    0.45716148409250296,
+    0.3350606172697502,
+    0.05345760285807807,
+    0.03942739378490902,
+    0.029079481637014272,
+    0.02144742959401777,
+    0.01581844690122815,
+    0.011666818220341334,
+    0.008604804772326955,
+    0.006346431715269708,
+    0.004680779701837358,
+    0.07047174330368795,
+    0.05197608993654424,
+    0.03833471116855938,
+    0.028273578912361288,
+    0.020853039977229662,
+    0.015380057743656248,
+    0.0113434864392192,
+    0.008366332997015167,
+    0.006170548022602724,
+    0.09290103444117351,
+    0.06851870402161223,
+    0.050535635356936046,
+    0.03727231093167883,
+    0.027490010808720804,
+    0.020275123151038507,
+    0.014953818012300231,
+    0.011029115408038415,
+    0.008134470179038851,
+    0.12246897544520442,
+    0.09032639443507642,
+    0.06661979086525043,
+    0.04913510123687853,
+    0.036239353834681645,
+    0.026728158349037055,
+    0.01971322259194125,
+    0.014539391000481097,
+    0.01072345679043305,
+    0.1614476096721558,
+    0.11907489565283563,
+    0.08782310746827399,
+    0.0647735037943771,
+    0.04777338122903294,
+    0.035235023896493925,
+    0.025987419710455966,
+    0.019166894428432515,
+    0.014136449332938845,
+    0.212832111758092,
+    0.1569732840927793,
+    0.11577487868409289,
+    0.08538919607742979,
+    0.06297838434057075,
+    0.046449399647141294,
+    0.03425852774997207,
+    0.025267209748917354,
+    0.01863570709036977,
+    0.28057094117028136,
+    0.20693372674213734,
+    0.15262295904478831,
+    0.11256631770138552,
+    0.0830227376022163,
+    0.06123301445510123,
+    0.045162110616291495,
+    0.03330909401518502,
+    0.024566959536922114,
+    0.36986924754405387,
+    0.2727952562811886,
+    0.20119880834552423,
+    0.1483931980031666,
+    0.10944667811247934,
+    0.08072186266651556,
+    0.05953601538874688,
+    0.04391049724673193,
+    0.032385972690065115,
+    0.4875888419099585,
+    0.3596187679075225,
+    0.26523506511087613,
+    0.19562282628825808,
+    0.1442806596820399,
+    0.10641349556830379,
+    0.07848475370171183,
+    0.05788604660265611,
+    0.04269357083058272,
+    0.6427754681788673,
+    0.4740759058435379,
+    0.3496523679382699,
+    0.2578843955111028,
+    0.19020137584158464,
+    0.14028209539523773,
+    0.10346437401624749,
+    0.07630964351090923,
+    0.05628180470939312,
+    0.8473538911886315,
+    0.6249617221289346,
+    0.46093746448544526,
+    0.3399621747112989,
+    0.2507374408445056,
+    0.18493017434848888,
+    0.13639434649000443,
+    0.10059698380740431,
+    0.07419481387293997,
+    1.1170442128832347,
+    0.8238705011413687,
+    0.6076416625434695,
+    0.4481631391669834,
+    0.3305405334902239,
+    0.2437885553976655,
+    0.17980505784062456,
+    0.13261434185183227,
+    0.09780905985627493,
+    1.4725698276850803,
+    1.0860866811790049,
+    0.8010379248967525,
+    0.5908016074981578,
+    0.43574283885172693,
+    0.3213800016804357,
+    0.23703224992129435,
+    0.17482197774900082,
+    0.1289390954784438,
+    0.056882859966880056,
+    0.041953675429108994,
+    0.03094272831984619,
+    0.022821658080795833,
+    0.016832002406933933,
+    0.012414361131167641,
+    0.009156151393583327,
+    0.006753074721802673,
+    0.004980697264377886,
+    0.0749871691143339,
+    0.055306420180036946,
+    0.04079097996707954,
+    0.030085187962956887,
+    0.0221891833806622,
+    0.01636552378223083,
+    0.012070312100812882,
+    0.008902399712328061,
+    0.006565921409167326,
+    0.0988536008044556,
+    0.07290899025758514,
+    0.05377366951858221,
+    0.03966050720600763,
+    0.029251413301713183,
+    0.021574236953228687,
+    0.015911973049411533,
+    0.011735797973949096,
+    0.008655680452553395,
+    0.13031608617078372,
+    0.09611399260839117,
+    0.07088840561877595,
+    0.05228339719115347,
+    0.03856136413264018,
+    0.028440745698553607,
+    0.02097633302358005,
+    0.015470991927560893,
+    0.011410554502237977,
+    0.17179224809892496,
+    0.12670453317881192,
+    0.09345030934583311,
+    0.068923819043692,
+    0.05083442596200913,
+    0.037492682482508075,
+    0.027652544769261513,
+    0.020394999279466336,
+    0.01504223206508675,
+    0.2264691748661431,
+    0.1670312333550803,
+    0.12319307001762837,
+    0.09086044684891675,
+    0.06701367861360613,
+    0.04942561122107485,
+    0.036453618054043756,
+    0.026886187877095652,
+    0.01982977649820134,
+    0.29854832061466374,
+    0.22019285511076536,
+    0.16240216438668215,
+    0.11977892281841557,
+    0.08834235926424934,
+    0.0651564754193449,
+    0.04805584007976253,
+    0.03544335004170689,
+    0.02614106964094032,
+    0.39356835116530925,
+    0.29027441435913826,
+    0.21409047597973532,
+    0.15790138447586774,
+    0.11645939458678124,
+    0.08589405743679485,
+    0.06335074236933076,
+    0.04672403049184773,
+    0.03446108038759163,
+    0.518830743110776,
+    0.38266107948486844,
+    0.28222980942603954,
+    0.20815721691865538,
+    0.15352533824629522,
+    0.11323186307227656,
+    0.08351360733854749,
+    0.06159505303065814,
+    0.045429130398710584,
+    0.6839608398385038,
+    0.5044519754722744,
+    0.37205608967022985,
+    0.2744081510060619,
+    0.20238839096897282,
+    0.14927056885458528,
+    0.11009377869695786,
+    0.08119912854075265,
+    0.05988802050228707,
+    0.9016474768394946,
+    0.6650056909379062,
+    0.49047169801876495,
+    0.3617450043444405,
+    0.26680326040576713,
+    0.19677944106553236,
+    0.14513371525959923,
+    0.10704266254135603,
+    0.07894879272846819,
+    1.1886180101816717,
+    0.8766594056169141,
+    0.6465758611037172,
+    0.47687886707588567,
+    0.35171967829943607,
+    0.25940913016674605,
+    0.1913259364367378,
+    0.14111150956739596,
+    0.1040761043862621,
+    1.5669236707460295,
+    1.155676897099459,
+    0.8523638486190875,
+    0.6286567917522514,
+    0.4636627450313752,
+    0.34197219206175883,
+    0.25221991932004584,
+    0.18602356910447815,
+    0.137200774449769,
+    0.0693363966702756,
+    0.0511387205745704,
+    0.037717113487166685,
+    0.027818072760138878,
+    0.020517083640339637,
+    0.01513227478892361,
+    0.011160735331666392,
+    0.008231545810593027,
+    0.0060711363918505,
+    0.09140433701680613,
+    0.06741482214939179,
+    0.049721472675837056,
+    0.03667182922437353,
+    0.027047128459554974,
+    0.019948477438410772,
+    0.014712902062998936,
+    0.010851429026788118,
+    0.008003418456753989,
+    0.12049591883484104,
+    0.08887117617279776,
+    0.06554650174635418,
+    0.04834350209151233,
+    0.035655513752906744,
+    0.0262975499494673,
+    0.019395629470865476,
+    0.014305151745846418,
+    0.010550694772710636,
+    0.15884658135185653,
+    0.11715651992427181,
+    0.08640821882318643,
+    0.06372995958758267,
+    0.047003720298248654,
+    0.034667364237690027,
+    0.02556874510278814,
+    0.018858103017263435,
+    0.013908701736439176,
+    0.20940324494937287,
+    0.15444434013204306,
+    0.11390966842270815,
+    0.08401351936288452,
+    0.061963760701551525,
+    0.045701068939808735,
+    0.033706600093251826,
+    0.024860138202517066,
+    0.01833547346034401,
+    0.27605075678775104,
+    0.2035998868372025,
+    0.15016410171262035,
+    0.11075279949044599,
+    0.08168518610690056,
+    0.06024650988523838,
+    0.044434518991020605,
+    0.03277246236710463,
+    0.0241711694869552,
+    0.3639104080813734,
+    0.2684003433514059,
+    0.19795736178846554,
+    0.1460024849332748,
+    0.107683419369217,
+    0.07942137979600869,
+    0.05857685060198811,
+    0.04320306994490258,
+    0.03186421314021267,
+    0.4797334615234352,
+    0.3538250704861855,
+    0.2609619518867737,
+    0.19247121250898952,
+    0.14195620233846878,
+    0.10469910341225237,
+    0.07722031214383183,
+    0.056953463909921204,
+    0.04200574902231595,
+    0.6324199280768994,
+    0.4664382278402862,
+    0.34401923584598354,
+    0.2537297064608918,
+    0.1871371052331287,
+    0.1380220575805257,
+    0.10179749416894113,
+    0.07508024442419083,
+    0.055375067420039906,
+    0.833702456690636,
+    0.6148931733182013,
+    0.4535114555067547,
+    0.33448515807382617,
+    0.24669789398518538,
+    0.18195082630031983,
+    0.13419694289468573,
+    0.09897629952256991,
+    0.07299948609760326,
+    1.0990478880157701,
+    0.810597399668517,
+    0.5978521514068305,
+    0.440942933061395,
+    0.3252153057562193,
+    0.2398609597024315,
+    0.1769082788265146,
+    0.13047783664413728,
+    0.09623329087967238,
+    1.4488457488138915,
+    1.0685891027275,
+    0.7881326714060309,
+    0.5812834008433703,
+    0.4287227320410875,
+    0.31620235620370113,
+    0.23321350279879746,
+    0.1720054794678602,
+    0.12686180093308486,
+    1.9099750126865855,
+    1.4086927381396994,
+    1.0389744458992844,
+    0.7662905259647008,
+    0.5651738331976066,
+    0.4168411991380802,
+    0.3074391896663068,
+    0.2267502721374853,
+    0.16723855527406897,
+    0.10314144439182996,
+    0.07607146834430988,
+    0.056106139779032733,
+    0.04138080924975099,
+    0.03052021366838362,
+    0.022510034464089078,
+    0.016602165931078588,
+    0.0122448463614212,
+    0.00903112660343523,
+    0.13596863691119065,
+    0.1002830037876406,
+    0.07396323944352376,
+    0.05455122585442791,
+    0.040233990082236284,
+    0.029674382794939377,
+    0.02188619603625578,
+    0.016142056946812304,
+    0.011905495228247433,
+    0.17924385616759528,
+    0.13220043030001763,
+    0.0975037814136773,
+    0.07191343756136694,
+    0.05303940449192863,
+    0.03911895362334483,
+    0.028851993102944416,
+    0.021279646537262765,
+    0.015694699327535436,
+    0.23629243260572344,
+    0.17427632910277643,
+    0.1285366549855544,
+    0.09480158183233292,
+    0.06992044346355956,
+    0.05156948143320364,
+    0.03803481905367978,
+    0.028052394948356436,
+    0.020689906825320865,
+    0.3114980613590724,
+    0.22974387312213745,
+    0.1694464710530485,
+    0.12497441678049688,
+    0.09217427044990298,
+    0.06798268279094487,
+    0.05014029551734949,
+    0.036980729964690394,
+    0.027274956691233376,
+    0.4106396517249708,
+    0.30286526867359814,
+    0.22337679905827973,
+    0.16475046668787213,
+    0.12151090170644822,
+    0.08961977183037033,
+    0.06609862481582932,
+    0.048750717763635217,
+    0.035955853682154974,
+    0.5413353869140995,
+    0.3992592695604391,
+    0.2944717234146576,
+    0.21718618076485774,
+    0.16018460641398732,
+    0.11814337377102521,
+    0.08713606805592128,
+    0.06426678123278941,
+    0.04739965047966776,
+    0.7136281162679984,
+    0.5263329302434193,
+    0.3881942809475693,
+    0.286310795128678,
+    0.2111671279832365,
+    0.15574528344503247,
+    0.11486917280657011,
+    0.08472119713289805,
+    0.06248570498298938,
+    0.9407570623293157,
+    0.6938507746197444,
+    0.5117462485462515,
+    0.3774359451348655,
+    0.2783760371171024,
+    0.20531488598239492,
+    0.15142899095237541,
+    0.11168571236876043,
+    0.08237325144192814,
+    1.2401751418523415,
+    0.9146851161635802,
+    0.6746215381172314,
+    0.49756381912118863,
+    0.3669757636102064,
+    0.27066118134384093,
+    0.1996248318029416,
+    0.14723231929490566,
+    0.10859047769345502,
+    1.6348900731718128,
+    1.2058051851130323,
+    0.8893357225080386,
+    0.6559252166880956,
+    0.4837744386045803,
+    0.35680547338747315,
+    0.26316013348385586,
+    0.19409247060522314,
+    0.1431519533255992,
+    2.155232322560111,
+    1.5895810686674068,
+    1.1723877502284172,
+    0.8646888566922405,
+    0.6377470412344906,
+    0.47036721412047405,
+    0.34691704047923144,
+    0.25586696810897075,
+    0.1887134321186403,
+    2.8411857411282337,
+    2.0955026608456286,
+    1.545527748519318,
+    1.1398964392053137,
+    0.8407250490052993,
+    0.6200726519662841,
+    0.45733155467582226,
+    0.33730265355030875,
+    0.24877592400709628,
+    0.02003499970863914,
+    0.01578626571861262,
+    0.01243854199963805,
+    0.009800755278960117,
+    0.007722352349725529,
+    0.006084707159389337,
+    0.004794350158969336,
+    0.0037776334743307776,
+    0.0029765274110583996,
+    0.028123144669358273,
+    0.022159193463927897,
+    0.01745999107655942,
+    0.013757327805715952,
+    0.010839871997873939,
+    0.008541108170837577,
+    0.0067298330460227275,
+    0.005302667045241056,
+    0.004178153841320502,
+    0.03947648003970828,
+    0.03110487709533746,
+    0.0245086030502936,
+    0.01931117173798125,
+    0.01521593675202709,
+    0.01198916018059771,
+    0.009446671879526606,
+    0.007443357854527371,
+    0.005864877795811693,
+    0.05541316572692677,
+    0.0436619401645203,
+    0.034402745158517385,
+    0.027107106784128737,
+    0.02135862225006887,
+    0.016829193467752787,
+    0.013260300662611324,
+    0.010448247208030339,
+    0.008232533522253926,
+    0.0777835038177467,
+    0.06128829935855653,
+    0.04829116012908424,
+    0.03805026687018486,
+    0.0299811146599543,
+    0.023623151956331054,
+    0.018613494350738675,
+    0.014666212730013282,
+    0.011556013706446657,
+    0.10918476479002938,
+    0.08603043346471297,
+    0.06778633902229439,
+    0.053411189191905635,
+    0.04208451396018433,
+    0.03315983676943403,
+    0.02612777649317285,
+    0.020586974212926667,
+    0.016221185425191156,
+    0.15326273923307288,
+    0.12076098634792856,
+    0.09515173679329389,
+    0.07497332779888793,
+    0.05907406496899237,
+    0.04654648865689663,
+    0.0366755801792856,
+    0.028897951710217973,
+    0.02276969059422678,
+    0.21513502623188244,
+    0.1695122904350606,
+    0.133564566922585,
+    0.10524011852728705,
+    0.08292231093038967,
+    0.0653373423202042,
+    0.05148154041499392,
+    0.04056407728541919,
+    0.03196183239183393,
+    0.301985203601302,
+    0.23794453388905465,
+    0.1874846864432115,
+    0.1477256362068767,
+    0.1163981123297585,
+    0.09171407821833692,
+    0.0722646783103263,
+    0.0569398268263993,
+    0.04486484898054342,
+    0.42389686510566427,
+    0.3340029272353524,
+    0.26317240014024695,
+    0.20736259040860128,
+    0.16338812078337492,
+    0.12873912290794468,
+    0.10143798513406549,
+    0.07992647919014141,
+    0.06297682339893765,
+    0.5950243591525255,
+    0.46884016866636546,
+    0.36941530270823886,
+    0.2910750293926551,
+    0.22934803218709626,
+    0.18071120692780607,
+    0.14238857860643847,
+    0.11219286098654394,
+    0.0884006159731185,
+    0.8352361556073767,
+    0.6581113093066338,
+    0.5185485476527741,
+    0.4085822450857113,
+    0.32193601111204884,
+    0.25366446167771023,
+    0.19987095850500305,
+    0.15748520620308465,
+    0.12408801337792785,
+    1.1724216410692623,
+    0.923791356592358,
+    0.727886999540922,
+    0.5735272151225376,
+    0.45190182912137694,
+    0.35606900209541814,
+    0.2805590198644084,
+    0.22106210640089413,
+    0.17418244086402176,
+    0.02538125048772571,
+    0.019998760683641648,
+    0.015757711743752956,
+    0.01241604334024137,
+    0.009783027810993375,
+    0.007708384267673574,
+    0.0060737012268683305,
+    0.004785678205997821,
+    0.0037708005441636455,
+    0.03562768104497341,
+    0.028072275921791408,
+    0.02211911222721506,
+    0.017428409690870325,
+    0.013732443745146932,
+    0.010820264990236639,
+    0.008525659134800117,
+    0.00671766021889368,
+    0.005293075655852465,
+    0.050010603585359255,
+    0.03940507553919535,
+    0.03104861503219823,
+    0.02446427223464552,
+    0.019276241962811757,
+    0.015188414380161058,
+    0.01196747435669943,
+    0.009429584872620503,
+    0.0074298944137847584,
+    0.07019992313883183,
+    0.055312935174035745,
+    0.04358296506274484,
+    0.03434051795812245,
+    0.02705807583156346,
+    0.021319989075280325,
+    0.016798753059884836,
+    0.013236315617731127,
+    0.01042934856579135,
+    0.09853968669437513,
+    0.07764281011271866,
+    0.06117744194678672,
+    0.048203811759504715,
+    0.037981442083944654,
+    0.02992688524246415,
+    0.02358042273213766,
+    0.01857982652459061,
+    0.014639684691207654,
+    0.1383202348330548,
+    0.10898727292688425,
+    0.08587482282961378,
+    0.06766372804799736,
+    0.05331457978594509,
+    0.04200839208468698,
+    0.033099857724209376,
+    0.02608051693943017,
+    0.02054973678422816,
+    0.1941602211869378,
+    0.152985519751215,
+    0.12054255557844382,
+    0.09497962767333616,
+    0.07483771710062188,
+    0.05896721263316769,
+    0.0464622960244777,
+    0.03660924190695005,
+    0.028845681502599682,
+    0.2725428534506199,
+    0.21474589302964475,
+    0.16920567899409267,
+    0.13332297721707578,
+    0.10504976168468605,
+    0.08277232222350885,
+    0.06521916105661324,
+    0.051388421330534756,
+    0.04049070555434236,
+    0.3825686153060651,
+    0.3014389770227479,
+    0.23751414317096028,
+    0.18714556678573863,
+    0.14745843215890445,
+    0.11618757306528522,
+    0.09154818708674169,
+    0.07213396697906561,
+    0.0568368348704361,
+    0.5370118627737849,
+    0.42313012643262604,
+    0.33339878744971035,
+    0.2626963776133676,
+    0.20698751587869643,
+    0.16309258665412762,
+    0.1285062613975347,
+    0.10125450553673947,
+    0.07978190930147382,
+    0.7538039693325524,
+    0.5939480874809993,
+    0.4679921371795069,
+    0.36874710951712397,
+    0.2905485369833861,
+    0.2289331907000774,
+    0.18038433904458068,
+    0.14213102815300618,
+    0.11198992812141,
+    1.0581152178771769,
+    0.8337253922251934,
+    0.6569209268491379,
+    0.5176106043508484,
+    0.4078432072814428,
+    0.32135369779415784,
+    0.2532056369758685,
+    0.19950943473326013,
+    0.1572003491825044,
+    1.485277154078414,
+    1.1703009813349878,
+    0.9221204158111818,
+    0.726570407798705,
+    0.5724898271820423,
+    0.4510844354642719,
+    0.3554249495046809,
+    0.2800515486649078,
+    0.22066225237961323,
+    0.03687099310094967,
+    0.029051924275783274,
+    0.02289101087716855,
+    0.018036615199890103,
+    0.014211669795385913,
+    0.011197863686436849,
+    0.008823182141533572,
+    0.006952088834316607,
+    0.005477790029145767,
+    0.05175584168507836,
+    0.04078020869542557,
+    0.032132129767332665,
+    0.02531801078057067,
+    0.019948931942157497,
+    0.015718449963621577,
+    0.0123851076325921,
+    0.009758652502371129,
+    0.007689178123202404,
+    0.0726497152164285,
+    0.057243210654679605,
+    0.0451038955389468,
+    0.03553891141886742,
+    0.028002331278625437,
+    0.022064000435916387,
+    0.01738498521398877,
+    0.013698228105480697,
+    0.010793305310308587,
+    0.10197846173854903,
+    0.08035233930579647,
+    0.0633123732388406,
+    0.04988599759217089,
+    0.0393068941891974,
+    0.03097125456789977,
+    0.024403317262681915,
+    0.01922821344280769,
+    0.015150571056483394,
+    0.14314724603640308,
+    0.11279064116201923,
+    0.08887162754429925,
+    0.07002501360930515,
+    0.05517511793670206,
+    0.043474374118856976,
+    0.034254955416581225,
+    0.02699065816068886,
+    0.021266868372408664,
+    0.20093590056635102,
+    0.15832431070020705,
+    0.12474917268663231,
+    0.09829416605177654,
+    0.07744935594951273,
+    0.06102501275441574,
+    0.0480837075534136,
+    0.037886807846916934,
+    0.029852319670538856,
+    0.282053879863975,
+    0.2222399580359559,
+    0.17511051069973885,
+    0.137975597316133,
+    0.10871572116757057,
+    0.08566085785376036,
+    0.06749513768051946,
+    0.05318174163384585,
+    0.04190372433339653,
+    0.3959192504778506,
+    0.3119584018991647,
+    0.24580276002751517,
+    0.19367645323645946,
+    0.1526043423355195,
+    0.12024221277546847,
+    0.0947429772434189,
+    0.074651252083231,
+    0.05882029042929618,
+    0.5557521597452915,
+    0.437896251311098,
+    0.3450335253761232,
+    0.27186378800237676,
+    0.21421083399484617,
+    0.16878408756802277,
+    0.13299079082459195,
+    0.1047880205947874,
+    0.08256608741169412,
+    0.7801097387630938,
+    0.6146753084544049,
+    0.48432382785347733,
+    0.3816154106083546,
+    0.30068791423956265,
+    0.23692235495837485,
+    0.18667927648831537,
+    0.1470910259874953,
+    0.11589808109958175,
+    1.0950406468810456,
+    0.8628202084221451,
+    0.679845733747,
+    0.5356738485984379,
+    0.4220758590198749,
+    0.33256809387555536,
+    0.26204184556030746,
+    0.20647178755021028,
+    0.16268622655677323,
+    1.5371094074827467,
+    1.2111413974535086,
+    0.9542999850790402,
+    0.7519257977942368,
+    0.5924682114939683,
+    0.4668260919635546,
+    0.3678283423653081,
+    0.28982460872768245,
+    0.22836278271545327,
+    2.1576416704727324,
+    1.7000801213361905,
+    1.3395516310774747,
+    1.055478827028459,
+    0.8316480891515112,
+    0.65528414827284,
+    0.5163209301854511,
+    0.40682702862601655,
+    0.32055301566261657,
+    0.055847887726727885,
+    0.04400447258789877,
+    0.034672638242187415,
+    0.02731976483236388,
+    0.021526182844302067,
+    0.016961220226075786,
+    0.013364329088823639,
+    0.010530214784888779,
+    0.008297118596744353,
+    0.0783937234268884,
+    0.061769112387591175,
+    0.04867000926048897,
+    0.03834877513784618,
+    0.03021631959636726,
+    0.02380847801964731,
+    0.018759519133500876,
+    0.014781270681383884,
+    0.011646671825727404,
+    0.11004133052986169,
+    0.08670535108742808,
+    0.06831812984262374,
+    0.05383020547932879,
+    0.042414671312312274,
+    0.033419979108612496,
+    0.026332751594278638,
+    0.020748481148729625,
+    0.016348442297717338,
+    0.15446510122810364,
+    0.12170836873972027,
+    0.09589821198128752,
+    0.07556150128735259,
+    0.05953750710089031,
+    0.046911650660676776,
+    0.03696330388808749,
+    0.029124659121585333,
+    0.022948321165141176,
+    0.21682278269921137,
+    0.1708421318350619,
+    0.13461239472439823,
+    0.10606573811038299,
+    0.0835728450112872,
+    0.06584992050884447,
+    0.051885418408760556,
+    0.04088230665503334,
+    0.0322125762631218,
+    0.30435430866681734,
+    0.23981123329626303,
+    0.18895552314336186,
+    0.14888455905763415,
+    0.11731126752494127,
+    0.09243358462028965,
+    0.0728316021642144,
+    0.057386525639967954,
+    0.0452168183476377,
+    0.42722237972824084,
+    0.33662321464471484,
+    0.2652370147599064,
+    0.20898937131533735,
+    0.1646699174408826,
+    0.12974909460382247,
+    0.10223377658858346,
+    0.08055351066208123,
+    0.06347088307320391,
+    0.5996923866140114,
+    0.4725182681403086,
+    0.3723134038552091,
+    0.2933585430163544,
+    0.23114729115190896,
+    0.18212890498261966,
+    0.14350563168991806,
+    0.11307302555125817,
+    0.0890941279220453,
+    0.8417886693847189,
+    0.6632742603981373,
+    0.5226166144862133,
+    0.4117876149348585,
+    0.3244616323199817,
+    0.25565448553959225,
+    0.20143896678685508,
+    0.1587206938869516,
+    0.12506149663988103,
+    1.1816194097534662,
+    0.9310385950539871,
+    0.7335973481181717,
+    0.5780265952721412,
+    0.45544704557476506,
+    0.35886240013769766,
+    0.2827600343088589,
+    0.22279636142339945,
+    0.17554892007576353,
+    1.658640084246631,
+    1.3068995998122652,
+    1.0297511679667632,
+    0.8113763812317615,
+    0.6393113720090459,
+    0.5037354301090287,
+    0.396910480021209,
+    0.31273942576675423,
+    0.24641815560952904,
+    2.3282343759431474,
+    1.8344959844445765,
+    1.4454625151645188,
+    1.1389296572258918,
+    0.897401869989723,
+    0.7070938149267326,
+    0.5571435494260405,
+    0.4389925751213234,
+    0.34589735663310084,
+    3.2681444038448504,
+    2.575083439788878,
+    2.0289968564650116,
+    1.5987164454299867,
+    1.2596837026851087,
+    0.9925481378179498,
+    0.7820628335398451,
+    0.6162142190392719,
+    0.4855363884605743,
+    0.029246162990455512,
+    0.020739406775949515,
+    0.014706988864100616,
+    0.01042920483625437,
+    0.007395688847093121,
+    0.005244523852181009,
+    0.0037190626870283175,
+    0.002637308487841908,
+    0.0018702013505452909,
+    0.03595267817935002,
+    0.025495215139493096,
+    0.01807948747980559,
+    0.012820753452914219,
+    0.009091613868148173,
+    0.0064471595238980136,
+    0.004571890813820409,
+    0.003242076690675363,
+    0.0022990621815478494,
+    0.044197082150220876,
+    0.03134159053010228,
+    0.022225342696105745,
+    0.01576071442465268,
+    0.011176435952952889,
+    0.007925574770587251,
+    0.005620283219855355,
+    0.003985525893795482,
+    0.002826266226939906,
+    0.054332032257761745,
+    0.03852861376466606,
+    0.027321894965832986,
+    0.019374845642866057,
+    0.013739334118454011,
+    0.009743009337884481,
+    0.006909085268594187,
+    0.0048994574051255246,
+    0.003474364829994875,
+    0.06679105464983076,
+    0.04736371235534648,
+    0.03358715115132091,
+    0.0238177428745054,
+    0.01688993725845495,
+    0.011977204645193246,
+    0.008493425932711936,
+    0.006022964974837808,
+    0.004271080642312739,
+    0.08210708850485504,
+    0.05822481083234074,
+    0.04128910984660484,
+    0.029279452651790855,
+    0.020763013559105738,
+    0.014723729202951506,
+    0.010441075955796074,
+    0.007404107044623575,
+    0.005250493470245478,
+    0.10093528269748883,
+    0.07157649660202745,
+    0.050757225113983936,
+    0.03599360158120208,
+    0.025524235256694193,
+    0.01810006659014959,
+    0.012835346770357288,
+    0.009101962464877295,
+    0.00645449805091079,
+    0.12408102002812554,
+    0.08798989284091224,
+    0.06239649900041351,
+    0.04424738980587031,
+    0.03137726532733291,
+    0.022250640856813417,
+    0.015778654174416467,
+    0.01118915761383987,
+    0.007934596114689276,
+    0.15253436776279147,
+    0.10816708849558186,
+    0.07670480564620084,
+    0.05439387609533155,
+    0.03857246924425034,
+    0.027352994314856965,
+    0.019396899204219935,
+    0.013754973017133668,
+    0.009754099390324903,
+    0.1875124281176979,
+    0.1329711703907303,
+    0.09429418803100562,
+    0.0668670800617882,
+    0.04741762445124805,
+    0.033625381974537336,
+    0.0238448535964939,
+    0.01690916235446131,
+    0.011990837786966854,
+    0.23051140024570782,
+    0.1634631420795137,
+    0.11591703833313909,
+    0.0822005475056289,
+    0.05829108565391496,
+    0.041336107481271644,
+    0.02931278020532943,
+    0.0207866472128575,
+    0.014740488596616908,
+    0.2833705806949755,
+    0.20094730865338006,
+    0.14249828177647791,
+    0.1010501730295602,
+    0.0716579690786812,
+    0.05081499990088222,
+    0.03603457156441897,
+    0.025553288406258347,
+    0.01812066912481815,
+    0.3483510399824696,
+    0.24702706886299025,
+    0.17517494064065783,
+    0.12422225616690473,
+    0.08809004798723219,
+    0.06246752227689979,
+    0.04429775472458086,
+    0.03141298073166532,
+    0.022275967813339615,
+    0.05006749701792171,
+    0.035504492922616544,
+    0.02517739237575441,
+    0.017854109005987176,
+    0.012660930236152822,
+    0.008978278019416936,
+    0.006366789382013019,
+    0.004514897728411644,
+    0.003201661037446098,
+    0.061548607525655795,
+    0.04364612234378995,
+    0.030950886985623705,
+    0.021948282086808345,
+    0.01556424172224429,
+    0.011037110760210599,
+    0.007826774738344972,
+    0.005550220898900013,
+    0.00393584241995195,
+    0.07566248192896909,
+    0.05365473039710973,
+    0.03804831695435446,
+    0.026981300853521756,
+    0.01913331926407164,
+    0.013568059896308212,
+    0.009621553208255603,
+    0.006822956771032719,
+    0.004838380882146712,
+    0.09301284629819208,
+    0.0659584389034765,
+    0.046773277409834585,
+    0.03316845449994468,
+    0.023520831441321728,
+    0.016679387690252245,
+    0.011827897088407712,
+    0.008387547080983293,
+    0.00594788283241497,
+    0.11434186872977437,
+    0.08108354343381431,
+    0.05749898168378684,
+    0.04077440075582211,
+    0.02891445567052854,
+    0.02050418231109337,
+    0.014540183534392959,
+    0.010310917743813144,
+    0.00731180761702258,
+    0.14056190585440745,
+    0.09967702579202072,
+    0.0706842256467002,
+    0.05012448671671327,
+    0.035544906174285254,
+    0.02520605072884399,
+    0.017874431577616406,
+    0.012675341633637323,
+    0.00898849761077798,
+    0.17279452922110988,
+    0.12253422889507998,
+    0.08689301286673813,
+    0.061618665683399756,
+    0.04369580286536471,
+    0.030986117061655084,
+    0.021973264881228277,
+    0.015581957835501405,
+    0.011049673833166459,
+    0.21241850092493447,
+    0.15063287785332177,
+    0.1068186800658769,
+    0.0757486053086421,
+    0.05371580329082717,
+    0.038091625732542,
+    0.027012012518778272,
+    0.01915509790623847,
+    0.013583503840837728,
+    0.26112875065308483,
+    0.1851749025148092,
+    0.13131355484836577,
+    0.09311871885843574,
+    0.06603351658440242,
+    0.046826517438792424,
+    0.03320620873860088,
+    0.023547604201675388,
+    0.016698373126655324,
+    0.3210088769138695,
+    0.22763785044828397,
+    0.1614254143215452,
+    0.11447201920755522,
+    0.08117583737684068,
+    0.05756443032496429,
+    0.04082081251905942,
+    0.028947367763553594,
+    0.020527521348262686,
+    0.39462027371472225,
+    0.27983808957356476,
+    0.1984423041396845,
+    0.14072190148337493,
+    0.09979048390386311,
+    0.0707646824893396,
+    0.05018154128445099,
+    0.03558536542663657,
+    0.02523474170251594,
+    0.4851116951151018,
+    0.34400850395471994,
+    0.24394763512161,
+    0.1729912138720245,
+    0.12267370438741165,
+    0.08699191948131473,
+    0.06168880358535994,
+    0.04374553993616058,
+    0.031021387238581076,
+    0.5963539443175542,
+    0.4228940062216029,
+    0.2998879142198252,
+    0.2126602878547091,
+    0.15080433684065425,
+    0.1069402672185178,
+    0.07583482671888905,
+    0.05377694570121759,
+    0.03813498380726662,
+    0.06836564193490366,
+    0.04848030348629318,
+    0.03437896229162943,
+    0.024379241944791852,
+    0.017288114538216003,
+    0.012259565123612273,
+    0.00869365694494061,
+    0.0061649553074884875,
+    0.004371770612072391,
+    0.08404274857568196,
+    0.05959745043644689,
+    0.04226249329918377,
+    0.029969710562840614,
+    0.02125249792675595,
+    0.015070838511426574,
+    0.010687222472401777,
+    0.0075786575569774285,
+    0.005374272923975477,
+    0.1033148141120464,
+    0.07326389983365017,
+    0.05195381770724468,
+    0.036842144364227045,
+    0.026125964582681148,
+    0.018526772454598675,
+    0.013137937797405201,
+    0.009316539618083588,
+    0.006606661699407952,
+    0.12700620810128097,
+    0.0900642389821522,
+    0.06386748541430091,
+    0.04529051418459522,
+    0.03211697880069848,
+    0.022775195774557177,
+    0.01615063315227291,
+    0.011452940023053153,
+    0.008121652812923496,
+    0.1561303384698737,
+    0.11071710845111986,
+    0.07851310785534703,
+    0.05567620209144837,
+    0.03948180837572959,
+    0.02799783631177779,
+    0.019854177667884408,
+    0.014079244070089016,
+    0.009984050556059061,
+    0.19193300040324146,
+    0.13610594218429165,
+    0.09651715681489903,
+    0.06844345963248433,
+    0.048535486550308114,
+    0.034418094399732715,
+    0.024406991797250085,
+    0.017307792862456078,
+    0.012273519664288834,
+    0.23594566568430803,
+    0.16731675670569196,
+    0.1186497619836276,
+    0.08413841085584804,
+    0.05966528767520285,
+    0.04231059889476484,
+    0.030003823807551754,
+    0.02127668873970953,
+    0.01508799300482965,
+    0.29005099195162204,
+    0.20568460586831522,
+    0.14585765353376368,
+    0.10343241296334994,
+    0.07334729300951276,
+    0.0520129545245125,
+    0.03688408020754274,
+    0.026155702655101126,
+    0.018547860690373456,
+    0.3565633540591676,
+    0.2528506882644167,
+    0.17930465884382557,
+    0.12715077385701984,
+    0.09016675526830983,
+    0.06394018305195259,
+    0.045342066447345064,
+    0.032153536189363056,
+    0.022801119809598237,
+    0.43832784229584265,
+    0.31083255008749244,
+    0.22042148563468028,
+    0.1563080549824135,
+    0.11084313301870395,
+    0.0786024759810647,
+    0.055739575940273164,
+    0.03952674883612995,
+    0.02802970505603821,
+    0.5388419621491645,
+    0.3821103863987,
+    0.2709669210085483,
+    0.19215146956053178,
+    0.13626086577965427,
+    0.09662701818250705,
+    0.06852136590663482,
+    0.04859073242685383,
+    0.03445727105024748,
+    0.6624052413645077,
+    0.4697331323655315,
+    0.33310306420192604,
+    0.23621423258338248,
+    0.16750720624152604,
+    0.11878481595276684,
+    0.08423418202431206,
+    0.05973320213019759,
+    0.04235875924689589,
+    0.8143031437958178,
+    0.5774488825637549,
+    0.4094878111605808,
+    0.29038114463849585,
+    0.2059187278922362,
+    0.14602367708669578,
+    0.10355014567241573,
+    0.07343078110827456,
+    0.0520721586547,
+    0.08090301357972803,
+    0.057370962084076584,
+    0.04068361788784208,
+    0.02885007858188482,
+    0.020458530420660117,
+    0.014507810291923679,
+    0.010287960823124224,
+    0.0072955281168144296,
+    0.005173496615927697,
+    0.09945509815837361,
+    0.07052684953310423,
+    0.05001288618854315,
+    0.03546576660473261,
+    0.025149930282358027,
+    0.01783463474107069,
+    0.012647120400589181,
+    0.00896848501520792,
+    0.006359844843752877,
+    0.12226141044726441,
+    0.0866995484192112,
+    0.061481473742178126,
+    0.0435985155912595,
+    0.030917127486767955,
+    0.021924342126562968,
+    0.015547265116667298,
+    0.0110250720962378,
+    0.007818237729601217,
+    0.15029749868379083,
+    0.10658085177286794,
+    0.07557995351958002,
+    0.05359620681391523,
+    0.03800681597529428,
+    0.026951871157509674,
+    0.01911244970805206,
+    0.013553260614376256,
+    0.009611058555398783,
+    0.18476261665857097,
+    0.13102118951882544,
+    0.09291139308040118,
+    0.0658864951222297,
+    0.04672225973121586,
+    0.03313227620229983,
+    0.023495176232070435,
+    0.01666119474573647,
+    0.011814995878875094,
+    0.22713102222907217,
+    0.16106600592300782,
+    0.11421715100558312,
+    0.08099510203331275,
+    0.057436265005997855,
+    0.04072992631680847,
+    0.028882917397212573,
+    0.02048181749422751,
+    0.014524323914291617,
+    0.279215039231423,
+    0.1980004788482167,
+    0.14040858877816154,
+    0.09956830365944554,
+    0.07060712724121838,
+    0.05006981372615426,
+    0.03550613577588354,
+    0.025178557376516683,
+    0.01785493514597384,
+    0.3432425802864471,
+    0.24340449370094494,
+    0.17260605459955122,
+    0.12240057540197992,
+    0.08679823482144948,
+    0.061551455484396514,
+    0.043648141924096044,
+    0.030952319135800068,
+    0.021949297671146086,
+    0.42195244656591935,
+    0.2992202235997115,
+    0.2121868066881184,
+    0.1504685759233031,
+    0.1067021682156953,
+    0.07566598296068068,
+    0.05365721309273124,
+    0.038050077514685476,
+    0.02698254932419705,
+    0.5187114810009342,
+    0.36783520653100316,
+    0.2608439259964289,
+    0.18497292407353005,
+    0.13117032535685857,
+    0.09301715016076934,
+    0.0659614909126145,
+    0.04677544168892369,
+    0.03316998926074116,
+    0.6376585862031456,
+    0.45218447314814525,
+    0.32065873835991165,
+    0.22738955579503853,
+    0.16124934049553152,
+    0.11434715952249197,
+    0.08108729530726087,
+    0.05750164225945297,
+    0.040776287456686634,
+    0.7838817675174268,
+    0.5558760937665485,
+    0.3941898439604759,
+    0.27953285781496784,
+    0.1982258543577235,
+    0.140568409892833,
+    0.09968163801751634,
+    0.07068749632602751,
+    0.050126806061956096,
+    0.9636357742864091,
+    0.683345514873356,
+    0.4845825623725165,
+    0.3436332786921604,
+    0.24368155066617653,
+    0.1728025247178339,
+    0.12253989876223448,
+    0.08689703355421503,
+    0.06162151688385055,
+    0.04365633671062012,
+    0.028995071125935773,
+    0.01925755143338807,
+    0.012790218227051094,
+    0.008494832941843488,
+    0.005641982445397797,
+    0.0037472150579183684,
+    0.0024887742608529413,
+    0.001652960191968525,
+    0.05136369469927295,
+    0.03411403918217385,
+    0.02265739791766511,
+    0.015048281959753034,
+    0.009994562957455657,
+    0.006638052701145973,
+    0.004408771434104679,
+    0.0029281577645236035,
+    0.0019447839431215753,
+    0.06043175703559037,
+    0.0401367413195243,
+    0.026657474195258973,
+    0.017704998141571098,
+    0.011759064527155619,
+    0.007809975321552871,
+    0.005187123038776191,
+    0.0034451127323220495,
+    0.0022881280528112787,
+    0.07110075082780835,
+    0.04722272830689042,
+    0.031363748522810486,
+    0.020830747325934654,
+    0.01383508204835111,
+    0.009188796363839468,
+    0.006102889619376881,
+    0.0040533341072688045,
+    0.0026920882417706426,
+    0.08365331435425316,
+    0.05555971898649442,
+    0.03690089744425392,
+    0.024508335481724527,
+    0.016277612461652737,
+    0.010811042946973264,
+    0.007180331260290568,
+    0.004768934621792451,
+    0.003167366045171901,
+    0.09842198459196219,
+    0.0653685732386583,
+    0.04341560866683441,
+    0.02883518765248171,
+    0.019151362205570097,
+    0.01271969091199488,
+    0.008447991070297286,
+    0.005610871649131113,
+    0.0037265523129767462,
+    0.11579800663962495,
+    0.0769091429043501,
+    0.05108046704715629,
+    0.033925928897694656,
+    0.022532461390943948,
+    0.014965303319045735,
+    0.009939451334023077,
+    0.006601449413703747,
+    0.004384460761180713,
+    0.1362416984101915,
+    0.09048715566555562,
+    0.060098526633091384,
+    0.03991542088932357,
+    0.02651048060626798,
+    0.01760736994165819,
+    0.011694223159013896,
+    0.007766909864786892,
+    0.005158520410244225,
+    0.1602946451700137,
+    0.10646231424819809,
+    0.07070868988206457,
+    0.04696233460773752,
+    0.031190803782216912,
+    0.020715883243599804,
+    0.013758793186571637,
+    0.009138127866661728,
+    0.006069237307016109,
+    0.18859404697687288,
+    0.125257825508118,
+    0.08319203655959584,
+    0.055253353783349696,
+    0.0366974199762617,
+    0.02437319258835563,
+    0.016187855095354007,
+    0.010751429121902245,
+    0.007140737761883204,
+    0.2218895991028937,
+    0.14737161184045647,
+    0.09787926998048704,
+    0.06500812043967258,
+    0.04317620803609866,
+    0.028676185802148084,
+    0.019045758522188715,
+    0.012649552495867564,
+    0.008401407492344965,
+    0.26106335263106434,
+    0.17338950192015415,
+    0.11515947785519162,
+    0.07648505355293878,
+    0.05079880115774757,
+    0.03373885588349994,
+    0.02240821378427291,
+    0.014882782235874375,
+    0.009884643604922874,
+    0.30715308136352676,
+    0.20400075021684733,
+    0.1354904398298454,
+    0.0899881949736521,
+    0.059767133716487154,
+    0.039695320855478236,
+    0.026364297563506767,
+    0.017510280079300684,
+    0.011629739336577682,
+    0.07743095675309103,
+    0.05142703826221338,
+    0.03415610984708105,
+    0.02268533983888917,
+    0.01506684004442829,
+    0.010006888613377889,
+    0.006646238987423441,
+    0.0044142084902288785,
+    0.002931768874408564,
+    0.09110109373814845,
+    0.06050628366043302,
+    0.04018623939817467,
+    0.02669034915498309,
+    0.017726832584570328,
+    0.011773566230126126,
+    0.007819606865121545,
+    0.005193519986203951,
+    0.0034493613697394792,
+    0.10718464072130424,
+    0.07118843484103095,
+    0.047280965080554,
+    0.0314024274299692,
+    0.0208564365556924,
+    0.013852143971089461,
+    0.009200128319303879,
+    0.006110415923218279,
+    0.00405833282524744,
+    0.12610767593610417,
+    0.08375647864206379,
+    0.055628237238095665,
+    0.03694640496339762,
+    0.02453856004598614,
+    0.016297686601091533,
+    0.01082437551549998,
+    0.007189186304067742,
+    0.004774815844164455,
+    0.14837150008606156,
+    0.09854336213717625,
+    0.06544918812350085,
+    0.043469150363090604,
+    0.028870748247074016,
+    0.01917498035695827,
+    0.0127353772941094,
+    0.008458409437924747,
+    0.005617791178645844,
+    0.17456591658181214,
+    0.11594081292264061,
+    0.07700399003641059,
+    0.05114346132352935,
+    0.033967767578206756,
+    0.022560249235932063,
+    0.014983759071465083,
+    0.009951709024301324,
+    0.006609590559485471,
+    0.20538485635295495,
+    0.13640971659207823,
+    0.09059874769322733,
+    0.06017264230616939,
+    0.03996464602762798,
+    0.02654317428819052,
+    0.017629083986036114,
+    0.01170864489726792,
+    0.007776488298479277,
+    0.24164476116020317,
+    0.1604923263143471,
+    0.10659360741826401,
+    0.07079589039157239,
+    0.04702025025448903,
+    0.03122926940767687,
+    0.02074143081882371,
+    0.01377576102713102,
+    0.009149397335905885,
+    0.28430621241044346,
+    0.1888266279653476,
+    0.12541229798133688,
+    0.08329463198297431,
+    0.055321494214320206,
+    0.03674267655964473,
+    0.02440325048952141,
+    0.016207818542767725,
+    0.010764688172507352,
+    0.33449937845573374,
+    0.22216324136848406,
+    0.14755335583346366,
+    0.09799997823044593,
+    0.06508829080110821,
+    0.043229454494852784,
+    0.02871155030991733,
+    0.01906924643930142,
+    0.012665152380754762,
+    0.39355395451486147,
+    0.2613853053839893,
+    0.1736033321146601,
+    0.11530149668145437,
+    0.07657937768269811,
+    0.05086144807357546,
+    0.0337804638588161,
+    0.022435848402626156,
+    0.01490113622031429,
+    0.4630343883726601,
+    0.3075318736341298,
+    0.20425233130806192,
+    0.13565753153252447,
+    0.0900991716649821,
+    0.05984084070385451,
+    0.03974427455847355,
+    0.026396810967222607,
+    0.017531874388954635,
+    0.5447813250407757,
+    0.36182544065352606,
+    0.24031229318354366,
+    0.15960734588155515,
+    0.10600583316766775,
+    0.07040551049517842,
+    0.04676097305179774,
+    0.031057066206496713,
+    0.020627059242036828,
+    0.07916383463637201,
+    0.05257795749328276,
+    0.03492051170668432,
+    0.023193029855000904,
+    0.015404030684693487,
+    0.010230839300360537,
+    0.006794979504540277,
+    0.004512996941071617,
+    0.0029973808422104633,
+    0.09313990453296978,
+    0.061860393245944556,
+    0.04108559345997957,
+    0.027287669886731265,
+    0.01812355293279463,
+    0.012037054547758406,
+    0.007994606947268664,
+    0.005309749157298514,
+    0.003526556877579134,
+    0.10958339570409026,
+    0.07278160725493746,
+    0.04833909663573463,
+    0.03210520283475016,
+    0.02132319635238018,
+    0.014162150135679017,
+    0.009406023991479362,
+    0.00624716490650616,
+    0.004149156902473939,
+    0.128929921865965,
+    0.08563091950533692,
+    0.056873177841156926,
+    0.03777325265729827,
+    0.025087724485821805,
+    0.0166624231592324,
+    0.011066621275047423,
+    0.007350077793305448,
+    0.004881674562176642,
+    0.15169200265751007,
+    0.10074872831050388,
+    0.06691391819185796,
+    0.04444197483056314,
+    0.02951686555220639,
+    0.019604109748693362,
+    0.013020390608856028,
+    0.008647705699489142,
+    0.005743515391474687,
+    0.17847264108457012,
+    0.11853552799408058,
+    0.07872731255306228,
+    0.052288034201333086,
+    0.03472795440333408,
+    0.023065139767853484,
+    0.015319090388449173,
+    0.010174424811270745,
+    0.006757510897530606,
+    0.20998129800961404,
+    0.13946251860898734,
+    0.09262631615826868,
+    0.06151928511420593,
+    0.040859040906865526,
+    0.027137201297604188,
+    0.018023616754620123,
+    0.011970680298049105,
+    0.00795052340210067,
+    0.24705268687601858,
+    0.164084088761417,
+    0.10897913528127691,
+    0.07238027779721869,
+    0.04807254710253346,
+    0.03192816959613962,
+    0.021205616827116927,
+    0.014084057767999161,
+    0.009354157666316086,
+    0.2906688865684865,
+    0.19305250222929457,
+    0.12821898159440778,
+    0.08515873687863758,
+    0.056559570015188125,
+    0.03756496488272181,
+    0.0249493867485412,
+    0.016570543885017525,
+    0.011005598150076628,
+    0.34198535821374615,
+    0.22713517744662237,
+    0.15085554862107237,
+    0.10019318366091838,
+    0.06654494411290261,
+    0.044196914652155334,
+    0.02935410482058181,
+    0.01949600954273138,
+    0.012948594086363258,
+    0.4023615551471415,
+    0.2672350176141882,
+    0.17748851431180981,
+    0.1178819040777573,
+    0.07829319752254497,
+    0.051999709592923465,
+    0.03453645889184374,
+    0.022937954887162184,
+    0.015234618466624121,
+    0.4733969369508486,
+    0.31441433001296404,
+    0.20882342744808463,
+    0.13869349990939486,
+    0.09211555979225333,
+    0.06118005790742482,
+    0.04063373760087196,
+    0.0269875624164151,
+    0.017924231640563407,
+    0.5569733416317367,
+    0.3699229681800971,
+    0.24569039872944567,
+    0.1631793027743167,
+    0.10837820684736774,
+    0.07198116133450931,
+    0.04780746736621706,
+    0.031752112547205696,
+    0.02108868565421758,
+    0.12837190559306486,
+    0.0852603038572715,
+    0.05662702738773541,
+    0.037609767801664425,
+    0.024979143341037773,
+    0.016590307213343078,
+    0.011018724288311339,
+    0.0073182662250024,
+    0.0048605463880082795,
+    0.1510354707623019,
+    0.10031268189817688,
+    0.066624310824583,
+    0.04424962735376056,
+    0.029389114824797582,
+    0.01951926201050219,
+    0.01296403759371334,
+    0.00861027792140841,
+    0.0057186571195878295,
+    0.17770020101362843,
+    0.1180224992682409,
+    0.07838657612128214,
+    0.05206172851883498,
+    0.03457764977737037,
+    0.022965312488499687,
+    0.015252788465675432,
+    0.010130389303221724,
+    0.006728263993549368,
+    0.20907248662123928,
+    0.1388589166388849,
+    0.09222542402270344,
+    0.06125302603567645,
+    0.04068220057848292,
+    0.027019749896828718,
+    0.017945609482917516,
+    0.011918870490773014,
+    0.007916113069943196,
+    0.24598342833971204,
+    0.1633739231898591,
+    0.1085074671842718,
+    0.07206701170457443,
+    0.047864486295742144,
+    0.031789982603231313,
+    0.02111383767224613,
+    0.014023101138930696,
+    0.009313672322638427,
+    0.2894108545586665,
+    0.19221695966315522,
+    0.12766404231275102,
+    0.08479016486470814,
+    0.05631477687485318,
+    0.037402381508807495,
+    0.024841404337607637,
+    0.016498825598022366,
+    0.010957965275008827,
+    0.34050522550122314,
+    0.22615212306072865,
+    0.15020263694805244,
+    0.09975954167845766,
+    0.06625693368710844,
+    0.0440056278101954,
+    0.029227058531177172,
+    0.01941162966857951,
+    0.012892551810785977,
+    0.4006201107088604,
+    0.2660784087652936,
+    0.17672033359933084,
+    0.11737170427460977,
+    0.0779543399661091,
+    0.051774651796261666,
+    0.034386983069698826,
+    0.0228386780714406,
+    0.015168682143288413,
+    0.47134804720875856,
+    0.31305352632952876,
+    0.20791962739149303,
+    0.13809322629738283,
+    0.091716878240233,
+    0.060915267024166525,
+    0.04045787239842803,
+    0.026870758661504547,
+    0.01784665451347056,
+    0.5545627283023873,
+    0.3683219198510785,
+    0.24462703625623425,
+    0.16247305316964208,
+    0.10790913960391255,
+    0.07166962264135271,
+    0.04760055384009064,
+    0.03161468753954365,
+    0.02099741258432956,
+    0.6524686406221157,
+    0.4333477352367651,
+    0.2878149966805749,
+    0.1911570445129476,
+    0.12696008230411726,
+    0.08432261829396749,
+    0.056004248161388874,
+    0.03719613877723738,
+    0.024704424849137915,
+    0.7676594644188585,
+    0.5098536077102379,
+    0.33862762506541316,
+    0.22490508397581258,
+    0.14937439551305437,
+    0.09920945156264242,
+    0.06589158232610297,
+    0.043762973719254826,
+    0.029065895841956166,
+    0.9031867841954241,
+    0.5998662971046052,
+    0.3984110271526419,
+    0.264611209736198,
+    0.17574586933114178,
+    0.11672449786897128,
+    0.07752448723043318,
+    0.05148915806078822,
+    0.034197367728839315,
+    0.09381852037273804,
+    0.05878069319882668,
+    0.03682822836266559,
+    0.023074215878075406,
+    0.014456830047457956,
+    0.009057726430464324,
+    0.0056749929147543714,
+    0.0035555881301729043,
+    0.0022277044467417834,
+    0.11769339822643116,
+    0.07373916690638255,
+    0.04620025267335868,
+    0.02894612777212481,
+    0.018135795033937915,
+    0.011362730935974967,
+    0.00711916153009853,
+    0.00446041195353589,
+    0.0027946092683994073,
+    0.14764393992841499,
+    0.0925042635624427,
+    0.05795726381576334,
+    0.03631232009908983,
+    0.022750980708308242,
+    0.014254311533313115,
+    0.008930841263231518,
+    0.005595494772415721,
+    0.0035057796712873917,
+    0.18521627658032846,
+    0.11604469017250586,
+    0.0727061917336002,
+    0.04555305640046831,
+    0.028540635920355547,
+    0.017881739736127014,
+    0.011203556111464553,
+    0.0070194327506704155,
+    0.00439792826946832,
+    0.23234999775076107,
+    0.14557566968945967,
+    0.09120841751962208,
+    0.05714536944380644,
+    0.03580363893679641,
+    0.022432273578649856,
+    0.014054629999919722,
+    0.008805733566955382,
+    0.005517110279861345,
+    0.29147827853760294,
+    0.18262167423629092,
+    0.11441907804654287,
+    0.07168768699427058,
+    0.04491492637703339,
+    0.028140824401484184,
+    0.017631243372138717,
+    0.011046611087598059,
+    0.006921101021920842,
+    0.36565348690202926,
+    0.2290951226397187,
+    0.14353637281563827,
+    0.08993072433702684,
+    0.05634484849474456,
+    0.0353020836349318,
+    0.02211803105804713,
+    0.013857745705430864,
+    0.008682378441932747,
+    0.458704755477564,
+    0.28739510486251985,
+    0.18006341838106077,
+    0.1128162383092187,
+    0.07068344997931636,
+    0.04428573559849194,
+    0.02774661364256327,
+    0.017384256086645972,
+    0.010891864628211572,
+    0.5754356521536678,
+    0.36053122976708435,
+    0.22588584344901655,
+    0.14152564343354435,
+    0.08867092972030127,
+    0.05555554164397485,
+    0.03480755437087505,
+    0.021808190604020856,
+    0.013663619464723319,
+    0.7218721537446823,
+    0.4522789895796782,
+    0.28336913032880867,
+    0.1775409998548235,
+    0.11123585195351066,
+    0.06969328081931028,
+    0.04366535883942543,
+    0.027357925185342954,
+    0.01714072872272017,
+    0.905573723841547,
+    0.5673746614055185,
+    0.355480727774908,
+    0.2227215214481716,
+    0.1395430813554494,
+    0.08742878293737259,
+    0.054777291798793384,
+    0.034319952720370424,
+    0.021502690550218233,
+    1.1360235535588943,
+    0.7117598071583976,
+    0.44594323902800653,
+    0.2793995536622561,
+    0.17505391663032985,
+    0.10967760444120614,
+    0.06871698244469619,
+    0.043053672628635624,
+    0.026974681670655885,
+    1.4251181105011754,
+    0.892887993678091,
+    0.5594265930520775,
+    0.35050097574353123,
+    0.2196015268543573,
+    0.13758829199965514,
+    0.08620403676854833,
+    0.05400994406712933,
+    0.03383918163793852,
+    0.13117338482767288,
+    0.08218486561900187,
+    0.051491788106915355,
+    0.032261465933874356,
+    0.02021297419389394,
+    0.012664158739731425,
+    0.007934553076981845,
+    0.004971284222293096,
+    0.0031146892054342255,
+    0.16455430501244916,
+    0.10309921835319852,
+    0.06459538584685674,
+    0.04047134342386458,
+    0.025356759109940202,
+    0.015886925863212158,
+    0.00995373313635564,
+    0.0062363734937044635,
+    0.003907313348689924,
+    0.20642998069847499,
+    0.12933584237172346,
+    0.08103357886971345,
+    0.05077046535608821,
+    0.03180953116507548,
+    0.01992982073032292,
+    0.012486752862893592,
+    0.007823401884481225,
+    0.004901643983680239,
+    0.25896215190449684,
+    0.16224914591201983,
+    0.10165495287855142,
+    0.06369050133764041,
+    0.03990440058032693,
+    0.025001548931663495,
+    0.015664373850801074,
+    0.009814296258537223,
+    0.006149011251120767,
+    0.3248626768849139,
+    0.20353820616500085,
+    0.12752404113059332,
+    0.07989841992168263,
+    0.05005924725553614,
+    0.03136392732481122,
+    0.019650633822250522,
+    0.012311832176409371,
+    0.007713807753540909,
+    0.40753352587119646,
+    0.2553344804128015,
+    0.1599762786345112,
+    0.10023091939784748,
+    0.06279829290372398,
+    0.039345399756021804,
+    0.024651314715425324,
+    0.015444939458416324,
+    0.009676812682322275,
+    0.5112424003322674,
+    0.3203118378415086,
+    0.20068694105716425,
+    0.12573762050845605,
+    0.07877916284859388,
+    0.04935799225425855,
+    0.03092456572626465,
+    0.01937535790418118,
+    0.012139361866487912,
+    0.6413430437134282,
+    0.4018245921801517,
+    0.2517576271598135,
+    0.15773525081989853,
+    0.09882683449118479,
+    0.061918582972297416,
+    0.03879422969516706,
+    0.024305986755457885,
+    0.015228579012875531,
+    0.8045516167130858,
+    0.5040806607985487,
+    0.3158247492301245,
+    0.19787561789864683,
+    0.1239762249608922,
+    0.0776755848890206,
+    0.04866656078417203,
+    0.030491358924988124,
+    0.01910393818900861,
+    1.0092934043654729,
+    0.6323587892230874,
+    0.3961956320908348,
+    0.2482308802581994,
+    0.15552561644504292,
+    0.09744241870894962,
+    0.061051196458079666,
+    0.038250780700507254,
+    0.023965496322466667,
+    1.2661377529229656,
+    0.7932810548101872,
+    0.4970192464982527,
+    0.3114005180027887,
+    0.19510367716262275,
+    0.12223950392412651,
+    0.07658746640208983,
+    0.04798481523233283,
+    0.030064220701499687,
+    1.5883436892017182,
+    0.9951547169826034,
+    0.6235003906682529,
+    0.3906455252929881,
+    0.24475353779309958,
+    0.15334693573492078,
+    0.09607739651619823,
+    0.06019596072847177,
+    0.03771494461148101,
+    1.9925443887940208,
+    1.248401061298115,
+    0.7821683765818328,
+    0.4900567520252746,
+    0.30703826362179143,
+    0.1923705671603982,
+    0.12052711174525685,
+    0.07551459082376787,
+    0.04731261991354818,
+    0.16969949278796737,
+    0.10632286441883153,
+    0.06661511659525003,
+    0.04173677772184612,
+    0.026149599424809843,
+    0.01638366897021127,
+    0.010264960642983762,
+    0.006431368772988988,
+    0.004029484937426407,
+    0.2128845126118753,
+    0.13337983985363075,
+    0.08356728942426503,
+    0.05235792657557897,
+    0.03280413298289563,
+    0.02055297470968657,
+    0.012877181348986478,
+    0.008068019439372626,
+    0.005054905721213427,
+    0.2670592290256339,
+    0.16732225732087447,
+    0.10483344049594943,
+    0.06568193868638836,
+    0.041152108041032656,
+    0.025783282742410547,
+    0.01615415833162758,
+    0.010121163934414314,
+    0.006341274938894825,
+    0.3350202930816092,
+    0.20990231976343782,
+    0.13151138827085912,
+    0.08239663699010367,
+    0.05162447052338893,
+    0.03234459626234921,
+    0.02026505834864489,
+    0.012696791344773292,
+    0.00795499858323821,
+    0.4202760458269502,
+    0.2633181296232482,
+    0.1649783233585366,
+    0.10336488116916509,
+    0.06476183320093593,
+    0.040575628705864494,
+    0.025422097607520816,
+    0.015927862792989984,
+    0.009979381602140555,
+    0.5272276287242998,
+    0.3303271610643877,
+    0.20696190296566822,
+    0.12966911089343203,
+    0.08124238364141043,
+    0.05090128909083489,
+    0.031891496962283966,
+    0.019981175264154487,
+    0.012518928334064199,
+    0.661396182938065,
+    0.41438860853591647,
+    0.25962943741453853,
+    0.16266722439680037,
+    0.10191689415676898,
+    0.06385461701383996,
+    0.04000722498187876,
+    0.025065972134853634,
+    0.015704737315568585,
+    0.8297078661516673,
+    0.5198419601071242,
+    0.3256997727904136,
+    0.20406267699873057,
+    0.1278526410599752,
+    0.08010429965158472,
+    0.050188238345900325,
+    0.031444744904090396,
+    0.019701268956057866,
+    1.040851400284568,
+    0.6521310140324351,
+    0.4085836454144197,
+    0.2559924182532946,
+    0.1603885004665362,
+    0.10048919127148016,
+    0.06296010956535517,
+    0.03944678374187035,
+    0.02471483544612712,
+    1.3057266077266643,
+    0.8180849029103678,
+    0.5125597536340984,
+    0.32113720728841255,
+    0.20120406484084144,
+    0.12606161724549023,
+    0.07898215851215121,
+    0.04948517637284035,
+    0.031004251172426205,
+    1.6380070907905369,
+    1.026270632693109,
+    0.642995636252101,
+    0.40286000112299647,
+    0.2524063482775936,
+    0.1581416980420923,
+    0.09908148836308953,
+    0.06207813282510745,
+    0.03889419344337672,
+    2.0548461014755866,
+    1.2874353356007473,
+    0.8066247599580154,
+    0.505379559955701,
+    0.3166385564885362,
+    0.19838549755342738,
+    0.124295682989402,
+    0.07787573688767857,
+    0.04879196324393695,
+    2.577762040524258,
+    1.6150610672780084,
+    1.0118941197949698,
+    0.6339882314179904,
+    0.39721653650675703,
+    0.24887051376573321,
+    0.15592636995103154,
+    0.09769350526190615,
+    0.06120851125666153,
+    0.25120255689976145,
+    0.15738747924419808,
+    0.09860894303208587,
+    0.06178206609954081,
+    0.038708696941270604,
+    0.024252397394367308,
+    0.015195003341670413,
+    0.009520218673598004,
+    0.005964761017496451,
+    0.3151284250406105,
+    0.1974393456318478,
+    0.12370288462079743,
+    0.07750432728864345,
+    0.048559261709045475,
+    0.030424132177108557,
+    0.0190618182021855,
+    0.011942917913253118,
+    0.007482669636747918,
+    0.39532210776103743,
+    0.24768358570028554,
+    0.15518271662771144,
+    0.09722757958251257,
+    0.06091659198203346,
+    0.03816644613225542,
+    0.02391265766797958,
+    0.014982144126401302,
+    0.009386854683443741,
+    0.49592342824830743,
+    0.31071394827118554,
+    0.19467351641618777,
+    0.12196999267238312,
+    0.07641860786393101,
+    0.04787901925637753,
+    0.02999793569956627,
+    0.018794790708154444,
+    0.011775615539053114,
+    0.6221257092816546,
+    0.3897842377293947,
+    0.244213910011395,
+    0.15300883942992774,
+    0.09586556696381879,
+    0.06006324185932534,
+    0.03763179144408938,
+    0.02357767718579393,
+    0.014772266749602771,
+    0.780443867143562,
+    0.4889762845460737,
+    0.30636131170276854,
+    0.19194643232108985,
+    0.12026137594207774,
+    0.07534809774056259,
+    0.047208305980598365,
+    0.02957770959568697,
+    0.018531503868966077,
+    0.9790507299003837,
+    0.6134106608345591,
+    0.3843239449540837,
+    0.24079283927689435,
+    0.1508654149924368,
+    0.09452263409987616,
+    0.05922184589242658,
+    0.03710462646650805,
+    0.023247389277934547,
+    1.2281989417467625,
+    0.7695110186678924,
+    0.4821264599114024,
+    0.3020696490468589,
+    0.18925755058550459,
+    0.118576694370471,
+    0.07429258385902938,
+    0.04654698839222657,
+    0.02916337022948688,
+    1.5407502333013448,
+    0.965335697044567,
+    0.6048176971499192,
+    0.3789401426940531,
+    0.23741969261424486,
+    0.14875201671772406,
+    0.0931985137119265,
+    0.05839223662153682,
+    0.03658484627989531,
+    1.9328393802733101,
+    1.2109937159856319,
+    0.7587313230079782,
+    0.4753725910500656,
+    0.2978381061503594,
+    0.1866063360516513,
+    0.11691561266187502,
+    0.07325185614446676,
+    0.045894934871768385,
+    2.424707125911329,
+    1.5191666325470863,
+    0.9518127912364011,
+    0.5963451080032521,
+    0.37363175943186433,
+    0.23409379867905153,
+    0.1466682239842667,
+    0.09189294226538619,
+    0.05757424893271655,
+    3.0417450650316518,
+    1.9057631984209535,
+    1.1940295096419824,
+    0.7481026347224892,
+    0.46871333376554275,
+    0.29366584082557673,
+    0.18399226105850733,
+    0.11527780021759161,
+    0.07222570746484404,
+    3.815806429474222,
+    2.3907406143895105,
+    1.4978853856795584,
+    0.9384793210640008,
+    0.5879912071277558,
+    0.368397738660432,
+    0.23081449553144787,
+    0.14461362206281864,
+    0.09060565991739626,
+    0.17985458152795,
+    0.11251925901557988,
+    0.07039344531486207,
+    0.044039013291141176,
+    0.02755135343898047,
+    0.01723646874877454,
+    0.01078334883204471,
+    0.006746196899630455,
+    0.004220504531332485,
+    0.22803577497350974,
+    0.14266201178242116,
+    0.08925112565417402,
+    0.055836612220820404,
+    0.034932077791138355,
+    0.021853941531773904,
+    0.01367209712888449,
+    0.008553433696611453,
+    0.005351134307535271,
+    0.2891242148295686,
+    0.18087969814118304,
+    0.11316058469516851,
+    0.07079466662177533,
+    0.044290022321723604,
+    0.02770838780467422,
+    0.01733471139746177,
+    0.010844810652700623,
+    0.006784648177652962,
+    0.36657761972008684,
+    0.22933550978899736,
+    0.1434751420185986,
+    0.08975983002456356,
+    0.056154863990266285,
+    0.03513118004905266,
+    0.021978502376087804,
+    0.013750023939452705,
+    0.008602185676728356,
+    0.46477999554225397,
+    0.29077213524055745,
+    0.18191065760846964,
+    0.11380556573678938,
+    0.07119817476855556,
+    0.0445424620277169,
+    0.02786631721866615,
+    0.017433513999475972,
+    0.01090662278710946,
+    0.5892897783045445,
+    0.3686670010681849,
+    0.2306426526990734,
+    0.14429290685071866,
+    0.09027143385571118,
+    0.05647492969835789,
+    0.03533141712950293,
+    0.022103773179468524,
+    0.013828394909226946,
+    0.7471544518801242,
+    0.46742910067419474,
+    0.2924294482985182,
+    0.18294749323230727,
+    0.1144542229748984,
+    0.07160398278949703,
+    0.044796340563537325,
+    0.028025146782460382,
+    0.017532879746381437,
+    0.9473094486220511,
+    0.5926485514679324,
+    0.37076829125682037,
+    0.23195724592763248,
+    0.14511533269457397,
+    0.09078595367366468,
+    0.05679681968399586,
+    0.0355327955006338,
+    0.022229757988467613,
+    1.201083911352502,
+    0.7514130058450357,
+    0.47009330490262713,
+    0.2940962075386924,
+    0.1839902385050077,
+    0.1151065773627015,
+    0.07201210379318555,
+    0.04505166613007895,
+    0.028184881626637983,
+    1.5228419437895644,
+    0.9527088254152642,
+    0.5960264686205397,
+    0.37288155816277524,
+    0.23327933193923206,
+    0.14594244611651885,
+    0.0913034060986651,
+    0.057120544345009384,
+    0.03573532166745625,
+    1.9307956453711663,
+    1.2079297256818022,
+    0.755695832277074,
+    0.4727726942878255,
+    0.2957724668014563,
+    0.18503892710977854,
+    0.11576264997283155,
+    0.07242255096292187,
+    0.04530844697497833,
+    2.4480359497501563,
+    1.5315216814011652,
+    0.9581389770200216,
+    0.599423638877304,
+    0.3750068700497093,
+    0.23460895344046506,
+    0.14677427383432798,
+    0.09182380784568406,
+    0.057446114138492176,
+    3.103839614324957,
+    1.941800595459249,
+    1.2148145590782875,
+    0.760003069521947,
+    0.4754673553805823,
+    0.29745828023405985,
+    0.18609359292181166,
+    0.11642246199802923,
+    0.07283533755714758,
+    0.26134561848323423,
+    0.16350106340845202,
+    0.1022882950586355,
+    0.06399282725069788,
+    0.04003470716947827,
+    0.025046209817654142,
+    0.0156692197990699,
+    0.009802858432436471,
+    0.006132789933299363,
+    0.3313574229828229,
+    0.2073013174676634,
+    0.12969027775803493,
+    0.08113584781042166,
+    0.050759593654336646,
+    0.03175583194710175,
+    0.019866842700117085,
+    0.012428943430884283,
+    0.007775701309962618,
+    0.42012467017066574,
+    0.26283520931281895,
+    0.16443296992402345,
+    0.10287130734396661,
+    0.06435756697422977,
+    0.040262892868595274,
+    0.02518896562384196,
+    0.015758529603668518,
+    0.00985873175493341,
+    0.5326717503327529,
+    0.33324605988232275,
+    0.20848287215854666,
+    0.13042947304110813,
+    0.08159829755628087,
+    0.051048907956446524,
+    0.031936830566205325,
+    0.019980077683242684,
+    0.012499784642087758,
+    0.6753690362608231,
+    0.422519253479927,
+    0.2643332903587404,
+    0.16537018802433728,
+    0.10345764262265353,
+    0.06472438560365838,
+    0.04049237915704996,
+    0.02533253509486567,
+    0.015848348447089728,
+    0.8562934581286481,
+    0.5357078178937072,
+    0.33514546143983454,
+    0.20967116135312053,
+    0.13117288151329595,
+    0.08206338312555495,
+    0.05133987126240724,
+    0.032118860822589634,
+    0.020093958071458404,
+    1.085685672670885,
+    0.6792184351098959,
+    0.42492748518841866,
+    0.2658399100126589,
+    0.166312747983817,
+    0.10404731983475132,
+    0.0650932949881174,
+    0.04072317344780742,
+    0.025476922868368244,
+    1.3765297032851374,
+    0.861174071356697,
+    0.5387611901197372,
+    0.33705568901064703,
+    0.21086622343601533,
+    0.13192052718849961,
+    0.08253111954163862,
+    0.05163249297104113,
+    0.03230192859627458,
+    1.7452878597585288,
+    1.09187375200892,
+    0.683089774365922,
+    0.42734944308788025,
+    0.26735511694205266,
+    0.16726068024944105,
+    0.10464035802826763,
+    0.06546430704427694,
+    0.040955283196084435,
+    2.212832535433887,
+    1.3843755054629763,
+    0.8660825026011691,
+    0.5418319656421895,
+    0.33897680429975535,
+    0.21206809701064191,
+    0.13267243421749217,
+    0.08300152191355545,
+    0.05192678253474083,
+    2.805627623257657,
+    1.75523547168319,
+    1.0980971015240029,
+    0.6869831790825723,
+    0.429785205413441,
+    0.2688789600917895,
+    0.1682140154417264,
+    0.10523677635977818,
+    0.06583743375672851,
+    3.5572264210418343,
+    2.225445010329465,
+    1.3922660263357098,
+    0.8710189104163293,
+    0.5449202436545805,
+    0.3409088693638546,
+    0.21327682090043917,
+    0.13342862688869914,
+    0.08347460543644583,
+    4.510170810146751,
+    2.821618850518666,
+    1.7652397819813896,
+    1.1043559222454555,
+    0.6908987750262865,
+    0.4322348508461466,
+    0.2704114886857085,
+    0.16917278435571798,
+    0.10583659409504528,
+    0.3129110946424732,
+    0.1957610654552803,
+    0.12247055283218082,
+    0.07661909826725159,
+    0.04793385906676664,
+    0.029988017308926074,
+    0.018760875915870834,
+    0.01173703688059219,
+    0.007342835982399118,
+    0.3967367601003639,
+    0.24820344242271933,
+    0.15527915491093824,
+    0.09714456703138821,
+    0.060774847139840445,
+    0.03802149886238667,
+    0.023786721707684835,
+    0.014881268401508992,
+    0.009309906256069122,
+    0.5030184595876227,
+    0.31469459306023856,
+    0.19687684420674473,
+    0.12316859787097563,
+    0.0770558039094289,
+    0.048207067538011954,
+    0.030158939920294305,
+    0.01886780722346821,
+    0.011803934434127989,
+    0.6377719337676083,
+    0.39899803940948136,
+    0.24961812683124318,
+    0.1561641990395653,
+    0.09769826162567204,
+    0.061121245351887475,
+    0.03823820988421735,
+    0.02392229881330952,
+    0.014966087121915052,
+    0.8086244783842187,
+    0.50588551237719,
+    0.31648825687853016,
+    0.19799898255897716,
+    0.12387062155496248,
+    0.07749499864143136,
+    0.048481833214752745,
+    0.03033083673875255,
+    0.018975348007115412,
+    1.0252466633008164,
+    0.6414070405255495,
+    0.40127220732542357,
+    0.2510408745122025,
+    0.15705428765152996,
+    0.09825511211135678,
+    0.06146961792877382,
+    0.038456156093202375,
+    0.024058648667352227,
+    1.299899704631514,
+    0.8132333928728928,
+    0.5087689064988525,
+    0.31829214403705064,
+    0.1991275167597749,
+    0.12457664656121321,
+    0.0779366966503167,
+    0.048758164972588544,
+    0.030503713316985957,
+    1.6481294722393187,
+    1.031090258600323,
+    0.645062866290462,
+    0.40355933730934374,
+    0.2524717314238072,
+    0.15794944949885856,
+    0.09881513647606711,
+    0.06181997612378085,
+    0.03867534452953421,
+    2.0896464147084797,
+    1.3073087390382767,
+    0.8178685767775092,
+    0.5116687350932514,
+    0.32010631280574137,
+    0.20026248326353652,
+    0.12528669569605225,
+    0.0783809122040046,
+    0.04903607173770697,
+    2.6494412071710967,
+    1.6575233107971032,
+    1.0369671606222473,
+    0.6487395291544061,
+    0.4058595032411014,
+    0.25391074378621414,
+    0.15884971349745522,
+    0.09937835280995158,
+    0.06217233125433011,
+    3.3591992697173665,
+    2.1015567660451095,
+    1.3147600026959922,
+    0.8225301798257784,
+    0.5145850918319008,
+    0.32193082178666466,
+    0.20140391873243968,
+    0.12600079189579308,
+    0.07882765965173756,
+    4.259094220746366,
+    2.6645422191897055,
+    1.6669706913880458,
+    1.0428775592048143,
+    0.6524371478825333,
+    0.4081727794216492,
+    0.2553579580830218,
+    0.1597551087280363,
+    0.0999447793062674,
+    5.400061778032396,
+    3.378345687613941,
+    2.1135350027751563,
+    1.3222537362985947,
+    0.8272183525988138,
+    0.517518070920215,
+    0.32376572991589675,
+    0.20255186003762568,
+    0.1267189582274794,
+    0.4655172410602556,
+    0.2912333651891824,
+    0.18219920879028656,
+    0.1139860869383639,
+    0.07131111107334805,
+    0.044613116382047235,
+    0.027910519459876434,
+    0.017461167470327582,
+    0.010923923141779307,
+    0.5902245243177682,
+    0.3692517897784984,
+    0.23100850377612772,
+    0.14452178782639621,
+    0.09041462463554684,
+    0.05656451162787058,
+    0.03538746069672441,
+    0.022138834730877327,
+    0.013850329851061287,
+    0.74833960674089,
+    0.4681705482682409,
+    0.2928933071180834,
+    0.18323768906842064,
+    0.11463577309261842,
+    0.07171756279700367,
+    0.044867397626276895,
+    0.028069600963050927,
+    0.017560690833637035,
+    0.9488120942863559,
+    0.5935886252501745,
+    0.37135641308557354,
+    0.2323251822449618,
+    0.1453455182224549,
+    0.09092996059755419,
+    0.05688691220336069,
+    0.03558915849920552,
+    0.022265019380094717,
+    1.2029891003427369,
+    0.7526049157293694,
+    0.4708389785232779,
+    0.2945627102129657,
+    0.18428208836944865,
+    0.11528916226107724,
+    0.07212633117231673,
+    0.045123128196543655,
+    0.028229589182586907,
+    1.5252575133245094,
+    0.9542200357045078,
+    0.5969719005384693,
+    0.3734730321077333,
+    0.23364936538207412,
+    0.1461739436321554,
+    0.09144823381838223,
+    0.057211150364433784,
+    0.035792005918040104,
+    1.9338583211519225,
+    1.2098457736719508,
+    0.7568945356865633,
+    0.473522618022152,
+    0.2962416283996083,
+    0.18533244043000735,
+    0.11594627554979924,
+    0.07253742940349968,
+    0.0453803163535667,
+    2.4519190848875767,
+    1.5339510189504675,
+    0.9596588007499706,
+    0.6003744594706709,
+    0.3756017152169188,
+    0.2349810959617998,
+    0.14700709081565277,
+    0.09196946103951632,
+    0.057537236584770876,
+    3.1087630014461847,
+    1.94488072756387,
+    1.216741527961358,
+    0.7612086051776261,
+    0.4762215534529444,
+    0.2979301159111509,
+    0.18638877917902216,
+    0.11660713418514139,
+    0.07295087077002499,
+    3.941568650746815,
+    2.4658942806644535,
+    1.5426940749240927,
+    0.9651285651080789,
+    0.6037964119577057,
+    0.37774253117477,
+    0.23632041700227435,
+    0.14784498668562684,
+    0.09249365909786296,
+    4.9974743720646435,
+    3.1264820085035137,
+    1.9559659583522366,
+    1.2236765859605887,
+    0.765547263557492,
+    0.4789358719978317,
+    0.29962822728984534,
+    0.1874511387388032,
+    0.11727175951444446,
+    6.336246381173877,
+    3.9640343976394035,
+    2.479949130822345,
+    1.5514869636673532,
+    0.9706295054655218,
+    0.60723786853696,
+    0.37989554913484785,
+    0.2376673717668243,
+    0.1486876583081516,
+    8.033661648644413,
+    5.025958461596797,
+    3.144302008531665,
+    1.9671143715969315,
+    1.2306511716888795,
+    0.7699106509753765,
+    0.4816656613359028,
+    0.30133601738881854,
+    0.18851955342614743,
+    0.07783602750939134,
+    0.05428515375715681,
+    0.037860076017915974,
+    0.026404739728556142,
+    0.018415448500495885,
+    0.012843479881290245,
+    0.008957423733484711,
+    0.006247172937770418,
+    0.004356963662277068,
+    0.09988561321711517,
+    0.06966318869452531,
+    0.04858517360793951,
+    0.033884740832989334,
+    0.02363222308484715,
+    0.016481813176161535,
+    0.011494905265517424,
+    0.008016887805422443,
+    0.005591215290614927,
+    0.12818146104071593,
+    0.08939755205997257,
+    0.062348503827530335,
+    0.04348369546991325,
+    0.030326818698819317,
+    0.021150822680823356,
+    0.014751210950228948,
+    0.01028793195337232,
+    0.0071751088255962055,
+    0.16449302782792785,
+    0.11472231553109442,
+    0.08001074486016277,
+    0.05580186612728307,
+    0.03891787620187003,
+    0.02714248094515878,
+    0.018929971102146302,
+    0.013202323201483533,
+    0.009207691706231277,
+    0.21109102661425191,
+    0.1472211417152313,
+    0.10267638997058573,
+    0.07160955916089794,
+    0.04994263008942145,
+    0.034831471237582554,
+    0.024292500943628118,
+    0.016942310534946287,
+    0.011816069779255986,
+    0.2708894237369825,
+    0.18892631714761432,
+    0.131762816054483,
+    0.09189529524911277,
+    0.06409050399643679,
+    0.044698618045486256,
+    0.031174141730689917,
+    0.02174177089001255,
+    0.015163355755466873,
+    0.3476276612489604,
+    0.2424458396063924,
+    0.1690889181006574,
+    0.11792762569515747,
+    0.08224622321977644,
+    0.057360955026800525,
+    0.04000523103406735,
+    0.027900834449868368,
+    0.019458869324765288,
+    0.44610449975616345,
+    0.3111265070420116,
+    0.21698885224666584,
+    0.15133446020710656,
+    0.10554514026435761,
+    0.07361031068652674,
+    0.051338013534260256,
+    0.035804653031118024,
+    0.024971226785454593,
+    0.5724781048426768,
+    0.39926320674883914,
+    0.27845800025343187,
+    0.19420486685094654,
+    0.13544423314922896,
+    0.09446282470079756,
+    0.06588117517430385,
+    0.04594748522601257,
+    0.032045138736658124,
+    0.7346511427331432,
+    0.5123674924998943,
+    0.35734028316347144,
+    0.24921971015047617,
+    0.17381321629242083,
+    0.12122249134980041,
+    0.08454416023422498,
+    0.05896360444436683,
+    0.04112296626330819,
+    0.9427649668233729,
+    0.6575122448880464,
+    0.45856853764350153,
+    0.31981929667683123,
+    0.223051461516491,
+    0.15556270369425415,
+    0.10849404265785155,
+    0.07566696266335518,
+    0.05277238361145393,
+    1.209833798614708,
+    0.843773967915826,
+    0.588472986742166,
+    0.4104185117024041,
+    0.28623804073069264,
+    0.19963089779136228,
+    0.13922850803216816,
+    0.09710209022414297,
+    0.06772187721582934,
+    1.5525585610190777,
+    1.082800380476018,
+    0.7551770950201231,
+    0.5266829003073691,
+    0.3673242730816544,
+    0.2561828407875462,
+    0.17866951008540638,
+    0.12460941465097145,
+    0.0869063009812664,
+    0.09588851315578191,
+    0.0668754925805884,
+    0.0466409516709318,
+    0.032528782799599636,
+    0.02268653774238886,
+    0.015822264174704045,
+    0.011034916233443826,
+    0.0076960778138063,
+    0.005367472889069401,
+    0.12305205241733423,
+    0.08582015037705698,
+    0.05985351780855917,
+    0.04174361823324462,
+    0.029113237233212175,
+    0.020304434978812604,
+    0.01416091506782056,
+    0.009876242100175608,
+    0.006887984113606653,
+    0.1579105474241609,
+    0.11013149849872667,
+    0.07680897292437133,
+    0.053568855432989664,
+    0.037360508325323824,
+    0.0260563264054173,
+    0.01817245471698924,
+    0.012674008810864662,
+    0.008839229583425702,
+    0.20264384460023432,
+    0.14132982648347303,
+    0.09856761202518906,
+    0.06874397557888687,
+    0.047944087122481265,
+    0.0334376281070664,
+    0.023320393410978194,
+    0.016264333914517846,
+    0.011343228779254103,
+    0.2600493027489872,
+    0.1813660953144984,
+    0.12649009315505977,
+    0.0882179419402027,
+    0.06152580874950265,
+    0.042909923526058574,
+    0.029926653130375624,
+    0.020871735346765046,
+    0.014556567167320032,
+    0.3337167235138225,
+    0.2327439391109299,
+    0.1623225249921541,
+    0.11320854248870595,
+    0.07895499465053672,
+    0.05506555462356735,
+    0.03840435072438405,
+    0.026784333048926787,
+    0.018680188138692655,
+    0.4282528365796002,
+    0.2986762277642854,
+    0.2083056582741912,
+    0.14527854323675335,
+    0.1013215641853172,
+    0.07066466348185539,
+    0.04928363182264695,
+    0.03437186630420853,
+    0.023971958833835252,
+    0.5495693776068056,
+    0.38328598103250894,
+    0.2673150092455835,
+    0.18643341448458983,
+    0.13002419181203206,
+    0.09068272714476058,
+    0.06324482304261572,
+    0.04410881507022345,
+    0.030762795645553374,
+    0.7052527736077081,
+    0.49186419808406173,
+    0.3430406776272378,
+    0.23924674120486192,
+    0.16685777200843938,
+    0.11637155824739209,
+    0.08116097563762999,
+    0.056604071180765415,
+    0.039477357794989655,
+    0.905038553726007,
+    0.6312007256439609,
+    0.4402181038732627,
+    0.3070211599963879,
+    0.21412566147589734,
+    0.1493375860576841,
+    0.1041524610166659,
+    0.07263901488027266,
+    0.05066060303589148,
+    1.1614201522957477,
+    0.8100088553006906,
+    0.5649241959239399,
+    0.3939948866631087,
+    0.27478371759735354,
+    0.1916423131683553,
+    0.13365703222028055,
+    0.09321637777477489,
+    0.06501186612559745,
+    1.4904301751625098,
+    1.039470201806496,
+    0.7249573434903283,
+    0.5056067494452243,
+    0.3526251404721116,
+    0.2459312298133146,
+    0.17151973258773576,
+    0.11962294780252289,
+    0.08342859113102596,
+    1.9126429850937265,
+    1.333933935873499,
+    0.9303250837415263,
+    0.6488363015308701,
+    0.45251767746726923,
+    0.31559924735596645,
+    0.22010827397755478,
+    0.15351003742646416,
+    0.10706245233233473,
+    0.1254431930588271,
+    0.08748780276801135,
+    0.06101658803905783,
+    0.04255477790201592,
+    0.02967896404057707,
+    0.02069898963049551,
+    0.014436089182142153,
+    0.010068156687596384,
+    0.007021831037964672,
+    0.16097905640266783,
+    0.11227156765479147,
+    0.07830152061604163,
+    0.054609802453602155,
+    0.03808649564604345,
+    0.026562651491525494,
+    0.018525580846751866,
+    0.012920289445465666,
+    0.009010993001273723,
+    0.20658160852251836,
+    0.14407613981446596,
+    0.10048297238219459,
+    0.07007980469051339,
+    0.048875733957993044,
+    0.03408738623747746,
+    0.023773553999242684,
+    0.016580381546928858,
+    0.011563649770265586,
+    0.2651025663425604,
+    0.18489039119559883,
+    0.12894804161303017,
+    0.08993218808350685,
+    0.06272137484459465,
+    0.043743746774439075,
+    0.030508186190232333,
+    0.021277313747658923,
+    0.014839429571242815,
+    0.3402014883321565,
+    0.23726660639633043,
+    0.1654767672734783,
+    0.11540840459251572,
+    0.08048924371708178,
+    0.056135585419642114,
+    0.03915062193256978,
+    0.027304804719658116,
+    0.01904318051607837,
+    0.43657462189129187,
+    0.3044800876172914,
+    0.21235344224501895,
+    0.14810158781216703,
+    0.10329043918759233,
+    0.07203781529403172,
+    0.05024130861630034,
+    0.03503977849932746,
+    0.02443778060517291,
+    0.5602485791991427,
+    0.3907339729071424,
+    0.2725094596438615,
+    0.19005617823008572,
+    0.13255081467862648,
+    0.0924448688571299,
+    0.06447379292788287,
+    0.04496593511243776,
+    0.031360576580279645,
+    0.718957206295914,
+    0.5014220758360333,
+    0.34970662500353833,
+    0.2438957705790284,
+    0.17010014295764686,
+    0.11863288389757681,
+    0.08273809120407469,
+    0.0577039983450458,
+    0.040244479616917565,
+    0.9226252125863782,
+    0.64346618305306,
+    0.44877239759379556,
+    0.31298717810859156,
+    0.21828653942537746,
+    0.1522395057275316,
+    0.10617634584878405,
+    0.07405053217905895,
+    0.0516450370576079,
+    1.1839888041259865,
+    0.8257489023444382,
+    0.5759017714921641,
+    0.40165097339659417,
+    0.2801232995211001,
+    0.19536629594348529,
+    0.13625424823972018,
+    0.09502775324532828,
+    0.06627517309381431,
+    1.5193921314657786,
+    1.0596691289786377,
+    0.7390446742850174,
+    0.5154316716912287,
+    0.3594773325975654,
+    0.2507101517984963,
+    0.1748526944957384,
+    0.12194745427378184,
+    0.08504977087567023,
+    1.949809357246651,
+    1.3598548659553147,
+    0.948403109047354,
+    0.6614444524701536,
+    0.46131097581808583,
+    0.3217319543848425,
+    0.22438540572056367,
+    0.15649303593934227,
+    0.10914288395391794,
+    2.5021562576732523,
+    1.7450779737678153,
+    1.2170691279534225,
+    0.8488201011551975,
+    0.5919923097028005,
+    0.4128729918981733,
+    0.28794986800508865,
+    0.20082477689554795,
+    0.1400611547230641,
+    0.15980948791682917,
+    0.11145587591004494,
+    0.07773263300449608,
+    0.05421304336335226,
+    0.037809784090894194,
+    0.026369664647279776,
+    0.01839098609868712,
+    0.012826419076853668,
+    0.008945525022544604,
+    0.20508072173338576,
+    0.14302937685999323,
+    0.09975292885673342,
+    0.06957065068693463,
+    0.04852063485729688,
+    0.03383972959444037,
+    0.02360083091230679,
+    0.016459919344119306,
+    0.011479635857805148,
+    0.2631765045675824,
+    0.18354709859773538,
+    0.12801118952089238,
+    0.08927879965276662,
+    0.06226568237722662,
+    0.04342593333446018,
+    0.030286533672659235,
+    0.02112272670895548,
+    0.014731615986282209,
+    0.33772980693160565,
+    0.23554278249163008,
+    0.1642745213635668,
+    0.114569922643195,
+    0.07990446154103886,
+    0.05572774098876976,
+    0.0388661791321425,
+    0.027106425875690916,
+    0.01890482522751195,
+    0.43340275636486103,
+    0.3022679345397393,
+    0.210810621088906,
+    0.14702557858662837,
+    0.10253999844541242,
+    0.07151443566664827,
+    0.04987628814371204,
+    0.034785202397321566,
+    0.024260231682360512,
+    0.5561781796259947,
+    0.38789515554002096,
+    0.27052958422891843,
+    0.18867535440390537,
+    0.13158778719489855,
+    0.09177322493208206,
+    0.06400536853743101,
+    0.04463924205174406,
+    0.0311327311519012,
+    0.7137337336905896,
+    0.4977790711427103,
+    0.3471658854996984,
+    0.2421237835052252,
+    0.1688643066253585,
+    0.1177709749915903,
+    0.08213697037374332,
+    0.057284758852161485,
+    0.039952089562330664,
+    0.9159220215191994,
+    0.63879117882444,
+    0.4455119110108262,
+    0.3107132180782151,
+    0.2167006122675235,
+    0.15113343309810087,
+    0.10540493799722093,
+    0.07351252946782691,
+    0.05126981801270645,
+    1.175386716228119,
+    0.8197495511556591,
+    0.5717176460666116,
+    0.39873284024754635,
+    0.2780881069277884,
+    0.19394689227671902,
+    0.1352643140311099,
+    0.09433734377244767,
+    0.06579366105382486,
+    1.5083532224654137,
+    1.051970266490778,
+    0.7336752592816856,
+    0.5116868824417172,
+    0.3568656055258909,
+    0.2488886558897994,
+    0.1735823292338458,
+    0.12106146386835849,
+    0.08443185489351183,
+    1.9356433183308512,
+    1.3499750503316141,
+    0.9415126326524709,
+    0.656638829900179,
+    0.4579593921304618,
+    0.3193944605322599,
+    0.22275516819105273,
+    0.15535605994272542,
+    0.10834992317766177,
+    2.4839772276117364,
+    1.7323993791166907,
+    1.2082267000690097,
+    0.84265312973269,
+    0.5876912809555868,
+    0.40987332690591405,
+    0.28585781268655247,
+    0.19936571547798634,
+    0.1390435620230267,
+    3.1876445463177285,
+    2.2231578339367566,
+    1.5504961995539057,
+    1.0813620284323429,
+    0.7541739456515558,
+    0.5259832741900484,
+    0.3668363330805192,
+    0.2558425369612404,
+    0.17843217210547255,
+    1.0,
+    0.6167551833416429,
+    0.38038695617878365,
+    0.2346056268988152,
+    0.14469423643095985,
+    0.0892409203184557,
+    0.055039800172586084,
+    0.03394608204653073,
+    0.020936422056338513,
+    1.3057380456174428,
+    0.8053207077209444,
+    0.49668572073925277,
+    0.30633349275771393,
+    0.18893276948946972,
+    0.11652526488572228,
+    0.07186756110852714,
+    0.0443246908278064,
+    0.027337482818065372,
+    1.704951843772859,
+    1.051537886994802,
+    0.6485414422841629,
+    0.3999912961406224,
+    0.246696705186271,
+    0.15215147163693785,
+    0.09384020878514038,
+    0.057876435174097324,
+    0.0356955913869611,
+    2.226220488359828,
+    1.373033025457288,
+    0.8468252353500404,
+    0.5222838532866441,
+    0.32212127369018395,
+    0.19866996521303296,
+    0.12253073081944198,
+    0.07557146335153044,
+    0.046609091734769396,
+    2.9068607895844716,
+    1.7928214592288039,
+    1.1057319277854927,
+    0.6819658978480498,
+    0.42060600236002216,
+    0.259410932100151,
+    0.1599930369882551,
+    0.09867653486107755,
+    0.060859264349761896,
+    3.7955987262740045,
+    2.3409551883144304,
+    1.4437962463634366,
+    0.8904688186338573,
+    0.5492012594965409,
+    0.33872272349225035,
+    0.20890899542944347,
+    0.12884570577780485,
+    0.0794662568897734,
+    4.956057662793073,
+    3.056674252467696,
+    1.8852196889963935,
+    1.1627190149262456,
+    0.7171129792256512,
+    0.44228314697898835,
+    0.27278042340394476,
+    0.16823874004851097,
+    0.10376211496378639,
+    6.471313046582778,
+    3.991215864506328,
+    2.461603072269674,
+    1.5182064541520344,
+    0.9363616999810037,
+    0.5775059319458764,
+    0.3561797769381654,
+    0.21967572362808374,
+    0.13548614120194685,
+    8.449839650023657,
+    5.211482402557825,
+    3.2142087846712974,
+    1.9823799282882653,
+    1.222643096124222,
+    0.7540714669114886,
+    0.46507748582769676,
+    0.2868389500397316,
+    0.17690940922127898,
+    11.033277110402667,
+    6.80483084708555,
+    4.196914696703116,
+    2.588468893234366,
+    1.5964516068209011,
+    0.9846198034608854,
+    0.6072693674053308,
+    0.3745365300318384,
+    0.23099734624792922,
+    14.406569690892844,
+    8.885326531030772,
+    5.48007119369625,
+    3.379862313793386,
+    2.0845476010131496,
+    1.2856555378472472,
+    0.7929347169591774,
+    0.4890465967361114,
+    0.30162202343258687,
+    18.81120615223791,
+    11.601908899300932,
+    7.155537450301388,
+    4.413214812068625,
+    2.721873110543439,
+    1.6787293493259068,
+    1.0353650276244966,
+    0.6385667474380717,
+    0.3938393513920445,
+    24.562507556929937,
+    15.14905385160481,
+    9.34325748569895,
+    5.762502483600433,
+    3.5540532757796583,
+    2.19198077970945,
+    1.3519155076710592,
+    0.8338008967960747,
+    0.5142510249738893,
+    1.1806528312344016,
+    0.7281737533908033,
+    0.4491049367771172,
+    0.27698779762160786,
+    0.17083365990551266,
+    0.10536254523594835,
+    0.06498289590433946,
+    0.0400785378775518,
+    0.024718645976734437,
+    1.5416233204087082,
+    0.9508041736224252,
+    0.5864134024244982,
+    0.361673505526318,
+    0.223064009210699,
+    0.13757588389766662,
+    0.08485063949669394,
+    0.05233207171943914,
+    0.03227607648797069,
+    2.0129562214687393,
+    1.2415011834306533,
+    0.7657022900056393,
+    0.4722508562575439,
+    0.29126316343436937,
+    0.17963806576463143,
+    0.11079270818580335,
+    0.06833197705005231,
+    0.042144101033601944,
+    2.6283935225340636,
+    1.6210753288844832,
+    0.9998066116767637,
+    0.6166359100908891,
+    0.3803133937831472,
+    0.23456025691000745,
+    0.1446662542551945,
+    0.08922366216651123,
+    0.055029156117919434,
+    3.4319934212271743,
+    2.116699731736279,
+    1.305485531126215,
+    0.8051649680996108,
+    0.4965896675205436,
+    0.3062742514371984,
+    0.18889623209797374,
+    0.11650273026013133,
+    0.07185366276138927,
+    4.481284382405092,
+    2.763855370876294,
+    1.7046221259945933,
+    1.0513345318460166,
+    0.6484160219420904,
+    0.39991394249455275,
+    0.2466489969241071,
+    0.15212204731896004,
+    0.09382206118451125,
+    5.851383511337593,
+    3.608871110337284,
+    2.22578996331243,
+    1.3727674969027466,
+    0.8466614692377018,
+    0.5221828496880035,
+    0.3220589791971862,
+    0.198631544761583,
+    0.12250703480686387,
+    7.640374070252078,
+    4.712240310497056,
+    2.9062986366504924,
+    1.792474748492941,
+    1.1055180921420293,
+    0.6818340136065607,
+    0.42052466207048256,
+    0.259360765054963,
+    0.15996209620310248,
+    9.976327106277136,
+    6.152951453508158,
+    3.7948647018006527,
+    2.3405024749157906,
+    1.4435170330282576,
+    0.8902966123621275,
+    0.5490950503858475,
+    0.3386572184727122,
+    0.2088685948691084,
+    13.026469858190627,
+    8.034142805682745,
+    4.955099219111804,
+    3.056083127359332,
+    1.8848551095218067,
+    1.1624941586455544,
+    0.7169742979490278,
+    0.44219761458279855,
+    0.272727670855251,
+    17.009157293928357,
+    10.490485925303625,
+    6.470061570203565,
+    3.990444009962617,
+    2.461127026979055,
+    1.5179128507515398,
+    0.9361806185619017,
+    0.5773942490420386,
+    0.3561108959283327,
+    22.209503802573686,
+    13.697826589683247,
+    8.448205549702125,
+    5.210474562714419,
+    3.2135871942238987,
+    1.9819965591579167,
+    1.2224066512259464,
+    0.7539256382949026,
+    0.4649875452725377,
+    28.999794089305713,
+    17.885773320419638,
+    11.031143403442483,
+    6.8035148722581225,
+    4.196103062407153,
+    2.5879683135753537,
+    1.5961428717215294,
+    0.9844293894880687,
+    0.6071519286006154,
+    1.495195192511022,
+    0.9221693850886785,
+    0.568752748172418,
+    0.35078120547514297,
+    0.2163461266956244,
+    0.1334325950354141,
+    0.08229524461481802,
+    0.05075601868055746,
+    0.03130403760701907,
+    1.952333248485938,
+    1.20411165061393,
+    0.7426421018382028,
+    0.4580283656764438,
+    0.2824913686484482,
+    0.17422801586320533,
+    0.10745603186696187,
+    0.06627406463527351,
+    0.04087487288492401,
+    2.549235800271982,
+    1.5722543933778261,
+    0.9696960466474448,
+    0.5980650630357112,
+    0.3688597276028213,
+    0.22749614892502656,
+    0.14030942903977245,
+    0.08653656763198612,
+    0.05337187663562208,
+    3.3286341716651555,
+    2.0529523788226007,
+    1.2661690207923952,
+    0.7809163065603222,
+    0.4816341798270902,
+    0.2970503768828589,
+    0.18320735965609175,
+    0.11299408869423122,
+    0.06968968988913243,
+    4.346324277885496,
+    2.680618026869503,
+    1.6532850626308135,
+    1.019672131918867,
+    0.6288880726699848,
+    0.387869978560949,
+    0.2392208197400772,
+    0.14754068053792946,
+    0.09099647947552145,
+    5.675160968225851,
+    3.5001849434514707,
+    2.15875720652807,
+    1.3314246967023127,
+    0.8211630829202263,
+    0.506456587759853,
+    0.31235972563841097,
+    0.19264947985466352,
+    0.11881756526843512,
+    7.4102735912156135,
+    4.570324647361921,
+    2.8187714158145316,
+    1.7384918813588737,
+    1.07222387902545,
+    0.661299635091629,
+    0.4078599776846992,
+    0.25154975531464513,
+    0.15514461545862937,
+    9.675876156484424,
+    5.967646772883583,
+    3.680577079527979,
+    2.270014991487327,
+    1.4000435122630446,
+    0.8634840930920719,
+    0.5325582901475929,
+    0.3284580858800907,
+    0.2025782269770204,
+    12.634159622204388,
+    7.792183434160248,
+    4.805869522567218,
+    2.9640449385069583,
+    1.828090079481728,
+    1.127484032135792,
+    0.6953816209546851,
+    0.42888021912431584,
+    0.2645140981776214,
+    16.496902893115966,
+    10.174550368413016,
+    6.2752066778893525,
+    3.8702662451283496,
+    2.3870067675951074,
+    1.4721987965858632,
+    0.90798623870366,
+    0.5600052191233648,
+    0.3453861215927077,
+    21.54063374239798,
+    13.285297513087844,
+    8.19377610343277,
+    5.05355388293305,
+    3.116805551595245,
+    1.9223059794143762,
+    1.18559217677245,
+    0.7312201203537101,
+    0.4509837993918507,
+    28.12642500415988,
+    17.347118410185598,
+    10.698925195523211,
+    6.59861757052344,
+    4.069731589509571,
+    2.5100280526392518,
+    1.5480728117981886,
+    0.9547819308668047,
+    0.5888667048230439,
+    36.725743215137285,
+    22.65079249001009,
+    13.969993675009688,
+    8.616066010312192,
+    5.3140033718737945,
+    3.277439123898131,
+    2.021377567750865,
+    1.2466950924008695,
+    0.7689056602848247,
+    1.7441199622328505,
+    1.0756950270767411,
+    0.6634404836444091,
+    0.4091803571263758,
+    0.2523641061792769,
+    0.15564687057544974,
+    0.09599601419831447,
+    0.059206039336948416,
+    0.03651563164619214,
+    2.27736379080829,
+    1.404575922335586,
+    0.8662794804973417,
+    0.5342823598192411,
+    0.32952141478652175,
+    0.2032340405916588,
+    0.12534564796637143,
+    0.07730757809257646,
+    0.047679849500185376,
+    2.973640545369948,
+    1.8340082197517855,
+    1.1311340758230926,
+    0.6976328043182514,
+    0.43026864813244764,
+    0.2653704189650886,
+    0.16366858140226181,
+    0.10094344593001864,
+    0.06225739350170586,
+    3.8827955940801426,
+    2.394734308505022,
+    1.4769647974965374,
+    0.9109256944691294,
+    0.5618181437029214,
+    0.3465042522241568,
+    0.2137082936091687,
+    0.13180569780655255,
+    0.08129184731615349,
+    5.069913930546223,
+    3.1268956957603855,
+    1.9285291281288908,
+    1.189430335998833,
+    0.7335873249510723,
+    0.452443785097304,
+    0.2790470496294746,
+    0.17210371425517118,
+    0.10614585783922582,
+    6.619979507120073,
+    4.08290667463176,
+    2.518153854679329,
+    1.5530844423252144,
+    0.957872879971341,
+    0.590773063704712,
+    0.36436234921850374,
+    0.22472236749505006,
+    0.13859868496537764,
+    8.643959103654483,
+    5.331206581772085,
+    3.288049292773016,
+    2.0279214444005804,
+    1.2507310622437295,
+    0.7713948656052194,
+    0.47576178176514905,
+    0.2934285449395113,
+    0.18097357603183978,
+    11.286746266402908,
+    6.961159262865929,
+    4.293331057439253,
+    2.647934183477316,
+    1.6331271328071557,
+    1.007239624214689,
+    0.621220259101498,
+    0.38314081479768747,
+    0.23630408347621418,
+    14.737534011272901,
+    9.089450491126316,
+    5.6059657041293995,
+    3.45750840565729,
+    2.1324362306364337,
+    1.3151910983905357,
+    0.8111509270171515,
+    0.5002815387102071,
+    0.30855123212965296,
+    19.24335885710007,
+    11.868441320019782,
+    7.319922702308333,
+    4.51460026830883,
+    2.784403116195043,
+    1.717295054425916,
+    1.0591506261441523,
+    0.6532366386139529,
+    0.402887082813827,
+    25.126785785184957,
+    15.497075373727933,
+    9.557901563382835,
+    5.894885331085555,
+    3.635701083151633,
+    2.242337488114596,
+    1.3829732685959564,
+    0.8529559318294906,
+    0.5260649921178393,
+    32.809000163795545,
+    20.235120911277715,
+    12.480115707575404,
+    7.697176051350585,
+    4.7472732267636335,
+    2.927905369345478,
+    1.805800812877651,
+    1.113737011424844,
+    0.686903074675703,
+    42.83995975253674,
+    26.4217672315244,
+    16.29576189308905,
+    10.050495614063895,
+    6.198695265126356,
+    3.8230774347219803,
+    2.3579028241812523,
+    1.4542487886296867,
+    0.8969154782556643,
+    0.28295527735287823,
+    0.18360543765285642,
+    0.11913881603860475,
+    0.07730739170109585,
+    0.050163607549114066,
+    0.032550412929089445,
+    0.02112147498197517,
+    0.013705408480871234,
+    0.008893234103576385,
+    0.33981156739141755,
+    0.22049863191841151,
+    0.143078256726581,
+    0.09284133588408022,
+    0.060243351057961816,
+    0.03909100738516137,
+    0.02536556867357041,
+    0.016459337253555938,
+    0.010680217199647016,
+    0.4080924109749152,
+    0.2648050477122387,
+    0.17182802573163086,
+    0.11149662999972121,
+    0.07234849174552486,
+    0.046945851707494386,
+    0.030462459401282213,
+    0.019766633238579176,
+    0.012826271984200223,
+    0.49009342787759763,
+    0.3180142782918822,
+    0.20635469778787768,
+    0.13390046990293683,
+    0.08688600759968035,
+    0.056379027811358985,
+    0.03658350596104136,
+    0.023738488589757193,
+    0.01540354937895054,
+    0.5885715136799694,
+    0.38191523187053117,
+    0.2478190686170912,
+    0.16080607853593526,
+    0.1043446536959586,
+    0.06770768153827239,
+    0.04393449953503148,
+    0.02850843812016507,
+    0.01849869812226365,
+    0.7068375273174424,
+    0.4586562751778333,
+    0.2976151811836791,
+    0.19311802948003123,
+    0.12531139427068788,
+    0.08131268518192651,
+    0.05276258244492039,
+    0.03423684877738856,
+    0.022215777922345022,
+    0.8488676030214735,
+    0.5508174621098066,
+    0.3574171937828251,
+    0.23192265895543246,
+    0.1504911366117455,
+    0.09765144251406299,
+    0.06336455714118847,
+    0.041116311222138074,
+    0.0266797579717766,
+    1.0194368289897116,
+    0.6614972758139023,
+    0.42923566567912386,
+    0.2785245887283644,
+    0.1807304302254711,
+    0.11727326681860566,
+    0.07609686477894301,
+    0.049378114776504445,
+    0.032040718444373104,
+    1.2242797870969153,
+    0.794416800500747,
+    0.5154851526335664,
+    0.33449058783519703,
+    0.21704592805191536,
+    0.14083784894756954,
+    0.09138756886254042,
+    0.05930002343130573,
+    0.03847889622977826,
+    1.470283351033608,
+    0.9540448252660516,
+    0.6190653848981288,
+    0.401702247766183,
+    0.2606585666019067,
+    0.16913743629960432,
+    0.10975074685227487,
+    0.07121561434392103,
+    0.04621074454471436,
+    1.7657182247961842,
+    1.1457480859458173,
+    0.7434587569033176,
+    0.48241924206222514,
+    0.3130346141610606,
+    0.20312346838421652,
+    0.13180377358270484,
+    0.08552549278934436,
+    0.05549621014659635,
+    2.120517005912911,
+    1.3759716961752027,
+    0.892847406267404,
+    0.5793552971288198,
+    0.3759349671120584,
+    0.24393856446628864,
+    0.15828807756565016,
+    0.10271076061403901,
+    0.06664747281133038,
+    2.546608121964021,
+    1.6524558337903241,
+    1.0722538183541745,
+    0.6957694284257605,
+    0.4514743517304116,
+    0.29295493872384804,
+    0.1900940680101816,
+    0.12334919100552422,
+    0.08003944089882047,
+    0.3090254409684047,
+    0.20052197600156807,
+    0.1301157041749339,
+    0.08443012985672212,
+    0.05478544556035396,
+    0.035549454327974586,
+    0.023067507986670212,
+    0.014968160124369788,
+    0.009712614714959272,
+    0.3711202011911491,
+    0.24081433503902783,
+    0.1562608119260531,
+    0.10139529833152208,
+    0.06579388905648091,
+    0.042692668283522923,
+    0.027702632437524008,
+    0.01797582289474155,
+    0.011664241998367828,
+    0.4456921193949231,
+    0.2892029348435886,
+    0.18765944893908684,
+    0.12176940318799967,
+    0.07901434026684494,
+    0.051271220884328256,
+    0.033269126617926296,
+    0.021587837520325788,
+    0.014008024140702072,
+    0.5352483229238879,
+    0.34731461276418635,
+    0.22536724558161741,
+    0.1462374271465792,
+    0.0948912742100594,
+    0.06157352530678268,
+    0.03995413751439639,
+    0.025925640875128705,
+    0.016822759709027798,
+    0.6427997147039033,
+    0.4171030985725522,
+    0.27065194781388985,
+    0.17562199155590985,
+    0.11395847754723307,
+    0.0739459477132106,
+    0.04798241693724384,
+    0.031135071039574917,
+    0.02020308084745384,
+    0.7719622005843727,
+    0.5009146993678227,
+    0.325036039138722,
+    0.21091101313721078,
+    0.13685699462876982,
+    0.08880445217260516,
+    0.057623877735063826,
+    0.03739127041481725,
+    0.024262634834504474,
+    0.9270782570362092,
+    0.6015671830333121,
+    0.39034792689405107,
+    0.25329091800216397,
+    0.1643566795726633,
+    0.10664858548114362,
+    0.0692026683351211,
+    0.04490457405595421,
+    0.029137904934271434,
+    1.1133629263436433,
+    0.7224445123278426,
+    0.4687834137846261,
+    0.3041865296083011,
+    0.1973820789607817,
+    0.12807827205579542,
+    0.0831080706980379,
+    0.0539275811914542,
+    0.034992798999358116,
+    1.3370791476863062,
+    0.8676106145964954,
+    0.5629795213417774,
+    0.36530897169535054,
+    0.23704351533614365,
+    0.15381398354972767,
+    0.09980758807886475,
+    0.06476364767511404,
+    0.04202416009564401,
+    1.6057483187883106,
+    1.0419460120681407,
+    0.6761031472752399,
+    0.4387131967117606,
+    0.28467441653647296,
+    0.18472096129723944,
+    0.1198626626084767,
+    0.07777708488900244,
+    0.05046838441751154,
+    1.9284031672719006,
+    1.2513119062859925,
+    0.8119575374003276,
+    0.5268670738521083,
+    0.34187614588596454,
+    0.22183830595314327,
+    0.14394755112448096,
+    0.09340540798716583,
+    0.06060936898957167,
+    2.3158914333165477,
+    1.5027472332325469,
+    0.9751101517544263,
+    0.6327343594632323,
+    0.41057184044800366,
+    0.266413912327858,
+    0.17287199386199578,
+    0.1121740452692454,
+    0.07278805635869377,
+    2.7812405735137187,
+    1.8047053141936154,
+    1.1710462237949983,
+    0.7598743393057921,
+    0.4930710673949404,
+    0.319946423936483,
+    0.20760843813159838,
+    0.13471400321698349,
+    0.08741389717137558,
+    0.41364331004676075,
+    0.2684069429056689,
+    0.17416524152614218,
+    0.11301321429125659,
+    0.07333258055697879,
+    0.04758441218463628,
+    0.03087681172215177,
+    0.020035500247978878,
+    0.013000735755977424,
+    0.4967597100253698,
+    0.3223399288424203,
+    0.20916154758370037,
+    0.1357217926575753,
+    0.08806783663146572,
+    0.05714589895312317,
+    0.03708111714866151,
+    0.02406138102964625,
+    0.015613069442669648,
+    0.5965773010485605,
+    0.3871100672781519,
+    0.25118991943660524,
+    0.1629933730998303,
+    0.10576395634843684,
+    0.06862864575250455,
+    0.04453209940734568,
+    0.028896211718607987,
+    0.018750318597125996,
+    0.7164519765667158,
+    0.46489494716415763,
+    0.3016633619108163,
+    0.1957448332670373,
+    0.12701588786929974,
+    0.0824187055257681,
+    0.05348026246553632,
+    0.034702540583926474,
+    0.022517958354357638,
+    0.8604139544433854,
+    0.5583097164545453,
+    0.362278805309712,
+    0.23507728579414328,
+    0.15253812667594074,
+    0.09897970368001005,
+    0.06422644589962596,
+    0.041675577916795416,
+    0.0270426577458959,
+    1.033303273931252,
+    0.6704950040626874,
+    0.43507415665358046,
+    0.2823130979960692,
+    0.18318873709522196,
+    0.11886842529357103,
+    0.07713193920010829,
+    0.050049759051455776,
+    0.03247653834567744,
+    1.2409325190544649,
+    0.805222508624609,
+    0.5224968146452859,
+    0.3390403502018135,
+    0.21999820064550024,
+    0.14275353437562283,
+    0.09263062841850084,
+    0.06010662614229191,
+    0.03900228863704516,
+    1.4902822391999062,
+    0.9670218039910833,
+    0.6274859518531314,
+    0.40716622742940844,
+    0.2642040610941041,
+    0.17143805452459626,
+    0.11124358352958837,
+    0.07218429368451008,
+    0.04683930604721756,
+    1.789735637008646,
+    1.1613326246821585,
+    0.7535713304593687,
+    0.48898113944376753,
+    0.31729253100163857,
+    0.20588636679105138,
+    0.13359657693991048,
+    0.08668881601167375,
+    0.056251073146027675,
+    2.1493604138357263,
+    1.3946877511808276,
+    0.9049919737856028,
+    0.5872357249304994,
+    0.38104845857599273,
+    0.24725663242018275,
+    0.16044112211931963,
+    0.1041078389483285,
+    0.06755401599865762,
+    2.5812472484961577,
+    1.6749326437171241,
+    1.0868386833627304,
+    0.7052333286860978,
+    0.45761533473471583,
+    0.2969397305350213,
+    0.19267973967989063,
+    0.12502699458983926,
+    0.08112814249249851,
+    3.0999162890408654,
+    2.01148920868776,
+    1.3052251930064849,
+    0.846941060931769,
+    0.5495673578288545,
+    0.35660601985540025,
+    0.23139630035434622,
+    0.15014959040621476,
+    0.09742981830146015,
+    3.7228053239221466,
+    2.4156725656071485,
+    1.5674937141432586,
+    1.0171231725939989,
+    0.6599959788630652,
+    0.42826149659387447,
+    0.2778924650128486,
+    0.18032025462272638,
+    0.11700711001898337,
+    0.5914932416896979,
+    0.38381109737601804,
+    0.2490492673224215,
+    0.1616043360337463,
+    0.10486263101950041,
+    0.06804378925844948,
+    0.04415259479601737,
+    0.0286499568655228,
+    0.018590527514599345,
+    0.7103463396773513,
+    0.4609330909170901,
+    0.29909257278482543,
+    0.19407668674223466,
+    0.125933452596769,
+    0.08171632950435875,
+    0.05302450119465917,
+    0.0344068039276341,
+    0.022326059271518366,
+    0.853081466918474,
+    0.5535517752219578,
+    0.35919144857083657,
+    0.23307394628927589,
+    0.15123818970356995,
+    0.09813619406617237,
+    0.06367910515637513,
+    0.04132041671376021,
+    0.026812198965516745,
+    1.0244974156273237,
+    0.6647810146190994,
+    0.43136643456283685,
+    0.2799072127143568,
+    0.18162759420287547,
+    0.11785542307403495,
+    0.0764746172459067,
+    0.049623232689378065,
+    0.0321997717834405,
+    1.2303572347180898,
+    0.7983603651542751,
+    0.5180440726187215,
+    0.3361510326524432,
+    0.21812336580187006,
+    0.14153698215149788,
+    0.09184122591776762,
+    0.059594394693607444,
+    0.03866990932892581,
+    1.4775819850128393,
+    0.9587807994403504,
+    0.6221384875421919,
+    0.4036963380026118,
+    0.26195250186264474,
+    0.169977051492736,
+    0.11029556056431136,
+    0.07156913579428431,
+    0.04644013931416648,
+    1.7744834271119048,
+    1.1514356943281365,
+    0.7471493607188862,
+    0.48481401955179887,
+    0.31458854937360675,
+    0.20413179364838147,
+    0.13245806073067895,
+    0.08595004991115626,
+    0.05577169889834596,
+    2.1310434649536214,
+    1.3828021576431262,
+    0.8972795903175536,
+    0.5822312749154821,
+    0.3778011459836455,
+    0.2451494999599177,
+    0.15907383545416576,
+    0.10322062712849235,
+    0.0669783175490802,
+    2.559249740028789,
+    1.6606587902403191,
+    1.0775765938229298,
+    0.6992232976329776,
+    0.4537155156815471,
+    0.2944091964141432,
+    0.1910377140244374,
+    0.12396150875784777,
+    0.08043676470896369,
+    3.0734986590149007,
+    1.9943472045942316,
+    1.2941020035283322,
+    0.8397233900286569,
+    0.5448839193809208,
+    0.35356700685660514,
+    0.22942433037768936,
+    0.1488700086504349,
+    0.09659951688252044,
+    3.691079404724344,
+    2.3950860922473067,
+    1.5541354601947068,
+    1.0084552018622033,
+    0.6543714625979429,
+    0.4246118323073324,
+    0.2755242525699301,
+    0.17878355707071455,
+    0.11600997001432696,
+    4.432755202940912,
+    2.8763483991462784,
+    1.8664193564721063,
+    1.2110915406658271,
+    0.7858591450984275,
+    0.5099322183319889,
+    0.33088737201170415,
+    0.21470785532035416,
+    0.1393207086024289,
+    5.323461387487318,
+    3.4543142895996914,
+    2.2414527584212793,
+    1.4544450930134065,
+    0.9437676170702444,
+    0.6123966585669091,
+    0.3973750112216469,
+    0.2578506876783547,
+    0.16731544575940993,
+    0.33171986376918167,
+    0.2068997734324878,
+    0.1290471898788709,
+    0.08048910319888467,
+    0.050202532421215,
+    0.031312241798440936,
+    0.019530020482187927,
+    0.012181232582768025,
+    0.0075976585570311905,
+    0.3882738242403168,
+    0.24217351759491024,
+    0.15104807216670085,
+    0.09421145768481984,
+    0.058761417022939744,
+    0.036650575369456276,
+    0.022859637206975474,
+    0.014257975706161198,
+    0.00889296139728107,
+    0.4544695059175002,
+    0.28346098041247675,
+    0.17679982126455032,
+    0.11027329671156771,
+    0.06877948111407772,
+    0.04289902599625037,
+    0.026756910660238876,
+    0.016688776760166574,
+    0.010409096673651239,
+    0.5319506979720066,
+    0.3317874233912158,
+    0.20694191160996445,
+    0.1290734722343311,
+    0.08050549598684797,
+    0.050212756904238105,
+    0.03131861899634795,
+    0.01953399805768523,
+    0.012183713469682216,
+    0.6226414344382277,
+    0.3883529019069762,
+    0.24222283978843068,
+    0.15107883532495314,
+    0.09423064523180648,
+    0.058773384648511354,
+    0.03665803979739604,
+    0.022864292907818932,
+    0.014260879552312391,
+    0.7287937723501121,
+    0.45456206530691073,
+    0.28351871140416496,
+    0.1768358291447074,
+    0.1102957554879631,
+    0.06879348906553098,
+    0.04290776301292766,
+    0.026762360098058078,
+    0.016692175674652185,
+    0.8530437154339454,
+    0.5320590375441003,
+    0.33185499677275915,
+    0.20698405836949987,
+    0.12909975994257897,
+    0.08052189211344327,
+    0.05022298346962732,
+    0.03132499749306498,
+    0.019537976443274183,
+    0.9984766720698202,
+    0.6227682445107252,
+    0.38843199567896375,
+    0.24227217202714013,
+    0.15110960474857446,
+    0.09424983668661886,
+    0.05878535471146569,
+    0.036665505745576185,
+    0.022868949556864242,
+    1.168704072991698,
+    0.7289422019052233,
+    0.45465464354740026,
+    0.2835764541536176,
+    0.17687184435839817,
+    0.11031821883841811,
+    0.06880749986990932,
+    0.04291650180902671,
+    0.026767810645735333,
+    1.3679530513176312,
+    0.8532174503147525,
+    0.5321673991811392,
+    0.33192258391661406,
+    0.20702621371284177,
+    0.12912605300470464,
+    0.08053829157935057,
+    0.05023321211780679,
+    0.03133137728885654,
+    1.6011714118690423,
+    0.9986800265081356,
+    0.6228950804099563,
+    0.3885111055595594,
+    0.24232151431308452,
+    0.1511403804388407,
+    0.09426903205005288,
+    0.05879732721229912,
+    0.03667297321430633,
+    1.8741504964057534,
+    1.1689420967402426,
+    0.7290906616901933,
+    0.4547472406428082,
+    0.28363420866322914,
+    0.17690786690711607,
+    0.11034068676386437,
+    0.06882151352779374,
+    0.04292524238490993,
+    2.1936689957996878,
+    1.3682316550468663,
+    0.8533912205792197,
+    0.5322757828876168,
+    0.33199018482558346,
+    0.2070683776417385,
+    0.12915235142179862,
+    0.08055469438524997,
+    0.05024344284920068,
+    0.3577911353058196,
+    0.223160904474615,
+    0.13918955606141936,
+    0.08681508332378529,
+    0.0541481624468293,
+    0.03377320373503468,
+    0.02106496765514804,
+    0.013138607334788504,
+    0.008194790778877416,
+    0.41878991148127204,
+    0.2612069618525412,
+    0.16291958103505094,
+    0.10161593587088502,
+    0.06337972610360627,
+    0.039531099591231515,
+    0.024656273085455104,
+    0.015378570511592476,
+    0.009591896965139252,
+    0.49018819264088964,
+    0.30573938155012326,
+    0.19069526935572784,
+    0.1189401429749799,
+    0.07418515235697294,
+    0.046270642464125676,
+    0.028859849795020518,
+    0.018000418533995914,
+    0.011227191745638571,
+    0.5737589603212953,
+    0.35786400472519586,
+    0.22320635447024625,
+    0.13921790405870765,
+    0.08683276449050704,
+    0.05415919051535428,
+    0.03378008214398281,
+    0.021069257845179996,
+    0.013141283205131353,
+    0.6715774665550626,
+    0.41887520419727015,
+    0.26126016048651785,
+    0.1629527620004343,
+    0.10163663144859954,
+    0.06339263431564858,
+    0.03953915068023364,
+    0.024661294697581364,
+    0.015381702583333323,
+    0.786072767093615,
+    0.49028802666543103,
+    0.3058016498653932,
+    0.19073410724796308,
+    0.11896436688190178,
+    0.07420026125276478,
+    0.046280066160013636,
+    0.02886572752727918,
+    0.018004084583592074,
+    0.9200880403802981,
+    0.5738758147600302,
+    0.35793688898549947,
+    0.22325181372243652,
+    0.1392462578294819,
+    0.08685044925825806,
+    0.054170220829907405,
+    0.03378696195381994,
+    0.02107354890897216,
+    1.0769511901307711,
+    0.6717142431691959,
+    0.41896051428438247,
+    0.2613133699551776,
+    0.16298594972360855,
+    0.1016573312412724,
+    0.06340554515663788,
+    0.03954720340895828,
+    0.024666317332432682,
+    1.2605574847431953,
+    0.7862328623572291,
+    0.49038788102263775,
+    0.30586393086252,
+    0.19077295305010553,
+    0.118988595722378,
+    0.07421537322570518,
+    0.046289491775175655,
+    0.028871606456624337,
+    1.4754662856625311,
+    0.9202754298225218,
+    0.5739926929978878,
+    0.35800978808975314,
+    0.22329728223307121,
+    0.13927461737491803,
+    0.08686813762777178,
+    0.054181253390946066,
+    0.03379384316483138,
+    1.7270142666839912,
+    1.0771705270571994,
+    0.6718510476398952,
+    0.41904584174614684,
+    0.2613665902607271,
+    0.16301914420594996,
+    0.101678035249762,
+    0.06341845862710956,
+    0.039555257777739376,
+    2.02144793568819,
+    1.260814215788041,
+    0.7863929902265949,
+    0.4904877557166509,
+    0.3059262245440866,
+    0.19081180676376605,
+    0.11901282949741347,
+    0.07423048827642081,
+    0.046298919310002636,
+    2.3660787496237545,
+    1.4757667860409251,
+    0.9204628574293574,
+    0.5741095950397151,
+    0.3580827020409801,
+    0.22334276000403583,
+    0.1393029826961921,
+    0.08688582959978171,
+    0.054192288198927824,
+    0.421979822827091,
+    0.2631965681643867,
+    0.16416053504504988,
+    0.10238994168588672,
+    0.06386248775055639,
+    0.039832206899792846,
+    0.02484407924578671,
+    0.015495708664190016,
+    0.009664958182991427,
+    0.4939219427490547,
+    0.3080681900895191,
+    0.19214779002691657,
+    0.1198461068034953,
+    0.07475021864130105,
+    0.04662308468713097,
+    0.029079674484622398,
+    0.018137527231547834,
+    0.011312708959280183,
+    0.5781292666899959,
+    0.36058984509918046,
+    0.2249065111909875,
+    0.1402783230409301,
+    0.087494167291872,
+    0.05457171959394224,
+    0.03403738410933497,
+    0.021229741808154665,
+    0.013241380001270486,
+    0.67669285382068,
+    0.422065765215383,
+    0.2632501720109089,
+    0.16419396874894254,
+    0.10241079490125284,
+    0.06387549428409815,
+    0.03984031931372055,
+    0.02484913910739571,
+    0.01549886459283598,
+    0.7920602619440094,
+    0.4940225372066412,
+    0.30813093270084996,
+    0.19218692374631885,
+    0.11987051522325622,
+    0.07476544262114049,
+    0.04663258016305376,
+    0.029085596987407532,
+    0.0181412212053439,
+    0.9270963259160702,
+    0.578247011205807,
+    0.3606632845169091,
+    0.22495231670506322,
+    0.14030689278160388,
+    0.08751198676401713,
+    0.0545828339261008,
+    0.034044316322496174,
+    0.021234065556862823,
+    1.0851542980044548,
+    0.6768306722585566,
+    0.42215172510710464,
+    0.2633037867746418,
+    0.1642274092621,
+    0.10243165236368247,
+    0.0638885034666115,
+    0.039848433379860486,
+    0.02485419999951985,
+    1.2701591167605875,
+    0.7922215766488847,
+    0.4941231521517662,
+    0.308193688090635,
+    0.19222606543587786,
+    0.11989492861415028,
+    0.07478066970156705,
+    0.046642077572869665,
+    0.02909152069639734,
+    1.486704872161334,
+    0.9272851426985698,
+    0.578364779702018,
+    0.3607367388916538,
+    0.22499813154810464,
+    0.14033546834092492,
+    0.08752980986535949,
+    0.054593950521856324,
+    0.034051249947504414,
+    1.7401688873008083,
+    1.085375305614276,
+    0.6769685187651822,
+    0.42223770250582054,
+    0.26335741245780864,
+    0.16426085658590903,
+    0.10245251407404071,
+    0.06390151529863594,
+    0.03985654909854917,
+    2.0368452495399643,
+    1.270417803318807,
+    0.7923829242078686,
+    0.4942237875886024,
+    0.30825645626147685,
+    0.1922652150972167,
+    0.11991934697718995,
+    0.07479589988321214,
+    0.04665157691697257,
+    2.3841011069958076,
+    1.4870076614429233,
+    0.9274739979363803,
+    0.578482572183513,
+    0.3608102082264607,
+    0.22504395572201163,
+    0.14036404972007832,
+    0.08754763659663821,
+    0.05460506938166984,
+    2.7905596115671485,
+    1.74052329825156,
+    1.0855963582355432,
+    0.6771063933462733,
+    0.4223236974150965,
+    0.2634110490626334,
+    0.16429431072175685,
+    0.10247338003319265,
+    0.06391452978071106,
+    0.5725904048798552,
+    0.35713515522752004,
+    0.22275175764802993,
+    0.13893436366878054,
+    0.08665591514006932,
+    0.05404888632638743,
+    0.03371128339480155,
+    0.02102634680133625,
+    0.013114518798718843,
+    0.6702096874750602,
+    0.4180220952560609,
+    0.2607280607664594,
+    0.16262088162922989,
+    0.10142963156373082,
+    0.06326352468442771,
+    0.039458622631222545,
+    0.02461106787394157,
+    0.015350375190655558,
+    0.7844717993129277,
+    0.48928947364743214,
+    0.30517883400252377,
+    0.190345645551839,
+    0.11872207618516133,
+    0.07404914009381221,
+    0.04618580911675769,
+    0.028806937677698038,
+    0.017967416274313697,
+    0.9182141282315655,
+    0.5727070213251126,
+    0.35720789104691936,
+    0.22279712431490098,
+    0.13896265969239022,
+    0.0866735638898528,
+    0.054059894175872494,
+    0.033718149192763,
+    0.021030629125664124,
+    1.0747578001178502,
+    0.670346185520896,
+    0.4181072315950082,
+    0.26078116186519645,
+    0.16265400176009237,
+    0.10145028919783704,
+    0.06327640923034444,
+    0.03946665895922734,
+    0.0246160802793626,
+    1.2579901500087283,
+    0.7846315685159407,
+    0.4893891246346515,
+    0.3052409881540532,
+    0.19038441223805191,
+    0.11874625567957876,
+    0.07406422128870913,
+    0.04619521553508855,
+    0.028812804633626902,
+    1.4724612534521293,
+    0.918401136024059,
+    0.5728236615210219,
+    0.3572806416800364,
+    0.22284250022136007,
+    0.13899096147890067,
+    0.08669121623406342,
+    0.05407090426726777,
+    0.03372501638904504,
+    1.7234969152204989,
+    1.0749766903281897,
+    0.6704827113665636,
+    0.4181923852732213,
+    0.26083427377875223,
+    0.16268712863635595,
+    0.10147095103917383,
+    0.06328929640038819,
+    0.03947469692394835,
+    2.0173309211434174,
+    1.2582463581781504,
+    0.7847913702582985,
+    0.489488795917258,
+    0.3053031549641885,
+    0.19042318681966974,
+    0.11877044009850542,
+    0.07407930555511291,
+    0.046204623869174656,
+    2.3612598371727835,
+    1.4727611418115805,
+    0.9185881819034358,
+    0.57294032547242,
+    0.35735340712988845,
+    0.22288788536928889,
+    0.1390192690294856,
+    0.08670887217343318,
+    0.054081916601029865,
+    2.763824199693045,
+    1.7238479306792842,
+    1.0751956251187347,
+    0.6706192650177244,
+    0.41827755629423147,
+    0.26088739650932913,
+    0.16272026225939434,
+    0.10149161708859802,
+    0.06330218619509335,
+    3.235020596443552,
+    2.017741780212879,
+    1.258502618528129,
+    0.7849512045466279,
+    0.48958848749938505,
+    0.30536533443550745,
+    0.19046196929830067,
+    0.11879462944294417,
+    0.07409439289364908,
+    3.786549904504163,
+    2.36174074241708,
+    1.4730610912477007,
+    0.9187752658774533,
+    0.5730570131841454,
+    0.357426187399493,
+    0.22293327976056965,
+    0.13904758234531897,
+    0.08672653170869431,
+    0.10456750700177399,
+    0.06578155374874324,
+    0.04138200228418361,
+    0.0260326796108992,
+    0.016376694464171615,
+    0.010302286417743268,
+    0.006480984649583639,
+    0.004077071858126381,
+    0.002564813193531324,
+    0.12563281573305576,
+    0.07903336378297475,
+    0.04971847963770937,
+    0.0312770088373465,
+    0.019675808450697035,
+    0.0123777001887168,
+    0.00778659043899833,
+    0.004898405175459804,
+    0.0030814993354213237,
+    0.15094176806518075,
+    0.09495477432336201,
+    0.05973435505874743,
+    0.03757781743689122,
+    0.023639534769088304,
+    0.014871209724658404,
+    0.009355212817638035,
+    0.00588519753831319,
+    0.003702272811973543,
+    0.18134925348686742,
+    0.11408358110075677,
+    0.07176794625027474,
+    0.04514793504275924,
+    0.028401760745904094,
+    0.01786704115489662,
+    0.011239836941334952,
+    0.007070780963258414,
+    0.004448102200354489,
+    0.21788238048226882,
+    0.13706591974460425,
+    0.08622572561328874,
+    0.0542430661931982,
+    0.034123345545801056,
+    0.021466388111078996,
+    0.013504121919023754,
+    0.008495202260399804,
+    0.005344180234587159,
+    0.26177517035137915,
+    0.1646780910466148,
+    0.10359605013094123,
+    0.06517042755672087,
+    0.0409975536958941,
+    0.025790829860443096,
+    0.016224551099421815,
+    0.01020657574037546,
+    0.0064207747694007555,
+    0.31451024016175655,
+    0.19785278296229963,
+    0.12446565716204887,
+    0.07829912514160894,
+    0.0492565832031832,
+    0.030986438028064205,
+    0.019493015536753953,
+    0.012262708426569962,
+    0.007714251172248887,
+    0.3778688828043948,
+    0.2377105750809682,
+    0.1495394833413031,
+    0.09407262201257549,
+    0.05917940877275059,
+    0.037228710625543525,
+    0.023419917900204465,
+    0.014733052669194054,
+    0.009268300678003272,
+    0.45399123576518646,
+    0.2855977897267775,
+    0.17966447603188596,
+    0.11302371765094103,
+    0.0711012050560986,
+    0.04472850004847889,
+    0.028137901671403186,
+    0.01770105211691487,
+    0.011135416197867141,
+    0.5454485710015283,
+    0.3431319682308533,
+    0.2158582016372161,
+    0.1357925449333386,
+    0.08542466822948648,
+    0.053739135279482105,
+    0.03380633159532305,
+    0.02126696028860909,
+    0.013378665432597464,
+    0.6553301477420804,
+    0.4122565084786442,
+    0.259343217107558,
+    0.16314819263352426,
+    0.1026336183241934,
+    0.06456497887155702,
+    0.04061667672591399,
+    0.025551226951367526,
+    0.016073821182513277,
+    0.7873475619362357,
+    0.4953063092875665,
+    0.3115883656472651,
+    0.19601468381531664,
+    0.12330934177020607,
+    0.07757170775087284,
+    0.048798977895774816,
+    0.030698566690321744,
+    0.019311920812212915,
+    0.9459601170842457,
+    0.5950866389603139,
+    0.37435839151508843,
+    0.23550218761861735,
+    0.14815022617415827,
+    0.09319866510539003,
+    0.05862961806899853,
+    0.036882847099038954,
+    0.023202341323973124,
+    0.16139338708466658,
+    0.10152970144943406,
+    0.0638705244534184,
+    0.04017980783668949,
+    0.02527640052448152,
+    0.01590093277874297,
+    0.01000299322639765,
+    0.006292704640643571,
+    0.0039586282623763624,
+    0.19390636959335433,
+    0.12198303889383647,
+    0.07673735426525766,
+    0.048274100998226564,
+    0.030368375994975452,
+    0.019104203734546635,
+    0.012018113856053782,
+    0.007560381090151703,
+    0.004756100908424249,
+    0.2329691497778024,
+    0.1465567372438891,
+    0.0921962296383883,
+    0.05799900379461307,
+    0.03648613890569446,
+    0.0229527792746205,
+    0.014439184091009019,
+    0.009083433196457425,
+    0.005714225825673991,
+    0.27990119593292756,
+    0.17608085047190639,
+    0.1107693227232206,
+    0.06968300541300855,
+    0.043836335945850013,
+    0.02757665714571332,
+    0.017347983195302064,
+    0.010913306836077647,
+    0.006865366697532436,
+    0.3362877855690568,
+    0.21155264838705073,
+    0.13308399817092006,
+    0.0837207697667451,
+    0.05266724314469762,
+    0.03313202336995832,
+    0.02084276500996201,
+    0.013111811748098582,
+    0.008248406928514777,
+    0.4040335531472307,
+    0.2541703025606164,
+    0.15989400434823292,
+    0.10058646651064018,
+    0.06327715217551841,
+    0.03980652791914274,
+    0.02504157678560238,
+    0.01575320935257104,
+    0.009910063053561917,
+    0.4854268251002359,
+    0.30537335834038026,
+    0.19210493355991715,
+    0.12084978761285814,
+    0.07602444609533023,
+    0.04782562318286461,
+    0.03008624659969543,
+    0.018926721163604224,
+    0.011906462735981515,
+    0.5832169152571036,
+    0.3668913600236309,
+    0.23080481127789093,
+    0.145195190493425,
+    0.09133970486013612,
+    0.057460179332280106,
+    0.036147174046089525,
+    0.02273954252670168,
+    0.014305040655857679,
+    0.7007069915672163,
+    0.44080227165707453,
+    0.2773008476245498,
+    0.17444501772694002,
+    0.10974024951757237,
+    0.0690356338123105,
+    0.04342908601738032,
+    0.02732046347879969,
+    0.017186816328524975,
+    0.8418656509897904,
+    0.5296026668099308,
+    0.33316359250722316,
+    0.2095872742501788,
+    0.13184761635282008,
+    0.08294298401519293,
+    0.05217795199979289,
+    0.032824219036947024,
+    0.02064913079359175,
+    1.0114609713416522,
+    0.6362920582006242,
+    0.400279985882352,
+    0.25180900033716425,
+    0.15840855123203293,
+    0.09965199444750787,
+    0.06268929246641593,
+    0.03943671586031275,
+    0.024808934614794515,
+    1.215221568126202,
+    0.7644742156755219,
+    0.4809170950889605,
+    0.3025363676189319,
+    0.19032023329328,
+    0.11972706450430015,
+    0.0753181610109081,
+    0.047381311832474834,
+    0.029806738253222685,
+    1.460030096544657,
+    0.9184788948732019,
+    0.5777986921803809,
+    0.36348285251720186,
+    0.22866057999452152,
+    0.1438462928342859,
+    0.09049113739964663,
+    0.056926360676637144,
+    0.03581135825019737,
+    0.20331067609697956,
+    0.12789912039444432,
+    0.0804590556271117,
+    0.050615356950397414,
+    0.03184121835942695,
+    0.02003074259866002,
+    0.012600982931137884,
+    0.00792705363012605,
+    0.004986768063911671,
+    0.24426797041476261,
+    0.15366462379812246,
+    0.09666767430426658,
+    0.06081190988807107,
+    0.038255687962399386,
+    0.0240659710272239,
+    0.01513947316938683,
+    0.009523972566380306,
+    0.0059913612865062724,
+    0.2934761839171011,
+    0.1846206333100332,
+    0.11614154780418484,
+    0.07306257640065579,
+    0.045962363781321305,
+    0.028914103340428536,
+    0.01818934674375329,
+    0.011442593639135301,
+    0.0071983315857863635,
+    0.35259747882745296,
+    0.22181278554117165,
+    0.13953846747046866,
+    0.08778116129105168,
+    0.05522156303770782,
+    0.03473890045970938,
+    0.02185362272932305,
+    0.013747724311236883,
+    0.008648448180821514,
+    0.423628862881066,
+    0.26649736244220745,
+    0.16764873787316145,
+    0.10546483106960983,
+    0.06634604431651955,
+    0.04173711323298156,
+    0.026256073575572417,
+    0.016517227623234557,
+    0.010390693321775354,
+    0.5089696445439594,
+    0.3201837261787183,
+    0.2014218718319538,
+    0.12671090731713974,
+    0.07971157197132991,
+    0.05014512831351997,
+    0.03154540591024592,
+    0.0198446522625385,
+    0.012483916819506368,
+    0.6115024772047529,
+    0.38468530258688943,
+    0.241998663198901,
+    0.15223704310051553,
+    0.09576960874754727,
+    0.06024695286286221,
+    0.03790028357354965,
+    0.023842392464647467,
+    0.014998823883075182,
+    0.7346907298618921,
+    0.462180835336292,
+    0.29074972075979166,
+    0.18290546396279542,
+    0.11506256535697396,
+    0.07238380778619553,
+    0.045535362551442894,
+    0.028645484482052674,
+    0.018020363410624015,
+    0.8826954733075679,
+    0.5552879798518011,
+    0.3493217648579173,
+    0.21975209230355952,
+    0.13824212210605868,
+    0.08696565354193393,
+    0.054708541656886406,
+    0.03441616785849908,
+    0.021650597405666556,
+    1.0605160333847372,
+    0.6671517228608939,
+    0.41969325055436213,
+    0.26402153891703833,
+    0.16609124144847806,
+    0.10448503784596484,
+    0.06572967387361746,
+    0.04134936557999205,
+    0.026012148442350606,
+    1.274158858945691,
+    0.8015506142147139,
+    0.5042411961720465,
+    0.3172091436373189,
+    0.1995506150052627,
+    0.12553373302034218,
+    0.07897103261549436,
+    0.04967926821189079,
+    0.031252341628679015,
+    1.5308404085587397,
+    0.9630243992968717,
+    0.6058214745678466,
+    0.3811114851456831,
+    0.23975043838377827,
+    0.15082272496521992,
+    0.09487988643224729,
+    0.059687244422032985,
+    0.0375481809755274,
+    1.8392309090998331,
+    1.1570273632061252,
+    0.7278652792231068,
+    0.45788706606772733,
+    0.28804858709003706,
+    0.18120622894444033,
+    0.11399360691188284,
+    0.07171134509269611,
+    0.04511232826397817,
+    0.2740166079296673,
+    0.1723789611075639,
+    0.10844053014534782,
+    0.06821800353505025,
+    0.04291472939195858,
+    0.02699689089902471,
+    0.016983262589334035,
+    0.010683867607461879,
+    0.006721030570737314,
+    0.3292177369327629,
+    0.20710500688052896,
+    0.1302860662204965,
+    0.08196064067636726,
+    0.05155997732491048,
+    0.03243546219022934,
+    0.020404570794593995,
+    0.012836151582172179,
+    0.008074994034383453,
+    0.3955392307423542,
+    0.24882667582744722,
+    0.15653242407114715,
+    0.09847175631032831,
+    0.061946825703237965,
+    0.038969643261098745,
+    0.02451510757262128,
+    0.01542201695998405,
+    0.009701715826026244,
+    0.47522130646383076,
+    0.2989532485762344,
+    0.18806615700654833,
+    0.11830906531257332,
+    0.07442612300865685,
+    0.04682014663428362,
+    0.02945371923512453,
+    0.018528809479343017,
+    0.011656143591956802,
+    0.5709554768899634,
+    0.3591779078231184,
+    0.2259524160638809,
+    0.14214263520418843,
+    0.08941939676838327,
+    0.05625214775943555,
+    0.035387222928215965,
+    0.022261470831772878,
+    0.014004294278733299,
+    0.6859754648131644,
+    0.43153493090507333,
+    0.271470928835577,
+    0.17077751979030933,
+    0.10743309197352015,
+    0.06758424214827938,
+    0.042516041406339515,
+    0.0267460833976607,
+    0.01682548406324479,
+    0.8241664321863148,
+    0.5184684039168522,
+    0.32615922629486555,
+    0.20518095238514414,
+    0.12907567785194218,
+    0.08119920694034483,
+    0.05108097294134596,
+    0.032134129075318235,
+    0.020215007506119837,
+    0.9901962136907085,
+    0.6229147784080992,
+    0.3918645777415704,
+    0.24651501716014307,
+    0.15507820083075335,
+    0.09755693040509744,
+    0.061371325041692446,
+    0.03860760605866978,
+    0.024287356425314852,
+    1.1896729875377425,
+    0.7484020592727176,
+    0.4708063881343485,
+    0.2961759021928859,
+    0.18631897792928467,
+    0.11720994611507968,
+    0.07373468672372205,
+    0.04638517639883086,
+    0.029180087217464824,
+    1.429334709331719,
+    0.8991689742135066,
+    0.5656511654755685,
+    0.35584106011190564,
+    0.2238532646796675,
+    0.1408220965056323,
+    0.08858866942422955,
+    0.0557295520028104,
+    0.03505846725794143,
+    1.717276707718452,
+    1.0803081501056515,
+    0.6796025905081078,
+    0.42752586933659825,
+    0.2689488997023378,
+    0.1691909562416416,
+    0.10643501314057342,
+    0.06695636855467965,
+    0.04212105732639872,
+    2.06322512957874,
+    1.297938132491187,
+    0.8165097311114434,
+    0.5136517098238568,
+    0.3231291299441487,
+    0.20327477281107076,
+    0.1278765342775952,
+    0.08044484710381332,
+    0.05060641862179189,
+    2.478865471238388,
+    1.5594100587040431,
+    0.980997056678712,
+    0.6171277527939425,
+    0.3882240631362394,
+    0.24422483434857803,
+    0.15363748766819466,
+    0.09665060344888748,
+    0.060801170917401726,
+    0.5683418292451244,
+    0.3733632167396707,
+    0.2452750870006287,
+    0.16112960679014265,
+    0.10585155835365967,
+    0.06953751473179706,
+    0.04568157550330212,
+    0.030009791815433826,
+    0.019714460258503548,
+    0.7323025251835791,
+    0.4810746145366008,
+    0.3160343939733401,
+    0.20761381947019678,
+    0.136388630025628,
+    0.08959836319054845,
+    0.058860234059957585,
+    0.03866730406921606,
+    0.025401876629613417,
+    0.9435641735230363,
+    0.6198596283064131,
+    0.40720702373592604,
+    0.2675082431693761,
+    0.17573532869603253,
+    0.11544655740701303,
+    0.07584079829607791,
+    0.04982241840185848,
+    0.03273005336414313,
+    1.2157726061821514,
+    0.7986826724878705,
+    0.5246820072180467,
+    0.3446815840399232,
+    0.22643313996261671,
+    0.14875168633143843,
+    0.09772007838649294,
+    0.0641956669895185,
+    0.0421723327311491,
+    1.566510335406301,
+    1.0290943016812173,
+    0.6760472994122148,
+    0.44411862964928356,
+    0.2917567415372384,
+    0.1916649979300507,
+    0.1259113028133323,
+    0.08271544803363914,
+    0.05433861131235311,
+    2.0184322450238703,
+    1.3259772851386555,
+    0.8710799012641053,
+    0.5722422268394581,
+    0.37592552153134573,
+    0.24695835279255168,
+    0.16223540175078274,
+    0.10657799294339851,
+    0.07001473449852812,
+    2.600728916796723,
+    1.7085079159716519,
+    1.1223773766214291,
+    0.7373281468439524,
+    0.4843761175629147,
+    0.3182032644075602,
+    0.20903862475522655,
+    0.13732463342547105,
+    0.09021325588762269,
+    3.3510121111757547,
+    2.20139464804826,
+    1.446171555242508,
+    0.9500396346683068,
+    0.6241135805560339,
+    0.4100015906920218,
+    0.269344089933476,
+    0.17694135932410696,
+    0.1162388402403609,
+    4.31774418960878,
+    2.8364740667294215,
+    1.8633769806445004,
+    1.2241161703972083,
+    0.8041638456377428,
+    0.528282777623177,
+    0.3470470534669862,
+    0.2279870978607371,
+    0.14977253450707034,
+    5.563368399871054,
+    3.654767280533594,
+    2.400941824231613,
+    1.577260930962206,
+    1.0361567361741197,
+    0.6806868545612446,
+    0.4471665123592077,
+    0.2937590000976086,
+    0.19298035016769488,
+    7.168342216097847,
+    4.709129560370172,
+    3.0935885240735375,
+    2.0322842753825596,
+    1.3350771583962073,
+    0.877057919732103,
+    0.5761693919539901,
+    0.37850541082398675,
+    0.24865317044553356,
+    9.236334255391316,
+    6.067664372084042,
+    3.986056579835007,
+    2.618577113583612,
+    1.720233007848501,
+    1.13007999112989,
+    0.7423882581751988,
+    0.4877002780355028,
+    0.32038701929439084,
+    11.900920450719543,
+    7.818122321816941,
+    5.135992370673882,
+    3.374009326767598,
+    2.2165023067627887,
+    1.4560962937797957,
+    0.9565595353951344,
+    0.6283967266891014,
+    0.41281533611021864,
+    0.7058794936805122,
+    0.4637164199952946,
+    0.30463120135712335,
+    0.2001226716130214,
+    0.13146743838160924,
+    0.08636546381933077,
+    0.056736431716855905,
+    0.037272105557093725,
+    0.024485322933102495,
+    0.9095183727443016,
+    0.5974937755024591,
+    0.3925141288647153,
+    0.25785597720890774,
+    0.16939442453873355,
+    0.11128100025217268,
+    0.07310430110580449,
+    0.048024719656164186,
+    0.031549083476157265,
+    1.1719049466166411,
+    0.7698645041894474,
+    0.5057503652681035,
+    0.3322447399209838,
+    0.2182629510245536,
+    0.14338440934016405,
+    0.09419413026957067,
+    0.06187935088669032,
+    0.04065066533551416,
+    1.5099873131322152,
+    0.9919623920976299,
+    0.6516540760166595,
+    0.4280938855868756,
+    0.28122953821926805,
+    0.18474931745076875,
+    0.12136815540305285,
+    0.07973089886984208,
+    0.052377958727986736,
+    1.9456029197614702,
+    1.2781332065335917,
+    0.8396494870824528,
+    0.5515945110837687,
+    0.36236132974361496,
+    0.23804757055245593,
+    0.15638160364965095,
+    0.10273243244315158,
+    0.06748845407245735,
+    2.506889090036287,
+    1.6468613191971275,
+    1.0818796154354178,
+    0.7107237802302068,
+    0.46689879777559096,
+    0.3067218143364821,
+    0.20149606689516666,
+    0.13236966878945713,
+    0.08695816988103638,
+    3.2301004721525803,
+    2.121963650426778,
+    1.3939906119179815,
+    0.9157601854888712,
+    0.6015942361138037,
+    0.39520786190562024,
+    0.25962558271995384,
+    0.17055693901851765,
+    0.11204469583702009,
+    4.1619508025579615,
+    2.734128053919982,
+    1.7961423788666133,
+    1.1799474573018787,
+    0.7751479049626964,
+    0.5092212122241425,
+    0.3345248581836832,
+    0.2197608388190154,
+    0.14436842314396614,
+    5.362630243934601,
+    3.522895509415901,
+    2.3143107403871332,
+    1.5203500043517544,
+    0.9987699989439288,
+    0.6561262261552637,
+    0.43103179421082777,
+    0.28315955103529283,
+    0.1860172089841033,
+    6.909693193751197,
+    4.539214157313914,
+    2.9819652751865706,
+    1.9589551394244953,
+    1.2869047370236548,
+    0.8454118059387825,
+    0.5553799757343936,
+    0.3648481311474266,
+    0.23968123558244855,
+    8.903067685073433,
+    5.848730145667959,
+    3.8422311866949483,
+    2.5240932859495566,
+    1.6581633448392126,
+    1.089304303241712,
+    0.7156013119901472,
+    0.4701030154733453,
+    0.3088267747057667,
+    11.471509947313143,
+    7.536027852249989,
+    4.950674850191745,
+    3.2522678993288854,
+    2.136526192705921,
+    1.4035572447953644,
+    0.9220448343404456,
+    0.6057228372312329,
+    0.3979200814089528,
+    14.78092104050078,
+    9.710093366498052,
+    6.378892961254537,
+    4.190513301502643,
+    2.7528917379132465,
+    1.8084688856502456,
+    1.1880451618646644,
+    0.7804675644848276,
+    0.5127158787944013,
+    0.9679730564499514,
+    0.6358946596514039,
+    0.417740985122226,
+    0.2744283632552481,
+    0.18028139263596407,
+    0.11843302253904717,
+    0.0778027095456126,
+    0.05111126510887798,
+    0.03357674091669627,
+    1.2472231975067976,
+    0.8193436432999804,
+    0.5382549067064051,
+    0.3535980866668521,
+    0.23229069598181665,
+    0.1525997155367955,
+    0.10024798058951849,
+    0.06585633254246312,
+    0.04326328082061086,
+    1.6070340946308252,
+    1.0557157472970506,
+    0.6935358389810679,
+    0.455607450379193,
+    0.29930414143557377,
+    0.19662314346687657,
+    0.12916847846262683,
+    0.08485519829541732,
+    0.0557442865585657,
+    2.070646686550136,
+    1.3602787404343273,
+    0.8936137022779322,
+    0.5870454526429657,
+    0.38565026766073457,
+    0.253346871655694,
+    0.1664322386369802,
+    0.10933503886071838,
+    0.07182593240693608,
+    2.6680066806585194,
+    1.752704983718461,
+    1.151411944438349,
+    0.7564019490505746,
+    0.49690635162430596,
+    0.3264348043979843,
+    0.21444620535443748,
+    0.14087705836308662,
+    0.09254696552095379,
+    3.4376988089156266,
+    2.258342109331703,
+    1.4835822933509186,
+    0.9746160300733636,
+    0.6402586565862209,
+    0.4206078442017161,
+    0.2763117011916436,
+    0.18151862184197626,
+    0.11924580078698033,
+    4.429439096420494,
+    2.909850277232966,
+    1.9115803268985638,
+    1.2557825998045553,
+    0.8249666078801249,
+    0.5419488247592861,
+    0.3560247479745869,
+    0.23388485292253838,
+    0.15364697184057002,
+    5.707286123500517,
+    3.7493117632290107,
+    2.463051333628509,
+    1.6180627953073805,
+    1.0629608785704727,
+    0.698295413903679,
+    0.4587341781897781,
+    0.3013581960434846,
+    0.1979725223024748,
+    7.353778703453546,
+    4.830949141223455,
+    3.1736159797856587,
+    2.0848570524590855,
+    1.3696140165899822,
+    0.8997463649736517,
+    0.5910742088481782,
+    0.3882968956209464,
+    0.2550855322256018,
+    9.47526723720636,
+    6.22462763272272,
+    4.089171122679483,
+    2.686316589068267,
+    1.764733389776752,
+    1.1593138164229246,
+    0.7615929594436417,
+    0.5003165041746803,
+    0.32867505042645595,
+    12.20878310824238,
+    8.02036784768193,
+    5.26885438473407,
+    3.461290935122749,
+    2.2738405852086574,
+    1.49376377307003,
+    0.9813045928774531,
+    0.644652602615527,
+    0.4234943778673116,
+    15.730889826390893,
+    10.334160404064695,
+    6.788863976262452,
+    4.4598373052218285,
+    2.9298199019151134,
+    1.9246990574314082,
+    1.2644007432866025,
+    0.8306281615564661,
+    0.545668093311366,
+    20.26908763437554,
+    13.315458004560824,
+    8.747380497310944,
+    5.746453898808982,
+    3.7750424165598213,
+    2.4799546812303648,
+    1.6291671833878425,
+    1.0702557314922676,
+    0.7030876526803701,
+    1.1745988348288903,
+    0.7716342116378649,
+    0.5069129467140389,
+    0.33300847949819,
+    0.21876467771547103,
+    0.14371401079056917,
+    0.09441065675316372,
+    0.06202159455109038,
+    0.04074411007135524,
+    1.5134583600249145,
+    0.9942426417055704,
+    0.6531520500963095,
+    0.4290779560743736,
+    0.28187600783280825,
+    0.18517400548535598,
+    0.12164714752107968,
+    0.0799141783493234,
+    0.05249836129647691,
+    1.9500753275163776,
+    1.2810712843945185,
+    0.8415796110760435,
+    0.5528624756534548,
+    0.36319429910481565,
+    0.2385947766600137,
+    0.15674108208678925,
+    0.10296858614279523,
+    0.06764359152743059,
+    2.512651740828539,
+    1.6506470019078305,
+    1.0843665600903647,
+    0.7123575393667774,
+    0.46797207011843084,
+    0.30742688370449367,
+    0.2019592511158584,
+    0.13267395037086074,
+    0.08715806287532536,
+    3.2375255876548517,
+    2.126841463154857,
+    1.3971950141933307,
+    0.9178652671135009,
+    0.6029771363446652,
+    0.3961163364398812,
+    0.26022239076219883,
+    0.17094900266571508,
+    0.11230225587739014,
+    4.171517986517156,
+    2.7404130647960763,
+    1.800271217810351,
+    1.1826598330414602,
+    0.7769297575011271,
+    0.5103917721957496,
+    0.33529383912771543,
+    0.220266008743349,
+    0.14470028657235368,
+    5.374957460781404,
+    3.5309936804435083,
+    2.319630706345985,
+    1.5238448722307922,
+    1.0010658973738065,
+    0.6576344804821099,
+    0.43202261814486903,
+    0.2838104572192132,
+    0.18644481155375237,
+    6.92557668421571,
+    4.549648566304646,
+    2.9888199958935298,
+    1.9634582402720984,
+    1.2898629782285953,
+    0.8473551759237711,
+    0.5566566420495834,
+    0.36568681698333555,
+    0.24023219703806564,
+    8.923533397040016,
+    5.8621747729319065,
+    3.8510634229035707,
+    2.529895484471942,
+    1.6619750078085864,
+    1.091808315218559,
+    0.717246283235132,
+    0.4711836534342843,
+    0.30953668280062413,
+    11.49787980394101,
+    7.553351114394219,
+    4.962055094519679,
+    3.2597439716693715,
+    2.1414374807265997,
+    1.4067836381371517,
+    0.9241643626499441,
+    0.6071152279842701,
+    0.3988347905923381,
+    14.814898326006874,
+    9.73241420927235,
+    6.393556287495404,
+    4.200146142816934,
+    2.759219881355062,
+    1.812626059853954,
+    1.1907761520071731,
+    0.7822616454621959,
+    0.5138944720464437,
+    19.088842130241417,
+    12.540114302424138,
+    8.238030659215982,
+    5.411844541884552,
+    3.555226067623422,
+    2.3355497915887353,
+    1.5343026646506825,
+    1.0079359794564013,
+    0.6621476727435875,
+    24.5957741899329,
+    16.15780661781141,
+    10.614616668803569,
+    6.973105303874703,
+    4.580871744698268,
+    3.009331571360996,
+    1.9769329968408758,
+    1.2987150074096694,
+    0.8531703771277875,
+    0.21052439495691305,
+    0.14533279439512845,
+    0.1003286157455507,
+    0.06926056282969105,
+    0.047813134147605484,
+    0.03300717902969307,
+    0.02278607932571122,
+    0.015730075283638446,
+    0.010859054113347769,
+    0.2759051973523894,
+    0.1904675860845904,
+    0.13148683568492656,
+    0.09077023715078002,
+    0.0626620597376911,
+    0.04325794284361662,
+    0.029862561602584065,
+    0.02061523333858033,
+    0.014231459821160796,
+    0.361590769286575,
+    0.24961951292465406,
+    0.17232160366173085,
+    0.1189599913109109,
+    0.08212249208446026,
+    0.056692200729369716,
+    0.03913672785567261,
+    0.027017534114802545,
+    0.018651205392959763,
+    0.47388699338731327,
+    0.3271417594648807,
+    0.22583808435170066,
+    0.15590440189315274,
+    0.10762658831186925,
+    0.07429862384252109,
+    0.051291094435664264,
+    0.03540814395141778,
+    0.024443554419703768,
+    0.621058117564079,
+    0.4287394424092224,
+    0.29597473131555224,
+    0.20432232939674363,
+    0.14105127861608685,
+    0.09737292667900661,
+    0.06722014109380674,
+    0.0464045553808487,
+    0.03203478488819559,
+    0.8139349481512138,
+    0.5618894688897218,
+    0.38789313073029374,
+    0.267777008109897,
+    0.18485639572242069,
+    0.12761322295997823,
+    0.08809613868425083,
+    0.06081603043211843,
+    0.04198356037801647,
+    1.0667119245141583,
+    0.7363907866163292,
+    0.5083578594665072,
+    0.3509382762226409,
+    0.24226570205359982,
+    0.16724499539710516,
+    0.1154554204259146,
+    0.07970315688116203,
+    0.055022043948984266,
+    1.3979917344565278,
+    0.965085520618369,
+    0.6662343125149507,
+    0.4599262445548503,
+    0.317504136993216,
+    0.2191848762737533,
+    0.15131144570934216,
+    0.10445590038820037,
+    0.07210978042513,
+    1.8321543471063264,
+    1.2648040673986551,
+    0.873141136517656,
+    0.6027616956097674,
+    0.41610874404955395,
+    0.28725529199286337,
+    0.19830297718540255,
+    0.13689589663528723,
+    0.0945043124494188,
+    2.4011512149072676,
+    1.657603699082721,
+    1.144305284129652,
+    0.7899563592984584,
+    0.5453361600708742,
+    0.3764657679886931,
+    0.25988827597439557,
+    0.1794105114783561,
+    0.12385372717658324,
+    3.1468566859318496,
+    2.172391830510049,
+    1.4996826154697673,
+    1.0352865056642178,
+    0.7146966549816844,
+    0.4933815961546761,
+    0.3405996064587348,
+    0.23512853504060627,
+    0.1623179444191158,
+    4.124149674670292,
+    2.8470534108233125,
+    1.9654265154013049,
+    1.3568067858359707,
+    0.9366540237779654,
+    0.6466069962341092,
+    0.44637678050268903,
+    0.30815043965253497,
+    0.2127276722393911,
+    5.404952381568807,
+    3.731239001288982,
+    2.575812607011173,
+    1.7781789330958577,
+    1.2275428381317055,
+    0.847418328607097,
+    0.5850042877136623,
+    0.4038501470765842,
+    0.27879272805194827,
+    0.2297771361447307,
+    0.1586236753743346,
+    0.10950380360478391,
+    0.0755945351513098,
+    0.05218571005412054,
+    0.03602573027801137,
+    0.024869897156099875,
+    0.017168611983210767,
+    0.011852129326467755,
+    0.3011371015128857,
+    0.20788610492325282,
+    0.14351148497825478,
+    0.09907129833553469,
+    0.06839259001030985,
+    0.047213940332914775,
+    0.032593533326110355,
+    0.022500524361862402,
+    0.015532946106005413,
+    0.39465873510784294,
+    0.2724475556260762,
+    0.188080647819288,
+    0.12983904371185825,
+    0.08963270526485824,
+    0.06187677930627883,
+    0.04271583464991149,
+    0.029488324219444754,
+    0.020356883399278113,
+    0.5172246010684861,
+    0.3570593166581632,
+    0.24649128318533564,
+    0.17016207070300585,
+    0.1174691856513382,
+    0.08109333367053813,
+    0.0559817345232981,
+    0.038646266695231676,
+    0.026678950593383353,
+    0.6778547239739995,
+    0.4679482453767046,
+    0.3230420215520041,
+    0.2230078832850359,
+    0.15395060917567388,
+    0.10627781276802707,
+    0.07336751408282548,
+    0.05064831485046306,
+    0.034964409374640834,
+    0.8883704020741774,
+    0.6132750222024776,
+    0.42336648314634556,
+    0.2922655783501446,
+    0.20176176359907444,
+    0.1392836251207092,
+    0.09615264994073061,
+    0.06637773882329874,
+    0.045823013863996086,
+    1.1642641754484655,
+    0.8037347218914752,
+    0.55484787456003,
+    0.38303205711865623,
+    0.26442122878615504,
+    0.18253977684985426,
+    0.12601397507059478,
+    0.08699211857892206,
+    0.06005388442519763,
+    1.5258399729075083,
+    1.0533438992085484,
+    0.7271623431686864,
+    0.5019871228379192,
+    0.3465403205520993,
+    0.23922963021329588,
+    0.16514908245254575,
+    0.11400853402064036,
+    0.07870431755665591,
+    1.9997073447919034,
+    1.3804721132225568,
+    0.9529910765934931,
+    0.6578850694395798,
+    0.45416245253694104,
+    0.313525177688065,
+    0.21643805315750378,
+    0.1494152118820207,
+    0.103146859880056,
+    2.620739747166842,
+    1.8091938034834025,
+    1.2489535529429137,
+    0.8621989387788868,
+    0.5952078908617483,
+    0.41089407259749017,
+    0.28365541097130276,
+    0.19581784586149834,
+    0.135180318353655,
+    3.4346409939774762,
+    2.3710600070883467,
+    1.6368306227846354,
+    1.1299648594619935,
+    0.7800566325224229,
+    0.5385020116748938,
+    0.3717479019955283,
+    0.25663135817867533,
+    0.17716214038357586,
+    4.501308750807288,
+    3.1074203031147882,
+    2.1451674334665967,
+    1.480888604928342,
+    1.0223123034562702,
+    0.7057400822181603,
+    0.48719854193812,
+    0.3363312149149776,
+    0.23218190612022052,
+    5.899242600790767,
+    4.072465863935519,
+    2.811374160251849,
+    1.940795806031324,
+    1.3398032940486828,
+    0.924915883044076,
+    0.638503722529375,
+    0.4407827902599021,
+    0.30428870080763926,
+    0.3508754051578199,
+    0.24222229982679896,
+    0.167215033230938,
+    0.11543473643185252,
+    0.07968887795326438,
+    0.055012186675708376,
+    0.037976951872981085,
+    0.02621689775875738,
+    0.018098496435206002,
+    0.4598438481487201,
+    0.3174472556994663,
+    0.21914560900797564,
+    0.1512843380600605,
+    0.104437186972967,
+    0.07209686186085104,
+    0.04977113651603904,
+    0.034358860651649364,
+    0.02371919525886307,
+    0.6026537100402132,
+    0.41603419760765165,
+    0.28720382982043396,
+    0.19826745093996984,
+    0.13687137155103676,
+    0.09448738187456725,
+    0.06522814254244003,
+    0.0450294049335078,
+    0.031085467554844898,
+    0.7898148375527947,
+    0.545238462363351,
+    0.37639832363934234,
+    0.2598417166397431,
+    0.17937836984359878,
+    0.12383153861455619,
+    0.08548550178607572,
+    0.05901381099982666,
+    0.04073942149206089,
+    1.0351010326924277,
+    0.7145686161134073,
+    0.49329320617724987,
+    0.3405385875805259,
+    0.23508641144688802,
+    0.16228886494076697,
+    0.1120340198383302,
+    0.07734123721745492,
+    0.05339152324408633,
+    1.3565637120729714,
+    0.9364862209481412,
+    0.6464911557198982,
+    0.44629681150129186,
+    0.30809523408626127,
+    0.2126895617904126,
+    0.14682748932731693,
+    0.10136045906854252,
+    0.06997288252802837,
+    1.7778603699451825,
+    1.2273229221790274,
+    0.8472665124722433,
+    0.5848994834076479,
+    0.40377779677883924,
+    0.278742781959246,
+    0.1924264759335862,
+    0.1328391299676156,
+    0.09170377602634823,
+    2.3299956108892275,
+    1.6084823477498673,
+    1.1103949942787794,
+    0.7665468290927797,
+    0.529175693532235,
+    0.3653095988365619,
+    0.25218675882738845,
+    0.1740938686812797,
+    0.12018345155528062,
+    3.053602880484059,
+    2.1080152715061344,
+    1.4552410902227926,
+    1.0046068732508513,
+    0.6935173673719874,
+    0.4787607487595542,
+    0.33050629347810523,
+    0.22816074691097055,
+    0.15750782196351906,
+    4.001934814006757,
+    2.762683961760281,
+    1.9071831569704814,
+    1.3165992363144956,
+    0.9088972617697789,
+    0.6274454744217042,
+    0.43314887164001314,
+    0.2990187237798437,
+    0.20642371024167488,
+    5.244782272742852,
+    3.6206676373431925,
+    2.4994810953798905,
+    1.725484460856434,
+    1.1911658904563573,
+    0.8223059730612907,
+    0.5676682977156243,
+    0.39188247050144664,
+    0.27053099724665214,
+    6.873610482659708,
+    4.74510813453726,
+    3.2757240558297105,
+    2.2613537533192316,
+    1.5610963287796589,
+    1.0776826686900494,
+    0.7439642980281664,
+    0.5135861351591696,
+    0.354547548755823,
+    9.008290260754906,
+    6.218756722164565,
+    4.293038306941291,
+    2.963643494716151,
+    2.045912972537907,
+    1.4123695709897774,
+    0.9750110741921542,
+    0.673086290106868,
+    0.46465641870293406,
+    0.4553868926218984,
+    0.3143704540711306,
+    0.21702157878080403,
+    0.1498180412522357,
+    0.10342494792799815,
+    0.07139807572240235,
+    0.04928873853928148,
+    0.034025843444844994,
+    0.02348930113539844,
+    0.596812595073607,
+    0.41200185940450024,
+    0.2844201572720333,
+    0.19634577858355295,
+    0.13554476988320113,
+    0.09357157956350844,
+    0.06459593025651027,
+    0.044592965355168636,
+    0.030784177134237617,
+    0.7821596963139406,
+    0.5399538345749194,
+    0.372750149165367,
+    0.25732324655530303,
+    0.17763977657963473,
+    0.12263132323134529,
+    0.08465694861268339,
+    0.05844183002812641,
+    0.040344561822828494,
+    1.025068498198272,
+    0.7076427856261633,
+    0.48851204863764913,
+    0.337237977283958,
+    0.232807877799005,
+    0.1607159086938772,
+    0.11094814982849809,
+    0.07659162089431543,
+    0.05287403530646105,
+    1.343415457163505,
+    0.9274094931522802,
+    0.640225154030135,
+    0.44197115824175265,
+    0.30510907528066594,
+    0.21062810566408754,
+    0.1454043897410524,
+    0.10037804066702329,
+    0.06929468268526333,
+    1.760628771363088,
+    1.2154273108683122,
+    0.8390545309905799,
+    0.5792304481564341,
+    0.3998642515825593,
+    0.27604111662738073,
+    0.19056141619891376,
+    0.13155161009131217,
+    0.09081495332482356,
+    2.3074125387067235,
+    1.5928924158230617,
+    1.0996326863200452,
+    0.7591172089287893,
+    0.5240467513022948,
+    0.36176889987518523,
+    0.24974248307362554,
+    0.17240649451431284,
+    0.11901859461352032,
+    3.024006372257009,
+    2.087583704675811,
+    1.441136422201163,
+    0.9948698980275353,
+    0.6867955724063718,
+    0.4741204445045345,
+    0.3273029194255939,
+    0.22594933904709996,
+    0.15598120513381886,
+    3.9631467655005643,
+    2.7359071339266587,
+    1.8886981200468786,
+    1.303838330049195,
+    0.9000879351027672,
+    0.621364069644275,
+    0.4289506524724314,
+    0.29612053745216077,
+    0.20442298477816687,
+    5.193948144088994,
+    3.585574953811582,
+    2.4752553149827223,
+    1.7087605065505982,
+    1.1796207248089223,
+    0.8143359172127049,
+    0.5621662726975865,
+    0.38808421866052817,
+    0.267908923192146,
+    6.806989223392581,
+    4.699117009483104,
+    3.2439746772227123,
+    2.23943598025446,
+    1.5459656774977804,
+    1.0672374191869516,
+    0.7367535550700869,
+    0.5086082919786813,
+    0.3511111590698241,
+    8.920978993622548,
+    6.1584825176614615,
+    4.251428789088634,
+    2.934918901995206,
+    2.026083321305083,
+    1.398680427619305,
+    0.9655609510398541,
+    0.6665625197600492,
+    0.4601528181834347,
+    11.69149290425796,
+    8.071070978612163,
+    5.571759507126001,
+    3.846392143931703,
+    2.65530709033256,
+    1.8330569219505872,
+    1.265427148273886,
+    0.8735712723446699,
+    0.6030586343171425,
+];
@@ -1,62 +1,291 @@
+import argparse
+import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import polars as pl
-from constants import NEGATIVE_FAS, POSITIVE_FAS
+from archive import Archive
+from changes import (
+    CHANGES_PATH,
+    build_changes,
+    changes_from_archive,
+    parse_changes,
+    read_changes,
+)
+from constants import compute_fas
+from instrument import PROFILE_MODES, enable_profiling, stage, write_report
+from rounds import RAW_JSON_DIR, Round, get_decoder
+
+HISTORY_PATH = Path("./output/history.arrow")
+HISTORY_CSV_PATH = Path("./output/history.csv")
+MANIFEST_PATH = Path("./output/manifest.json")
+
+# below this many files, spinning up worker processes costs more than it saves
+POOL_THRESHOLD = 64
 
 # fmt: off
-columns = ["round", "arena", "pirate1", "pirate2", "pirate3", "pirate4", "fa1", "fa2", "fa3", "fa4", "pfa1", "pfa2", "pfa3", "pfa4", "nfa1", "nfa2", "nfa3", "nfa4", "opening_odds1", "opening_odds2", "opening_odds3", "opening_odds4", "closing_odds1", "closing_odds2", "closing_odds3", "closing_odds4", "winner"]
+history_schema = {
+    "round": pl.UInt32, "arena": pl.UInt8,
+    "pirate1": pl.UInt8, "pirate2": pl.UInt8, "pirate3": pl.UInt8, "pirate4": pl.UInt8,
+    "fa1": pl.Int8, "fa2": pl.Int8, "fa3": pl.Int8, "fa4": pl.Int8,
+    "pfa1": pl.Int8, "pfa2": pl.Int8, "pfa3": pl.Int8, "pfa4": pl.Int8,
+    "nfa1": pl.Int8, "nfa2": pl.Int8, "nfa3": pl.Int8, "nfa4": pl.Int8,
+    "opening_odds1": pl.UInt8, "opening_odds2": pl.UInt8, "opening_odds3": pl.UInt8, "opening_odds4": pl.UInt8,
+    "closing_odds1": pl.UInt8, "closing_odds2": pl.UInt8, "closing_odds3": pl.UInt8, "closing_odds4": pl.UInt8,
+    "winner": pl.UInt8,
+}
 # fmt: on
 
+# older rounds don't have fa data, and food 0 has no adjustment for anyone
+NO_FOODS = [[0] * 10] * 5
 
-def get_df_from_file(path: Path) -> pl.DataFrame:
-    rows = []
-    data = json.loads(path.read_text())
-    winners = data["winners"]
+decode_round = get_decoder(changes=True)
+
+
+def parse_round(round: Round) -> tuple | None:
+    winners = round.winners
     if winners is None or not all(winners):
-        return pl.DataFrame(schema=columns)
-
-    round = data["round"]
-    for arena in range(5):
-        pirates = data["pirates"][arena]
-        # older rounds don't have fa data
-        fas = [0] * len(pirates)
-        positive_fas = [0] * len(pirates)
-        negative_fas = [0] * len(pirates)
-        if "foods" in data:
-            foods = data["foods"][arena]
-            positive_fas = [
-                sum(POSITIVE_FAS[pirate][food] for food in foods) for pirate in pirates
-            ]
-            negative_fas = [
-                -sum(NEGATIVE_FAS[pirate][food] for food in foods) for pirate in pirates
-            ]
-            fas = [sum(x) for x in zip(positive_fas, negative_fas)]
-        pirate1, pirate2, pirate3, pirate4 = pirates
-        fa1, fa2, fa3, fa4 = fas
-        pfa1, pfa2, pfa3, pfa4 = positive_fas
-        nfa1, nfa2, nfa3, nfa4 = negative_fas
-        # fmt: off
-        _, opening_odds1, opening_odds2, opening_odds3, opening_odds4 = data["openingOdds"][arena]
-        _, closing_odds1, closing_odds2, closing_odds3, closing_odds4 = data["currentOdds"][arena]
-        winner = winners[arena]
-        rows.append([round, arena, pirate1, pirate2, pirate3, pirate4, fa1, fa2, fa3, fa4, pfa1, pfa2, pfa3, pfa4, nfa1, nfa2, nfa3, nfa4, opening_odds1, opening_odds2, opening_odds3, opening_odds4, closing_odds1, closing_odds2, closing_odds3, closing_odds4, winner])
-        # fmt: on
-    if rows:
-        return pl.DataFrame(rows, schema=columns)
-    return pl.DataFrame(schema=columns)
-
-
-pathlist = list(Path("raw_json").glob("**/*.json"))
-dfs = []
-for path in pathlist:
-    df = get_df_from_file(path)
-    if df.height > 0:
-        dfs.append(df)
-
-if dfs:
-    df = pl.concat(dfs)
+        return None
+
+    return (
+        round.round,
+        round.pirates,
+        round.foods if round.foods is not None else NO_FOODS,
+        [odds[1:] for odds in round.opening_odds],
+        [odds[1:] for odds in round.current_odds],
+        winners,
+    )
+
+
+def build_history(records: list[tuple]) -> pl.DataFrame:
+    if not records:
+        return pl.DataFrame(schema=history_schema)
+
+    return history_from_arrays(*(np.array(field) for field in zip(*records)))
+
+
+def history_from_arrays(
+    rounds: np.ndarray,
+    pirates: np.ndarray,
+    foods: np.ndarray,
+    opening_odds: np.ndarray,
+    closing_odds: np.ndarray,
+    winners: np.ndarray,
+) -> pl.DataFrame:
+    # one gather over every (round, arena, pirate, food) at once
+    pfas, nfas, fas = compute_fas(pirates, foods)
+
+    data = {
+        "round": np.repeat(rounds, 5),
+        "arena": np.tile(np.arange(5), len(rounds)),
+    }
+    for name, values in [
+        ("pirate", pirates),
+        ("fa", fas),
+        ("pfa", pfas),
+        ("nfa", nfas),
+        ("opening_odds", opening_odds),
+        ("closing_odds", closing_odds),
+    ]:
+        for position in range(4):
+            data[f"{name}{position + 1}"] = values[:, :, position].ravel()
+    data["winner"] = winners.ravel()
+    return pl.DataFrame(data).cast(history_schema)
+
+
+def get_df_from_file(path: Path) -> pl.DataFrame:
+    record = parse_round(get_decoder()(path.read_bytes()))
+    return build_history([record] if record is not None else [])
+
+
+def parse_file(path: Path) -> tuple[int, dict, tuple | None, np.ndarray]:
+    # runs in a worker process, so the file is only read once for hashing and
+    # parsing, and only the parsed arrays travel back, never the JSON
+    mtime_ns = path.stat().st_mtime_ns
+    raw = path.read_bytes()
+    entry = {"size": len(raw), "mtime_ns": mtime_ns, "hash": file_hash(raw)}
+    round = decode_round(raw)
+    return int(path.stem), entry, parse_round(round), parse_changes(round)
+
+
+def file_hash(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def load_manifest() -> dict[int, dict]:
+    if not MANIFEST_PATH.exists():
+        return {}
+    rounds = json.loads(MANIFEST_PATH.read_text())["rounds"]
+    return {int(round): entry for round, entry in rounds.items()}
+
+
+def write_manifest(manifest: dict[int, dict]) -> None:
+    # one round per line, so the manifest stays readable
+    rounds = ",\n".join(
+        f'  "{round}": {json.dumps(manifest[round])}' for round in sorted(manifest)
+    )
+    MANIFEST_PATH.write_text(f'{{"version": 1, "rounds": {{\n{rounds}\n}}}}\n')
+
+
+def find_stale_paths(
+    pathlist: list[Path], manifest: dict[int, dict]
+) -> tuple[list[Path], dict[int, dict]]:
+    # a file with the size and mtime it had last time is taken as unchanged
+    # without reading it. a fresh git checkout touches every file in raw_json/,
+    # so a changed mtime falls back to comparing content hashes, and the new
+    # mtime is recorded so the next run skips the hash again
+    stale = []
+    unchanged = {}
+    for path in pathlist:
+        round = int(path.stem)
+        entry = manifest.get(round)
+        stat = path.stat()
+        if entry is not None and entry["size"] == stat.st_size:
+            if entry.get("mtime_ns") == stat.st_mtime_ns:
+                unchanged[round] = entry
+                continue
+            if entry["hash"] == file_hash(path.read_bytes()):
+                unchanged[round] = entry | {"mtime_ns": stat.st_mtime_ns}
+                continue
+        stale.append(path)
+    return stale, unchanged
+
+
+def parse_files(paths: list[Path], workers: int | None) -> list:
+    if len(paths) < POOL_THRESHOLD or workers == 1:
+        return [parse_file(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_file, paths, chunksize=64))
+
+
+def read_history() -> pl.DataFrame:
+    # written uncompressed, so polars memory-maps the file instead of decoding it
+    return pl.read_ipc(HISTORY_PATH)
+
+
+def ingest(
+    full: bool = False, workers: int | None = None, csv: bool = False
+) -> pl.DataFrame:
+    with stage("scan") as counts:
+        pathlist = sorted(RAW_JSON_DIR.glob("**/*.json"))
+        outputs_exist = HISTORY_PATH.exists() and CHANGES_PATH.exists()
+        manifest = {} if full or not outputs_exist else load_manifest()
+        stale, unchanged = find_stale_paths(pathlist, manifest)
+        counts.update(files=len(pathlist), stale=len(stale), unchanged=len(unchanged))
+    print(f"{len(unchanged)} rounds unchanged, parsing {len(stale)} new or changed...")
+
+    with stage("parse", files=len(stale)) as counts:
+        records = []
+        change_arrays = []
+        parsed = {}
+        for round, entry, record, round_changes in parse_files(stale, workers):
+            parsed[round] = entry
+            if record is not None:
+                records.append(record)
+            change_arrays.append(round_changes)
+        counts["bytes"] = sum(entry["size"] for entry in parsed.values())
+        counts["finished_rounds"] = len(records)
+
+    with stage("build") as counts:
+        new_rows = build_history(records)
+        new_changes = build_changes(change_arrays)
+        if manifest:
+            history = read_history()
+            history = history.filter(pl.col("round").is_in(list(unchanged)))
+            df = pl.concat([history, new_rows])
+            changes = read_changes()
+            changes = changes.filter(pl.col("round").is_in(list(unchanged)))
+            new_changes = pl.concat([changes, new_changes])
+        else:
+            df = new_rows
+        counts.update(new_rows=new_rows.height, rows=df.height, changes=new_changes.height)
+
+    with stage("write", rows=df.height):
+        df = write_outputs(df, new_changes, csv)
+        write_manifest(unchanged | parsed)
+    return df
+
+
+def ingest_archive(path: Path, csv: bool = False) -> pl.DataFrame:
+    # the archive is already one array of fixed-width rounds, so there's nothing
+    # to parse and rebuilding everything is cheaper than tracking what changed
+    archive = Archive(path)
+    records = archive.records
+    print(f"Reading {len(records)} rounds from {path}...")
+    with stage("build", rounds=len(records)) as counts:
+        df = history_from_arrays(
+            records["round"],
+            records["pirates"],
+            records["foods"],
+            records["opening_odds"],
+            records["current_odds"],
+            records["winners"],
+        )
+        changes = changes_from_archive(records, archive.changes)
+        counts.update(rows=df.height, changes=changes.height)
+    with stage("write", rows=df.height):
+        df = write_outputs(df, changes, csv)
+    # the manifest describes outputs built from raw_json/, which these aren't,
+    # so the next raw_json/ ingest has to start from scratch
+    MANIFEST_PATH.unlink(missing_ok=True)
+    return df
+
+
+def write_outputs(df: pl.DataFrame, changes: pl.DataFrame, csv: bool) -> pl.DataFrame:
     df = df.sort(["round", "arena"])
-    df.write_csv("./output/history.csv")
-else:
-    pl.DataFrame(schema=columns).write_csv("./output/history.csv")
+    df.write_ipc(HISTORY_PATH, compression="uncompressed")
+    # stable, so changes within a round stay in the order the site reported them
+    changes.sort("round", maintain_order=True).write_ipc(
+        CHANGES_PATH, compression="uncompressed"
+    )
+    if csv:
+        df.write_csv(HISTORY_CSV_PATH)
+    return df
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Build output/history.arrow and output/changes.arrow from raw_json/"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="ignore the manifest and re-parse every round",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all cores)",
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="also export the history as output/history.csv",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=None,
+        help="read rounds from a packed archive (see archive.py) instead of raw_json/",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        action="append",
+        default=[],
+        help="profile each stage into output/run_report.json (or set NEOFOODCLUB_PROFILE)",
+    )
+    args = parser.parse_args(argv)
+    enable_profiling(args.profile)
+    if args.archive is not None:
+        ingest_archive(args.archive, csv=args.csv)
+    else:
+        ingest(full=args.full, workers=args.workers, csv=args.csv)
+    write_report("preprocessing")
+
+
+if __name__ == "__main__":
+    main()
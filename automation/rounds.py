@@ -0,0 +1,121 @@
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+RAW_JSON_DIR = Path("raw_json")
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    # arena is 0-4, pirate is the position (1-4) within the arena, t is an ISO timestamp
+    arena: int
+    pirate: int
+    old: int
+    new: int
+    t: str
+
+
+@dataclass(frozen=True, slots=True)
+class Round:
+    # the fields of a raw_json/ round file that anything here reads, odds rows
+    # keep the site's leading placeholder entry
+    round: int
+    pirates: list[list[int]]
+    foods: list[list[int]] | None
+    opening_odds: list[list[int]]
+    current_odds: list[list[int]]
+    winners: list[int] | None
+    start: str | None = None
+    timestamp: str | None = None
+    changes: list[Change] | None = None
+
+
+def _json_decoder(changes: bool) -> Callable[[bytes], Round]:
+    def decode(raw: bytes) -> Round:
+        data = json.loads(raw)
+        return Round(
+            round=data["round"],
+            pirates=data["pirates"],
+            foods=data.get("foods"),
+            opening_odds=data["openingOdds"],
+            current_odds=data["currentOdds"],
+            winners=data.get("winners"),
+            start=data.get("start"),
+            timestamp=data.get("timestamp"),
+            changes=[Change(**change) for change in data["changes"]]
+            if changes and data.get("changes") is not None
+            else None,
+        )
+
+    return decode
+
+
+if msgspec is not None:
+    # straight from bytes into typed fields; anything not declared on the
+    # struct, including the changes list unless asked for, is skipped
+    # without ever being built
+    class _RoundStruct(msgspec.Struct, rename="camel"):
+        round: int
+        pirates: list[list[int]]
+        opening_odds: list[list[int]]
+        current_odds: list[list[int]]
+        foods: list[list[int]] | None = None
+        winners: list[int] | None = None
+        start: str | None = None
+        timestamp: str | None = None
+
+    class _RoundWithChangesStruct(_RoundStruct, rename="camel"):
+        changes: list[Change] | None = None
+
+
+def _msgspec_decoder(changes: bool) -> Callable[[bytes], Round]:
+    decoder = msgspec.json.Decoder(_RoundWithChangesStruct if changes else _RoundStruct)
+
+    def decode(raw: bytes) -> Round:
+        data = decoder.decode(raw)
+        return Round(
+            round=data.round,
+            pirates=data.pirates,
+            foods=data.foods,
+            opening_odds=data.opening_odds,
+            current_odds=data.current_odds,
+            winners=data.winners,
+            start=data.start,
+            timestamp=data.timestamp,
+            changes=data.changes if changes else None,
+        )
+
+    return decode
+
+
+BACKENDS = {"msgspec": _msgspec_decoder, "json": _json_decoder}
+
+
+def get_decoder(backend: str | None = None, changes: bool = False) -> Callable[[bytes], Round]:
+    # msgspec when it's installed, the standard library otherwise
+    if backend is None:
+        backend = "msgspec" if msgspec is not None else "json"
+    if backend == "msgspec" and msgspec is None:
+        raise ImportError("the msgspec backend needs msgspec installed (pip install msgspec)")
+    return BACKENDS[backend](changes)
+
+
+def load_round(path: Path, changes: bool = False, backend: str | None = None) -> Round:
+    return get_decoder(backend, changes)(path.read_bytes())
+
+
+def iter_rounds(
+    paths: Iterable[Path] | None = None, changes: bool = False, backend: str | None = None
+) -> Iterator[Round]:
+    # one file in memory at a time, in round order when reading all of raw_json/
+    if paths is None:
+        paths = sorted(RAW_JSON_DIR.glob("**/*.json"), key=lambda path: int(path.stem))
+    decode = get_decoder(backend, changes)
+    for path in paths:
+        yield decode(path.read_bytes())
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from constants import MAX_NFA, MAX_PFA, compute_fas
+from design import (
+    ASC_SLOT,
+    NFA_SLOT,
+    PFA_SLOT,
+    POSITION_SLOT,
+    load_published_params,
+)
+from rounds import Round, iter_rounds
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+# [pirate id, position - 1, pfa, -nfa], pirate 0 is padding so ids index directly
+EXP_UTILITY_TABLE_SHAPE = (21, 4, MAX_PFA + 1, MAX_NFA + 1)
+
+
+@dataclass(frozen=True)
+class Coefficients:
+    # all indexed by pirate id (index 0 is unused), position by [pirate id, position - 1]
+    intercepts: np.ndarray
+    pfa: np.ndarray
+    nfa: np.ndarray
+    position: np.ndarray
+
+    @classmethod
+    def from_params(cls, params: np.ndarray) -> "Coefficients":
+        # same gather the fitter uses, with the trailing 0 for Goob's intercept and position 1
+        coeff = np.append(params, 0.0)
+        return cls(
+            intercepts=coeff[ASC_SLOT],
+            pfa=coeff[PFA_SLOT],
+            nfa=coeff[NFA_SLOT],
+            position=coeff[POSITION_SLOT],
+        )
+
+    @classmethod
+    def from_published(cls, path: Path = Path("./output/python.py")) -> "Coefficients":
+        return cls.from_params(load_published_params(path))
+
+    def utilities(self, pirates: np.ndarray, pfa: np.ndarray, nfa: np.ndarray) -> np.ndarray:
+        # any (..., 4) batch of arenas, e.g. (rounds, 5, 4)
+        return (
+            self.intercepts[pirates]
+            + self.pfa[pirates] * pfa
+            + self.nfa[pirates] * nfa
+            + self.position[pirates, np.arange(4)]
+        )
+
+    def probabilities(self, pirates: np.ndarray, pfa: np.ndarray, nfa: np.ndarray) -> np.ndarray:
+        utilities = self.utilities(pirates, pfa, nfa)
+        exp_utilities = np.exp(utilities - utilities.max(axis=-1, keepdims=True))
+        return exp_utilities / exp_utilities.sum(axis=-1, keepdims=True)
+
+    def exp_utility_table(self) -> np.ndarray:
+        # every input is a small integer, so every exp(utility) the model can
+        # produce fits in one EXP_UTILITY_TABLE_SHAPE table
+        pfa = np.arange(MAX_PFA + 1)[None, None, :, None]
+        nfa = -np.arange(MAX_NFA + 1)[None, None, None, :]
+        utilities = (
+            self.intercepts[:, None, None, None]
+            + self.position[:, :, None, None]
+            + self.pfa[:, None, None, None] * pfa
+            + self.nfa[:, None, None, None] * nfa
+        )
+        table = np.exp(utilities)
+        table[0] = 0.0
+        return table
+
+
+def lookup_probabilities(
+    table: np.ndarray, pirates: np.ndarray, pfa: np.ndarray, nfa: np.ndarray
+) -> np.ndarray:
+    # one gather and a normalization, no exp in sight
+    pfa, nfa = np.asarray(pfa, dtype=np.intp), np.asarray(nfa, dtype=np.intp)
+    exp_utilities = table[pirates, np.arange(4), pfa, -nfa]
+    return exp_utilities / exp_utilities.sum(axis=-1, keepdims=True)
+
+
+def round_arrays(rounds: list[Round]) -> tuple[np.ndarray, np.ndarray]:
+    # pirates and foods as (rounds, 5, 4) and (rounds, 5, 10), food 0 for rounds without food data
+    pirates = np.array([round.pirates for round in rounds], dtype=np.intp)
+    foods = np.array([round.foods or [[0] * 10] * 5 for round in rounds], dtype=np.intp)
+    return pirates, foods
+
+
+def score_rounds(rounds: list[Round], coefficients: Coefficients) -> np.ndarray:
+    # decoded rounds in, (rounds, 5, 4) win probabilities out
+    pirates, foods = round_arrays(rounds)
+    pfa, nfa, _ = compute_fas(pirates, foods)
+    return coefficients.probabilities(pirates, pfa, nfa)
+
+
+def score_files(paths: list[Path], coefficients: Coefficients) -> np.ndarray:
+    return score_rounds(list(iter_rounds(paths)), coefficients)
+
+
+def score_history(
+    df: "pl.DataFrame", coefficients: Coefficients
+) -> tuple[np.ndarray, np.ndarray]:
+    # the preprocessed history has one row per arena, in round then arena order,
+    # so complete rounds reshape straight into (rounds, 5, 4)
+    def stack(name: str) -> np.ndarray:
+        columns = df.select([f"{name}{i}" for i in range(1, 5)]).to_numpy()
+        return columns.reshape(-1, 5, 4)
+
+    rounds = df["round"].to_numpy()[::5]
+    pirates = stack("pirate").astype(np.intp)
+    return rounds, coefficients.probabilities(pirates, stack("pfa"), stack("nfa"))
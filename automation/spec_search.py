@@ -0,0 +1,225 @@
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import logit
+import numpy as np
+import polars as pl
+from design import (
+    ASC_SLOT,
+    FIXED,
+    NFA_SLOT,
+    PFA_SLOT,
+    POSITION_SLOT,
+    Design,
+    Matches,
+    Term,
+    load_matches,
+    varnames,
+)
+from validate import kfold_splits
+
+OUTPUT_PATH = Path("./output/spec_search.csv")
+
+# a spec whose fit fails only has spec, params and converged, so the columns
+# are spelled out for when that's every spec
+RANKING_SCHEMA = {
+    "spec": pl.String,
+    "params": pl.Int64,
+    "loglikelihood": pl.Float64,
+    "aic": pl.Float64,
+    "bic": pl.Float64,
+    "converged": pl.Boolean,
+    "fit_time": pl.Float64,
+    "heldout_loglikelihood": pl.Float64,
+    "heldout_log_loss": pl.Float64,
+}
+
+# set once per worker process by the pool initializer
+_matches: Matches | None = None
+_splits: list[tuple[np.ndarray, np.ndarray]] | None = None
+
+
+def _local(slots: np.ndarray) -> np.ndarray:
+    # design.py's slots for one group of coefficients, renumbered from 0 with
+    # -1 for the ones that don't exist (Goob's intercept, position 1)
+    used = slots != FIXED
+    return np.where(used, slots - slots[used].min(), -1)
+
+
+def _names(prefix: str) -> list[str]:
+    return [name for name in varnames if name.rsplit("_", 1)[0].startswith(prefix)]
+
+
+POSITIONS = np.arange(4)
+
+# [arena, position - 1], arena 0 and position 1 being the reference
+ARENA_POSITION_SLOT = np.full((5, 4), -1)
+ARENA_POSITION_SLOT[1:, 1:] = np.arange(12).reshape(4, 3)
+
+# a term builder takes the matches and returns its coefficient names and
+# [(local slot, value)] parts, slots numbered from 0 within the term with -1
+# meaning "no coefficient". values are views of the matches where possible,
+# so every candidate design shares the one history table
+TERMS = {
+    # the published model, exactly as design.py builds it
+    "asc": lambda m: (_names("asc"), [(_local(ASC_SLOT)[m.pirates], None)]),
+    "pfa": lambda m: (_names("pfa"), [(_local(PFA_SLOT)[m.pirates], m.pfa)]),
+    "nfa": lambda m: (_names("nfa"), [(_local(NFA_SLOT)[m.pirates], m.nfa)]),
+    "position": lambda m: (
+        _names("is_pos"),
+        [(_local(POSITION_SLOT)[m.pirates, POSITIONS], None)],
+    ),
+    # what the odds already say, as one shared coefficient each
+    "opening_odds": lambda m: (
+        ["log_opening_implied_winrate"],
+        [(np.zeros_like(m.pirates), -np.log(m.opening_odds))],
+    ),
+    "closing_odds": lambda m: (
+        ["log_closing_implied_winrate"],
+        [(np.zeros_like(m.pirates), -np.log(m.closing_odds))],
+    ),
+    # whether food adjustments count for more or less depending on the seat
+    "fa_position": lambda m: (
+        [f"{fa}_pos{position}" for fa in ("pfa", "nfa") for position in range(2, 5)],
+        [
+            (np.broadcast_to([-1, 0, 1, 2], m.pirates.shape), m.pfa),
+            (np.broadcast_to([-1, 3, 4, 5], m.pirates.shape), m.nfa),
+        ],
+    ),
+    # seat effects that differ by arena, against arena 0 (a per-arena
+    # intercept alone would cancel out of every match)
+    "arena_position": lambda m: (
+        [f"is_pos{position}_arena{arena}" for arena in range(1, 5) for position in range(2, 5)],
+        [(ARENA_POSITION_SLOT[m.arena], None)],
+    ),
+}
+
+BASE_SPEC = ("asc", "pfa", "nfa", "position")
+EXTRA_TERMS = ("opening_odds", "closing_odds", "fa_position", "arena_position")
+
+
+def default_specs() -> list[tuple[str, ...]]:
+    # the published model plus every combination of the extra terms
+    return [
+        BASE_SPEC + extras
+        for size in range(len(EXTRA_TERMS) + 1)
+        for extras in itertools.combinations(EXTRA_TERMS, size)
+    ]
+
+
+def build_spec_design(matches: Matches, spec: tuple[str, ...]) -> Design:
+    # BASE_SPEC gives the same parameters, in the same order, as build_design
+    names, parts = [], []
+    for term in spec:
+        term_names, term_parts = TERMS[term](matches)
+        parts += [(slot, value, len(names)) for slot, value in term_parts]
+        names += term_names
+    # the zero slot goes past the end once the parameter count is known
+    fixed = len(names)
+    terms = [
+        Term(np.where(slot < 0, fixed, slot + offset), value) for slot, value, offset in parts
+    ]
+    return Design(terms=terms, choice=matches.winner, varnames=names)
+
+
+def _init_worker(matches: Matches, splits: list[tuple[np.ndarray, np.ndarray]]) -> None:
+    global _matches, _splits
+    _matches, _splits = matches, splits
+
+
+def _evaluate_spec(spec: tuple[str, ...]) -> dict:
+    # one design per candidate, reused for every fold: held-out matches just
+    # get zero weight in the training fit instead of a copied subset
+    design = build_spec_design(_matches, spec)
+    row = {"spec": "+".join(spec), "params": design.n_params}
+    try:
+        result = logit.fit(design)
+    except np.linalg.LinAlgError:
+        return row | {"converged": False}
+    row |= {
+        "loglikelihood": result.loglikelihood,
+        "aic": result.aic,
+        "bic": result.bic,
+        "converged": result.converged,
+        "fit_time": result.fit_time,
+    }
+
+    held_out = 0.0
+    rows = np.arange(len(design.choice))
+    for train, test in _splits:
+        try:
+            # the full fit is a close start, so each fold takes a couple of steps
+            fold = logit.fit(design, init=result.coeff, weights=train.astype(float))
+        except np.linalg.LinAlgError:
+            return row | {"converged": False}
+        probabilities = design.probabilities(fold.coeff)
+        held_out += np.log(probabilities[rows[test], design.choice[test]]).sum()
+        row["converged"] &= fold.converged
+    row["heldout_loglikelihood"] = held_out
+    row["heldout_log_loss"] = -held_out / len(rows)
+    return row
+
+
+def search_specs(
+    matches: Matches,
+    specs: list[tuple[str, ...]],
+    folds: int = 5,
+    workers: int | None = None,
+) -> pl.DataFrame:
+    splits = kfold_splits(matches.round, folds)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(matches, splits)
+    ) as executor:
+        rows = list(executor.map(_evaluate_spec, specs))
+    return pl.DataFrame(rows, schema=RANKING_SCHEMA).sort("heldout_loglikelihood", descending=True, nulls_last=True)
+
+
+def parse_spec(text: str) -> tuple[str, ...]:
+    spec = tuple(term.strip() for term in text.split(",") if term.strip())
+    unknown = [term for term in spec if term not in TERMS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown terms {', '.join(unknown)} (choose from {', '.join(TERMS)})"
+        )
+    return spec
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Fit candidate model specifications and rank them by AIC, BIC "
+        "and held-out log-likelihood"
+    )
+    parser.add_argument(
+        "--spec",
+        type=parse_spec,
+        action="append",
+        default=None,
+        help="comma-separated terms to fit together, repeatable "
+        f"(terms: {', '.join(TERMS)}; default: {','.join(BASE_SPEC)} "
+        "plus every combination of the others)",
+    )
+    parser.add_argument("--folds", type=int, default=5, help="round folds for the held-out fit")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all cores)",
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    specs = args.spec or default_specs()
+    print(f"Fitting {len(specs)} specifications...")
+    ranking = search_specs(load_matches(), specs, folds=args.folds, workers=args.workers)
+    with pl.Config(tbl_rows=len(ranking), tbl_cols=-1, fmt_str_lengths=80, tbl_width_chars=200):
+        print(ranking.select("spec", "params", "aic", "bic", "heldout_log_loss", "converged"))
+    if ranking["heldout_loglikelihood"].is_null().all():
+        print("No specification could be fitted")
+    print(f"Writing {args.output}...")
+    ranking.write_csv(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from constants import compute_fas
+from scoring import Coefficients
+
+# the site's odds run 2:1 to 13:1 and come out a little short of fair
+MIN_ODDS, MAX_ODDS = 2, 13
+ODDS_MARGIN = 0.85
+# about how many odds changes a recent round has
+MEAN_CHANGES = 50
+ROUND_LENGTH = timedelta(days=1)
+FIRST_START = datetime(2020, 1, 1, tzinfo=UTC)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat(timespec="seconds")
+
+
+def generate_rounds(
+    count: int, coefficients: Coefficients, first_round: int = 1, seed: int = 0
+) -> list[dict]:
+    # rounds shaped like raw_json/ files, with winners drawn from the model, so
+    # everything downstream (fits included) behaves like it does on real data
+    rng = np.random.default_rng(seed)
+    # every pirate races once per round, and each arena serves 10 different foods
+    pirates = rng.random((count, 20)).argsort(axis=1).reshape(count, 5, 4) + 1
+    foods = rng.random((count, 5, 40)).argsort(axis=2)[:, :, :10] + 1
+    pfa, nfa, _ = compute_fas(pirates, foods)
+    probabilities = coefficients.probabilities(pirates, pfa, nfa)
+    opening_odds = np.clip(np.rint(ODDS_MARGIN / probabilities), MIN_ODDS, MAX_ODDS).astype(int)
+    draws = rng.random((count, 5, 1))
+    winners = (probabilities.cumsum(axis=2) < draws).sum(axis=2).clip(max=3) + 1
+
+    rounds = []
+    for i in range(count):
+        number = first_round + i
+        start = FIRST_START + (number - 1) * ROUND_LENGTH
+        odds = opening_odds[i].copy()
+        changes = []
+        n_changes = rng.poisson(MEAN_CHANGES)
+        offsets = np.sort(rng.integers(60, int(ROUND_LENGTH.total_seconds()), n_changes))
+        for offset, arena, position, step in zip(
+            offsets,
+            rng.integers(0, 5, n_changes),
+            rng.integers(0, 4, n_changes),
+            rng.choice([-2, -1, 1, 2], n_changes),
+        ):
+            old = int(odds[arena, position])
+            new = int(np.clip(old + step, MIN_ODDS, MAX_ODDS))
+            if new == old:
+                continue
+            odds[arena, position] = new
+            changes.append({
+                "arena": int(arena),
+                "pirate": int(position) + 1,
+                "old": old,
+                "new": new,
+                "t": _iso(start + timedelta(seconds=int(offset))),
+            })
+        end = start + ROUND_LENGTH
+        rounds.append({
+            "pirates": pirates[i].tolist(),
+            "openingOdds": [[1, *row] for row in opening_odds[i].tolist()],
+            "currentOdds": [[1, *row] for row in odds.tolist()],
+            "changes": changes,
+            "round": number,
+            "start": _iso(start),
+            "timestamp": _iso(end),
+            "lastChange": changes[-1]["t"] if changes else _iso(start),
+            "winners": winners[i].tolist(),
+            "foods": foods[i].tolist(),
+        })
+    return rounds
+
+
+def write_rounds(
+    directory: Path,
+    count: int,
+    coefficients: Coefficients,
+    seed: int = 0,
+    chunk: int = 5000,
+) -> int:
+    # compact JSON like the CDN serves, a chunk of rounds in memory at a time
+    directory.mkdir(parents=True, exist_ok=True)
+    for first in range(1, count + 1, chunk):
+        rounds = generate_rounds(
+            min(chunk, count - first + 1), coefficients, first_round=first, seed=seed + first
+        )
+        for data in rounds:
+            (directory / f"{data['round']}.json").write_text(
+                json.dumps(data, separators=(",", ":"))
+            )
+    return count
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Write synthetic round files, with winners drawn from the published model"
+    )
+    parser.add_argument("output", type=Path, help="directory to write round files into")
+    parser.add_argument("--rounds", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    write_rounds(args.output, args.rounds, Coefficients.from_published(), seed=args.seed)
+    print(f"Wrote {args.rounds} rounds to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
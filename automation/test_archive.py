@@ -0,0 +1,67 @@
+import contextlib
+import dataclasses
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import preprocessing
+from archive import Archive, is_finished, write_archive
+from changes import read_changes
+from polars.testing import assert_frame_equal
+from rounds import Round, iter_rounds, load_round
+
+RAW_JSON_DIR = Path(__file__).resolve().parent / "raw_json"
+
+
+def instants(round: Round) -> Round:
+    # the archive keeps times as UTC microseconds, so its ISO strings name the
+    # same instants as the site's in a different offset
+    def parse(timestamp: str | None) -> datetime | None:
+        return None if timestamp is None else datetime.fromisoformat(timestamp)
+
+    return dataclasses.replace(
+        round,
+        start=parse(round.start),
+        timestamp=parse(round.timestamp),
+        changes=[dataclasses.replace(change, t=parse(change.t)) for change in round.changes or []],
+    )
+
+
+class ArchiveTest(unittest.TestCase):
+    # every 20th round, old ones without food data through recent ones with changes
+    def setUp(self) -> None:
+        self.addCleanup(os.chdir, os.getcwd())
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.chdir(directory)
+        self.enterContext(contextlib.redirect_stdout(io.StringIO()))
+        Path("output").mkdir()
+        Path("raw_json").mkdir()
+        sample = sorted(RAW_JSON_DIR.glob("*.json"), key=lambda path: int(path.stem))[::20]
+        for path in sample:
+            shutil.copy(path, Path("raw_json") / path.name)
+        self.paths = sorted(Path("raw_json").glob("*.json"), key=lambda path: int(path.stem))
+        write_archive(Path("round_archive"), iter_rounds(self.paths, changes=True))
+
+    def test_rounds_match_load_round(self) -> None:
+        archive = Archive(Path("round_archive"))
+        expected = [load_round(path, changes=True) for path in self.paths]
+        expected = [instants(round) for round in expected if is_finished(round)]
+        self.assertEqual(len(archive), len(expected))
+        for round in expected:
+            self.assertEqual(instants(archive[round.round]), round)
+        self.assertEqual([instants(round) for round in archive], expected)
+
+    def test_ingest_matches_raw_json(self) -> None:
+        history = preprocessing.ingest(full=True, workers=1)
+        changes = read_changes()
+        assert_frame_equal(preprocessing.ingest_archive(Path("round_archive")), history)
+        assert_frame_equal(read_changes(), changes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+from constants import NEGATIVE_FAS, POSITIVE_FAS, compute_fas
+from rounds import iter_rounds
+from scoring import round_arrays
+
+
+def loop_fas(pirates: list[int], foods: list[int]) -> tuple[list[int], list[int], list[int]]:
+    # the per-round dict sums preprocessing.py used before the lookup matrices
+    pfa = [sum(POSITIVE_FAS[pirate][food] for food in foods) for pirate in pirates]
+    nfa = [-sum(NEGATIVE_FAS[pirate][food] for food in foods) for pirate in pirates]
+    return pfa, nfa, [p + n for p, n in zip(pfa, nfa)]
+
+
+class ComputeFasTest(unittest.TestCase):
+    def test_matches_the_dict_loop(self) -> None:
+        rounds = [round for round in iter_rounds() if round.foods is not None]
+        pirates, foods = round_arrays(rounds)
+        pfa, nfa, fa = compute_fas(pirates, foods)
+        for i, round in enumerate(rounds):
+            for arena in range(5):
+                expected = loop_fas(round.pirates[arena], round.foods[arena])
+                actual = (pfa[i, arena].tolist(), nfa[i, arena].tolist(), fa[i, arena].tolist())
+                self.assertEqual(actual, expected, f"round {round.round} arena {arena}")
+
+    def test_every_pirate_and_food(self) -> None:
+        # every pirate sees every food at least once, so every entry of the
+        # dicts is reached; the other nine foods are random
+        rows = np.arange(200)
+        pirates = (rows[:, None] // 40) * 4 + np.arange(1, 5)
+        foods = np.random.default_rng(0).integers(1, 41, size=(200, 10))
+        foods[:, 0] = rows % 40 + 1
+        pfa, nfa, fa = compute_fas(pirates, foods)
+        for row in range(200):
+            expected = loop_fas(pirates[row].tolist(), foods[row].tolist())
+            self.assertEqual((pfa[row].tolist(), nfa[row].tolist(), fa[row].tolist()), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
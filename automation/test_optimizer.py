@@ -0,0 +1,61 @@
+import itertools
+import unittest
+
+import numpy as np
+from bets import MAX_WINNINGS
+from optimizer import bet_amounts, chosen_values, select_bets
+
+# small enough to try every set: 12 candidate bets, sets of 3
+ROUNDS, BETS, COUNT = 40, 12, 3
+
+
+class SelectBetsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.probabilities = rng.uniform(0.0, 0.3, size=(ROUNDS, BETS))
+        self.odds = rng.integers(2, 200, size=(ROUNDS, BETS)).astype(float)
+        # a round where no bet pays on average
+        self.probabilities[0] = 0.1 / self.odds[0]
+
+    def brute_force(self, bet_amount: int | None, value) -> np.ndarray:
+        # the best value over every set the objective may pick, per round
+        amounts = bet_amounts(self.odds, bet_amount)
+        expected = self.probabilities * np.minimum(amounts * self.odds, MAX_WINNINGS)
+        best = np.full(ROUNDS, -np.inf)
+        for size in range(COUNT + 1):
+            for bets in itertools.combinations(range(BETS), size):
+                bets = list(bets)
+                best = np.maximum(best, value(expected[:, bets], amounts[:, bets], size))
+        return best
+
+    def picked(self, objective: str, bet_amount: int | None) -> tuple[np.ndarray, ...]:
+        chosen, stakes = select_bets(self.probabilities, self.odds, objective, bet_amount, COUNT)
+        returns = np.minimum(stakes * chosen_values(self.odds, chosen), MAX_WINNINGS)
+        expected = chosen_values(self.probabilities, chosen) * returns
+        return chosen, expected.sum(axis=1), stakes.sum(axis=1)
+
+    def test_expected_return(self) -> None:
+        for bet_amount in (None, 20_000):
+            chosen, expected, staked = self.picked("expected_return", bet_amount)
+            best = self.brute_force(
+                bet_amount, lambda expected, amounts, size: (expected - amounts).sum(axis=1)
+            )
+            np.testing.assert_allclose(expected - staked, best)
+            self.assertTrue((chosen[0] == -1).all())
+            self.assertEqual(staked[0], 0)
+
+    def test_expected_ratio(self) -> None:
+        # dinkelbach against every set of exactly COUNT bets
+        def ratio(expected: np.ndarray, amounts: np.ndarray, size: int) -> np.ndarray:
+            if size < COUNT:
+                return np.full(ROUNDS, -np.inf)
+            return expected.sum(axis=1) / amounts.sum(axis=1)
+
+        for bet_amount in (None, 20_000):
+            chosen, expected, staked = self.picked("expected_ratio", bet_amount)
+            self.assertTrue((chosen >= 0).all())
+            np.testing.assert_allclose(expected / staked, self.brute_force(bet_amount, ratio))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+from bets import bet_odds, bet_probabilities
+from optimizer import chosen_values, select_bets
+from outcomes import _round_distributions
+
+
+class RoundDistributionsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # every odds at 2: in round 0 no pirate is better than a coin flip's
+        # worth, so no bet pays on average; in round 1 each arena's first
+        # pirate wins 70% of the time, so plenty do
+        self.probabilities = np.full((2, 5, 4), 0.25)
+        self.probabilities[1] = [0.7, 0.1, 0.1, 0.1]
+        self.odds = np.full((2, 5, 4), 2)
+        self.winners = np.ones((2, 5), dtype=np.intp)
+        self.stats = _round_distributions(
+            self.probabilities,
+            self.odds,
+            self.probabilities,
+            self.winners,
+            "expected_return",
+            None,
+            10,
+        )
+
+    def test_no_bet_round(self) -> None:
+        self.assertEqual(self.stats["stake"][0], 0)
+        self.assertEqual(self.stats["expected_profit"][0], 0)
+        self.assertEqual(self.stats["realized_profit"][0], 0)
+        self.assertEqual(self.stats["p_profit"][0], 0)
+        self.assertEqual(self.stats["p_total_loss"][0], 0)
+
+    def test_expected_profit_matches_the_bets(self) -> None:
+        probabilities, odds = bet_probabilities(self.probabilities), bet_odds(self.odds)
+        chosen, stake = select_bets(probabilities, odds)
+        self.assertTrue((chosen[0] == -1).all())
+        self.assertTrue((chosen[1] >= 0).all())
+        expected = (chosen_values(probabilities * odds, chosen) * stake - stake).sum(axis=1)
+        np.testing.assert_allclose(self.stats["expected_profit"], expected)
+        self.assertEqual(self.stats["stake"][1], 10)
+        self.assertGreater(self.stats["p_total_loss"][1], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import preprocessing
+from changes import read_changes
+from polars.testing import assert_frame_equal
+
+RAW_JSON_DIR = Path(__file__).resolve().parent / "raw_json"
+
+
+class IngestTest(unittest.TestCase):
+    # preprocessing.py works on raw_json/ and output/ relative to where it runs,
+    # so each test runs in a scratch directory holding a sample of the rounds
+    def setUp(self) -> None:
+        self.addCleanup(os.chdir, os.getcwd())
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.chdir(directory)
+        self.enterContext(contextlib.redirect_stdout(io.StringIO()))
+        Path("output").mkdir()
+        Path("raw_json").mkdir()
+        # every 20th round, old ones without food data through recent ones with changes
+        self.sample = sorted(RAW_JSON_DIR.glob("*.json"), key=lambda path: int(path.stem))[::20]
+
+    def copy(self, paths: list[Path]) -> None:
+        for path in paths:
+            shutil.copy(path, Path("raw_json") / path.name)
+
+    def test_incremental_matches_full(self) -> None:
+        self.copy(self.sample[:150])
+        preprocessing.ingest(workers=1)
+
+        # new rounds, a changed round, a removed round and a fresh checkout's mtimes
+        self.copy(self.sample[150:])
+        changed = Path("raw_json") / self.sample[10].name
+        data = json.loads(changed.read_bytes())
+        data["currentOdds"][0][1] += 1
+        changed.write_text(json.dumps(data))
+        (Path("raw_json") / self.sample[20].name).unlink()
+        os.utime(Path("raw_json") / self.sample[30].name)
+
+        history = preprocessing.ingest(workers=1)
+        changes = read_changes()
+        assert_frame_equal(history, preprocessing.ingest(full=True, workers=1))
+        assert_frame_equal(changes, read_changes())
+        rounds = {int(path.stem) for path in Path("raw_json").glob("*.json")}
+        self.assertEqual(preprocessing.load_manifest().keys(), rounds)
+
+    def test_unchanged_rerun(self) -> None:
+        self.copy(self.sample)
+        first = preprocessing.ingest(workers=1)
+        stale, _ = preprocessing.find_stale_paths(
+            sorted(Path("raw_json").glob("*.json")), preprocessing.load_manifest()
+        )
+        self.assertEqual(stale, [])
+        assert_frame_equal(preprocessing.ingest(workers=1), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import itertools
+import re
+import runpy
+import unittest
+from pathlib import Path
+
+import final
+import numpy as np
+from constants import compute_fas
+from design import load_published_params, varnames
+from rounds import iter_rounds
+from scoring import Coefficients, lookup_probabilities, round_arrays
+
+PUBLISHED = Path(__file__).resolve().parent / "output" / "python.py"
+
+
+class ExpUtilityTableTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.coefficients = Coefficients.from_published(PUBLISHED)
+        rounds = list(itertools.islice(iter_rounds(), 500))
+        cls.pirates, foods = round_arrays(rounds)
+        cls.pfa, cls.nfa, _ = compute_fas(cls.pirates, foods)
+        cls.expected = cls.coefficients.probabilities(cls.pirates, cls.pfa, cls.nfa)
+
+    def check(self, shape: list[int], values: list[float]) -> None:
+        table = np.array(values).reshape(shape)
+        probabilities = lookup_probabilities(table, self.pirates, self.pfa, self.nfa)
+        np.testing.assert_allclose(probabilities, self.expected, rtol=1e-12)
+
+    def test_published_python(self) -> None:
+        published = runpy.run_path(str(PUBLISHED))
+        self.check(published["LOGIT_EXP_UTILITY_SHAPE"], published["LOGIT_EXP_UTILITY"])
+
+    def test_javascript(self) -> None:
+        params = final.ParamsSeries(varnames, load_published_params(PUBLISHED))
+        source = final.generate_javascript(params)
+        shape = re.search(r"LOGIT_EXP_UTILITY_SHAPE = \[(.*?)\];", source).group(1)
+        values = re.search(r"LOGIT_EXP_UTILITY = \[(.*?)\];", source, re.S).group(1)
+        self.check(
+            [int(size) for size in shape.split(",")],
+            [float(value) for value in values.split(",") if value.strip()],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
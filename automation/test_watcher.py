@@ -0,0 +1,76 @@
+# runs against recorded rounds served by mock_cdn.py:
+#
+#   uv run python -m unittest test_watcher
+import asyncio
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+import grab_rounds
+import requests
+import watcher
+from mock_cdn import RAW_JSON_DIR, SCRIPT_DIR, start_mock_cdn
+from scoring import Coefficients
+
+COEFFICIENTS = Coefficients.from_published(SCRIPT_DIR / "output" / "python.py")
+
+# two finished rounds, so every payload is final from the first poll on
+FIRST, SECOND = sorted(int(path.stem) for path in RAW_JSON_DIR.glob("*.json"))[-2:]
+
+
+class WatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = start_mock_cdn(current_round=FIRST)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(self.server.server_close)
+
+    def watch(self, current_round, polls: int = 4) -> watcher.RoundState | None:
+        # current_round stands in for grab_rounds.get_current_round
+        with (
+            mock.patch.object(watcher, "get_current_round", current_round),
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            return asyncio.run(
+                watcher.watch(
+                    base_url=self.server.base_url,
+                    coefficients=COEFFICIENTS,
+                    interval=0.0,
+                    polls=polls,
+                    on_update=lambda update: None,
+                )
+            )
+
+    def test_late_round_bump(self) -> None:
+        # current_round.txt still names the finished round on the first two
+        # lookups and only then moves on
+        calls = 0
+
+        def current_round(session, base_url, timeout):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                self.server.current_round = SECOND
+            return grab_rounds.get_current_round(session, base_url, timeout)
+
+        state = self.watch(current_round)
+        self.assertEqual(state.round, SECOND)
+        self.assertTrue(state.finished)
+
+    def test_current_round_failure(self) -> None:
+        # a failed lookup is retried on the next poll instead of ending the watch
+        calls = 0
+
+        def current_round(session, base_url, timeout):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise requests.ConnectionError("connection refused")
+            return grab_rounds.get_current_round(session, base_url, timeout)
+
+        state = self.watch(current_round, polls=2)
+        self.assertEqual(state.round, FIRST)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import logit
+import numpy as np
+from design import Matches, build_design, load_matches
+
+OUTPUT_PATH = Path("./output/validation.json")
+
+# calibration buckets over predicted win probability
+BUCKETS = np.linspace(0.0, 1.0, 11)
+
+# set once per worker process by the pool initializer
+_matches: Matches | None = None
+
+
+def _init_worker(matches: Matches) -> None:
+    global _matches
+    _matches = matches
+
+
+def kfold_splits(rounds: np.ndarray, folds: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    # whole rounds go to one side of the split, so arenas from the same round
+    # never end up in both training and held-out data
+    unique_rounds = np.unique(rounds)
+    fold_of_round = np.arange(len(unique_rounds)) % folds
+    fold = fold_of_round[np.searchsorted(unique_rounds, rounds)]
+    return [(fold != k, fold == k) for k in range(folds)]
+
+
+def forward_splits(rounds: np.ndarray, folds: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    # rolling origin: train on everything before a cutoff, test on the next block
+    unique_rounds = np.unique(rounds)
+    edges = np.append(unique_rounds, unique_rounds[-1] + 1)
+    # the first block is only ever trained on
+    cutoffs = edges[np.linspace(0, len(unique_rounds), folds + 2, dtype=int)[1:]]
+    return [
+        (rounds < start, (rounds >= start) & (rounds < end))
+        for start, end in zip(cutoffs[:-1], cutoffs[1:])
+    ]
+
+
+def implied_probabilities(odds: np.ndarray) -> np.ndarray:
+    # the naive baseline: exp(log_opening_implied_winrate), normalized per
+    # match, for any (..., 4) odds
+    implied = 1.0 / odds
+    return implied / implied.sum(axis=-1, keepdims=True)
+
+
+def score(probabilities: np.ndarray, winner: np.ndarray) -> dict:
+    rows = np.arange(len(winner))
+    outcomes = np.zeros_like(probabilities)
+    outcomes[rows, winner] = 1.0
+    return {
+        "matches": len(winner),
+        "log_loss": float(-np.log(probabilities[rows, winner]).mean()),
+        "brier": float(((probabilities - outcomes) ** 2).sum(axis=1).mean()),
+        "calibration": calibration(probabilities.ravel(), outcomes.ravel()),
+    }
+
+
+def calibration(predicted: np.ndarray, observed: np.ndarray) -> list[dict]:
+    bucket = np.clip(np.digitize(predicted, BUCKETS) - 1, 0, len(BUCKETS) - 2)
+    count = np.bincount(bucket, minlength=len(BUCKETS) - 1)
+    mean_predicted = np.bincount(bucket, weights=predicted, minlength=len(BUCKETS) - 1)
+    mean_observed = np.bincount(bucket, weights=observed, minlength=len(BUCKETS) - 1)
+    return [
+        {
+            "low": float(BUCKETS[i]),
+            "high": float(BUCKETS[i + 1]),
+            "count": int(count[i]),
+            "predicted": float(mean_predicted[i] / count[i]),
+            "observed": float(mean_observed[i] / count[i]),
+        }
+        for i in range(len(count))
+        if count[i]
+    ]
+
+
+def _evaluate_fold(split: tuple[np.ndarray, np.ndarray]) -> dict | None:
+    train, test = split
+    try:
+        result = logit.fit(build_design(_matches.take(train)))
+    except np.linalg.LinAlgError:
+        # some pirate or position has no matches in the training rounds
+        return None
+    held_out = _matches.take(test)
+    probabilities = build_design(held_out).probabilities(result.coeff)
+    return {
+        "train_matches": int(train.sum()),
+        "first_test_round": int(held_out.round.min()),
+        "last_test_round": int(held_out.round.max()),
+        "converged": result.converged,
+        "model": score(probabilities, held_out.winner),
+        "opening_odds": score(implied_probabilities(held_out.opening_odds), held_out.winner),
+    }
+
+
+def pooled(folds: list[dict], key: str) -> dict:
+    # match-weighted averages over every held-out match
+    matches = sum(fold[key]["matches"] for fold in folds)
+    return {
+        "matches": matches,
+        "log_loss": sum(f[key]["log_loss"] * f[key]["matches"] for f in folds) / matches,
+        "brier": sum(f[key]["brier"] * f[key]["matches"] for f in folds) / matches,
+    }
+
+
+def cross_validate(
+    matches: Matches, scheme: str, folds: int, workers: int | None = None
+) -> dict:
+    if scheme == "kfold":
+        splits = kfold_splits(matches.round, folds)
+    else:
+        splits = forward_splits(matches.round, folds)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(matches,)
+    ) as executor:
+        results = list(executor.map(_evaluate_fold, splits))
+
+    skipped = sum(fold is None for fold in results)
+    if skipped:
+        print(f"Skipped {skipped} of {len(splits)} folds with a singular fit")
+    results = [fold for fold in results if fold is not None]
+    if not results:
+        raise ValueError("Every fold's training data left some coefficient unidentified")
+
+    return {
+        "scheme": scheme,
+        "folds": results,
+        "model": pooled(results, "model"),
+        "opening_odds": pooled(results, "opening_odds"),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Cross-validate the logit model by round and compare it to the opening odds"
+    )
+    parser.add_argument(
+        "--scheme",
+        choices=["kfold", "forward"],
+        default="kfold",
+        help="k-fold over rounds, or forward-chaining (train on the past, test on the next block)",
+    )
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all cores)",
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    report = cross_validate(load_matches(), args.scheme, args.folds, args.workers)
+    for i, fold in enumerate(report["folds"]):
+        label = f"Fold {i + 1}"
+        if args.scheme == "forward":
+            label = f"Rounds {fold['first_test_round']}-{fold['last_test_round']}"
+        print(
+            f"{label}: "
+            f"log-loss {fold['model']['log_loss']:.4f} "
+            f"(opening odds {fold['opening_odds']['log_loss']:.4f}), "
+            f"brier {fold['model']['brier']:.4f} "
+            f"(opening odds {fold['opening_odds']['brier']:.4f})"
+        )
+    model, baseline = report["model"], report["opening_odds"]
+    print(
+        f"Overall: log-loss {model['log_loss']:.4f} (opening odds {baseline['log_loss']:.4f}), "
+        f"brier {model['brier']:.4f} (opening odds {baseline['brier']:.4f})"
+    )
+    print(f"Writing {args.output}...")
+    args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "numpy",
+#     "requests",
+# ]
+# ///
+# follows the running round live: polls it, applies each new odds change to an
+# in-memory copy of the round and re-prices only the arenas that moved. try it
+# against a replay of recorded rounds (see mock_cdn.py):
+#
+#   uv run mock_cdn.py --replay 9150 9151 --replay-step 2
+#   uv run watcher.py --base-url http://127.0.0.1:8000 --interval 0.1
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import requests
+from grab_rounds import BASE_URL, get_current_round, make_session
+from rounds import Change, Round, get_decoder
+from scoring import Coefficients, score_rounds
+
+
+class RoundState:
+    # everything about the running round that the watcher keeps between polls.
+    # win probabilities only depend on pirates and foods, so they're scored once
+    # per round; odds, implied probabilities and edges are updated in place
+    def __init__(self, round: Round, coefficients: Coefficients) -> None:
+        self.round = round.round
+        self.probabilities = score_rounds([round], coefficients)[0]
+        self.odds = np.array(round.opening_odds, dtype=np.int64)[:, 1:]
+        self.applied = 0
+        self.finished = False
+        self.implied = 1 / self.odds
+        # expected return of a 1 NP bet on each pirate, above break-even
+        self.edges = self.probabilities * self.odds - 1
+
+    def apply(self, round: Round) -> tuple[list[Change], list[int]]:
+        # only the changes past the ones already applied; returns them and the
+        # arenas whose odds moved
+        new = (round.changes or [])[self.applied :]
+        touched = set()
+        for change in new:
+            self.odds[change.arena, change.pirate - 1] = change.new
+            touched.add(change.arena)
+        self.applied += len(new)
+
+        # the change log can miss a move (some 2019 rounds do), so anything
+        # that still disagrees with the current odds is taken from them
+        current = np.array(round.current_odds, dtype=np.int64)[:, 1:]
+        drifted = np.flatnonzero((current != self.odds).any(axis=1))
+        self.odds[drifted] = current[drifted]
+        touched.update(drifted.tolist())
+
+        arenas = sorted(touched)
+        if arenas:
+            self.implied[arenas] = 1 / self.odds[arenas]
+            self.edges[arenas] = self.probabilities[arenas] * self.odds[arenas] - 1
+        self.finished = round.winners is not None and all(round.winners)
+        return new, arenas
+
+
+@dataclass(frozen=True, slots=True)
+class Update:
+    state: RoundState
+    changes: list[Change]
+    arenas: list[int]
+
+
+def print_update(update: Update) -> None:
+    state = update.state
+    for arena in update.arenas:
+        odds = " ".join(f"{odds:2d}" for odds in state.odds[arena])
+        edges = " ".join(f"{edge:+.3f}" for edge in state.edges[arena])
+        print(f"Round {state.round} arena {arena}: odds {odds}  edges {edges}")
+    if state.finished:
+        print(f"Round {state.round} finished after {state.applied} changes")
+
+
+async def watch(
+    base_url: str = BASE_URL,
+    coefficients: Coefficients | None = None,
+    interval: float = 30.0,
+    polls: int | None = None,
+    on_update: Callable[[Update], None] = print_update,
+    timeout: float = 10.0,
+) -> RoundState | None:
+    # polls the running round every `interval` seconds (`polls` times, or for
+    # good). only the latest payload and the round state are kept, so memory
+    # stays flat however long it runs
+    if coefficients is None:
+        coefficients = Coefficients.from_published()
+    session = make_session(workers=1, retries=3, backoff=0.5)
+    decode = get_decoder(changes=True)
+    state = None
+    previous = None
+    current_round = None
+
+    poll = 0
+    while polls is None or poll < polls:
+        poll += 1
+        started = time.perf_counter()
+        # asked again on every poll once the round is over, since
+        # current_round.txt can move on well after the winners are in
+        if current_round is None or (state is not None and state.finished):
+            try:
+                current_round = await asyncio.to_thread(
+                    get_current_round, session, base_url, timeout
+                )
+            except requests.RequestException as e:
+                print(f"Current round failed: {e}")
+
+        r = None
+        if current_round is not None:
+            try:
+                r = await asyncio.to_thread(
+                    session.get, f"{base_url}/rounds/{current_round}.json", timeout=timeout
+                )
+            except requests.RequestException as e:
+                print(f"Round {current_round} failed: {e}")
+
+        # an unchanged payload has nothing new, so it isn't even decoded
+        if r is not None and r.status_code == 200 and r.content != previous:
+            previous = r.content
+            round = decode(r.content)
+            if state is None or state.round != round.round:
+                state = RoundState(round, coefficients)
+                on_update(Update(state, [], list(range(5))))
+            changes, arenas = state.apply(round)
+            if arenas or state.finished:
+                on_update(Update(state, changes, arenas))
+
+        await asyncio.sleep(max(0.0, interval - (time.perf_counter() - started)))
+    return state
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Follow the running round's odds and re-price each arena as they move"
+    )
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help="CDN to poll (default: $NEOFOODCLUB_BASE_URL or cdn.neofood.club)",
+    )
+    parser.add_argument("--interval", type=float, default=30.0, help="seconds between polls")
+    parser.add_argument(
+        "--polls", type=int, default=None, help="stop after this many polls (default: never)"
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(
+            watch(base_url=args.base_url.rstrip("/"), interval=args.interval, polls=args.polls)
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import logit
+import numpy as np
+import polars as pl
+from design import Matches, build_design, load_matches
+
+OUTPUT_PATH = Path("./output/coefficient_trajectory.csv")
+
+# the pooled coefficients are all within a few units of 0; a window fit past
+# this has chased a coefficient its matches don't identify off to infinity
+MAX_COEFFICIENT = 20.0
+
+TRAJECTORY_SCHEMA = {
+    "first_round": pl.Int64,
+    "last_round": pl.Int64,
+    "matches": pl.Int64,
+    "coefficient": pl.String,
+    "pirate": pl.Int64,
+    "estimate": pl.Float64,
+    "stderr": pl.Float64,
+    "iterations": pl.Int64,
+}
+
+# set once per worker process by the pool initializer
+_matches: Matches | None = None
+_init: np.ndarray | None = None
+
+
+def _init_worker(matches: Matches, init: np.ndarray) -> None:
+    global _matches, _init
+    _matches, _init = matches, init
+
+
+def window_ends(rounds: np.ndarray, window: int | None, step: int) -> list[int]:
+    # the last round of each window, stepping back from the newest round so the
+    # most recent window always ends on the latest data
+    first, last = int(rounds.min()), int(rounds.max())
+    earliest = first if window is None else min(first + window - 1, last)
+    return sorted(range(last, earliest - 1, -step))
+
+
+def _try_fit(
+    matches: Matches, init: np.ndarray, weights: np.ndarray | None
+) -> logit.LogitResult | None:
+    try:
+        result = logit.fit(build_design(matches), init=init, weights=weights)
+    except np.linalg.LinAlgError:
+        return None
+    # newton can converge with a near-singular information matrix, which
+    # shows up as exploding coefficients and negative variances
+    with np.errstate(invalid="ignore"):
+        identified = np.isfinite(result.stderr).all()
+    if not result.converged or not identified or np.abs(result.coeff).max() > MAX_COEFFICIENT:
+        return None
+    return result
+
+
+def _fit_windows(
+    ends: list[int], window: int | None, half_life: float | None, min_matches: int
+) -> list[tuple[int, int, int, logit.LogitResult | None]]:
+    # windows handed to one worker are neighbours, so each fit starts from the
+    # previous window's coefficients instead of from scratch
+    results = []
+    init = _init
+    for last in ends:
+        first = int(_matches.round.min()) if window is None else last - window + 1
+        mask = (_matches.round >= first) & (_matches.round <= last)
+        matches = _matches.take(mask)
+        if len(matches) < min_matches:
+            # too few matches to pin down 119 coefficients, and a half-identified
+            # fit would be a poor warm start for the next window
+            results.append((first, last, len(matches), None))
+            continue
+        weights = None
+        if half_life is not None:
+            weights = 0.5 ** ((last - matches.round) / half_life)
+        result = _try_fit(matches, init, weights)
+        if result is None and init is not _init:
+            # a neighbour that landed somewhere odd is a bad start, retry from the pooled fit
+            result = _try_fit(matches, _init, weights)
+        results.append((first, last, len(matches), result))
+        init = result.coeff if result is not None else _init
+    return results
+
+
+def fit_windows(
+    matches: Matches,
+    init: np.ndarray,
+    window: int | None,
+    step: int,
+    half_life: float | None = None,
+    min_matches: int = 2000,
+    workers: int | None = None,
+) -> pl.DataFrame:
+    ends = window_ends(matches.round, window, step)
+    workers = min(workers or os.cpu_count(), len(ends))
+    # contiguous chunks, one per worker, so warm starts come from the neighbouring window
+    chunks = [list(chunk) for chunk in np.array_split(ends, workers)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(matches, init)
+    ) as executor:
+        futures = [
+            executor.submit(_fit_windows, chunk, window, half_life, min_matches)
+            for chunk in chunks
+        ]
+        fits = [fit for future in futures for fit in future.result()]
+
+    rows = []
+    for first, last, n_matches, result in fits:
+        if result is None:
+            # too few matches, or some coefficient isn't identified in this
+            # window, e.g. early rounds with no food data say nothing about pfa/nfa
+            print(f"Skipping rounds {first}-{last} ({n_matches} matches): no usable fit")
+            continue
+        for name, estimate, stderr in zip(result.varnames, result.coeff, result.stderr):
+            rows.append({
+                "first_round": first,
+                "last_round": last,
+                "matches": n_matches,
+                "coefficient": name,
+                "pirate": int(name.rsplit("_", 1)[1]),
+                "estimate": estimate,
+                "stderr": stderr,
+                "iterations": result.iterations,
+            })
+    # every window can fail, e.g. a short --window on rounds without food data
+    return pl.DataFrame(rows, schema=TRAJECTORY_SCHEMA)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Fit the model over sliding round windows and write the coefficient trajectory"
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=None,
+        help="rounds per window (default: every round up to the end of the window)",
+    )
+    parser.add_argument(
+        "--step",
+        type=int,
+        default=100,
+        help="rounds between the ends of consecutive windows",
+    )
+    parser.add_argument(
+        "--half-life",
+        type=float,
+        default=None,
+        help="weight matches by 0.5 ** (rounds before the window end / half-life)",
+    )
+    parser.add_argument(
+        "--min-matches",
+        type=int,
+        default=2000,
+        help="skip windows with fewer arena-matches than this",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all cores)",
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    matches = load_matches()
+    # every chunk of windows starts from the pooled fit rather than from zero
+    pooled = logit.fit(build_design(matches))
+    trajectory = fit_windows(
+        matches,
+        pooled.coeff,
+        window=args.window,
+        step=args.step,
+        half_life=args.half_life,
+        min_matches=args.min_matches,
+        workers=args.workers,
+    )
+    if trajectory.is_empty():
+        print("No window could be fitted")
+    print(f"Writing {args.output}...")
+    trajectory.write_csv(args.output)
+
+
+if __name__ == "__main__":
+    main()